@@ -1,8 +1,42 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
 __version__ = "2.11.0"
 
-from . import article, collection, island, notebook, objects, rank, user
+__all__ = [
+    "article",
+    "collection",
+    "island",
+    "notebook",
+    "objects",
+    "rank",
+    "user",
+    "request_budget",
+]
+
+# 可以直接从包中访问的函数，值为所在的子模块
+_LAZY_ATTRIBUTES = {"request_budget": "budget"}
+
+if TYPE_CHECKING:
+    from . import article, collection, island, notebook, objects, rank, user
+    from .budget import request_budget
+
+
+def __getattr__(name: str) -> Any:
+    # 子模块在首次访问时才导入，以缩短导入耗时
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    if name in __all__:
+        module = import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ["article", "collection", "island", "notebook", "objects", "rank", "user"]
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
 
 
 def future() -> None:
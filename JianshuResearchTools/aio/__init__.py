@@ -0,0 +1,20 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+__all__ = ["article", "collection", "island", "notebook", "rank", "user"]
+
+if TYPE_CHECKING:
+    from . import article, collection, island, notebook, rank, user
+
+
+def __getattr__(name: str) -> Any:
+    # 子模块在首次访问时才导入，以缩短导入耗时
+    if name in __all__:
+        module = import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,458 @@
+from datetime import datetime
+from typing import AsyncGenerator, Callable, Dict, List, Literal, Optional, Union
+
+from ..article import (
+    _ConvertArticleHtmlToMarkdown,
+    _ParseArticleAllBasicData,
+    _ParseArticleCommentsData,
+    _ParseArticleHtml,
+    _ParseArticlePaidStatus,
+    _ParseArticleText,
+)
+from ..assert_funcs import AssertArticleJsonDataNormal, AssertArticleUrl
+from ..records import CommentRecord
+from ..utils import AsyncIterPages, Cursor
+from .assert_funcs import AssertArticleStatusNormal
+from .basic_apis import (
+    GetArticleCommentsJsonDataApi,
+    GetArticleHtmlJsonDataApi,
+    GetArticleJsonDataApi,
+)
+
+__all__ = [
+    "GetArticleTitle",
+    "GetArticleAuthorName",
+    "GetArticleReadsCount",
+    "GetArticleWordage",
+    "GetArticleLikesCount",
+    "GetArticleCommentsCount",
+    "GetArticleMostValuableCommentsCount",
+    "GetArticleTotalFPCount",
+    "GetArticleDescription",
+    "GetArticlePublishTime",
+    "GetArticleUpdateTime",
+    "GetArticlePaidStatus",
+    "GetArticleReprintStatus",
+    "GetArticleCommentStatus",
+    "GetArticleHtml",
+    "GetArticleText",
+    "GetArticleMarkdown",
+    "GetArticleCommentsData",
+    "GetArticleAllBasicData",
+    "GetArticleAllCommentsData",
+]
+
+
+async def GetArticleTitle(article_url: str, disable_check: bool = False) -> str:
+    """获取文章标题
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 文章标题
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    return json_obj["public_title"]
+
+
+async def GetArticleAuthorName(article_url: str, disable_check: bool = False) -> str:
+    """获取文章作者名
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 文章作者名
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        await AssertArticleStatusNormal(article_url)
+    json_obj = await GetArticleHtmlJsonDataApi(article_url)
+    return json_obj["props"]["initialState"]["note"]["data"]["user"]["nickname"]
+
+
+async def GetArticleReadsCount(article_url: str, disable_check: bool = False) -> int:
+    """获取文章阅读量
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 文章阅读量
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        await AssertArticleStatusNormal(article_url)
+    json_obj = await GetArticleHtmlJsonDataApi(article_url)
+    return json_obj["props"]["initialState"]["note"]["data"]["views_count"]
+
+
+async def GetArticleWordage(article_url: str, disable_check: bool = False) -> int:
+    """获取文章字数
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 文章字数
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        await AssertArticleStatusNormal(article_url)
+    json_obj = await GetArticleHtmlJsonDataApi(article_url)
+    return json_obj["props"]["initialState"]["note"]["data"]["wordage"]
+
+
+async def GetArticleLikesCount(article_url: str, disable_check: bool = False) -> int:
+    """获取文章点赞量
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 文章点赞量
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    return json_obj["likes_count"]
+
+
+async def GetArticleCommentsCount(article_url: str, disable_check: bool = False) -> int:
+    """获取文章评论数量
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 文章评论数量
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    return json_obj["public_comment_count"]
+
+
+async def GetArticleMostValuableCommentsCount(
+    article_url: str, disable_check: bool = False
+) -> int:
+    """获取文章精选评论数量
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 文章精选评论数量
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    return json_obj["featured_comments_count"]
+
+
+async def GetArticleTotalFPCount(
+    article_url: str, disable_check: bool = False
+) -> float:
+    """获取文章总获钻量
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 文章总获钻量
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    return json_obj["total_fp_amount"] / 1000
+
+
+async def GetArticleDescription(article_url: str, disable_check: bool = False) -> str:
+    """获取文章摘要
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 文章摘要
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    return json_obj["description"]
+
+
+async def GetArticlePublishTime(
+    article_url: str, disable_check: bool = False
+) -> datetime:
+    """获取文章发布时间
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (str): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        datetime: 文章发布时间
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    return datetime.fromisoformat(json_obj["first_shared_at"]).replace(tzinfo=None)
+
+
+async def GetArticleUpdateTime(
+    article_url: str, disable_check: bool = False
+) -> datetime:
+    """获取文章更新时间
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        datetime: 文章更新时间
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    return datetime.fromtimestamp(json_obj["last_updated_at"])
+
+
+async def GetArticlePaidStatus(article_url: str, disable_check: bool = False) -> bool:
+    """获取文章付费状态
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        bool: 文章付费状态，True 为付费文章，False 为免费文章
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    return _ParseArticlePaidStatus(json_obj)
+
+
+async def GetArticleReprintStatus(
+    article_url: str, disable_check: bool = False
+) -> bool:
+    """获取文章转载声明状态
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        bool: 文章转载声明状态，True 为允许转载，False 为禁止转载
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    return json_obj["reprintable"]
+
+
+async def GetArticleCommentStatus(
+    article_url: str, disable_check: bool = False
+) -> bool:
+    """获取文章评论区状态
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        bool: 文章评论区状态，True 为开启评论，False 为关闭评论
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    return json_obj["commentable"]
+
+
+async def GetArticleHtml(article_url: str, disable_check: bool = False) -> str:
+    """获取 Html 格式的文章内容
+
+    # ! 该函数可以获取设置禁止转载的文章内容，请尊重作者版权，由此带来的风险您需自行承担
+    # ! 该函数不能获取文章付费部分的内容
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: Html 格式的文章内容
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    return _ParseArticleHtml(json_obj)
+
+
+async def GetArticleText(article_url: str, disable_check: bool = False) -> str:
+    """获取纯文本格式的文章内容
+
+    # ! 该函数可以获取设置禁止转载的文章内容，请尊重作者版权，由此带来的风险您需自行承担
+    # ! 该函数不能获取文章付费部分的内容
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 纯文本格式的文章内容
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    return _ParseArticleText(json_obj)
+
+
+async def GetArticleMarkdown(article_url: str, disable_check: bool = False) -> str:
+    """获取 Markdown 格式的文章内容
+
+    # ! 该函数可以获取设置禁止转载的文章内容，请尊重作者版权，由此带来的风险您需自行承担
+    # ! 该函数不能获取文章付费部分的内容
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: Markdown 格式的文章内容
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        await AssertArticleStatusNormal(article_url)
+    html_text = await GetArticleHtml(article_url, disable_check=True)
+    return _ConvertArticleHtmlToMarkdown(html_text)
+
+
+async def GetArticleCommentsData(
+    article_id: int,
+    page: int = 1,
+    count: int = 10,
+    author_only: bool = False,
+    sorting_method: Literal["positive", "reverse"] = "positive",
+    typed: bool = False,
+) -> Union[List[Dict], List[CommentRecord]]:
+    """获取文章评论信息
+
+    Args:
+        article_id (int): 文章 ID
+        page (int, optional): 页码. Defaults to 1.
+        count (int, optional): 每次获取的评论数（不包含子评论）. Defaults to 10.
+        author_only (bool, optional): 为 True 时只获取作者发布的评论，包含作者发布的子评论及其父评论. Defaults to False.
+        sorting_method (Literal["positive", "reverse"], optional): 排序方式，为”positive“时按时间正序排列，为”reverse“时按时间倒序排列. Defaults to "positive".
+        typed (bool, optional): 为 True 时返回 CommentRecord 对象而非字典，内存占用更小. Defaults to False.
+
+    Returns:
+        Union[List[Dict], List[CommentRecord]]: 文章评论信息
+    """
+    order_by = {
+        "positive": "asc",
+        "reverse": "desc",
+    }[sorting_method]
+    json_obj = await GetArticleCommentsJsonDataApi(
+        article_id, page, count, author_only, order_by
+    )
+    if typed:
+        return [CommentRecord.from_json(item) for item in json_obj["comments"]]
+    return _ParseArticleCommentsData(json_obj)
+
+
+async def GetArticleAllBasicData(article_url: str, disable_check: bool = False) -> Dict:
+    """获取文章的全部基础信息
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 文章基础信息
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    html_json_obj = await GetArticleHtmlJsonDataApi(article_url)
+    return _ParseArticleAllBasicData(json_obj, html_json_obj)
+
+
+async def GetArticleAllCommentsData(
+    article_id: int,
+    count: int = 10,
+    author_only: bool = False,
+    sorting_method: Literal["positive", "reverse"] = "positive",
+    max_count: Optional[int] = None,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+    typed: bool = False,
+) -> AsyncGenerator[Union[Dict, CommentRecord], None]:
+    """获取文章的全部评论信息
+
+    Args:
+        article_id (int): 文章 ID
+        count (int, optional): 单次获取的数据数量，会影响性能. Defaults to 10.
+        author_only (bool, optional): 为 True 时只获取作者发布的评论，包含作者发布的子评论及其父评论. Defaults to False.
+        sorting_method (Literal["positive", "reverse"], optional): 排序方式，为”positive“时按时间正序排列，为”reverse“时按时间倒序排列. Defaults to "positive".
+        max_count (int, optional): 获取的文章评论信息数量上限，Defaults to None.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
+        typed (bool, optional): 为 True 时返回 CommentRecord 对象而非字典，内存占用更小. Defaults to False.
+
+    Yields:
+        AsyncIterator[Dict], None]: 文章信息
+    """
+    async for item in AsyncIterPages(
+        lambda page: GetArticleCommentsData(
+            article_id, page, count, author_only, sorting_method, typed=typed
+        ),
+        max_count,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    ):
+        yield item
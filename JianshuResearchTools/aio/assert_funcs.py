@@ -0,0 +1,91 @@
+from ..assert_funcs import (
+    AssertArticleJsonDataNormal,
+    AssertArticleUrl,
+    AssertCollectionJsonDataNormal,
+    AssertIslandJsonDataNormal,
+    AssertNotebookJsonDataNormal,
+    AssertNotebookUrl,
+    AssertUserJsonDataNormal,
+)
+from .basic_apis import (
+    GetArticleJsonDataApi,
+    GetCollectionJsonDataApi,
+    GetIslandJsonDataApi,
+    GetNotebookJsonDataApi,
+    GetUserJsonDataApi,
+)
+
+__all__ = [
+    "AssertUserStatusNormal",
+    "AssertArticleStatusNormal",
+    "AssertNotebookStatusNormal",
+    "AssertCollectionStatusNormal",
+    "AssertIslandStatusNormal",
+]
+
+
+async def AssertUserStatusNormal(user_url: str) -> None:
+    """判断用户账号状态是否正常
+
+    Args:
+        user_url (str): 用户主页 URL
+
+    Raises:
+        ResourceError: 用户账号状态异常时抛出此错误
+    """
+    json_obj = await GetUserJsonDataApi(user_url)
+    AssertUserJsonDataNormal(user_url, json_obj)
+
+
+async def AssertArticleStatusNormal(article_url: str) -> None:
+    """判断文章状态是否正常
+
+    Args:
+        article_url (str): 文章 URL
+
+    Raises:
+        ResourceError: 文章状态异常时抛出此错误
+    """
+    AssertArticleUrl(article_url)
+    json_obj = await GetArticleJsonDataApi(article_url)
+    AssertArticleJsonDataNormal(article_url, json_obj)
+
+
+async def AssertNotebookStatusNormal(notebook_url: str) -> None:
+    """判断文集状态是否正常
+
+    Args:
+        notebook_url (str): 文集 URL
+
+    Raises:
+        ResourceError: 文集状态异常时抛出此错误
+    """
+    AssertNotebookUrl(notebook_url)
+    json_obj = await GetNotebookJsonDataApi(notebook_url)
+    AssertNotebookJsonDataNormal(notebook_url, json_obj)
+
+
+async def AssertCollectionStatusNormal(collection_url: str) -> None:
+    """判断专题状态是否正常
+
+    Args:
+        collection_url (str): 专题 URL
+
+    Raises:
+        ResourceError: 专题状态异常时抛出此错误
+    """
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    AssertCollectionJsonDataNormal(collection_url, json_obj)
+
+
+async def AssertIslandStatusNormal(island_url: str) -> None:
+    """判断小岛状态是否正常
+
+    Args:
+        island_url (str): 小岛 URL
+
+    Raises:
+        ResourceError: 小岛状态异常时抛出此错误
+    """
+    json_obj = await GetIslandJsonDataApi(island_url)
+    AssertIslandJsonDataNormal(island_url, json_obj)
@@ -0,0 +1,363 @@
+from functools import partial
+from time import perf_counter
+from typing import Dict, Optional
+
+from httpx import AsyncClient, Request
+from lxml import etree
+from lxml.etree import _Element
+
+from ..budget import _ConsumeRequestBudget
+from ..exceptions import ResourceError
+from ..httpx_client import get_async_client
+from ..json_backend import json_loads
+from ..metrics import _InstrumentAsyncApi, _RecordSource
+from ..rate_limit import EndpointFamily
+from ..response_cache import ResponseCache, get_response_cache
+from ..single_flight import get_async_single_flight
+
+__all__ = [
+    "GetArticleJsonDataApi",
+    "GetArticleHtmlJsonDataApi",
+    "GetArticleCommentsJsonDataApi",
+    "GetCollectionJsonDataApi",
+    "GetCollectionEditorsJsonDataApi",
+    "GetCollectionRecommendedWritersJsonDataApi",
+    "GetCollectionSubscribersJsonDataApi",
+    "GetCollectionArticlesJsonDataApi",
+    "GetIslandJsonDataApi",
+    "GetIslandPostsJsonDataApi",
+    "GetNotebookJsonDataApi",
+    "GetDailyArticleRankListJsonDataApi",
+    "GetArticlesFPRankListJsonDataApi",
+    "GetUserJsonDataApi",
+    "GetUserPCHtmlDataApi",
+    "GetUserCollectionsAndNotebooksJsonDataApi",
+    "GetUserArticlesListJsonDataApi",
+    "GetUserFollowingListHtmlDataApi",
+    "GetUserFollowersListHtmlDataApi",
+    "GetUserNextAnniversaryDayHtmlDataApi",
+    "GetIslandPostJsonDataApi",
+    "GetUserTimelineHtmlDataApi",
+]
+
+
+async def _SendRequest(
+    client: AsyncClient,
+    request: Request,
+    cache_key: str,
+    response_cache: Optional[ResponseCache],
+    start_time: float,
+) -> bytes:
+    response = await client.send(request)
+    _RecordSource(response.status_code, len(response.content), start_time)
+    if response_cache is not None and response.is_success:
+        response_cache.set(
+            cache_key, response.content, response_cache.get_ttl(request.url)
+        )
+    return response.content
+
+
+async def _GetSource(
+    family: EndpointFamily, request_url: str, params: Optional[Dict] = None
+) -> bytes:
+    client = get_async_client(family)
+    start_time = perf_counter()
+    request = client.build_request("GET", request_url, params=params)
+    # 缓存与请求合并使用同一个键，不同类型接口的请求即使 URL 相同也不能共享响应
+    key = ResponseCache.make_key("GET", request.url, family)
+    response_cache = get_response_cache()
+    if response_cache is not None:
+        content = response_cache.get(key)
+        if content is not None:
+            _RecordSource(None, len(content), start_time)
+            return content
+        if response_cache.offline:
+            raise ResourceError(f"离线模式下缓存中没有 {request.url} 的数据")
+
+    # 在合并请求前检查预算，每个调用方都计入各自的预算，超出预算时不会加入其它调用
+    _ConsumeRequestBudget(family)
+    send = partial(_SendRequest, client, request, key, response_cache, start_time)
+    single_flight = get_async_single_flight()
+    if single_flight is None:
+        return await send()
+    content, shared = await single_flight.do(key, send)
+    if shared:
+        _RecordSource(None, len(content), start_time, coalesced=True)
+    return content
+
+
+@_InstrumentAsyncApi
+async def GetArticleJsonDataApi(article_url: str) -> Dict:
+    request_url = article_url.replace("https://www.jianshu.com", "/asimov")
+    source = await _GetSource("api", request_url)
+    return json_loads(source)
+
+
+@_InstrumentAsyncApi
+async def GetArticleHtmlJsonDataApi(article_url: str) -> Dict:
+    request_url = article_url.replace("https://www.jianshu.com", "")
+    source = await _GetSource("pc", request_url)
+    html_obj = etree.HTML(source)  # type: ignore
+    # xpath 返回的是 str 的子类，部分 JSON 解析库（如 orjson）不接受
+    return json_loads(str(html_obj.xpath("//script[@id='__NEXT_DATA__']/text()")[0]))
+
+
+@_InstrumentAsyncApi
+async def GetArticleCommentsJsonDataApi(
+    article_id: int, page: int, count: int, author_only: bool, order_by: str
+) -> Dict:
+    params = {
+        "page": page,
+        "count": count,
+        "author_only": author_only,
+        "order_by": order_by,
+    }
+    request_url = f"shakespeare/notes/{article_id}/comments"
+    source = await _GetSource("api", request_url, params=params)
+    return json_loads(source)
+
+
+@_InstrumentAsyncApi
+async def GetCollectionJsonDataApi(collection_url: str) -> Dict:
+    request_url = collection_url.replace(
+        "https://www.jianshu.com/c/", "asimov/collections/slug/"
+    )
+    source = await _GetSource("api", request_url)
+    return json_loads(source)
+
+
+@_InstrumentAsyncApi
+async def GetCollectionEditorsJsonDataApi(collection_id: int, page: int) -> Dict:
+    request_url = f"collections/{collection_id}/editors"
+    params = {
+        "page": page,
+    }
+    source = await _GetSource("api", request_url, params=params)
+    return json_loads(source)
+
+
+@_InstrumentAsyncApi
+async def GetCollectionRecommendedWritersJsonDataApi(
+    collection_id: int, page: int, count: int
+) -> Dict:
+    params = {
+        "collection_id": collection_id,
+        "page": page,
+        "count": count,
+    }
+    source = await _GetSource(
+        "api",
+        "/collections/recommended_users",
+        params=params,
+    )
+    return json_loads(source)
+
+
+@_InstrumentAsyncApi
+async def GetCollectionSubscribersJsonDataApi(
+    collection_id: int, max_sort_id: Optional[int]
+) -> Dict:
+    request_url = f"/collection/{collection_id}/subscribers"
+    params = {
+        "max_sort_id": max_sort_id,
+    }
+    source = await _GetSource("api", request_url, params=params)
+    return json_loads(source)
+
+
+@_InstrumentAsyncApi
+async def GetCollectionArticlesJsonDataApi(
+    collection_slug: str, page: int, count: int, order_by: str
+) -> Dict:
+    request_url = f"/asimov/collections/slug/{collection_slug}/public_notes"
+    params = {
+        "page": page,
+        "count": count,
+        "order_by": order_by,
+    }
+    source = await _GetSource("api", request_url, params=params)
+    return json_loads(source)
+
+
+@_InstrumentAsyncApi
+async def GetIslandJsonDataApi(island_url: str) -> Dict:
+    request_url = island_url.replace("https://www.jianshu.com/g/", "/asimov/groups/")
+    source = await _GetSource("api", request_url)
+    return json_loads(source)
+
+
+@_InstrumentAsyncApi
+async def GetIslandPostsJsonDataApi(
+    group_slug: str,
+    max_id: Optional[int],
+    count: int,
+    topic_id: Optional[int],
+    order_by: str,
+) -> Dict:
+    params = {
+        "group_slug": group_slug,
+        "order_by": order_by,
+        "max_id": max_id,
+        "count": count,
+        "topic_id": topic_id,
+    }
+    source = await _GetSource(
+        "api",
+        "/asimov/posts",
+        params=params,
+    )
+    return json_loads(source)
+
+
+@_InstrumentAsyncApi
+async def GetNotebookJsonDataApi(notebook_url: str) -> Dict:
+    request_url = notebook_url.replace("https://www.jianshu.com/", "/asimov/")
+    source = await _GetSource("api", request_url)
+    return json_loads(source)
+
+
+@_InstrumentAsyncApi
+async def GetNotebookArticlesJsonDataApi(
+    notebook_url: str, page: int, count: int, order_by: str
+) -> Dict:
+    request_url = (
+        notebook_url.replace("https://www.jianshu.com/nb/", "/asimov/notebooks/")
+        + "/public_notes/"
+    )
+    params = {
+        "page": page,
+        "count": count,
+        "order_by": order_by,
+    }
+    source = await _GetSource("api", request_url, params=params)
+    return json_loads(source)
+
+
+@_InstrumentAsyncApi
+async def GetAssetsRankJsonDataApi(max_id: int, since_id: int) -> Dict:
+    params = {
+        "max_id": max_id,
+        "since_id": since_id,
+    }
+    source = await _GetSource(
+        "api",
+        "/asimov/fp_rankings",
+        params=params,
+    )
+    return json_loads(source)
+
+
+@_InstrumentAsyncApi
+async def GetDailyArticleRankListJsonDataApi() -> Dict:
+    source = await _GetSource(
+        "api",
+        "/asimov/daily_activity_participants/rank",
+    )
+    return json_loads(source)
+
+
+@_InstrumentAsyncApi
+async def GetArticlesFPRankListJsonDataApi(date: str, type_: Optional[str]) -> Dict:
+    params = {
+        "date": date,
+        "type": type_,
+    }
+    source = await _GetSource(
+        "api",
+        "/asimov/fp_rankings/voter_notes",
+        params=params,
+    )
+    return json_loads(source)
+
+
+@_InstrumentAsyncApi
+async def GetUserJsonDataApi(user_url: str) -> Dict:
+    request_url = user_url.replace("https://www.jianshu.com/u/", "/asimov/users/slug/")
+    source = await _GetSource("api", request_url)
+    return json_loads(source)
+
+
+@_InstrumentAsyncApi
+async def GetUserPCHtmlDataApi(user_url: str) -> _Element:
+    source = await _GetSource("pc", user_url)
+    return etree.HTML(source)  # type: ignore
+
+
+@_InstrumentAsyncApi
+async def GetUserCollectionsAndNotebooksJsonDataApi(
+    user_url: str, user_slug: str
+) -> Dict:
+    request_url = (
+        user_url.replace("https://www.jianshu.com/u/", "/users/")
+        + "/collections_and_notebooks"
+    )
+    params = {
+        "slug": user_slug,
+    }
+    source = await _GetSource("api", request_url, params=params)
+    return json_loads(source)
+
+
+@_InstrumentAsyncApi
+async def GetUserArticlesListJsonDataApi(
+    user_url: str, page: int, count: int, order_by: str
+) -> Dict:
+    request_url = (
+        user_url.replace("https://www.jianshu.com/u/", "/asimov/users/slug/")
+        + "/public_notes"
+    )
+    params = {
+        "page": page,
+        "count": count,
+        "order_by": order_by,
+    }
+    source = await _GetSource("api", request_url, params=params)
+    return json_loads(source)
+
+
+@_InstrumentAsyncApi
+async def GetUserFollowingListHtmlDataApi(user_url: str, page: int) -> _Element:
+    request_url = (
+        user_url.replace("https://www.jianshu.com/u/", "/users/") + "/following"
+    )
+    params = {
+        "page": page,
+    }
+    source = await _GetSource("pc", request_url, params=params)
+    return etree.HTML(source)  # type: ignore
+
+
+@_InstrumentAsyncApi
+async def GetUserFollowersListHtmlDataApi(user_url: str, page: int) -> _Element:
+    request_url = (
+        user_url.replace("https://www.jianshu.com/u/", "/users/") + "/followers"
+    )
+    params = {
+        "page": page,
+    }
+    source = await _GetSource("pc", request_url, params=params)
+    return etree.HTML(source)  # type: ignore
+
+
+@_InstrumentAsyncApi
+async def GetUserNextAnniversaryDayHtmlDataApi(user_slug: str) -> _Element:
+    request_url = f"/mobile/u/{user_slug}/anniversary"
+    source = await _GetSource("mobile", request_url)
+    return etree.HTML(source)  # type: ignore
+
+
+@_InstrumentAsyncApi
+async def GetIslandPostJsonDataApi(post_slug: str) -> Dict:
+    request_url = f"/asimov/posts/{post_slug}"
+    source = await _GetSource("api", request_url)
+    return json_loads(source)
+
+
+@_InstrumentAsyncApi
+async def GetUserTimelineHtmlDataApi(uslug: str, max_id: Optional[int]) -> _Element:
+    request_url = f"/users/{uslug}/timeline"
+    params = {
+        "max_id": max_id,
+    }
+    source = await _GetSource("pc", request_url, params=params)
+    return etree.HTML(source)  # type: ignore
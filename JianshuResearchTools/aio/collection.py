@@ -0,0 +1,472 @@
+from datetime import datetime
+from typing import AsyncGenerator, Callable, Dict, List, Literal, Optional, Union
+
+from ..assert_funcs import AssertCollectionJsonDataNormal, AssertCollectionUrl
+from ..collection import (
+    _ParseCollectionAllBasicData,
+    _ParseCollectionArticlesInfo,
+    _ParseCollectionEditorsInfo,
+    _ParseCollectionOwnerInfo,
+    _ParseCollectionRecommendedWritersInfo,
+    _ParseCollectionSubscribersInfo,
+)
+from ..convert import CollectionUrlToCollectionSlug
+from ..records import ArticleSummary
+from ..utils import AsyncIterPages, AsyncIterPagesById, Cursor
+from .assert_funcs import AssertCollectionStatusNormal
+from .basic_apis import (
+    GetCollectionArticlesJsonDataApi,
+    GetCollectionEditorsJsonDataApi,
+    GetCollectionJsonDataApi,
+    GetCollectionRecommendedWritersJsonDataApi,
+    GetCollectionSubscribersJsonDataApi,
+)
+
+__all__ = [
+    "GetCollectionName",
+    "GetCollectionAvatarUrl",
+    "GetCollectionIntroductionText",
+    "GetCollectionIntroductionHtml",
+    "GetCollectionArticlesCount",
+    "GetCollectionSubscribersCount",
+    "GetCollectionArticlesUpdateTime",
+    "GetCollectionInformationUpdateTime",
+    "GetCollectionOwnerInfo",
+    "GetCollectionEditorsInfo",
+    "GetCollectionRecommendedWritersInfo",
+    "GetCollectionSubscribersInfo",
+    "GetCollectionAllBasicData",
+    "GetCollectionAllEditorsInfo",
+    "GetCollectionAllRecommendedWritersInfo",
+    "GetCollectionAllSubscribersInfo",
+    "GetCollectionAllArticlesInfo",
+]
+
+
+async def GetCollectionName(collection_url: str, disable_check: bool = False) -> str:
+    """获取专题名称
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 专题名称
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    return json_obj["title"]
+
+
+async def GetCollectionAvatarUrl(
+    collection_url: str, disable_check: bool = False
+) -> str:
+    """获取专题头像链接
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 专题头像链接
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    return json_obj["image"]
+
+
+async def GetCollectionIntroductionText(
+    collection_url: str, disable_check: bool = False
+) -> str:
+    """获取纯文本格式的专题简介
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 纯文本格式的专题简介
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    return json_obj["content_without_html"]
+
+
+async def GetCollectionIntroductionHtml(
+    collection_url: str, disable_check: bool = False
+) -> str:
+    """获取 Html 格式的专题简介
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: Html 格式的专题简介
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    return json_obj["content_in_full"]
+
+
+async def GetCollectionArticlesCount(
+    collection_url: str, disable_check: bool = False
+) -> int:
+    """获取专题中的文章数量
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 专题中的文章数量
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    return json_obj["notes_count"]
+
+
+async def GetCollectionSubscribersCount(
+    collection_url: str, disable_check: bool = False
+) -> int:
+    """获取专题的订阅者数量
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 专题的订阅者数量
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    return json_obj["subscribers_count"]
+
+
+async def GetCollectionArticlesUpdateTime(
+    collection_url: str, disable_check: bool = False
+) -> datetime:
+    """获取专题文章更新时间
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        datetime: 专题文章更新时间
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    return datetime.fromtimestamp(json_obj["newly_added_at"])
+
+
+async def GetCollectionInformationUpdateTime(
+    collection_url: str, disable_check: bool = False
+) -> datetime:
+    """获取专题信息更新时间
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        datetime: 专题信息更新时间
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    return datetime.fromtimestamp(json_obj["last_updated_at"])
+
+
+async def GetCollectionOwnerInfo(
+    collection_url: str, disable_check: bool = False
+) -> Dict:
+    """获取专题的所有者信息
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 用户信息
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    return _ParseCollectionOwnerInfo(json_obj)
+
+
+async def GetCollectionEditorsInfo(collection_id: int, page: int = 1) -> List[Dict]:
+    """获取专题编辑信息
+
+    Args:
+        collection_id (int): 专题 ID
+        page (int, optional): 页码. Defaults to 1.
+
+    Returns:
+        List[Dict]: 专题编辑信息
+    """
+    json_obj = await GetCollectionEditorsJsonDataApi(collection_id, page=page)
+    return _ParseCollectionEditorsInfo(json_obj)
+
+
+async def GetCollectionRecommendedWritersInfo(
+    collection_id: int, page: int = 1, count: int = 20
+) -> List[Dict]:
+    """获取专题推荐作者信息
+
+    Args:
+        collection_id (int): 专题 ID
+        page (int, optional): 页码. Defaults to 1.
+        count (int, optional): 每次返回的结果数量. Defaults to 20.
+
+    Returns:
+        List[Dict]: 专题推荐作者信息
+    """
+    json_obj = await GetCollectionRecommendedWritersJsonDataApi(
+        collection_id, page=page, count=count
+    )
+    return _ParseCollectionRecommendedWritersInfo(json_obj)
+
+
+async def GetCollectionSubscribersInfo(
+    collection_id: int, start_sort_id: Optional[int] = None
+) -> List[Dict]:
+    """获取专题关注者信息
+
+    Args:
+        collection_id (int): 专题 ID
+        start_sort_id (int): 起始序号，等于上一条数据的序号
+
+    Returns:
+        List[Dict]: 关注者信息
+    """
+    json_obj = await GetCollectionSubscribersJsonDataApi(
+        collection_id, max_sort_id=start_sort_id
+    )
+    return _ParseCollectionSubscribersInfo(json_obj)
+
+
+async def GetCollectionArticlesInfo(
+    collection_url: str,
+    page: int = 1,
+    count: int = 10,
+    sorting_method: Literal["time", "comment_time", "hot"] = "time",
+    disable_check: bool = False,
+    typed: bool = False,
+) -> Union[List[Dict], List[ArticleSummary]]:
+    """获取专题文章信息
+
+    Args:
+        collection_url (str): 专题 URL
+        page (int, optional): 页码. Defaults to 1.
+        count (int, optional): 每次返回的数据数量. Defaults to 10.
+        sorting_method (Literal["time", "comment_time", "hot"], optional): 排序方法，"time" 为按照发布时间排序，
+        "comment_time" 为按照最近评论时间排序，"hot" 为按照热度排序. Defaults to "time".
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        typed (bool, optional): 为 True 时返回 ArticleSummary 对象而非字典，内存占用更小. Defaults to False.
+
+    Returns:
+        Union[List[Dict], List[ArticleSummary]]: 文章信息
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+        await AssertCollectionStatusNormal(collection_url)
+    order_by = {
+        "time": "added_at",
+        "comment_time": "commented_at",
+        "hot": "top",
+    }[sorting_method]
+    json_obj = await GetCollectionArticlesJsonDataApi(
+        CollectionUrlToCollectionSlug(collection_url),
+        page=page,
+        count=count,
+        order_by=order_by,
+    )
+    if typed:
+        return [ArticleSummary.from_json(item) for item in json_obj]
+    return _ParseCollectionArticlesInfo(json_obj)
+
+
+async def GetCollectionAllBasicData(
+    collection_url: str, disable_check: bool = False
+) -> Dict:
+    """获取专题的所有基础信息
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 专题基础信息
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+    json_obj = await GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    return _ParseCollectionAllBasicData(json_obj)
+
+
+async def GetCollectionAllEditorsInfo(
+    collection_id: int,
+    max_count: Optional[int] = None,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+) -> AsyncGenerator[Dict, None]:
+    """获取专题的所有编辑信息
+
+    Args:
+        collection_id (int): 专题 ID
+        max_count (int, optional): 获取的专题编辑信息数量上限，Defaults to None.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
+
+    Yields:
+        AsyncIterator[Dict], None]: 编辑信息
+    """
+    async for item in AsyncIterPages(
+        lambda page: GetCollectionEditorsInfo(collection_id, page),
+        max_count,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    ):
+        yield item
+
+
+async def GetCollectionAllRecommendedWritersInfo(
+    collection_id: int,
+    count: int = 20,
+    max_count: Optional[int] = None,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+) -> AsyncGenerator[Dict, None]:
+    """获取专题的所有推荐作者信息
+
+    Args:
+        collection_id (int): 专题 ID
+        count (int, optional): 单次获取的数据数量，会影响性能. Defaults to 20.
+        max_count (int, optional): 获取的专题推荐作者信息数量上限，Defaults to None.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
+
+    Yields:
+        AsyncIterator[Dict], None]: 推荐作者信息
+    """
+    async for item in AsyncIterPages(
+        lambda page: GetCollectionRecommendedWritersInfo(collection_id, page, count),
+        max_count,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    ):
+        yield item
+
+
+async def GetCollectionAllSubscribersInfo(
+    collection_id: int,
+    max_count: Optional[int] = None,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+) -> AsyncGenerator[Dict, None]:
+    """获取专题的所有关注者信息
+
+    Args:
+        collection_id (int): 专题 ID
+        max_count (int, optional): 获取的专题关注者信息数量上限，Defaults to None.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
+
+    Yields:
+        AsyncIterator[Dict], None]: 关注者信息
+    """
+    async for item in AsyncIterPagesById(
+        lambda start_sort_id: GetCollectionSubscribersInfo(
+            collection_id, start_sort_id
+        ),
+        lambda result: result[-1]["sort_id"],
+        max_count,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    ):
+        yield item
+
+
+async def GetCollectionAllArticlesInfo(
+    collection_url: str,
+    count: int = 10,
+    sorting_method: Literal["time", "comment_time", "hot"] = "time",
+    max_count: Optional[int] = None,
+    disable_check: bool = False,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+    typed: bool = False,
+) -> AsyncGenerator[Union[Dict, ArticleSummary], None]:
+    """获取专题的所有文章信息
+
+    Args:
+        collection_url (str): 专题 URL
+        count (int, optional): 单次获取的数据数量，会影响性能. Defaults to 10.
+        sorting_method (Literal["time", "comment_time", "hot"], optional): 排序方法，"time" 为按照发布时间排序，
+        "comment_time" 为按照最近评论时间排序，"hot" 为按照热度排序. Defaults to "time".
+        max_count (int, optional): 获取的专题文章信息数量上限，Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
+        typed (bool, optional): 为 True 时返回 ArticleSummary 对象而非字典，内存占用更小. Defaults to False.
+
+    Yields:
+        AsyncIterator[Dict], None]: 文章信息
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+        await AssertCollectionStatusNormal(collection_url)
+    async for item in AsyncIterPages(
+        lambda page: GetCollectionArticlesInfo(
+            collection_url, page, count, sorting_method, typed=typed, disable_check=True
+        ),
+        max_count,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    ):
+        yield item
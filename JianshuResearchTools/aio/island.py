@@ -0,0 +1,281 @@
+from typing import AsyncGenerator, Callable, Dict, List, Literal, Optional
+
+from ..assert_funcs import (
+    AssertIslandJsonDataNormal,
+    AssertIslandPostUrl,
+    AssertIslandUrl,
+)
+from ..convert import (
+    IslandPostSlugToIslandPostUrl,
+    IslandPostUrlToIslandPostSlug,
+    IslandUrlToIslandSlug,
+)
+from ..island import _ParseIslandAllBasicData, _ParseIslandPosts
+from ..utils import AsyncIterPagesById, Cursor
+from .assert_funcs import AssertIslandStatusNormal
+from .basic_apis import (
+    GetIslandJsonDataApi,
+    GetIslandPostJsonDataApi,
+    GetIslandPostsJsonDataApi,
+)
+
+__all__ = [
+    "GetIslandName",
+    "GetIslandAvatarUrl",
+    "GetIslandIntroduction",
+    "GetIslandMembersCount",
+    "GetIslandPostsCount",
+    "GetIslandCategory",
+    "GetIslandPostFullContent",
+    "GetIslandPosts",
+    "GetIslandAllBasicData",
+    "GetIslandAllPostsData",
+]
+
+
+async def GetIslandName(island_url: str, disable_check: bool = False) -> str:
+    """获取小岛名称
+
+    Args:
+        island_url (str): 小岛 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 小岛名称
+    """
+    if not disable_check:
+        AssertIslandUrl(island_url)
+    json_obj = await GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
+    return json_obj["name"]
+
+
+async def GetIslandAvatarUrl(island_url: str, disable_check: bool = False) -> str:
+    """获取小岛头像链接
+
+    Args:
+        island_url (str): 小岛 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 小岛头像链接
+    """
+    if not disable_check:
+        AssertIslandUrl(island_url)
+    json_obj = await GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
+    return json_obj["image"]
+
+
+async def GetIslandIntroduction(island_url: str, disable_check: bool = False) -> str:
+    """获取小岛简介
+
+    Args:
+        island_url (str): 小岛 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 小岛简介
+    """
+    if not disable_check:
+        AssertIslandUrl(island_url)
+    json_obj = await GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
+    return json_obj["intro"]
+
+
+async def GetIslandMembersCount(island_url: str, disable_check: bool = False) -> int:
+    """获取小岛成员数量
+
+    Args:
+        island_url (str): 小岛 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 成员数量
+    """
+    if not disable_check:
+        AssertIslandUrl(island_url)
+    json_obj = await GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
+    return json_obj["members_count"]
+
+
+async def GetIslandPostsCount(island_url: str, disable_check: bool = False) -> int:
+    """获取小岛帖子数量
+
+    Args:
+        island_url (str): 小岛 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 帖子数量
+    """
+    if not disable_check:
+        AssertIslandUrl(island_url)
+    json_obj = await GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
+    return json_obj["posts_count"]
+
+
+async def GetIslandCategory(island_url: str, disable_check: bool = False) -> str:
+    """获取小岛分类
+
+    Args:
+        island_url (str): 小岛 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 分类
+    """
+    if not disable_check:
+        AssertIslandUrl(island_url)
+    json_obj = await GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
+    return json_obj["category"]["name"]
+
+
+async def GetIslandPostFullContent(post_url: str, disable_check: bool = False) -> str:
+    """获取小岛帖子完整内容
+
+    Args:
+        post_url (str): 小岛帖子 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 小岛帖子完整内容
+    """
+    if not disable_check:
+        AssertIslandPostUrl(post_url)
+        await AssertIslandStatusNormal(post_url)
+    json_obj = await GetIslandPostJsonDataApi(IslandPostUrlToIslandPostSlug(post_url))
+    return json_obj["content"]
+
+
+async def GetIslandPosts(
+    island_url: str,
+    start_sort_id: Optional[int] = None,
+    count: int = 10,
+    topic_id: Optional[int] = None,
+    sorting_method: Literal["time", "comment_time", "hot"] = "time",
+    get_full_content: bool = False,
+    disable_check: bool = False,
+) -> List[Dict]:
+    """获取小岛帖子信息
+
+    Args:
+        island_url (str): 小岛 URL
+        start_sort_id (int, optional): 起始序号，等于上一条数据的序号. Defaults to None.
+        count (int, optional): 每次返回的数据数量. Defaults to 10.
+        topic_id (int, optional): 话题 ID. Defaults to None.
+        sorting_method (Literal["time", "comment_time", "hot"], optional): 排序方法，"time" 为按照发布时间排序，
+        "comment_time" 为按照最近评论时间排序，"hot" 为按照热度排序. Defaults to "time".
+        get_full_content (bool, optional): 为 True 时，当检测到获取的帖子内容不全时，
+        自动调用 GetIslandPostFullContent 函数获取完整内容并替换. Defaults to False.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        List[Dict]: 帖子信息
+    """
+    if not disable_check:
+        AssertIslandUrl(island_url)
+        await AssertIslandStatusNormal(island_url)
+    order_by = {
+        "time": "latest",
+        "hot": "hot",
+        "most_valuable": "best",
+    }[sorting_method]
+    json_obj = await GetIslandPostsJsonDataApi(
+        group_slug=IslandUrlToIslandSlug(island_url),
+        max_id=start_sort_id,
+        count=count,
+        topic_id=topic_id,
+        order_by=order_by,
+    )
+    result = _ParseIslandPosts(json_obj)
+    if get_full_content:
+        for item_data in result:
+            if "..." in item_data["content"]:  # 获取到的帖子内容不全
+                item_data["content"] = await GetIslandPostFullContent(
+                    IslandPostSlugToIslandPostUrl(item_data["pslug"]),
+                    disable_check=True,
+                )
+    return result
+
+
+async def GetIslandAllBasicData(island_url: str, disable_check: bool = False) -> Dict:
+    """获取小岛的所有基础信息
+
+    Args:
+        island_url (str): 小岛 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 小岛基础信息
+    """
+    if not disable_check:
+        AssertIslandUrl(island_url)
+    json_obj = await GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
+    return _ParseIslandAllBasicData(json_obj)
+
+
+async def GetIslandAllPostsData(
+    island_url: str,
+    count: int = 10,
+    topic_id: Optional[int] = None,
+    sorting_method: Literal["time", "comment_time", "hot"] = "time",
+    get_full_content: bool = False,
+    max_count: Optional[int] = None,
+    disable_check: bool = False,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+) -> AsyncGenerator[Dict, None]:
+    """获取小岛的所有帖子信息
+
+    Args:
+        island_url (str): 小岛 URL
+        count (int, optional): 单次获取的数据数量，会影响性能. Defaults to 10.
+        topic_id (int, optional): 话题 ID. Defaults to None.
+        sorting_method (Literal["time", "comment_time", "hot"], optional): 排序方法，time 为按照发布时间排序，
+        comment_time 为按照最近评论时间排序，hot 为按照热度排序. Defaults to "time".
+        get_full_content (bool, optional): 为 True 时，当检测到获取的帖子内容不全时，
+        自动调用 GetIslandPostFullContent 函数获取完整内容并替换. Defaults to False.
+        max_count (int, optional): 获取的小岛帖子信息数量上限，Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
+
+    Yields:
+        AsyncIterator[Dict], None]: 帖子信息
+    """
+    if not disable_check:
+        AssertIslandUrl(island_url)
+        await AssertIslandStatusNormal(island_url)
+    async for item in AsyncIterPagesById(
+        lambda start_sort_id: GetIslandPosts(
+            island_url,
+            start_sort_id,
+            count,
+            topic_id,
+            sorting_method,
+            get_full_content,
+            disable_check=True,
+        ),
+        lambda result: result[-1]["sorted_id"],
+        max_count,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    ):
+        yield item
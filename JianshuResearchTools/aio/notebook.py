@@ -0,0 +1,241 @@
+from datetime import datetime
+from typing import AsyncGenerator, Callable, Dict, List, Literal, Optional, Union
+
+from ..assert_funcs import AssertNotebookJsonDataNormal, AssertNotebookUrl
+from ..notebook import (
+    _ParseNotebookAllBasicData,
+    _ParseNotebookArticlesInfo,
+    _ParseNotebookAuthorInfo,
+)
+from ..records import ArticleSummary
+from ..utils import AsyncIterPages, Cursor
+from .assert_funcs import AssertNotebookStatusNormal
+from .basic_apis import GetNotebookArticlesJsonDataApi, GetNotebookJsonDataApi
+
+__all__ = [
+    "GetNotebookName",
+    "GetNotebookArticlesCount",
+    "GetNotebookAuthorInfo",
+    "GetNotebookWordage",
+    "GetNotebookSubscribersCount",
+    "GetNotebookUpdateTime",
+    "GetNotebookArticlesInfo",
+    "GetNotebookAllBasicData",
+    "GetNotebookAllArticlesInfo",
+]
+
+
+async def GetNotebookName(notebook_url: str, disable_check: bool = False) -> str:
+    """获取文集名称
+
+    Args:
+        notebook_url (str): 文集 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 文集名称
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+    json_obj = await GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
+    return json_obj["name"]
+
+
+async def GetNotebookArticlesCount(
+    notebook_url: str, disable_check: bool = False
+) -> int:
+    """获取文集中的文章数量
+
+    Args:
+        notebook_url (str): 文集 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 文章数量
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+    json_obj = await GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
+    return json_obj["notes_count"]
+
+
+async def GetNotebookAuthorInfo(notebook_url: str, disable_check: bool = False) -> Dict:
+    """获取文集作者的信息
+
+    Args:
+        notebook_url (str): 文集 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 作者信息
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+    json_obj = await GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
+    return _ParseNotebookAuthorInfo(json_obj)
+
+
+async def GetNotebookWordage(notebook_url: str, disable_check: bool = False) -> int:
+    """获取文集中所有文章的总字数
+
+    Args:
+        notebook_url (str): 文集 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 文集中的文章总字数
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+    json_obj = await GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
+    return json_obj["wordage"]
+
+
+async def GetNotebookSubscribersCount(
+    notebook_url: str, disable_check: bool = False
+) -> int:
+    """获取文集的订阅者数量
+
+    Args:
+        notebook_url (str): 文集 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 文集订阅者数量
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+    json_obj = await GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
+    return json_obj["subscribers_count"]
+
+
+async def GetNotebookUpdateTime(
+    notebook_url: str, disable_check: bool = False
+) -> datetime:
+    """获取文集的更新时间
+
+    Args:
+        notebook_url (str): 文集 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        datetime: 更新时间
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+    json_obj = await GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
+    return datetime.fromtimestamp(json_obj["last_updated_at"])
+
+
+async def GetNotebookArticlesInfo(
+    notebook_url: str,
+    page: int = 1,
+    count: int = 10,
+    sorting_method: Literal["time", "comment_time", "hot"] = "time",
+    disable_check: bool = False,
+    typed: bool = False,
+) -> Union[List[Dict], List[ArticleSummary]]:
+    """获取文集中的文章信息
+
+    Args:
+        notebook_url (str): 文集 URL
+        page (int, optional): 页码. Defaults to 1.
+        count (int, optional): 每次返回的数据数量. Defaults to 10.
+        sorting_method (Literal["time", "comment_time", "hot"], optional): 排序方法，"time" 为按照发布时间排序，
+        "comment_time" 为按照最近评论时间排序，"hot" 为按照热度排序. Defaults to "time".
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        typed (bool, optional): 为 True 时返回 ArticleSummary 对象而非字典，内存占用更小. Defaults to False.
+
+    Returns:
+        Union[List[Dict], List[ArticleSummary]]: 文章信息
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+        await AssertNotebookStatusNormal(notebook_url)
+    order_by = {
+        "time": "added_at",
+        "comment_time": "commented_at",
+        "hot": "top",
+    }[sorting_method]
+    json_obj = await GetNotebookArticlesJsonDataApi(
+        notebook_url=notebook_url, page=page, count=count, order_by=order_by
+    )
+    if typed:
+        return [ArticleSummary.from_json(item) for item in json_obj]
+    return _ParseNotebookArticlesInfo(json_obj)
+
+
+async def GetNotebookAllBasicData(
+    notebook_url: str, disable_check: bool = False
+) -> Dict:
+    """获取文集的所有基础信息
+
+    Args:
+        notebook_url (str): 文集 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 文集基础信息
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+    json_obj = await GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
+    return _ParseNotebookAllBasicData(json_obj)
+
+
+async def GetNotebookAllArticlesInfo(
+    notebook_url: str,
+    count: int = 10,
+    sorting_method: Literal["time", "comment_time", "hot"] = "time",
+    max_count: Optional[int] = None,
+    disable_check: bool = False,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+    typed: bool = False,
+) -> AsyncGenerator[Union[Dict, ArticleSummary], None]:
+    """获取文集中的全部文章信息
+
+    Args:
+        notebook_url (str): 文集 URL
+        count (int, optional): 单次获取的数据数量，会影响性能. Defaults to 10.
+        sorting_method (Literal["time", "comment_time", "hot"], optional): 排序方法，time 为按照发布时间排序，
+        comment_time 为按照最近评论时间排序，hot 为按照热度排序. Defaults to "time".
+        max_count (int, optional): 获取的文集文章信息数量上限，Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
+        typed (bool, optional): 为 True 时返回 ArticleSummary 对象而非字典，内存占用更小. Defaults to False.
+
+    Yields:
+        AsyncIterator[Dict], None]: 文章信息
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+        await AssertNotebookStatusNormal(notebook_url)
+    async for item in AsyncIterPages(
+        lambda page: GetNotebookArticlesInfo(
+            notebook_url, page, count, sorting_method, typed=typed, disable_check=True
+        ),
+        max_count,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    ):
+        yield item
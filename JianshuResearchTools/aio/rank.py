@@ -0,0 +1,323 @@
+from asyncio import Semaphore, gather
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Set, TypeVar
+
+from ..convert import UserSlugToUserUrl
+from ..exceptions import APIError, ResourceError
+from ..rank import (
+    DiffAssetsRankSnapshots,
+    _CheckAssetsRankPage,
+    _DeduplicateAssetsRankItems,
+    _FillAssetsRankItemFP,
+    _GetAssetsRankSinceIds,
+    _GetDatesInRange,
+    _ParseArticleFPRankBasicInfo,
+    _ParseArticleFPRankData,
+    _ParseAssetsRankData,
+    _ParseDailyArticleRankData,
+    _ParseUserFPRankData,
+)
+from .basic_apis import (
+    GetArticlesFPRankListJsonDataApi,
+    GetAssetsRankJsonDataApi,
+    GetDailyArticleRankListJsonDataApi,
+)
+from .user import GetUserFPCount
+
+__all__ = [
+    "GetAssetsRankData",
+    "GetAllAssetsRankData",
+    "GetAssetsRankSnapshot",
+    "DiffAssetsRankSnapshots",
+    "GetDailyArticleRankData",
+    "GetUserFPRankData",
+    "GetArticleFPRankBasicInfo",
+    "GetUserFPRankData",
+    "GetArticleFPRankDataRange",
+    "GetArticleFPRankBasicInfoRange",
+    "GetUserFPRankDataRange",
+]
+
+T = TypeVar("T")
+
+
+async def GetAssetsRankData(
+    start_id: int = 1, get_full: bool = False, concurrency: int = 8
+) -> List[Dict]:
+    """获取资产排行榜信息
+
+    ! 2.10 之前的版本中存在数据错误，总资产（assets）以简书钻（FP）字段返回，
+    ! 为保证向后兼容，FP 字段在 v3 中暂不移除，其值与 assets 字段相同。
+    ! 若 get_full = True，将获取真实的简书钻数据，并替换兼容用途的 FP 字段，简书贝（FTN）字段也将正确计算。
+
+    Args:
+        start_id (int, optional): 起始位置. Defaults to 1.
+        get_full (bool, optional): 为 True 时获取简书贝和总资产数据. Defaults to False.
+        concurrency (int, optional): get_full 为 True 时同时获取简书钻数据的用户数量上限. Defaults to 8.
+
+    Returns:
+        List[Dict]: 资产排行榜信息
+    """
+    result = await _FetchAssetsRankPage(start_id - 1)  # 索引下标为 0
+    if get_full:
+        if concurrency <= 0:
+            raise ValueError("并发数量上限必须大于 0")
+        semaphore = Semaphore(concurrency)
+
+        async def FillItemFP(item_data: Dict) -> None:
+            user_url = UserSlugToUserUrl(item_data["uslug"])
+            async with semaphore:
+                try:
+                    fp_count = await GetUserFPCount(user_url, disable_check=True)
+                except APIError:
+                    return
+            _FillAssetsRankItemFP(item_data, fp_count)
+
+        await gather(*(FillItemFP(item_data) for item_data in result))
+    return result
+
+
+async def _FetchAssetsRankPage(since_id: int) -> List[Dict]:
+    json_obj = await GetAssetsRankJsonDataApi(max_id=1000000000, since_id=since_id)
+    return _ParseAssetsRankData(json_obj)
+
+
+async def GetAllAssetsRankData(
+    start_id: int = 1, max_count: int = 1000, concurrency: int = 8
+) -> AsyncGenerator[Dict, None]:
+    """将资产排行榜按位置分段并发获取，依次返回全部数据
+
+    排行榜在获取过程中可能发生变动，同一用户出现在多个分段中时只返回排名最靠前的一条数据；
+    分段大小以第一页返回的数据条数为准
+
+    Args:
+        start_id (int, optional): 起始位置. Defaults to 1.
+        max_count (int, optional): 获取的数据数量上限. Defaults to 1000.
+        concurrency (int, optional): 同时获取的分段数量上限. Defaults to 8.
+
+    Raises:
+        ResourceError: 排行榜中间的分段返回的数据不足一页，可能遗漏数据时抛出此异常
+
+    Yields:
+        Iterator[Dict, None, None]: 资产排行榜信息，FP 字段含义同 GetAssetsRankData
+    """
+    if concurrency <= 0:
+        raise ValueError("并发数量上限必须大于 0")
+    since_id = start_id - 1  # 索引下标为 0
+    first_page = await _FetchAssetsRankPage(since_id)
+    # 分段大小以接口实际返回的数据条数为准
+    page_size = len(first_page)
+    if not page_size:
+        return
+    since_ids = _GetAssetsRankSinceIds(since_id, max_count, page_size)
+    seen_uids: Set[int] = set()
+    short_page_since_id = None
+    count = 0
+    pages = [(since_id, first_page)]
+    next_index = 0
+    while pages:
+        for page_since_id, page in pages:
+            if not page:  # 已到达排行榜末尾
+                return
+            short_page_since_id = _CheckAssetsRankPage(
+                page_since_id, page, page_size, short_page_since_id
+            )
+            for item_data in _DeduplicateAssetsRankItems(page, seen_uids):
+                yield item_data
+                count += 1
+                if count == max_count:
+                    return
+        batch = since_ids[next_index : next_index + concurrency]
+        next_index += concurrency
+        pages = list(
+            zip(batch, await gather(*(_FetchAssetsRankPage(x) for x in batch)))
+        )
+
+
+async def GetAssetsRankSnapshot(max_count: int = 1000, concurrency: int = 8) -> Dict:
+    """获取带有时间戳的资产排行榜快照，可使用 DiffAssetsRankSnapshots 与之前的快照对比
+
+    Args:
+        max_count (int, optional): 获取的数据数量上限. Defaults to 1000.
+        concurrency (int, optional): 同时获取的分段数量上限. Defaults to 8.
+
+    Returns:
+        Dict: 资产排行榜快照
+    """
+    fetch_time = datetime.now()
+    return {
+        "fetch_time": fetch_time,
+        "data": [
+            item_data
+            async for item_data in GetAllAssetsRankData(1, max_count, concurrency)
+        ],
+    }
+
+
+async def GetDailyArticleRankData() -> List[Dict]:
+    """获取日更排行榜信息
+
+    Returns:
+        List[Dict]: 日更排行榜信息
+    """
+    json_obj = await GetDailyArticleRankListJsonDataApi()
+    return _ParseDailyArticleRankData(json_obj)
+
+
+async def GetArticleFPRankData(target_date: str = "latest") -> List[Dict]:
+    """获取文章收益排行榜信息
+
+    目前只能获取 2020 年 6 月 20 日之后的数据。
+
+    Args:
+        target_date (str, optional): 日期，格式“YYYYMMDD”. Defaults to "latest".
+
+    Raises:
+        ResourceError: 对应日期的排行榜数据为空时抛出此异常
+
+    Returns:
+        List[Dict]: 文章收益排行榜信息
+    """
+    if target_date == "latest":
+        target_date = (datetime.today() + timedelta(days=-1)).strftime(r"%Y%m%d")
+    json_obj = await GetArticlesFPRankListJsonDataApi(date=target_date, type_=None)
+    if json_obj["notes"] == []:
+        raise ResourceError(f"对应日期 {target_date} 的排行榜数据为空")
+    return _ParseArticleFPRankData(json_obj)
+
+
+async def GetArticleFPRankBasicInfo(target_date: str = "latest") -> Dict:
+    """获取文章收益排行榜信息
+
+    目前只能获取 2020 年 6 月 20 日之后的数据。
+
+    Args:
+        target_date (str, optional): 日期，格式“YYYYMMDD”. Defaults to "latest".
+
+    Raises:
+        ResourceError: 对应日期的排行榜数据为空时抛出此异常
+
+    Returns:
+        Dict: 文章收益排行榜基础信息
+    """
+    if target_date == "latest":
+        target_date = (date.today() + timedelta(days=-1)).strftime("%Y%m%d")
+    json_obj = await GetArticlesFPRankListJsonDataApi(date=target_date, type_=None)
+    if json_obj["notes"] == []:
+        raise ResourceError(f"对应日期 {target_date} 的排行榜数据为空")
+    return _ParseArticleFPRankBasicInfo(json_obj)
+
+
+async def GetUserFPRankData(
+    target_date: str = "latest", rank_type: str = "all"
+) -> List[Dict]:
+    """获取用户收益排行榜信息
+
+    目前只能获取 2020 年 6 月 20 日之后的数据。
+
+    Args:
+        target_date (str, optional): 日期，格式“YYYYMMDD”. Defaults to "latest".
+        rank_type (str, optional): 排行榜分类，"all" 为总收益榜，"write" 为内容收益榜，"vote" 为投票收益榜
+
+    Raises:
+        ResourceError: 对应日期的排行榜数据为空时抛出此异常
+
+    Returns:
+        List[Dict]: 用户收益排行榜信息
+    """
+    type_ = {"all": None, "write": "note", "vote": "like"}[rank_type]
+    json_obj = await GetArticlesFPRankListJsonDataApi(date=target_date, type_=type_)
+    if json_obj["users"] == []:
+        raise ResourceError(f"对应日期 {target_date} 的排行榜数据为空")
+    return _ParseUserFPRankData(json_obj)
+
+
+async def _GetFPRankRange(
+    func: Callable[[str], Awaitable[T]],
+    start_date: str,
+    end_date: str,
+    concurrency: int,
+) -> Dict[str, T]:
+    if concurrency <= 0:
+        raise ValueError("并发数量上限必须大于 0")
+    dates = _GetDatesInRange(start_date, end_date)
+    semaphore = Semaphore(concurrency)
+
+    async def Fetch(target_date: str) -> Any:
+        async with semaphore:
+            try:
+                return await func(target_date)
+            except ResourceError:  # 该日期没有排行榜数据
+                return None
+
+    results = await gather(*(Fetch(target_date) for target_date in dates))
+    return {
+        target_date: data
+        for target_date, data in zip(dates, results)
+        if data is not None
+    }
+
+
+async def GetArticleFPRankDataRange(
+    start_date: str, end_date: str, concurrency: int = 8
+) -> Dict[str, List[Dict]]:
+    """并发获取日期范围内每一天的文章收益排行榜信息
+
+    启用响应缓存（enable_response_cache）后，两天前及更早日期的数据将被永久缓存，
+    再次获取时只会对缓存中不存在的日期与最近的日期发送请求
+
+    Args:
+        start_date (str): 起始日期，格式“YYYYMMDD”
+        end_date (str): 结束日期（包含），格式“YYYYMMDD”
+        concurrency (int, optional): 同时获取的日期数量上限. Defaults to 8.
+
+    Returns:
+        Dict[str, List[Dict]]: 以日期为键的文章收益排行榜信息，排行榜数据为空的日期不包含在内
+    """
+    return await _GetFPRankRange(
+        GetArticleFPRankData, start_date, end_date, concurrency
+    )
+
+
+async def GetArticleFPRankBasicInfoRange(
+    start_date: str, end_date: str, concurrency: int = 8
+) -> Dict[str, Dict]:
+    """并发获取日期范围内每一天的文章收益排行榜基础信息
+
+    缓存行为同 GetArticleFPRankDataRange
+
+    Args:
+        start_date (str): 起始日期，格式“YYYYMMDD”
+        end_date (str): 结束日期（包含），格式“YYYYMMDD”
+        concurrency (int, optional): 同时获取的日期数量上限. Defaults to 8.
+
+    Returns:
+        Dict[str, Dict]: 以日期为键的文章收益排行榜基础信息，排行榜数据为空的日期不包含在内
+    """
+    return await _GetFPRankRange(
+        GetArticleFPRankBasicInfo, start_date, end_date, concurrency
+    )
+
+
+async def GetUserFPRankDataRange(
+    start_date: str, end_date: str, rank_type: str = "all", concurrency: int = 8
+) -> Dict[str, List[Dict]]:
+    """并发获取日期范围内每一天的用户收益排行榜信息
+
+    缓存行为同 GetArticleFPRankDataRange
+
+    Args:
+        start_date (str): 起始日期，格式“YYYYMMDD”
+        end_date (str): 结束日期（包含），格式“YYYYMMDD”
+        rank_type (str, optional): 排行榜分类，"all" 为总收益榜，"write" 为内容收益榜，"vote" 为投票收益榜
+        concurrency (int, optional): 同时获取的日期数量上限. Defaults to 8.
+
+    Returns:
+        Dict[str, List[Dict]]: 以日期为键的用户收益排行榜信息，排行榜数据为空的日期不包含在内
+    """
+    return await _GetFPRankRange(
+        lambda target_date: GetUserFPRankData(target_date, rank_type),
+        start_date,
+        end_date,
+        concurrency,
+    )
@@ -0,0 +1,705 @@
+from datetime import datetime
+from typing import AsyncGenerator, Callable, Dict, List, Literal, Optional, Union
+
+from ..assert_funcs import AssertUserJsonDataNormal, AssertUserUrl
+from ..convert import UserUrlToUserSlug
+from ..records import ArticleSummary
+from ..user import (
+    _ParseUserAllBasicData,
+    _ParseUserArticlesCount,
+    _ParseUserArticlesInfo,
+    _ParseUserAssetsCount,
+    _ParseUserBadgesList,
+    _ParseUserCollectionsInfo,
+    _ParseUserFollowListInfo,
+    _ParseUserFPCount,
+    _ParseUserFTNCount,
+    _ParseUserGender,
+    _ParseUserIntroductionText,
+    _ParseUserNextAnniversaryDay,
+    _ParseUserNotebooksInfo,
+    _ParseUserTimelineInfo,
+    _ParseUserVIPInfo,
+)
+from ..utils import AsyncIterPages, AsyncIterPagesById, Cursor
+from .assert_funcs import AssertUserStatusNormal
+from .basic_apis import (
+    GetUserArticlesListJsonDataApi,
+    GetUserCollectionsAndNotebooksJsonDataApi,
+    GetUserFollowersListHtmlDataApi,
+    GetUserFollowingListHtmlDataApi,
+    GetUserJsonDataApi,
+    GetUserNextAnniversaryDayHtmlDataApi,
+    GetUserPCHtmlDataApi,
+    GetUserTimelineHtmlDataApi,
+)
+
+__all__ = [
+    "GetUserName",
+    "GetUserGender",
+    "GetUserFollowersCount",
+    "GetUserFansCount",
+    "GetUserArticlesCount",
+    "GetUserWordage",
+    "GetUserLikesCount",
+    "GetUserAssetsCount",
+    "GetUserFPCount",
+    "GetUserFTNCount",
+    "GetUserBadgesList",
+    "GetUserLastUpdateTime",
+    "GetUserVIPInfo",
+    "GetUserIntroductionHtml",
+    "GetUserIntroductionText",
+    "GetUserNextAnniversaryDay",
+    "GetUserNotebooksInfo",
+    "GetUserOwnCollectionsInfo",
+    "GetUserManageableCollectionsInfo",
+    "GetUserArticlesInfo",
+    "GetUserFollowingInfo",
+    "GetUserFansInfo",
+    "GetUserAllBasicData",
+    "GetUserTimelineInfo",
+    "GetUserAllArticlesInfo",
+    "GetUserAllFollowingInfo",
+    "GetUserAllFansInfo",
+    "GetUserAllTimelineInfo",
+]
+
+
+async def GetUserName(user_url: str, disable_check: bool = False) -> str:
+    """获取用户昵称
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 用户昵称
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    return json_obj["nickname"]
+
+
+async def GetUserGender(user_url: str, disable_check: bool = False) -> int:
+    """获取用户性别
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 用户性别，0 为未知，1 为男，2 为女
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    return _ParseUserGender(json_obj)
+
+
+async def GetUserFollowersCount(user_url: str, disable_check: bool = False) -> int:
+    """获取用户关注人数
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 用户关注人数
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    return json_obj["following_users_count"]
+
+
+async def GetUserFansCount(user_url: str, disable_check: bool = False) -> int:
+    """获取用户粉丝数
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 用户粉丝数
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    return json_obj["followers_count"]
+
+
+async def GetUserArticlesCount(user_url: str, disable_check: bool = False) -> int:
+    """获取用户文章数
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 用户文章数
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    html_obj = await GetUserPCHtmlDataApi(user_url)
+    return _ParseUserArticlesCount(html_obj)
+
+
+async def GetUserWordage(user_url: str, disable_check: bool = False) -> int:
+    """获取用户文章总字数
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 用户文章总字数
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    return json_obj["total_wordage"]
+
+
+async def GetUserLikesCount(user_url: str, disable_check: bool = False) -> int:
+    """获取用户被喜欢数
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        int: 用户被喜欢数
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    return json_obj["total_likes_count"]
+
+
+async def GetUserAssetsCount(user_url: str, disable_check: bool = False) -> float:
+    """获取用户总资产
+
+    # ! 当用户资产大于 10000 时，结果的精确度将下降到 1000
+    # ! 当用户没有文章时，该函数将抛出 APIError 异常
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Raises:
+        APIError: 由于用户没有文章导致无法获取总资产信息时抛出此异常
+
+    Returns:
+        float: 用户总资产
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    html_obj = await GetUserPCHtmlDataApi(user_url)
+    return _ParseUserAssetsCount(html_obj)
+
+
+async def GetUserFPCount(user_url: str, disable_check: bool = False) -> float:
+    """获取用户简书钻数量
+
+    # ! 当用户没有文章时，该函数将抛出 APIError 异常
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Raises:
+        APIError: 由于用户没有文章导致无法获取总资产信息时抛出此异常
+
+    Returns:
+        float: 用户简书钻数量
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    return _ParseUserFPCount(json_obj)
+
+
+async def GetUserFTNCount(user_url: str, disable_check: bool = False) -> float:
+    """获取用户简书贝数量
+
+    # ! 视用户资产配置情况不同，该函数获取到的数值会有不大于 1000 的偏差
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        float: 用户简书贝数量
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    html_obj = await GetUserPCHtmlDataApi(user_url)
+    return _ParseUserFTNCount(json_obj, html_obj)
+
+
+async def GetUserBadgesList(user_url: str, disable_check: bool = False) -> List[str]:
+    """获取用户徽章列表
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        List[str]: 用户徽章列表
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    html_obj = await GetUserPCHtmlDataApi(user_url)
+    return _ParseUserBadgesList(html_obj)
+
+
+async def GetUserLastUpdateTime(user_url: str, disable_check: bool = False) -> datetime:
+    """获取用户文章最后更新时间
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        datetime: 用户文章最后更新时间
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    return datetime.fromtimestamp(json_obj["last_updated_at"])
+
+
+async def GetUserVIPInfo(user_url: str, disable_check: bool = False) -> Dict:
+    """获取用户会员信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 用户会员信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    return _ParseUserVIPInfo(json_obj)
+
+
+async def GetUserIntroductionHtml(user_url: str, disable_check: bool = False) -> str:
+    """获取 Html 格式的用户简介
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: Html 格式的用户个人简介
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    return json_obj["intro"]
+
+
+async def GetUserIntroductionText(user_url: str, disable_check: bool = False) -> str:
+    """获取纯文本格式的用户简介
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        str: 纯文本格式的用户个人简介
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    return _ParseUserIntroductionText(json_obj)
+
+
+async def GetUserNextAnniversaryDay(
+    user_url: str, disable_check: bool = False
+) -> datetime:
+    """获取用户的下一次简书周年纪念日
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        datetime: 用户的下一次简书周年纪念日
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    user_slug = UserUrlToUserSlug(user_url)
+    html_obj = await GetUserNextAnniversaryDayHtmlDataApi(user_slug)
+    return _ParseUserNextAnniversaryDay(html_obj)
+
+
+async def GetUserNotebooksInfo(
+    user_url: str, disable_check: bool = False
+) -> List[Dict]:
+    """获取用户文集与连载信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        List[Dict]: 用户文集与连载信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    json_obj = await GetUserCollectionsAndNotebooksJsonDataApi(
+        user_url=user_url, user_slug=UserUrlToUserSlug(user_url)
+    )
+    return _ParseUserNotebooksInfo(json_obj)
+
+
+async def GetUserOwnCollectionsInfo(
+    user_url: str, disable_check: bool = False
+) -> List[Dict]:
+    """获取用户自己创建的专题信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        List[Dict]: 用户自己创建的专题信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    json_obj = await GetUserCollectionsAndNotebooksJsonDataApi(
+        user_url=user_url, user_slug=UserUrlToUserSlug(user_url)
+    )
+    return _ParseUserCollectionsInfo(json_obj["own_collections"])
+
+
+async def GetUserManageableCollectionsInfo(
+    user_url: str, disable_check: bool = False
+) -> List[Dict]:
+    """获取用户管理的专题信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        List[Dict]: 用户管理的专题信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    json_obj = await GetUserCollectionsAndNotebooksJsonDataApi(
+        user_url=user_url, user_slug=UserUrlToUserSlug(user_url)
+    )
+    return _ParseUserCollectionsInfo(json_obj["manageable_collections"])
+
+
+async def GetUserArticlesInfo(
+    user_url: str,
+    page: int = 1,
+    count: int = 10,
+    sorting_method: Literal["time", "comment_time", "hot"] = "time",
+    disable_check: bool = False,
+    typed: bool = False,
+) -> Union[List[Dict], List[ArticleSummary]]:
+    """获取用户文章信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        page (int, optional): 页码，与网页端文章顺序相同. Defaults to 1.
+        count (int, optional): 获取的文章数量. Defaults to 10.
+        sorting_method (Literal["time", "comment_time", "hot"], optional): 排序方法，time 为按照发布时间排序，
+        comment_time 为按照最近评论时间排序，hot 为按照热度排序. Defaults to "time".
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        typed (bool, optional): 为 True 时返回 ArticleSummary 对象而非字典，内存占用更小. Defaults to False.
+
+    Returns:
+        Union[List[Dict], List[ArticleSummary]]: 用户文章信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    order_by = {
+        "time": "added_at",
+        "comment_time": "commented_at",
+        "hot": "top",
+    }[sorting_method]
+    json_obj = await GetUserArticlesListJsonDataApi(
+        user_url=user_url, page=page, count=count, order_by=order_by
+    )
+    if typed:
+        return [ArticleSummary.from_json(item) for item in json_obj]
+    return _ParseUserArticlesInfo(json_obj)
+
+
+async def GetUserFollowingInfo(
+    user_url: str, page: int = 1, disable_check: bool = False
+) -> List[Dict]:
+    """获取用户关注者信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        page (int, optional): 关注列表页码. Defaults to 1.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        List[Dict]: 用户关注者信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    html_obj = await GetUserFollowingListHtmlDataApi(user_url=user_url, page=page)
+    return _ParseUserFollowListInfo(html_obj)
+
+
+async def GetUserFansInfo(
+    user_url: str, page: int = 1, disable_check: bool = False
+) -> List[Dict]:
+    """获取用户粉丝信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        page (int, optional): 粉丝列表页码. Defaults to 1.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        List[Dict]: 用户粉丝信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    html_obj = await GetUserFollowersListHtmlDataApi(user_url=user_url, page=page)
+    return _ParseUserFollowListInfo(html_obj)
+
+
+async def GetUserAllBasicData(user_url: str, disable_check: bool = False) -> Dict:
+    """获取用户的所有基础信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 用户基础信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+    json_obj = await GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    html_obj = await GetUserPCHtmlDataApi(user_url)
+    anniversary_day_html_obj = await GetUserNextAnniversaryDayHtmlDataApi(
+        UserUrlToUserSlug(user_url)
+    )
+    return _ParseUserAllBasicData(
+        user_url, json_obj, html_obj, anniversary_day_html_obj
+    )
+
+
+async def GetUserTimelineInfo(
+    user_url: str, max_id: Optional[int] = 1000000000, disable_check: bool = False
+) -> List[Dict]:
+    """获取用户动态信息
+
+    ！在极少数情况下可能会遇到不在可解析列表中的动态类型，此时程序会跳过这条动态，不会抛出异常
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        max_id (int, optional): 最大 id，值等于上一次获取到的数据中最后一项的 operation_id. Defaults to 1000000000.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        List[Dict]: 用户动态信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    user_slug = UserUrlToUserSlug(user_url)
+    html_obj = await GetUserTimelineHtmlDataApi(user_slug, max_id)
+    return _ParseUserTimelineInfo(html_obj)
+
+
+async def GetUserAllArticlesInfo(
+    user_url: str,
+    count: int = 10,
+    sorting_method: Literal["time", "comment_time", "hot"] = "time",
+    max_count: Optional[int] = None,
+    disable_check: bool = False,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+    typed: bool = False,
+) -> AsyncGenerator[Union[Dict, ArticleSummary], None]:
+    """获取用户的所有文章信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        count (int, optional): 单次获取的数据数量，会影响性能. Defaults to 10.
+        sorting_method (Literal["time", "comment_time", "hot"], optional): 排序方法，time 为按照发布时间排序，
+        comment_time 为按照最近评论时间排序，hot 为按照热度排序. Defaults to "time".
+        max_count (int, optional): 获取的文章信息数量上限，Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
+        typed (bool, optional): 为 True 时返回 ArticleSummary 对象而非字典，内存占用更小. Defaults to False.
+
+    Yields:
+        AsyncIterator[Dict], None]: 文章信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    async for item in AsyncIterPages(
+        lambda page: GetUserArticlesInfo(
+            user_url, page, count, sorting_method, typed=typed, disable_check=True
+        ),
+        max_count,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    ):
+        yield item
+
+
+async def GetUserAllFollowingInfo(
+    user_url: str,
+    max_count: Optional[int] = None,
+    disable_check: bool = False,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+) -> AsyncGenerator[Dict, None]:
+    """获取用户的所有关注者信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        max_count (int, optional): 获取的关注者信息数量上限，Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
+
+    Yields:
+        AsyncIterator[Dict], None]: 关注者信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    async for item in AsyncIterPages(
+        lambda page: GetUserFollowingInfo(user_url, page, disable_check=True),
+        max_count,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    ):
+        yield item
+
+
+async def GetUserAllFansInfo(
+    user_url: str,
+    max_count: Optional[int] = None,
+    disable_check: bool = False,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+) -> AsyncGenerator[Dict, None]:
+    """获取用户的所有粉丝信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        max_count (int, optional): 获取的粉丝信息数量上限，Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
+
+    Yields:
+        AsyncIterator[Dict], None]: 粉丝信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    async for item in AsyncIterPages(
+        lambda page: GetUserFansInfo(user_url, page, disable_check=True),
+        max_count,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    ):
+        yield item
+
+
+async def GetUserAllTimelineInfo(
+    user_url: str,
+    max_count: Optional[int] = None,
+    disable_check: bool = False,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+) -> AsyncGenerator[Dict, None]:
+    """获取用户的所有动态信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        max_count (int, optional): 获取的动态信息数量上限，Defaults to None.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
+
+    Yields:
+        AsyncIterator[Dict], None]: 动态信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+        await AssertUserStatusNormal(user_url)
+    async for item in AsyncIterPagesById(
+        lambda max_id: GetUserTimelineInfo(user_url, max_id, disable_check=True),
+        lambda result: result[-1]["operation_id"],
+        max_count,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    ):
+        yield item
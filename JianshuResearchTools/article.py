@@ -1,16 +1,32 @@
 from contextlib import suppress
 from datetime import datetime
 from re import findall, sub
-from typing import Dict, Generator, List, Literal, Optional
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from lxml import etree
 
-from .assert_funcs import AssertArticleStatusNormal, AssertArticleUrl
+from .assert_funcs import (
+    AssertArticleJsonDataNormal,
+    AssertArticleStatusNormal,
+    AssertArticleUrl,
+)
 from .basic_apis import (
     GetArticleCommentsJsonDataApi,
     GetArticleHtmlJsonDataApi,
     GetArticleJsonDataApi,
 )
+from .records import CommentRecord
+from .utils import BatchCall, Cursor, IterPages
 
 with suppress(ImportError):
     from tomd import convert as html2md
@@ -35,6 +51,7 @@ __all__ = [
     "GetArticleMarkdown",
     "GetArticleCommentsData",
     "GetArticleAllBasicData",
+    "GetArticlesAllBasicData",
     "GetArticleAllCommentsData",
 ]
 
@@ -51,8 +68,9 @@ def GetArticleTitle(article_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     return json_obj["public_title"]
 
 
@@ -119,8 +137,9 @@ def GetArticleLikesCount(article_url: str, disable_check: bool = False) -> int:
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     return json_obj["likes_count"]
 
 
@@ -136,8 +155,9 @@ def GetArticleCommentsCount(article_url: str, disable_check: bool = False) -> in
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     return json_obj["public_comment_count"]
 
 
@@ -155,8 +175,9 @@ def GetArticleMostValuableCommentsCount(
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     return json_obj["featured_comments_count"]
 
 
@@ -172,8 +193,9 @@ def GetArticleTotalFPCount(article_url: str, disable_check: bool = False) -> flo
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     return json_obj["total_fp_amount"] / 1000
 
 
@@ -189,8 +211,9 @@ def GetArticleDescription(article_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     return json_obj["description"]
 
 
@@ -206,8 +229,9 @@ def GetArticlePublishTime(article_url: str, disable_check: bool = False) -> date
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     return datetime.fromisoformat(json_obj["first_shared_at"]).replace(tzinfo=None)
 
 
@@ -223,11 +247,24 @@ def GetArticleUpdateTime(article_url: str, disable_check: bool = False) -> datet
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     return datetime.fromtimestamp(json_obj["last_updated_at"])
 
 
+def _ParseArticlePaidStatus(json_obj: Dict) -> bool:
+    paid_type = {
+        "free": False,  # 免费文章
+        "fbook_free": False,  # 免费连载中的免费文章
+        "pbook_free": False,  # 付费连载中的免费文章
+        "paid": True,  # 付费文章
+        "fbook_paid": True,  # 免费连载中的付费文章
+        "pbook_paid": True,  # 付费连载中的付费文章
+    }
+    return paid_type[json_obj["paid_type"]]
+
+
 def GetArticlePaidStatus(article_url: str, disable_check: bool = False) -> bool:
     """获取文章付费状态
 
@@ -240,17 +277,10 @@ def GetArticlePaidStatus(article_url: str, disable_check: bool = False) -> bool:
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
-    paid_type = {
-        "free": False,  # 免费文章
-        "fbook_free": False,  # 免费连载中的免费文章
-        "pbook_free": False,  # 付费连载中的免费文章
-        "paid": True,  # 付费文章
-        "fbook_paid": True,  # 免费连载中的付费文章
-        "pbook_paid": True,  # 付费连载中的付费文章
-    }
-    return paid_type[json_obj["paid_type"]]
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    return _ParseArticlePaidStatus(json_obj)
 
 
 def GetArticleReprintStatus(article_url: str, disable_check: bool = False) -> bool:
@@ -265,8 +295,9 @@ def GetArticleReprintStatus(article_url: str, disable_check: bool = False) -> bo
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     return json_obj["reprintable"]
 
 
@@ -282,28 +313,13 @@ def GetArticleCommentStatus(article_url: str, disable_check: bool = False) -> bo
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
     return json_obj["commentable"]
 
 
-def GetArticleHtml(article_url: str, disable_check: bool = False) -> str:
-    """获取 Html 格式的文章内容
-
-    # ! 该函数可以获取设置禁止转载的文章内容，请尊重作者版权，由此带来的风险您需自行承担
-    # ! 该函数不能获取文章付费部分的内容
-
-    Args:
-        article_url (str): 文章 URL
-        disable_check (bool): 禁用参数有效性检查. Defaults to False.
-
-    Returns:
-        str: Html 格式的文章内容
-    """
-    if not disable_check:
-        AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
-    json_obj = GetArticleJsonDataApi(article_url)
+def _ParseArticleHtml(json_obj: Dict) -> str:
     html_text = json_obj["free_content"]
 
     # 去除 image-container、image-container-fill 和 image-view
@@ -322,13 +338,11 @@ def GetArticleHtml(article_url: str, disable_check: bool = False) -> str:
 
     for old_img_block, new_img_block in zip(old_img_blocks, new_img_blocks):
         html_text = html_text.replace(old_img_block, new_img_block)  # 替换 img 标签
-    with open("result.html", "w", encoding="utf-8") as f:
-        f.write(html_text)
     return html_text
 
 
-def GetArticleText(article_url: str, disable_check: bool = False) -> str:
-    """获取纯文本格式的文章内容
+def GetArticleHtml(article_url: str, disable_check: bool = False) -> str:
+    """获取 Html 格式的文章内容
 
     # ! 该函数可以获取设置禁止转载的文章内容，请尊重作者版权，由此带来的风险您需自行承担
     # ! 该函数不能获取文章付费部分的内容
@@ -338,20 +352,27 @@ def GetArticleText(article_url: str, disable_check: bool = False) -> str:
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
 
     Returns:
-        str: 纯文本格式的文章内容
+        str: Html 格式的文章内容
     """
     if not disable_check:
         AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    html_text = _ParseArticleHtml(json_obj)
+    with open("result.html", "w", encoding="utf-8") as f:
+        f.write(html_text)
+    return html_text
+
+
+def _ParseArticleText(json_obj: Dict) -> str:
     html_obj = etree.HTML(json_obj["free_content"])  # type: ignore
     result = "".join(html_obj.itertext())
-    result = sub(r"\s{3,}", "", result)  # 去除多余的空行
-    return result
+    return sub(r"\s{3,}", "", result)  # 去除多余的空行
 
 
-def GetArticleMarkdown(article_url: str, disable_check: bool = False) -> str:
-    """获取 Markdown 格式的文章内容
+def GetArticleText(article_url: str, disable_check: bool = False) -> str:
+    """获取纯文本格式的文章内容
 
     # ! 该函数可以获取设置禁止转载的文章内容，请尊重作者版权，由此带来的风险您需自行承担
     # ! 该函数不能获取文章付费部分的内容
@@ -361,16 +382,21 @@ def GetArticleMarkdown(article_url: str, disable_check: bool = False) -> str:
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
 
     Returns:
-        str: Markdown 格式的文章内容
+        str: 纯文本格式的文章内容
     """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+    json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    return _ParseArticleText(json_obj)
+
+
+def _ConvertArticleHtmlToMarkdown(html_text: str) -> str:
     try:
         html2md  # noqa: B018  # type: ignore
     except NameError:
         raise ImportError("未安装 html2md 模块，该函数不可用") from None
-    if not disable_check:
-        AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
-    html_text = GetArticleHtml(article_url, disable_check=True)
     image_descriptions = list(
         findall(r'class="image-caption">.+</div>', html_text)
     )  # 获取图片描述块
@@ -408,32 +434,27 @@ def GetArticleMarkdown(article_url: str, disable_check: bool = False) -> str:
     return markdown
 
 
-def GetArticleCommentsData(
-    article_id: int,
-    page: int = 1,
-    count: int = 10,
-    author_only: bool = False,
-    sorting_method: Literal["positive", "reverse"] = "positive",
-) -> List[Dict]:
-    """获取文章评论信息
+def GetArticleMarkdown(article_url: str, disable_check: bool = False) -> str:
+    """获取 Markdown 格式的文章内容
+
+    # ! 该函数可以获取设置禁止转载的文章内容，请尊重作者版权，由此带来的风险您需自行承担
+    # ! 该函数不能获取文章付费部分的内容
 
     Args:
-        article_id (int): 文章 ID
-        page (int, optional): 页码. Defaults to 1.
-        count (int, optional): 每次获取的评论数（不包含子评论）. Defaults to 10.
-        author_only (bool, optional): 为 True 时只获取作者发布的评论，包含作者发布的子评论及其父评论. Defaults to False.
-        sorting_method (Literal["positive", "reverse"], optional): 排序方式，为”positive“时按时间正序排列，为”reverse“时按时间倒序排列. Defaults to "positive".
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
 
     Returns:
-        List[Dict]: 文章评论信息
+        str: Markdown 格式的文章内容
     """
-    order_by = {
-        "positive": "asc",
-        "reverse": "desc",
-    }[sorting_method]
-    json_obj = GetArticleCommentsJsonDataApi(
-        article_id, page, count, author_only, order_by
-    )
+    if not disable_check:
+        AssertArticleUrl(article_url)
+        AssertArticleStatusNormal(article_url)
+    html_text = GetArticleHtml(article_url, disable_check=True)
+    return _ConvertArticleHtmlToMarkdown(html_text)
+
+
+def _ParseArticleCommentsData(json_obj: Dict) -> List[Dict]:
     result = []
     for item in json_obj["comments"]:
         item_data = {
@@ -514,23 +535,41 @@ def GetArticleCommentsData(
     return result
 
 
-def GetArticleAllBasicData(article_url: str, disable_check: bool = False) -> Dict:
-    """获取文章的全部基础信息
+def GetArticleCommentsData(
+    article_id: int,
+    page: int = 1,
+    count: int = 10,
+    author_only: bool = False,
+    sorting_method: Literal["positive", "reverse"] = "positive",
+    typed: bool = False,
+) -> Union[List[Dict], List[CommentRecord]]:
+    """获取文章评论信息
 
     Args:
-        article_url (str): 文章 URL
-        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        article_id (int): 文章 ID
+        page (int, optional): 页码. Defaults to 1.
+        count (int, optional): 每次获取的评论数（不包含子评论）. Defaults to 10.
+        author_only (bool, optional): 为 True 时只获取作者发布的评论，包含作者发布的子评论及其父评论. Defaults to False.
+        sorting_method (Literal["positive", "reverse"], optional): 排序方式，为”positive“时按时间正序排列，为”reverse“时按时间倒序排列. Defaults to "positive".
+        typed (bool, optional): 为 True 时返回 CommentRecord 对象而非字典，内存占用更小. Defaults to False.
 
     Returns:
-        Dict: 文章基础信息
+        Union[List[Dict], List[CommentRecord]]: 文章评论信息
     """
-    if not disable_check:
-        AssertArticleUrl(article_url)
-        AssertArticleStatusNormal(article_url)
-    result = {}
-    json_obj = GetArticleJsonDataApi(article_url)
-    html_json_obj = GetArticleHtmlJsonDataApi(article_url)
+    order_by = {
+        "positive": "asc",
+        "reverse": "desc",
+    }[sorting_method]
+    json_obj = GetArticleCommentsJsonDataApi(
+        article_id, page, count, author_only, order_by
+    )
+    if typed:
+        return [CommentRecord.from_json(item) for item in json_obj["comments"]]
+    return _ParseArticleCommentsData(json_obj)
 
+
+def _ParseArticleAllBasicData(json_obj: Dict, html_json_obj: Dict) -> Dict:
+    result = {}
     result["title"] = json_obj["public_title"]
     result["author_name"] = html_json_obj["props"]["initialState"]["note"]["data"][
         "user"
@@ -561,13 +600,66 @@ def GetArticleAllBasicData(article_url: str, disable_check: bool = False) -> Dic
     return result
 
 
+def GetArticleAllBasicData(article_url: str, disable_check: bool = False) -> Dict:
+    """获取文章的全部基础信息
+
+    Args:
+        article_url (str): 文章 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 文章基础信息
+    """
+    if not disable_check:
+        AssertArticleUrl(article_url)
+    json_obj = GetArticleJsonDataApi(article_url)
+    if not disable_check:
+        AssertArticleJsonDataNormal(article_url, json_obj)
+    html_json_obj = GetArticleHtmlJsonDataApi(article_url)
+    return _ParseArticleAllBasicData(json_obj, html_json_obj)
+
+
+def GetArticlesAllBasicData(
+    article_urls: Iterable[str],
+    concurrency: int = 8,
+    ordered: bool = True,
+    disable_check: bool = False,
+) -> Generator[Tuple[str, Union[Dict, Exception]], None, None]:
+    """批量获取多个文章的全部基础信息
+
+    各请求并发进行并共用连接池，单个文章获取失败不会中断整个批次
+
+    Args:
+        article_urls (Iterable[str]): 文章 URL 序列
+        concurrency (int, optional): 并发数量上限. Defaults to 8.
+        ordered (bool, optional): 为 True 时按输入顺序返回结果，为 False 时按完成顺序返回结果. Defaults to True.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Yields:
+        Iterator[Tuple[str, Union[Dict, Exception]]]: (文章 URL, 文章基础信息或获取失败时抛出的异常)
+    """
+    yield from BatchCall(
+        lambda article_url: GetArticleAllBasicData(
+            article_url, disable_check=disable_check
+        ),
+        article_urls,
+        concurrency,
+        ordered,
+    )
+
+
 def GetArticleAllCommentsData(
     article_id: int,
     count: int = 10,
     author_only: bool = False,
     sorting_method: Literal["positive", "reverse"] = "positive",
     max_count: Optional[int] = None,
-) -> Generator[Dict, None, None]:
+    prefetch: int = 0,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+    typed: bool = False,
+) -> Generator[Union[Dict, CommentRecord], None, None]:
     """获取文章的全部评论信息
 
     Args:
@@ -576,23 +668,23 @@ def GetArticleAllCommentsData(
         author_only (bool, optional): 为 True 时只获取作者发布的评论，包含作者发布的子评论及其父评论. Defaults to False.
         sorting_method (Literal["positive", "reverse"], optional): 排序方式，为”positive“时按时间正序排列，为”reverse“时按时间倒序排列. Defaults to "positive".
         max_count (int, optional): 获取的文章评论信息数量上限，Defaults to None.
+        prefetch (int, optional): 预取深度，大于 0 时会并发请求后续页面. Defaults to 0.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
+        typed (bool, optional): 为 True 时返回 CommentRecord 对象而非字典，内存占用更小. Defaults to False.
 
     Yields:
         Iterator[Dict], None, None]: 文章信息
     """
-    page = 1
-    now_count = 0
-    while True:
-        result = GetArticleCommentsData(
-            article_id, page, count, author_only, sorting_method
-        )
-        if result:
-            page += 1
-        else:
-            return
-        for item in result:
-            yield item
-            if max_count:
-                now_count += 1
-                if now_count == max_count:
-                    return
+    yield from IterPages(
+        lambda page: GetArticleCommentsData(
+            article_id, page, count, author_only, sorting_method, typed=typed
+        ),
+        max_count,
+        prefetch,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    )
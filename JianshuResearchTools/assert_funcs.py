@@ -1,6 +1,6 @@
 from functools import lru_cache
 from re import compile as re_compile
-from typing import Any
+from typing import Any, Dict
 
 from .basic_apis import (
     GetArticleJsonDataApi,
@@ -23,12 +23,17 @@ __all__ = [
     "AssertJianshuUrl",
     "AssertUserUrl",
     "AssertUserStatusNormal",
+    "AssertUserJsonDataNormal",
     "AssertArticleUrl",
     "AssertArticleStatusNormal",
+    "AssertArticleJsonDataNormal",
+    "AssertNotebookJsonDataNormal",
     "AssertCollectionUrl",
     "AssertCollectionStatusNormal",
+    "AssertCollectionJsonDataNormal",
     "AssertIslandUrl",
     "AssertIslandStatusNormal",
+    "AssertIslandJsonDataNormal",
     "AssertIslandPostUrl",
 ]
 
@@ -82,23 +87,36 @@ def AssertUserUrl(string: str) -> None:
         raise InputError(f"{string} 不是有效的简书用户主页 URL")
 
 
-@lru_cache(maxsize=64)
-def AssertUserStatusNormal(user_url: str) -> None:
-    """判断用户账号状态是否正常
+def AssertUserJsonDataNormal(user_url: str, json_obj: Dict) -> None:
+    """根据已获取的用户 JSON 数据判断用户状态是否正常，不会发送额外的请求
 
     Args:
         user_url (str): 用户主页 URL
+        json_obj (Dict): 用户 JSON 数据
 
     Raises:
         ResourceError: 用户账号状态异常时抛出此错误
     """
-    user_json_data = GetUserJsonDataApi(user_url)
     try:
-        user_json_data["nickname"]
+        json_obj["nickname"]
     except KeyError:
         raise ResourceError(f"用户 {user_url} 账号状态异常") from None
 
 
+@lru_cache(maxsize=64)
+def AssertUserStatusNormal(user_url: str) -> None:
+    """判断用户账号状态是否正常
+
+    Args:
+        user_url (str): 用户主页 URL
+
+    Raises:
+        ResourceError: 用户账号状态异常时抛出此错误
+    """
+    json_obj = GetUserJsonDataApi(user_url)
+    AssertUserJsonDataNormal(user_url, json_obj)
+
+
 def AssertArticleUrl(string: str) -> None:
     """判断字符串是否是有效的简书文章 URL
 
@@ -112,6 +130,22 @@ def AssertArticleUrl(string: str) -> None:
         raise InputError(f"{string} 不是有效的简书文章 URL")
 
 
+def AssertArticleJsonDataNormal(article_url: str, json_obj: Dict) -> None:
+    """根据已获取的文章 JSON 数据判断文章状态是否正常，不会发送额外的请求
+
+    Args:
+        article_url (str): 文章 URL
+        json_obj (Dict): 文章 JSON 数据
+
+    Raises:
+        ResourceError: 文章状态异常时抛出此错误
+    """
+    try:
+        json_obj["show_ad"]
+    except KeyError:
+        raise ResourceError(f"文章 {article_url} 状态异常") from None
+
+
 @lru_cache(maxsize=64)
 def AssertArticleStatusNormal(article_url: str) -> None:
     """判断文章状态是否正常
@@ -124,10 +158,7 @@ def AssertArticleStatusNormal(article_url: str) -> None:
     """
     AssertArticleUrl(article_url)
     json_obj = GetArticleJsonDataApi(article_url)
-    try:
-        json_obj["show_ad"]
-    except KeyError:
-        raise ResourceError(f"文章 {article_url} 状态异常") from None
+    AssertArticleJsonDataNormal(article_url, json_obj)
 
 
 def AssertNotebookUrl(string: str) -> None:
@@ -143,23 +174,36 @@ def AssertNotebookUrl(string: str) -> None:
         raise InputError(f"{string} 不是有效的简书文集 URL")
 
 
-def AssertNotebookStatusNormal(notebook_url: str) -> None:
-    """判断文集状态是否正常
+def AssertNotebookJsonDataNormal(notebook_url: str, json_obj: Dict) -> None:
+    """根据已获取的文集 JSON 数据判断文集状态是否正常，不会发送额外的请求
 
     Args:
         notebook_url (str): 文集 URL
+        json_obj (Dict): 文集 JSON 数据
 
     Raises:
         ResourceError: 文集状态异常时抛出此错误
     """
-    AssertNotebookUrl(notebook_url)
-    json_obj = GetNotebookJsonDataApi(notebook_url)
     try:
         json_obj["name"]
     except KeyError:
         raise ResourceError(f"文集 {notebook_url} 状态异常") from None
 
 
+def AssertNotebookStatusNormal(notebook_url: str) -> None:
+    """判断文集状态是否正常
+
+    Args:
+        notebook_url (str): 文集 URL
+
+    Raises:
+        ResourceError: 文集状态异常时抛出此错误
+    """
+    AssertNotebookUrl(notebook_url)
+    json_obj = GetNotebookJsonDataApi(notebook_url)
+    AssertNotebookJsonDataNormal(notebook_url, json_obj)
+
+
 def AssertCollectionUrl(string: str) -> None:
     """判断字符串是否是有效的简书专题 URL
 
@@ -173,23 +217,36 @@ def AssertCollectionUrl(string: str) -> None:
         raise InputError(f"{string} 不是有效的简书专题 URL")
 
 
-@lru_cache(maxsize=64)
-def AssertCollectionStatusNormal(collection_url: str) -> None:
-    """判断专题状态是否正常
+def AssertCollectionJsonDataNormal(collection_url: str, json_obj: Dict) -> None:
+    """根据已获取的专题 JSON 数据判断专题状态是否正常，不会发送额外的请求
 
     Args:
         collection_url (str): 专题 URL
+        json_obj (Dict): 专题 JSON 数据
 
     Raises:
         ResourceError: 专题状态异常时抛出此错误
     """
-    collection_json_data = GetCollectionJsonDataApi(collection_url)
     try:
-        collection_json_data["title"]
+        json_obj["title"]
     except KeyError:
         raise ResourceError(f"专题 {collection_url} 状态异常") from None
 
 
+@lru_cache(maxsize=64)
+def AssertCollectionStatusNormal(collection_url: str) -> None:
+    """判断专题状态是否正常
+
+    Args:
+        collection_url (str): 专题 URL
+
+    Raises:
+        ResourceError: 专题状态异常时抛出此错误
+    """
+    json_obj = GetCollectionJsonDataApi(collection_url)
+    AssertCollectionJsonDataNormal(collection_url, json_obj)
+
+
 def AssertIslandUrl(string: str) -> None:
     """判断字符串是否是有效的简书小岛 URL
 
@@ -203,15 +260,28 @@ def AssertIslandUrl(string: str) -> None:
         raise InputError(f"{string} 不是有效的简书小岛 URL")
 
 
-@lru_cache(maxsize=64)
-def AssertIslandStatusNormal(island_url: str) -> None:
-    island_json_data = GetIslandJsonDataApi(island_url)
+def AssertIslandJsonDataNormal(island_url: str, json_obj: Dict) -> None:
+    """根据已获取的小岛 JSON 数据判断小岛状态是否正常，不会发送额外的请求
+
+    Args:
+        island_url (str): 小岛 URL
+        json_obj (Dict): 小岛 JSON 数据
+
+    Raises:
+        ResourceError: 小岛状态异常时抛出此错误
+    """
     try:
-        island_json_data["name"]
+        json_obj["name"]
     except KeyError:
         raise ResourceError(f"小岛 {island_url} 状态异常") from None
 
 
+@lru_cache(maxsize=64)
+def AssertIslandStatusNormal(island_url: str) -> None:
+    json_obj = GetIslandJsonDataApi(island_url)
+    AssertIslandJsonDataNormal(island_url, json_obj)
+
+
 def AssertIslandPostUrl(string: str) -> None:
     """判断字符串是否是有效的简书小岛帖子 URL
 
@@ -1,18 +1,19 @@
+from functools import partial
+from time import perf_counter
 from typing import Dict, Optional
 
+from httpx import Client, Request
 from lxml import etree
 from lxml.etree import _Element
 
-from .httpx_client import (
-    JIANSHU_API_CLIENT,
-    JIANSHU_MOBILE_CLIENT,
-    JIANSHU_PC_CLIENT,
-)
-
-try:
-    from ujson import loads as json_loads
-except ImportError:
-    from json import loads as json_loads
+from .budget import _ConsumeRequestBudget
+from .exceptions import ResourceError
+from .httpx_client import get_client
+from .json_backend import json_loads
+from .metrics import _InstrumentApi, _RecordSource
+from .rate_limit import EndpointFamily
+from .response_cache import ResponseCache, get_response_cache
+from .single_flight import get_single_flight
 
 __all__ = [
     "GetArticleJsonDataApi",
@@ -40,19 +41,68 @@ __all__ = [
 ]
 
 
+def _SendRequest(
+    client: Client,
+    request: Request,
+    cache_key: str,
+    response_cache: Optional[ResponseCache],
+    start_time: float,
+) -> bytes:
+    response = client.send(request)
+    _RecordSource(response.status_code, len(response.content), start_time)
+    if response_cache is not None and response.is_success:
+        response_cache.set(
+            cache_key, response.content, response_cache.get_ttl(request.url)
+        )
+    return response.content
+
+
+def _GetSource(
+    family: EndpointFamily, request_url: str, params: Optional[Dict] = None
+) -> bytes:
+    client = get_client(family)
+    start_time = perf_counter()
+    request = client.build_request("GET", request_url, params=params)
+    # 缓存与请求合并使用同一个键，不同类型接口的请求即使 URL 相同也不能共享响应
+    key = ResponseCache.make_key("GET", request.url, family)
+    response_cache = get_response_cache()
+    if response_cache is not None:
+        content = response_cache.get(key)
+        if content is not None:
+            _RecordSource(None, len(content), start_time)
+            return content
+        if response_cache.offline:
+            raise ResourceError(f"离线模式下缓存中没有 {request.url} 的数据")
+
+    # 在合并请求前检查预算，每个调用方都计入各自的预算，超出预算时不会加入其它调用
+    _ConsumeRequestBudget(family)
+    send = partial(_SendRequest, client, request, key, response_cache, start_time)
+    single_flight = get_single_flight()
+    if single_flight is None:
+        return send()
+    content, shared = single_flight.do(key, send)
+    if shared:
+        _RecordSource(None, len(content), start_time, coalesced=True)
+    return content
+
+
+@_InstrumentApi
 def GetArticleJsonDataApi(article_url: str) -> Dict:
     request_url = article_url.replace("https://www.jianshu.com", "/asimov")
-    source = JIANSHU_API_CLIENT.get(request_url).content
+    source = _GetSource("api", request_url)
     return json_loads(source)
 
 
+@_InstrumentApi
 def GetArticleHtmlJsonDataApi(article_url: str) -> Dict:
     request_url = article_url.replace("https://www.jianshu.com", "")
-    source = JIANSHU_PC_CLIENT.get(request_url).content
+    source = _GetSource("pc", request_url)
     html_obj = etree.HTML(source)  # type: ignore
-    return json_loads(html_obj.xpath("//script[@id='__NEXT_DATA__']/text()")[0])
+    # xpath 返回的是 str 的子类，部分 JSON 解析库（如 orjson）不接受
+    return json_loads(str(html_obj.xpath("//script[@id='__NEXT_DATA__']/text()")[0]))
 
 
+@_InstrumentApi
 def GetArticleCommentsJsonDataApi(
     article_id: int, page: int, count: int, author_only: bool, order_by: str
 ) -> Dict:
@@ -63,27 +113,30 @@ def GetArticleCommentsJsonDataApi(
         "order_by": order_by,
     }
     request_url = f"shakespeare/notes/{article_id}/comments"
-    source = JIANSHU_API_CLIENT.get(request_url, params=params).content
+    source = _GetSource("api", request_url, params=params)
     return json_loads(source)
 
 
+@_InstrumentApi
 def GetCollectionJsonDataApi(collection_url: str) -> Dict:
     request_url = collection_url.replace(
         "https://www.jianshu.com/c/", "asimov/collections/slug/"
     )
-    source = JIANSHU_API_CLIENT.get(request_url).content
+    source = _GetSource("api", request_url)
     return json_loads(source)
 
 
+@_InstrumentApi
 def GetCollectionEditorsJsonDataApi(collection_id: int, page: int) -> Dict:
     request_url = f"collections/{collection_id}/editors"
     params = {
         "page": page,
     }
-    source = JIANSHU_API_CLIENT.get(request_url, params=params).content
+    source = _GetSource("api", request_url, params=params)
     return json_loads(source)
 
 
+@_InstrumentApi
 def GetCollectionRecommendedWritersJsonDataApi(
     collection_id: int, page: int, count: int
 ) -> Dict:
@@ -92,13 +145,15 @@ def GetCollectionRecommendedWritersJsonDataApi(
         "page": page,
         "count": count,
     }
-    source = JIANSHU_API_CLIENT.get(
+    source = _GetSource(
+        "api",
         "/collections/recommended_users",
         params=params,
-    ).content
+    )
     return json_loads(source)
 
 
+@_InstrumentApi
 def GetCollectionSubscribersJsonDataApi(
     collection_id: int, max_sort_id: Optional[int]
 ) -> Dict:
@@ -106,10 +161,11 @@ def GetCollectionSubscribersJsonDataApi(
     params = {
         "max_sort_id": max_sort_id,
     }
-    source = JIANSHU_API_CLIENT.get(request_url, params=params).content
+    source = _GetSource("api", request_url, params=params)
     return json_loads(source)
 
 
+@_InstrumentApi
 def GetCollectionArticlesJsonDataApi(
     collection_slug: str, page: int, count: int, order_by: str
 ) -> Dict:
@@ -119,16 +175,18 @@ def GetCollectionArticlesJsonDataApi(
         "count": count,
         "order_by": order_by,
     }
-    source = JIANSHU_API_CLIENT.get(request_url, params=params).content
+    source = _GetSource("api", request_url, params=params)
     return json_loads(source)
 
 
+@_InstrumentApi
 def GetIslandJsonDataApi(island_url: str) -> Dict:
     request_url = island_url.replace("https://www.jianshu.com/g/", "/asimov/groups/")
-    source = JIANSHU_API_CLIENT.get(request_url).content
+    source = _GetSource("api", request_url)
     return json_loads(source)
 
 
+@_InstrumentApi
 def GetIslandPostsJsonDataApi(
     group_slug: str,
     max_id: Optional[int],
@@ -143,19 +201,22 @@ def GetIslandPostsJsonDataApi(
         "count": count,
         "topic_id": topic_id,
     }
-    source = JIANSHU_API_CLIENT.get(
+    source = _GetSource(
+        "api",
         "/asimov/posts",
         params=params,
-    ).content
+    )
     return json_loads(source)
 
 
+@_InstrumentApi
 def GetNotebookJsonDataApi(notebook_url: str) -> Dict:
     request_url = notebook_url.replace("https://www.jianshu.com/", "/asimov/")
-    source = JIANSHU_API_CLIENT.get(request_url).content
+    source = _GetSource("api", request_url)
     return json_loads(source)
 
 
+@_InstrumentApi
 def GetNotebookArticlesJsonDataApi(
     notebook_url: str, page: int, count: int, order_by: str
 ) -> Dict:
@@ -168,52 +229,61 @@ def GetNotebookArticlesJsonDataApi(
         "count": count,
         "order_by": order_by,
     }
-    source = JIANSHU_API_CLIENT.get(request_url, params=params).content
+    source = _GetSource("api", request_url, params=params)
     return json_loads(source)
 
 
+@_InstrumentApi
 def GetAssetsRankJsonDataApi(max_id: int, since_id: int) -> Dict:
     params = {
         "max_id": max_id,
         "since_id": since_id,
     }
-    source = JIANSHU_API_CLIENT.get(
+    source = _GetSource(
+        "api",
         "/asimov/fp_rankings",
         params=params,
-    ).content
+    )
     return json_loads(source)
 
 
+@_InstrumentApi
 def GetDailyArticleRankListJsonDataApi() -> Dict:
-    source = JIANSHU_API_CLIENT.get(
+    source = _GetSource(
+        "api",
         "/asimov/daily_activity_participants/rank",
-    ).content
+    )
     return json_loads(source)
 
 
+@_InstrumentApi
 def GetArticlesFPRankListJsonDataApi(date: str, type_: Optional[str]) -> Dict:
     params = {
         "date": date,
         "type": type_,
     }
-    source = JIANSHU_API_CLIENT.get(
+    source = _GetSource(
+        "api",
         "/asimov/fp_rankings/voter_notes",
         params=params,
-    ).content
+    )
     return json_loads(source)
 
 
+@_InstrumentApi
 def GetUserJsonDataApi(user_url: str) -> Dict:
     request_url = user_url.replace("https://www.jianshu.com/u/", "/asimov/users/slug/")
-    source = JIANSHU_API_CLIENT.get(request_url).content
+    source = _GetSource("api", request_url)
     return json_loads(source)
 
 
+@_InstrumentApi
 def GetUserPCHtmlDataApi(user_url: str) -> _Element:
-    source = JIANSHU_PC_CLIENT.get(user_url).content
+    source = _GetSource("pc", user_url)
     return etree.HTML(source)  # type: ignore
 
 
+@_InstrumentApi
 def GetUserCollectionsAndNotebooksJsonDataApi(user_url: str, user_slug: str) -> Dict:
     request_url = (
         user_url.replace("https://www.jianshu.com/u/", "/users/")
@@ -222,10 +292,11 @@ def GetUserCollectionsAndNotebooksJsonDataApi(user_url: str, user_slug: str) ->
     params = {
         "slug": user_slug,
     }
-    source = JIANSHU_API_CLIENT.get(request_url, params=params).content
+    source = _GetSource("api", request_url, params=params)
     return json_loads(source)
 
 
+@_InstrumentApi
 def GetUserArticlesListJsonDataApi(
     user_url: str, page: int, count: int, order_by: str
 ) -> Dict:
@@ -238,10 +309,11 @@ def GetUserArticlesListJsonDataApi(
         "count": count,
         "order_by": order_by,
     }
-    source = JIANSHU_API_CLIENT.get(request_url, params=params).content
+    source = _GetSource("api", request_url, params=params)
     return json_loads(source)
 
 
+@_InstrumentApi
 def GetUserFollowingListHtmlDataApi(user_url: str, page: int) -> _Element:
     request_url = (
         user_url.replace("https://www.jianshu.com/u/", "/users/") + "/following"
@@ -249,10 +321,11 @@ def GetUserFollowingListHtmlDataApi(user_url: str, page: int) -> _Element:
     params = {
         "page": page,
     }
-    source = JIANSHU_PC_CLIENT.get(request_url, params=params).content
+    source = _GetSource("pc", request_url, params=params)
     return etree.HTML(source)  # type: ignore
 
 
+@_InstrumentApi
 def GetUserFollowersListHtmlDataApi(user_url: str, page: int) -> _Element:
     request_url = (
         user_url.replace("https://www.jianshu.com/u/", "/users/") + "/followers"
@@ -260,26 +333,29 @@ def GetUserFollowersListHtmlDataApi(user_url: str, page: int) -> _Element:
     params = {
         "page": page,
     }
-    source = JIANSHU_PC_CLIENT.get(request_url, params=params).content
+    source = _GetSource("pc", request_url, params=params)
     return etree.HTML(source)  # type: ignore
 
 
+@_InstrumentApi
 def GetUserNextAnniversaryDayHtmlDataApi(user_slug: str) -> _Element:
     request_url = f"/mobile/u/{user_slug}/anniversary"
-    source = JIANSHU_MOBILE_CLIENT.get(request_url).content
+    source = _GetSource("mobile", request_url)
     return etree.HTML(source)  # type: ignore
 
 
+@_InstrumentApi
 def GetIslandPostJsonDataApi(post_slug: str) -> Dict:
     request_url = f"/asimov/posts/{post_slug}"
-    source = JIANSHU_API_CLIENT.get(request_url).content
+    source = _GetSource("api", request_url)
     return json_loads(source)
 
 
+@_InstrumentApi
 def GetUserTimelineHtmlDataApi(uslug: str, max_id: Optional[int]) -> _Element:
     request_url = f"/users/{uslug}/timeline"
     params = {
         "max_id": max_id,
     }
-    source = JIANSHU_PC_CLIENT.get(request_url, params=params).content
+    source = _GetSource("pc", request_url, params=params)
     return etree.HTML(source)  # type: ignore
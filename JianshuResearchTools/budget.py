@@ -0,0 +1,160 @@
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Dict, Generator, Optional, Tuple
+
+from .exceptions import BudgetExceededError
+
+__all__ = ["RequestBudget", "request_budget"]
+
+_PACKAGE_NAME = __name__.rsplit(".", 1)[0]
+# 线程池与事件循环的调度代码，到达这些栈帧说明已经没有调用方的代码
+_SCHEDULER_MODULES = ("threading", "concurrent.", "asyncio.")
+
+
+class RequestBudget:
+    """请求预算，记录上下文中发出的网络请求"""
+
+    def __init__(
+        self,
+        max_requests: Optional[int] = None,
+        raise_on_exceed: bool = True,
+        track_call_sites: bool = True,
+    ) -> None:
+        """构建新的请求预算
+
+        Args:
+            max_requests (Optional[int], optional): 请求次数上限，为 None 时不限制. Defaults to None.
+            raise_on_exceed (bool, optional): 为 True 时在即将超出上限时抛出异常，不发出该请求；
+            为 False 时只进行记录. Defaults to True.
+            track_call_sites (bool, optional): 是否记录发出请求的调用位置. Defaults to True.
+        """
+        if max_requests is not None and max_requests < 0:
+            raise ValueError("请求次数上限不能小于 0")
+        self.max_requests = max_requests
+        self.raise_on_exceed = raise_on_exceed
+        self.track_call_sites = track_call_sites
+        self.requests = 0
+        self.families: Dict[str, int] = {}
+        self.call_sites: Dict[str, int] = {}
+        self._lock = Lock()
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """剩余可发出的请求次数，不限制时为 None"""
+        if self.max_requests is None:
+            return None
+        return max(self.max_requests - self.requests, 0)
+
+    @property
+    def exceeded(self) -> bool:
+        """发出的请求次数是否已超出上限"""
+        return self.max_requests is not None and self.requests > self.max_requests
+
+    def report(self) -> str:
+        """生成请求统计报告
+
+        Returns:
+            str: 请求次数、各类接口的请求次数与各调用位置的请求次数
+        """
+        with self._lock:
+            families = sorted(self.families.items(), key=lambda x: -x[1])
+            call_sites = sorted(self.call_sites.items(), key=lambda x: -x[1])
+        limit = "不限" if self.max_requests is None else str(self.max_requests)
+        lines = [f"请求次数：{self.requests} / {limit}"]
+        lines.extend(f"  {family}：{count}" for family, count in families)
+        if call_sites:
+            lines.append("调用位置：")
+            lines.extend(f"  {count:>5}  {site}" for site, count in call_sites)
+        return "\n".join(lines)
+
+    def _WillExceed(self) -> bool:
+        return (
+            self.raise_on_exceed
+            and self.max_requests is not None
+            and self.requests >= self.max_requests
+        )
+
+    def _Check(self, call_site: Optional[str]) -> None:
+        if self._WillExceed():
+            raise BudgetExceededError(
+                f"请求次数超出预算 {self.max_requests}"
+                + (f"，调用位置：{call_site}" if call_site else "")
+            )
+
+    def _Consume(self, family: str, call_site: Optional[str]) -> None:
+        with self._lock:
+            self._Check(call_site)
+            self.requests += 1
+            self.families[family] = self.families.get(family, 0) + 1
+            if call_site is not None and self.track_call_sites:
+                self.call_sites[call_site] = self.call_sites.get(call_site, 0) + 1
+
+
+_active_budgets: ContextVar[Tuple[RequestBudget, ...]] = ContextVar(
+    "jrt_request_budgets", default=()
+)
+
+
+@contextmanager
+def request_budget(
+    max_requests: Optional[int] = None,
+    raise_on_exceed: bool = True,
+    track_call_sites: bool = True,
+) -> Generator[RequestBudget, None, None]:
+    """在上下文中记录所有客户端发出的网络请求，可限制请求次数
+
+    命中响应缓存的请求不计入，重试不重复计入；上下文中通过本库函数并发发出的请求同样计入，
+    与其它调用合并的请求也计入发起调用的上下文。
+    可以嵌套使用，此时请求同时计入所有外层预算
+
+    Args:
+        max_requests (Optional[int], optional): 请求次数上限，为 None 时不限制. Defaults to None.
+        raise_on_exceed (bool, optional): 为 True 时在即将超出上限时抛出 BudgetExceededError，不发出该请求；
+        为 False 时只进行记录. Defaults to True.
+        track_call_sites (bool, optional): 是否记录发出请求的调用位置. Defaults to True.
+
+    Yields:
+        Iterator[RequestBudget]: 请求预算
+    """
+    budget = RequestBudget(max_requests, raise_on_exceed, track_call_sites)
+    token = _active_budgets.set((*_active_budgets.get(), budget))
+    try:
+        yield budget
+    finally:
+        _active_budgets.reset(token)
+
+
+def _FindCallSite() -> str:
+    # 取调用栈中第一个不属于本库的栈帧；在工作线程中找不到时，取最外层的本库栈帧
+    frame = sys._getframe(1)
+    candidate = None
+    while frame is not None:
+        module_name = frame.f_globals.get("__name__", "")
+        if module_name.startswith(_SCHEDULER_MODULES):
+            break
+        if not module_name.startswith(_PACKAGE_NAME):
+            candidate = frame
+            break
+        if module_name != f"{_PACKAGE_NAME}.utils":  # 跳过线程池等通用辅助函数
+            candidate = frame
+        frame = frame.f_back
+    if candidate is None:
+        return "<unknown>"
+    code = candidate.f_code
+    return f"{code.co_filename}:{candidate.f_lineno} in {code.co_name}"
+
+
+def _ConsumeRequestBudget(family: str) -> None:
+    """在发出网络请求前调用，超出预算时抛出异常"""
+    budgets = _active_budgets.get()
+    if not budgets:
+        return
+    call_site = (
+        _FindCallSite() if any(budget.track_call_sites for budget in budgets) else None
+    )
+    for budget in budgets:  # 先检查全部预算，避免部分预算计入了没有发出的请求
+        budget._Check(call_site)
+    for budget in budgets:
+        budget._Consume(family, call_site)
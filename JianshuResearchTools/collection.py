@@ -1,7 +1,21 @@
 from datetime import datetime
-from typing import Dict, Generator, List, Literal, Optional
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from .assert_funcs import AssertCollectionStatusNormal, AssertCollectionUrl
+from .assert_funcs import (
+    AssertCollectionJsonDataNormal,
+    AssertCollectionStatusNormal,
+    AssertCollectionUrl,
+)
 from .basic_apis import (
     GetCollectionArticlesJsonDataApi,
     GetCollectionEditorsJsonDataApi,
@@ -10,6 +24,8 @@ from .basic_apis import (
     GetCollectionSubscribersJsonDataApi,
 )
 from .convert import CollectionUrlToCollectionSlug
+from .records import ArticleSummary
+from .utils import BatchCall, Cursor, IterPages, IterPagesById
 
 __all__ = [
     "GetCollectionName",
@@ -25,6 +41,7 @@ __all__ = [
     "GetCollectionRecommendedWritersInfo",
     "GetCollectionSubscribersInfo",
     "GetCollectionAllBasicData",
+    "GetCollectionsAllBasicData",
     "GetCollectionAllEditorsInfo",
     "GetCollectionAllRecommendedWritersInfo",
     "GetCollectionAllSubscribersInfo",
@@ -44,8 +61,9 @@ def GetCollectionName(collection_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
     json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
     return json_obj["title"]
 
 
@@ -61,8 +79,9 @@ def GetCollectionAvatarUrl(collection_url: str, disable_check: bool = False) ->
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
     json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
     return json_obj["image"]
 
 
@@ -80,8 +99,9 @@ def GetCollectionIntroductionText(
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
     json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
     return json_obj["content_without_html"]
 
 
@@ -99,8 +119,9 @@ def GetCollectionIntroductionHtml(
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
     json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
     return json_obj["content_in_full"]
 
 
@@ -116,8 +137,9 @@ def GetCollectionArticlesCount(collection_url: str, disable_check: bool = False)
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
     json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
     return json_obj["notes_count"]
 
 
@@ -135,8 +157,9 @@ def GetCollectionSubscribersCount(
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
     json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
     return json_obj["subscribers_count"]
 
 
@@ -154,8 +177,9 @@ def GetCollectionArticlesUpdateTime(
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
     json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
     return datetime.fromtimestamp(json_obj["newly_added_at"])
 
 
@@ -173,11 +197,20 @@ def GetCollectionInformationUpdateTime(
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
     json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
     return datetime.fromtimestamp(json_obj["last_updated_at"])
 
 
+def _ParseCollectionOwnerInfo(json_obj: Dict) -> Dict:
+    return {
+        "uid": json_obj["owner"]["id"],
+        "name": json_obj["owner"]["nickname"],
+        "uslug": json_obj["owner"]["slug"],
+    }
+
+
 def GetCollectionOwnerInfo(collection_url: str, disable_check: bool = False) -> Dict:
     """获取专题的所有者信息
 
@@ -190,13 +223,22 @@ def GetCollectionOwnerInfo(collection_url: str, disable_check: bool = False) ->
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
     json_obj = GetCollectionJsonDataApi(collection_url)
-    return {
-        "uid": json_obj["owner"]["id"],
-        "name": json_obj["owner"]["nickname"],
-        "uslug": json_obj["owner"]["slug"],
-    }
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    return _ParseCollectionOwnerInfo(json_obj)
+
+
+def _ParseCollectionEditorsInfo(json_obj: Dict) -> List[Dict]:
+    result = []
+    for item in json_obj["editors"]:
+        item_data = {
+            "uslug": item["slug"],
+            "name": item["nickname"],
+            "avatar_url": item["avatar_source"],
+        }
+        result.append(item_data)
+    return result
 
 
 def GetCollectionEditorsInfo(collection_id: int, page: int = 1) -> List[Dict]:
@@ -210,12 +252,20 @@ def GetCollectionEditorsInfo(collection_id: int, page: int = 1) -> List[Dict]:
         List[Dict]: 专题编辑信息
     """
     json_obj = GetCollectionEditorsJsonDataApi(collection_id, page=page)
+    return _ParseCollectionEditorsInfo(json_obj)
+
+
+def _ParseCollectionRecommendedWritersInfo(json_obj: Dict) -> List[Dict]:
     result = []
-    for item in json_obj["editors"]:
+    for item in json_obj["users"]:
         item_data = {
+            "uid": item["id"],
             "uslug": item["slug"],
             "name": item["nickname"],
             "avatar_url": item["avatar_source"],
+            "collection_name": item["collection_name"],
+            "likes_count": item["total_likes_count"],
+            "words_count": item["total_wordage"],
         }
         result.append(item_data)
     return result
@@ -237,16 +287,18 @@ def GetCollectionRecommendedWritersInfo(
     json_obj = GetCollectionRecommendedWritersJsonDataApi(
         collection_id, page=page, count=count
     )
+    return _ParseCollectionRecommendedWritersInfo(json_obj)
+
+
+def _ParseCollectionSubscribersInfo(json_obj: List[Dict]) -> List[Dict]:
     result = []
-    for item in json_obj["users"]:
+    for item in json_obj:
         item_data = {
-            "uid": item["id"],
             "uslug": item["slug"],
             "name": item["nickname"],
             "avatar_url": item["avatar_source"],
-            "collection_name": item["collection_name"],
-            "likes_count": item["total_likes_count"],
-            "words_count": item["total_wordage"],
+            "sort_id": item["like_id"],
+            "subscribe_time": datetime.fromisoformat(item["subscribed_at"]),
         }
         result.append(item_data)
     return result
@@ -267,14 +319,34 @@ def GetCollectionSubscribersInfo(
     json_obj = GetCollectionSubscribersJsonDataApi(
         collection_id, max_sort_id=start_sort_id
     )
+    return _ParseCollectionSubscribersInfo(json_obj)
+
+
+def _ParseCollectionArticlesInfo(json_obj: List[Dict]) -> List[Dict]:
     result = []
     for item in json_obj:
         item_data = {
-            "uslug": item["slug"],
-            "name": item["nickname"],
-            "avatar_url": item["avatar_source"],
-            "sort_id": item["like_id"],
-            "subscribe_time": datetime.fromisoformat(item["subscribed_at"]),
+            "aid": item["object"]["data"]["id"],
+            "title": item["object"]["data"]["title"],
+            "aslug": item["object"]["data"]["slug"],
+            "release_time": datetime.fromisoformat(
+                item["object"]["data"]["first_shared_at"]
+            ).replace(tzinfo=None),
+            "first_image_url": item["object"]["data"]["list_image_url"],
+            "summary": item["object"]["data"]["public_abbr"],
+            "views_count": item["object"]["data"]["views_count"],
+            "likes_count": item["object"]["data"]["likes_count"],
+            "paid": item["object"]["data"]["paid"],
+            "commentable": item["object"]["data"]["commentable"],
+            "user": {
+                "uid": item["object"]["data"]["user"]["id"],
+                "name": item["object"]["data"]["user"]["nickname"],
+                "uslug": item["object"]["data"]["user"]["slug"],
+                "avatar_url": item["object"]["data"]["user"]["avatar"],
+            },
+            "total_fp_amount": item["object"]["data"]["total_fp_amount"] / 1000,
+            "comments_count": item["object"]["data"]["public_comments_count"],
+            "rewards_count": item["object"]["data"]["total_rewards_count"],
         }
         result.append(item_data)
     return result
@@ -286,7 +358,8 @@ def GetCollectionArticlesInfo(
     count: int = 10,
     sorting_method: Literal["time", "comment_time", "hot"] = "time",
     disable_check: bool = False,
-) -> List[Dict]:
+    typed: bool = False,
+) -> Union[List[Dict], List[ArticleSummary]]:
     """获取专题文章信息
 
     Args:
@@ -296,9 +369,10 @@ def GetCollectionArticlesInfo(
         sorting_method (Literal["time", "comment_time", "hot"], optional): 排序方法，"time" 为按照发布时间排序，
         "comment_time" 为按照最近评论时间排序，"hot" 为按照热度排序. Defaults to "time".
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        typed (bool, optional): 为 True 时返回 ArticleSummary 对象而非字典，内存占用更小. Defaults to False.
 
     Returns:
-        List[Dict]: 文章信息
+        Union[List[Dict], List[ArticleSummary]]: 文章信息
     """
     if not disable_check:
         AssertCollectionUrl(collection_url)
@@ -314,51 +388,13 @@ def GetCollectionArticlesInfo(
         count=count,
         order_by=order_by,
     )
-    result = []
-    for item in json_obj:
-        item_data = {
-            "aid": item["object"]["data"]["id"],
-            "title": item["object"]["data"]["title"],
-            "aslug": item["object"]["data"]["slug"],
-            "release_time": datetime.fromisoformat(
-                item["object"]["data"]["first_shared_at"]
-            ).replace(tzinfo=None),
-            "first_image_url": item["object"]["data"]["list_image_url"],
-            "summary": item["object"]["data"]["public_abbr"],
-            "views_count": item["object"]["data"]["views_count"],
-            "likes_count": item["object"]["data"]["likes_count"],
-            "paid": item["object"]["data"]["paid"],
-            "commentable": item["object"]["data"]["commentable"],
-            "user": {
-                "uid": item["object"]["data"]["user"]["id"],
-                "name": item["object"]["data"]["user"]["nickname"],
-                "uslug": item["object"]["data"]["user"]["slug"],
-                "avatar_url": item["object"]["data"]["user"]["avatar"],
-            },
-            "total_fp_amount": item["object"]["data"]["total_fp_amount"] / 1000,
-            "comments_count": item["object"]["data"]["public_comments_count"],
-            "rewards_count": item["object"]["data"]["total_rewards_count"],
-        }
-        result.append(item_data)
-    return result
-
-
-def GetCollectionAllBasicData(collection_url: str, disable_check: bool = False) -> Dict:
-    """获取专题的所有基础信息
+    if typed:
+        return [ArticleSummary.from_json(item) for item in json_obj]
+    return _ParseCollectionArticlesInfo(json_obj)
 
-    Args:
-        collection_url (str): 专题 URL
-        disable_check (bool): 禁用参数有效性检查. Defaults to False.
 
-    Returns:
-        Dict: 专题基础信息
-    """
-    if not disable_check:
-        AssertCollectionUrl(collection_url)
-        AssertCollectionStatusNormal(collection_url)
+def _ParseCollectionAllBasicData(json_obj: Dict) -> Dict:
     result = {}
-    json_obj = GetCollectionJsonDataApi(collection_url)
-
     result["name"] = json_obj["title"]
     result["avatar_url"] = json_obj["image"]
     result["introduction_text"] = json_obj["content_without_html"]
@@ -377,36 +413,93 @@ def GetCollectionAllBasicData(collection_url: str, disable_check: bool = False)
     return result
 
 
+def GetCollectionAllBasicData(collection_url: str, disable_check: bool = False) -> Dict:
+    """获取专题的所有基础信息
+
+    Args:
+        collection_url (str): 专题 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 专题基础信息
+    """
+    if not disable_check:
+        AssertCollectionUrl(collection_url)
+    json_obj = GetCollectionJsonDataApi(collection_url)
+    if not disable_check:
+        AssertCollectionJsonDataNormal(collection_url, json_obj)
+    return _ParseCollectionAllBasicData(json_obj)
+
+
+def GetCollectionsAllBasicData(
+    collection_urls: Iterable[str],
+    concurrency: int = 8,
+    ordered: bool = True,
+    disable_check: bool = False,
+) -> Generator[Tuple[str, Union[Dict, Exception]], None, None]:
+    """批量获取多个专题的所有基础信息
+
+    各请求并发进行并共用连接池，单个专题获取失败不会中断整个批次
+
+    Args:
+        collection_urls (Iterable[str]): 专题 URL 序列
+        concurrency (int, optional): 并发数量上限. Defaults to 8.
+        ordered (bool, optional): 为 True 时按输入顺序返回结果，为 False 时按完成顺序返回结果. Defaults to True.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Yields:
+        Iterator[Tuple[str, Union[Dict, Exception]]]: (专题 URL, 专题基础信息或获取失败时抛出的异常)
+    """
+    yield from BatchCall(
+        lambda collection_url: GetCollectionAllBasicData(
+            collection_url, disable_check=disable_check
+        ),
+        collection_urls,
+        concurrency,
+        ordered,
+    )
+
+
 def GetCollectionAllEditorsInfo(
-    collection_id: int, max_count: Optional[int] = None
+    collection_id: int,
+    max_count: Optional[int] = None,
+    prefetch: int = 0,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
 ) -> Generator[Dict, None, None]:
     """获取专题的所有编辑信息
 
     Args:
         collection_id (int): 专题 ID
         max_count (int, optional): 获取的专题编辑信息数量上限，Defaults to None.
+        prefetch (int, optional): 预取深度，大于 0 时会并发请求后续页面. Defaults to 0.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
 
     Yields:
         Iterator[Dict], None, None]: 编辑信息
     """
-    page = 1
-    now_count = 0
-    while True:
-        result = GetCollectionEditorsInfo(collection_id, page)
-        if result:
-            page += 1
-        else:
-            return
-        for item in result:
-            yield item
-            if max_count:
-                now_count += 1
-                if now_count == max_count:
-                    return
+    yield from IterPages(
+        lambda page: GetCollectionEditorsInfo(collection_id, page),
+        max_count,
+        prefetch,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    )
 
 
 def GetCollectionAllRecommendedWritersInfo(
-    collection_id: int, count: int = 20, max_count: Optional[int] = None
+    collection_id: int,
+    count: int = 20,
+    max_count: Optional[int] = None,
+    prefetch: int = 0,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
 ) -> Generator[Dict, None, None]:
     """获取专题的所有推荐作者信息
 
@@ -414,52 +507,55 @@ def GetCollectionAllRecommendedWritersInfo(
         collection_id (int): 专题 ID
         count (int, optional): 单次获取的数据数量，会影响性能. Defaults to 20.
         max_count (int, optional): 获取的专题推荐作者信息数量上限，Defaults to None.
+        prefetch (int, optional): 预取深度，大于 0 时会并发请求后续页面. Defaults to 0.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
 
     Yields:
         Iterator[Dict], None, None]: 推荐作者信息
     """
-    page = 1
-    now_count = 0
-    while True:
-        result = GetCollectionRecommendedWritersInfo(collection_id, page, count)
-        if result:
-            page += 1
-        else:
-            return
-        for item in result:
-            yield item
-            if max_count:
-                now_count += 1
-                if now_count == max_count:
-                    return
+    yield from IterPages(
+        lambda page: GetCollectionRecommendedWritersInfo(collection_id, page, count),
+        max_count,
+        prefetch,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    )
 
 
 def GetCollectionAllSubscribersInfo(
-    collection_id: int, max_count: Optional[int] = None
+    collection_id: int,
+    max_count: Optional[int] = None,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
 ) -> Generator[Dict, None, None]:
     """获取专题的所有关注者信息
 
     Args:
         collection_id (int): 专题 ID
         max_count (int, optional): 获取的专题关注者信息数量上限，Defaults to None.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
 
     Yields:
         Iterator[Dict], None, None]: 关注者信息
     """
-    start_sort_id = None
-    now_count = 0
-    while True:
-        result = GetCollectionSubscribersInfo(collection_id, start_sort_id)
-        if result:
-            start_sort_id = result[-1]["sort_id"]
-        else:
-            return
-        for item in result:
-            yield item
-            if max_count:
-                now_count += 1
-                if now_count == max_count:
-                    return
+    yield from IterPagesById(
+        lambda start_sort_id: GetCollectionSubscribersInfo(
+            collection_id, start_sort_id
+        ),
+        lambda result: result[-1]["sort_id"],
+        max_count,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    )
 
 
 def GetCollectionAllArticlesInfo(
@@ -468,7 +564,12 @@ def GetCollectionAllArticlesInfo(
     sorting_method: Literal["time", "comment_time", "hot"] = "time",
     max_count: Optional[int] = None,
     disable_check: bool = False,
-) -> Generator[Dict, None, None]:
+    prefetch: int = 0,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+    typed: bool = False,
+) -> Generator[Union[Dict, ArticleSummary], None, None]:
     """获取专题的所有文章信息
 
     Args:
@@ -478,6 +579,12 @@ def GetCollectionAllArticlesInfo(
         "comment_time" 为按照最近评论时间排序，"hot" 为按照热度排序. Defaults to "time".
         max_count (int, optional): 获取的专题文章信息数量上限，Defaults to None.
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        prefetch (int, optional): 预取深度，大于 0 时会并发请求后续页面. Defaults to 0.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
+        typed (bool, optional): 为 True 时返回 ArticleSummary 对象而非字典，内存占用更小. Defaults to False.
 
     Yields:
         Iterator[Dict], None, None]: 文章信息
@@ -485,19 +592,13 @@ def GetCollectionAllArticlesInfo(
     if not disable_check:
         AssertCollectionUrl(collection_url)
         AssertCollectionStatusNormal(collection_url)
-    page = 1
-    now_count = 0
-    while True:
-        result = GetCollectionArticlesInfo(
-            collection_url, page, count, sorting_method, disable_check=True
-        )
-        if result:
-            page += 1
-        else:
-            return
-        for item in result:
-            yield item
-            if max_count:
-                now_count += 1
-                if now_count == max_count:
-                    return
+    yield from IterPages(
+        lambda page: GetCollectionArticlesInfo(
+            collection_url, page, count, sorting_method, typed=typed, disable_check=True
+        ),
+        max_count,
+        prefetch,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    )
@@ -1,4 +1,4 @@
-__all__ = ["InputError", "APIError", "ResourceError"]
+__all__ = ["InputError", "APIError", "ResourceError", "BudgetExceededError"]
 
 
 class InputError(Exception):
@@ -15,3 +15,7 @@ class APIError(Exception):
 
 class ResourceError(Exception):
     """访问的资源不存在或无法正常访问时抛出此异常"""
+
+
+class BudgetExceededError(Exception):
+    """请求次数超出请求预算时抛出此异常"""
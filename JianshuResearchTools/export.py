@@ -0,0 +1,309 @@
+import gzip
+from contextlib import suppress
+from datetime import date, datetime
+from json import JSONEncoder
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
+
+from .records import _Record
+
+with suppress(ImportError):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+with suppress(ImportError):
+    import zstandard
+
+__all__ = [
+    "IterArrowBatches",
+    "WriteParquet",
+    "WriteFeather",
+    "WriteNDJSON",
+]
+
+Row = Union[Dict, _Record]
+
+
+def _AssertPyarrowInstalled() -> None:
+    try:
+        pa  # noqa: B018  # type: ignore
+    except NameError:
+        raise ImportError("未安装 pyarrow 模块，该函数不可用") from None
+
+
+def _ToRow(item: Row) -> Dict:
+    return item.to_dict() if isinstance(item, _Record) else item
+
+
+def IterArrowBatches(
+    items: Iterable[Row],
+    batch_size: int = 10000,
+    schema: Optional["pa.Schema"] = None,
+) -> Generator["pa.RecordBatch", None, None]:
+    """将数据流按固定大小切分，逐批转换为 Arrow RecordBatch
+
+    同一时间只有一批数据驻留在内存中，嵌套字典会被转换为 struct 类型的列
+
+    Args:
+        items (Iterable[Union[Dict, _Record]]): 数据条目，可直接传入 "All" 系列生成器
+        batch_size (int, optional): 每批的数据条数. Defaults to 10000.
+        schema (Optional[pa.Schema], optional): 列类型，为 None 时根据第一批数据推断，
+        如果某列在第一批数据中全部为 None，请手动指定. Defaults to None.
+
+    Yields:
+        Iterator[pa.RecordBatch]: Arrow RecordBatch
+    """
+    _AssertPyarrowInstalled()
+    if batch_size <= 0:
+        raise ValueError("每批的数据条数必须大于 0")
+    rows: List[Dict] = []
+    for item in items:
+        rows.append(_ToRow(item))
+        if len(rows) == batch_size:
+            batch = pa.RecordBatch.from_pylist(rows, schema=schema)
+            schema = batch.schema  # 后续批次使用相同的列类型
+            rows = []
+            yield batch
+    if rows:
+        yield pa.RecordBatch.from_pylist(rows, schema=schema)
+
+
+def WriteParquet(
+    items: Iterable[Row],
+    path: str,
+    batch_size: int = 10000,
+    schema: Optional["pa.Schema"] = None,
+    compression: Literal["zstd", "snappy", "gzip", "none"] = "zstd",
+) -> int:
+    """以流式方式将数据写入 Parquet 文件，每批数据写入一个行组
+
+    Args:
+        items (Iterable[Union[Dict, _Record]]): 数据条目，可直接传入 "All" 系列生成器
+        path (str): 文件路径
+        batch_size (int, optional): 每批的数据条数. Defaults to 10000.
+        schema (Optional[pa.Schema], optional): 列类型，为 None 时根据第一批数据推断. Defaults to None.
+        compression (Literal["zstd", "snappy", "gzip", "none"], optional): 压缩算法. Defaults to "zstd".
+
+    Returns:
+        int: 写入的数据条数，没有数据且未指定 schema 时不会创建文件
+    """
+    writer: Any = None
+    rows_count = 0
+    try:
+        for batch in IterArrowBatches(items, batch_size, schema):
+            if writer is None:
+                writer = pq.ParquetWriter(path, batch.schema, compression=compression)
+            writer.write_table(pa.Table.from_batches([batch]))
+            rows_count += batch.num_rows
+        if writer is None and schema is not None:
+            writer = pq.ParquetWriter(path, schema, compression=compression)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows_count
+
+
+def WriteFeather(
+    items: Iterable[Row],
+    path: str,
+    batch_size: int = 10000,
+    schema: Optional["pa.Schema"] = None,
+    compression: Optional[Literal["zstd", "lz4"]] = "zstd",
+) -> int:
+    """以流式方式将数据写入 Feather（Arrow IPC）文件
+
+    Args:
+        items (Iterable[Union[Dict, _Record]]): 数据条目，可直接传入 "All" 系列生成器
+        path (str): 文件路径
+        batch_size (int, optional): 每批的数据条数. Defaults to 10000.
+        schema (Optional[pa.Schema], optional): 列类型，为 None 时根据第一批数据推断. Defaults to None.
+        compression (Optional[Literal["zstd", "lz4"]], optional): 压缩算法，为 None 时不压缩. Defaults to "zstd".
+
+    Returns:
+        int: 写入的数据条数，没有数据且未指定 schema 时不会创建文件
+    """
+    writer: Any = None
+    rows_count = 0
+    try:
+        for batch in IterArrowBatches(items, batch_size, schema):
+            if writer is None:
+                writer = _NewFeatherWriter(path, batch.schema, compression)
+            writer.write_batch(batch)
+            rows_count += batch.num_rows
+        if writer is None and schema is not None:
+            writer = _NewFeatherWriter(path, schema, compression)
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows_count
+
+
+def _NewFeatherWriter(
+    path: str, schema: "pa.Schema", compression: Optional[str]
+) -> "pa.ipc.RecordBatchFileWriter":
+    return pa.ipc.new_file(
+        path, schema, options=pa.ipc.IpcWriteOptions(compression=compression)
+    )
+
+
+def _JsonDefault(obj: Any) -> Any:
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"无法序列化 {type(obj).__name__} 类型的对象")
+
+
+def _GetLineSerializer() -> Callable[[Dict], bytes]:
+    # orjson 与 msgspec 原生支持 datetime，且直接输出 bytes
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        option = orjson.OPT_APPEND_NEWLINE
+        return lambda obj: orjson.dumps(obj, option=option)
+
+    try:
+        from msgspec.json import Encoder
+    except ImportError:
+        pass
+    else:
+        encode = Encoder().encode
+        return lambda obj: encode(obj) + b"\n"
+
+    encoder = JSONEncoder(
+        ensure_ascii=False, separators=(",", ":"), default=_JsonDefault
+    )
+    return lambda obj: (encoder.encode(obj) + "\n").encode()
+
+
+class _NDJSONFileWriter:
+    def __init__(
+        self,
+        target: Union[str, BinaryIO],
+        compression: Optional[str],
+        max_file_size: Optional[int],
+    ) -> None:
+        if compression not in (None, "gzip", "zstd"):
+            raise ValueError(f"不支持的压缩算法 {compression}")
+        if compression == "zstd":
+            try:
+                zstandard  # noqa: B018  # type: ignore
+            except NameError:
+                raise ImportError("未安装 zstandard 模块，无法使用 zstd 压缩") from None
+        if max_file_size is not None:
+            if not isinstance(target, str):
+                raise ValueError("写入文件对象时不支持按大小切分文件")
+            if "{index" not in target:
+                raise ValueError("按大小切分文件时，文件路径中需包含 {index} 占位符")
+        self._target = target
+        self._compression = compression
+        self._max_file_size = max_file_size
+        self._index = 0
+        self._size = 0
+        self._raw: Optional[BinaryIO] = None
+        self._file: Any = None
+
+    def _Open(self) -> None:
+        if isinstance(self._target, str):
+            path = self._target.format(index=self._index)
+            self._raw = open(path, "wb")  # noqa: SIM115
+            raw = self._raw
+        else:
+            raw = self._target
+        if self._compression == "gzip":
+            self._file = gzip.GzipFile(fileobj=raw, mode="wb")
+        elif self._compression == "zstd":
+            self._file = zstandard.ZstdCompressor().stream_writer(raw, closefd=False)
+        else:
+            self._file = raw
+
+    def _CloseFile(self) -> None:
+        if self._file is not self._target:
+            self._file.close()  # 写入压缩数据的结尾
+        if self._raw is not None:
+            self._raw.close()
+        else:
+            self._target.flush()  # type: ignore
+        self._file = None
+        self._raw = None
+
+    def GetFlushSize(self, buffer_size: int) -> int:
+        if self._max_file_size is None:
+            return buffer_size
+        return max(1, min(buffer_size, self._max_file_size - self._size))
+
+    def Write(self, chunk: bytes) -> None:
+        if self._file is None:
+            self._Open()
+        self._file.write(chunk)
+        self._size += len(chunk)
+        if self._max_file_size is not None and self._size >= self._max_file_size:
+            self._CloseFile()
+            self._index += 1
+            self._size = 0
+
+    def Close(self) -> None:
+        if self._file is not None:
+            self._CloseFile()
+
+
+def WriteNDJSON(
+    items: Iterable[Row],
+    target: Union[str, BinaryIO],
+    compression: Optional[Literal["gzip", "zstd"]] = None,
+    max_file_size: Optional[int] = None,
+    buffer_size: int = 1024 * 1024,
+) -> int:
+    """以流式方式将数据写入 NDJSON（每行一个 JSON 对象）文件
+
+    数据在内存中累积到 buffer_size 后一次性写入，写入阻塞时不会继续从 items 中读取数据，
+    因此写入管道时下游的处理速度会自然地限制爬取速度。
+    datetime 会被序列化为 ISO 8601 格式的字符串，安装 orjson 或 msgspec 后序列化速度更快。
+    items 中途抛出异常时，已获取的数据仍会写入文件，之后再抛出该异常
+
+    Args:
+        items (Iterable[Union[Dict, _Record]]): 数据条目，可直接传入 "All" 系列生成器
+        target (Union[str, BinaryIO]): 文件路径或以二进制模式打开的文件对象（如 sys.stdout.buffer），
+        按大小切分文件时，路径中需包含 {index} 占位符，如 "timeline-{index:04d}.ndjson.gz"
+        compression (Optional[Literal["gzip", "zstd"]], optional): 压缩算法，使用 zstd 需安装 zstandard. Defaults to None.
+        max_file_size (Optional[int], optional): 单个文件的大小上限（字节，按压缩前计算），
+        达到后切换到下一个文件，为 None 时不切分. Defaults to None.
+        buffer_size (int, optional): 写入缓冲区大小（字节）. Defaults to 1 MiB.
+
+    Returns:
+        int: 写入的数据条数
+    """
+    dumps = _GetLineSerializer()
+    writer = _NDJSONFileWriter(target, compression, max_file_size)
+    rows_count = 0
+    pending: List[bytes] = []
+    pending_size = 0
+    try:
+        for item in items:
+            line = dumps(_ToRow(item))
+            pending.append(line)
+            pending_size += len(line)
+            rows_count += 1
+            if pending_size >= writer.GetFlushSize(buffer_size):
+                chunk = b"".join(pending)
+                pending = []
+                pending_size = 0
+                writer.Write(chunk)
+    finally:
+        # items 中途抛出异常时，同样写入已获取的数据
+        try:
+            if pending:
+                writer.Write(b"".join(pending))
+        finally:
+            writer.Close()
+    return rows_count
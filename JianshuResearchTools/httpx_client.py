@@ -1,22 +1,338 @@
-from httpx import Client
+from asyncio import AbstractEventLoop, get_running_loop
+from os import environ
+from threading import RLock
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Union
+from weakref import WeakKeyDictionary, WeakSet
 
-from JianshuResearchTools.headers import API_HEADER, MOBILE_HEADER, PC_HEADER
+from httpx import (
+    AsyncBaseTransport,
+    AsyncClient,
+    AsyncHTTPTransport,
+    BaseTransport,
+    Client,
+    HTTPTransport,
+    Limits,
+    Proxy,
+    Timeout,
+)
 
-JIANSHU_API_CLIENT = Client(
-    http2=True,
-    timeout=5,
-    base_url="https://www.jianshu.com",
-    headers=API_HEADER,
+from JianshuResearchTools.headers import API_HEADER, MOBILE_HEADER, PC_HEADER
+from JianshuResearchTools.rate_limit import (
+    AsyncRateLimitedTransport,
+    EndpointFamily,
+    RateLimitedTransport,
 )
-JIANSHU_PC_CLIENT = Client(
-    http2=True,
-    timeout=5,
-    base_url="https://www.jianshu.com",
-    headers=PC_HEADER,
+from JianshuResearchTools.retry import AsyncRetryTransport, RetryTransport
+
+__all__ = [  # noqa: F822  客户端对象通过 __getattr__ 按需创建
+    "HttpConfig",
+    "set_http_config",
+    "get_http_config",
+    "get_client",
+    "get_async_client",
+    "JIANSHU_API_CLIENT",
+    "JIANSHU_PC_CLIENT",
+    "JIANSHU_MOBILE_CLIENT",
+    "JIANSHU_API_ASYNC_CLIENT",
+    "JIANSHU_PC_ASYNC_CLIENT",
+    "JIANSHU_MOBILE_ASYNC_CLIENT",
+]
+
+
+class HttpConfig:
+    """网络请求配置，对所有客户端统一生效"""
+
+    def __init__(
+        self,
+        limits: Optional[Limits] = None,
+        timeout: Union[float, Timeout, None] = 5,
+        http2: bool = True,
+        proxy: Optional[str] = None,
+        local_address: Optional[str] = None,
+        transport: Optional[BaseTransport] = None,
+        async_transport: Optional[AsyncBaseTransport] = None,
+    ) -> None:
+        """构建新的网络请求配置
+
+        Args:
+            limits (Optional[Limits], optional): 连接池大小与长连接保持时间，为 None 时使用 httpx 的默认值. Defaults to None.
+            timeout (Union[float, Timeout, None], optional): 超时时间（秒），可传入 httpx.Timeout 分别设置连接、读取、写入
+            与等待连接池的超时时间，为 None 时不限制. Defaults to 5.
+            http2 (bool, optional): 是否启用 HTTP/2. Defaults to True.
+            proxy (Optional[str], optional): 代理地址，如 "http://127.0.0.1:7890". Defaults to None.
+            local_address (Optional[str], optional): 发送请求时绑定的本地 IP 地址. Defaults to None.
+            transport (Optional[BaseTransport], optional): 自定义同步传输层，传入时忽略以上连接相关的配置，
+            限速与重试仍然生效. Defaults to None.
+            async_transport (Optional[AsyncBaseTransport], optional): 自定义异步传输层，同上. Defaults to None.
+        """
+        self.limits = limits if limits is not None else Limits()
+        self.timeout = timeout if isinstance(timeout, Timeout) else Timeout(timeout)
+        self.http2 = http2
+        self.proxy = proxy
+        self.local_address = local_address
+        self.transport = transport
+        self.async_transport = async_transport
+
+    @classmethod
+    def from_env(cls) -> "HttpConfig":
+        """从环境变量中读取网络请求配置，未设置的项使用默认值
+
+        支持的环境变量：JRT_HTTP2（0 / 1）、JRT_TIMEOUT、JRT_MAX_CONNECTIONS、
+        JRT_MAX_KEEPALIVE_CONNECTIONS、JRT_KEEPALIVE_EXPIRY、JRT_PROXY、JRT_LOCAL_ADDRESS
+
+        Returns:
+            HttpConfig: 网络请求配置
+        """
+        default_limits = Limits()
+        return cls(
+            limits=Limits(
+                max_connections=_GetIntEnv(
+                    "JRT_MAX_CONNECTIONS", default_limits.max_connections
+                ),
+                max_keepalive_connections=_GetIntEnv(
+                    "JRT_MAX_KEEPALIVE_CONNECTIONS",
+                    default_limits.max_keepalive_connections,
+                ),
+                keepalive_expiry=_GetFloatEnv(
+                    "JRT_KEEPALIVE_EXPIRY", default_limits.keepalive_expiry
+                ),
+            ),
+            timeout=_GetFloatEnv("JRT_TIMEOUT", 5),
+            http2=environ.get("JRT_HTTP2", "1") != "0",
+            proxy=environ.get("JRT_PROXY") or None,
+            local_address=environ.get("JRT_LOCAL_ADDRESS") or None,
+        )
+
+    def make_transport(self) -> BaseTransport:
+        """根据配置构建实际发送请求的同步传输层
+
+        Returns:
+            BaseTransport: 传输层
+        """
+        if self.transport is not None:
+            return self.transport
+        return HTTPTransport(
+            http2=self.http2,
+            limits=self.limits,
+            proxy=Proxy(self.proxy) if self.proxy else None,
+            local_address=self.local_address,
+        )
+
+    def make_async_transport(self) -> AsyncBaseTransport:
+        """根据配置构建实际发送请求的异步传输层
+
+        Returns:
+            AsyncBaseTransport: 异步传输层
+        """
+        if self.async_transport is not None:
+            return self.async_transport
+        return AsyncHTTPTransport(
+            http2=self.http2,
+            limits=self.limits,
+            proxy=Proxy(self.proxy) if self.proxy else None,
+            local_address=self.local_address,
+        )
+
+
+def _GetIntEnv(name: str, default: Optional[int]) -> Optional[int]:
+    value = environ.get(name)
+    return int(value) if value else default
+
+
+def _GetFloatEnv(name: str, default: Optional[float]) -> Optional[float]:
+    value = environ.get(name)
+    return float(value) if value else default
+
+
+_http_config = HttpConfig.from_env()
+
+# 各客户端传输层链中负责限速的一层，更新配置时替换其内部的网络传输层
+_rate_limited_transports: List[RateLimitedTransport] = []
+# 异步客户端随事件循环结束而关闭，关闭后的传输层无需再更新
+_async_rate_limited_transports: "WeakSet[AsyncRateLimitedTransport]" = WeakSet()
+
+
+def _MakeTransport(family: EndpointFamily) -> RetryTransport:
+    # 每次重试都会重新获取令牌
+    transport = RateLimitedTransport(_http_config.make_transport(), family)
+    _rate_limited_transports.append(transport)
+    return RetryTransport(transport)
+
+
+def _MakeAsyncTransport(family: EndpointFamily) -> AsyncRetryTransport:
+    transport = AsyncRateLimitedTransport(_http_config.make_async_transport(), family)
+    _async_rate_limited_transports.add(transport)
+    return AsyncRetryTransport(transport)
+
+
+def _MakeClientOptions(headers: Dict[str, str]) -> Dict:
+    return {
+        "http2": _http_config.http2,
+        "timeout": _http_config.timeout,
+        "base_url": "https://www.jianshu.com",
+        "headers": headers,
+    }
+
+
+def set_http_config(config: Optional[HttpConfig] = None) -> None:
+    """设置网络请求配置，并应用到所有同步与异步客户端（包括尚未创建的客户端）
+
+    原有的连接池将被替换，请在没有请求进行时调用
+
+    Args:
+        config (Optional[HttpConfig], optional): 网络请求配置，为 None 时恢复默认配置（包括环境变量中的配置）. Defaults to None.
+    """
+    global _http_config
+    _http_config = config if config is not None else HttpConfig.from_env()
+    with _clients_lock:
+        clients = [
+            *_clients.values(),
+            *_unbound_async_clients.values(),
+            *(client for x in _async_clients.values() for client in x.values()),
+        ]
+    for client in clients:
+        client.timeout = _http_config.timeout
+    for transport in _rate_limited_transports:
+        old_transport = transport.transport
+        transport.transport = _http_config.make_transport()
+        if old_transport is not transport.transport:
+            old_transport.close()
+    # 异步传输层需要在事件循环中关闭，此处只替换，旧连接池中的连接会在回收时关闭
+    for async_transport in list(_async_rate_limited_transports):
+        async_transport.transport = _http_config.make_async_transport()
+
+
+def get_http_config() -> HttpConfig:
+    """获取当前的网络请求配置
+
+    Returns:
+        HttpConfig: 网络请求配置
+    """
+    return _http_config
+
+
+_CLIENT_HEADERS: Dict[EndpointFamily, Dict[str, str]] = {
+    "api": API_HEADER,
+    "pc": PC_HEADER,
+    "mobile": MOBILE_HEADER,
+}
+# 客户端在首次发送请求时才创建，以缩短导入耗时
+_clients: Dict[EndpointFamily, Client] = {}
+# 异步客户端的连接只能在创建它的事件循环中使用，因此每个事件循环分别创建客户端
+_async_clients: "WeakKeyDictionary[AbstractEventLoop, Dict[EndpointFamily, AsyncClient]]" = (
+    WeakKeyDictionary()
 )
-JIANSHU_MOBILE_CLIENT = Client(
-    http2=True,
-    timeout=5,
-    base_url="https://www.jianshu.com",
-    headers=MOBILE_HEADER,
+_async_client_closers: "WeakKeyDictionary[AbstractEventLoop, AsyncGenerator[None, None]]" = (
+    WeakKeyDictionary()
 )
+# 在事件循环外获取的异步客户端（如导入 JIANSHU_API_ASYNC_CLIENT 时），只能在一个事件循环中使用
+_unbound_async_clients: Dict[EndpointFamily, AsyncClient] = {}
+_clients_lock = RLock()
+
+
+def get_client(family: EndpointFamily) -> Client:
+    """获取对应接口类型的客户端，首次调用时创建
+
+    Args:
+        family (EndpointFamily): 接口类型，可选 "api"、"pc"、"mobile"
+
+    Returns:
+        Client: 客户端
+    """
+    client = _clients.get(family)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(family)
+            if client is None:
+                client = Client(
+                    **_MakeClientOptions(_CLIENT_HEADERS[family]),
+                    transport=_MakeTransport(family),
+                )
+                _clients[family] = client
+    return client
+
+
+async def _CloseAsyncClientsOnShutdown(
+    loop: AbstractEventLoop, clients: Dict[EndpointFamily, AsyncClient]
+) -> AsyncGenerator[None, None]:
+    # 事件循环在 shutdown_asyncgens() 中关闭所有未结束的异步生成器，asyncio.run 返回前会调用该方法
+    try:
+        yield
+    finally:
+        with _clients_lock:
+            _async_clients.pop(loop, None)
+            _async_client_closers.pop(loop, None)
+        for client in clients.values():
+            await client.aclose()
+
+
+async def _StartCloser(closer: AsyncGenerator[None, None]) -> None:
+    # 首次迭代时异步生成器注册到当前事件循环中
+    await closer.__anext__()
+
+
+def _GetLoopAsyncClients(loop: AbstractEventLoop) -> Dict[EndpointFamily, AsyncClient]:
+    clients = _async_clients.get(loop)
+    if clients is None:
+        # 未调用 shutdown_asyncgens() 就关闭的事件循环，其中的客户端只能在回收时关闭连接
+        for other_loop in list(_async_clients.keys()):
+            if other_loop.is_closed():
+                _async_clients.pop(other_loop, None)
+                _async_client_closers.pop(other_loop, None)
+        clients = _async_clients[loop] = {}
+        closer = _async_client_closers[loop] = _CloseAsyncClientsOnShutdown(
+            loop, clients
+        )
+        loop.create_task(_StartCloser(closer))
+    return clients
+
+
+def get_async_client(family: EndpointFamily) -> AsyncClient:
+    """获取当前事件循环中对应接口类型的异步客户端，首次调用时创建
+
+    每个事件循环分别创建客户端，并在事件循环结束时（如 asyncio.run 返回前）关闭，
+    在事件循环外调用时返回不绑定事件循环的客户端，该客户端只能在一个事件循环中使用
+
+    Args:
+        family (EndpointFamily): 接口类型，可选 "api"、"pc"、"mobile"
+
+    Returns:
+        AsyncClient: 异步客户端
+    """
+    try:
+        loop: Optional[AbstractEventLoop] = get_running_loop()
+    except RuntimeError:
+        loop = None
+    clients = _unbound_async_clients if loop is None else _async_clients.get(loop)
+    client = clients.get(family) if clients is not None else None
+    if client is None:
+        with _clients_lock:
+            clients = (
+                _unbound_async_clients if loop is None else _GetLoopAsyncClients(loop)
+            )
+            client = clients.get(family)
+            if client is None:
+                client = AsyncClient(
+                    **_MakeClientOptions(_CLIENT_HEADERS[family]),
+                    transport=_MakeAsyncTransport(family),
+                )
+                clients[family] = client
+    return client
+
+
+_CLIENT_NAMES: Dict[str, Tuple[EndpointFamily, bool]] = {
+    "JIANSHU_API_CLIENT": ("api", False),
+    "JIANSHU_PC_CLIENT": ("pc", False),
+    "JIANSHU_MOBILE_CLIENT": ("mobile", False),
+    "JIANSHU_API_ASYNC_CLIENT": ("api", True),
+    "JIANSHU_PC_ASYNC_CLIENT": ("pc", True),
+    "JIANSHU_MOBILE_ASYNC_CLIENT": ("mobile", True),
+}
+
+
+def __getattr__(name: str) -> Any:
+    # 兼容直接导入客户端对象的旧代码
+    if name in _CLIENT_NAMES:
+        family, is_async = _CLIENT_NAMES[name]
+        return get_async_client(family) if is_async else get_client(family)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,23 @@
 from contextlib import suppress
 from datetime import datetime
-from typing import Dict, Generator, List, Literal, Optional
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from .assert_funcs import AssertIslandPostUrl, AssertIslandStatusNormal, AssertIslandUrl
+from .assert_funcs import (
+    AssertIslandJsonDataNormal,
+    AssertIslandPostUrl,
+    AssertIslandStatusNormal,
+    AssertIslandUrl,
+)
 from .basic_apis import (
     GetIslandJsonDataApi,
     GetIslandPostJsonDataApi,
@@ -13,6 +28,7 @@ from .convert import (
     IslandPostUrlToIslandPostSlug,
     IslandUrlToIslandSlug,
 )
+from .utils import BatchCall, Cursor, IterPagesById
 
 __all__ = [
     "GetIslandName",
@@ -24,6 +40,7 @@ __all__ = [
     "GetIslandPostFullContent",
     "GetIslandPosts",
     "GetIslandAllBasicData",
+    "GetIslandsAllBasicData",
     "GetIslandAllPostsData",
 ]
 
@@ -40,8 +57,9 @@ def GetIslandName(island_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertIslandUrl(island_url)
-        AssertIslandStatusNormal(island_url)
     json_obj = GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
     return json_obj["name"]
 
 
@@ -57,8 +75,9 @@ def GetIslandAvatarUrl(island_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertIslandUrl(island_url)
-        AssertIslandStatusNormal(island_url)
     json_obj = GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
     return json_obj["image"]
 
 
@@ -74,8 +93,9 @@ def GetIslandIntroduction(island_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertIslandUrl(island_url)
-        AssertIslandStatusNormal(island_url)
     json_obj = GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
     return json_obj["intro"]
 
 
@@ -91,8 +111,9 @@ def GetIslandMembersCount(island_url: str, disable_check: bool = False) -> int:
     """
     if not disable_check:
         AssertIslandUrl(island_url)
-        AssertIslandStatusNormal(island_url)
     json_obj = GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
     return json_obj["members_count"]
 
 
@@ -108,8 +129,9 @@ def GetIslandPostsCount(island_url: str, disable_check: bool = False) -> int:
     """
     if not disable_check:
         AssertIslandUrl(island_url)
-        AssertIslandStatusNormal(island_url)
     json_obj = GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
     return json_obj["posts_count"]
 
 
@@ -125,8 +147,9 @@ def GetIslandCategory(island_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertIslandUrl(island_url)
-        AssertIslandStatusNormal(island_url)
     json_obj = GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
     return json_obj["category"]["name"]
 
 
@@ -147,47 +170,7 @@ def GetIslandPostFullContent(post_url: str, disable_check: bool = False) -> str:
     return json_obj["content"]
 
 
-def GetIslandPosts(
-    island_url: str,
-    start_sort_id: Optional[int] = None,
-    count: int = 10,
-    topic_id: Optional[int] = None,
-    sorting_method: Literal["time", "comment_time", "hot"] = "time",
-    get_full_content: bool = False,
-    disable_check: bool = False,
-) -> List[Dict]:
-    """获取小岛帖子信息
-
-    Args:
-        island_url (str): 小岛 URL
-        start_sort_id (int, optional): 起始序号，等于上一条数据的序号. Defaults to None.
-        count (int, optional): 每次返回的数据数量. Defaults to 10.
-        topic_id (int, optional): 话题 ID. Defaults to None.
-        sorting_method (Literal["time", "comment_time", "hot"], optional): 排序方法，"time" 为按照发布时间排序，
-        "comment_time" 为按照最近评论时间排序，"hot" 为按照热度排序. Defaults to "time".
-        get_full_content (bool, optional): 为 True 时，当检测到获取的帖子内容不全时，
-        自动调用 GetIslandPostFullContent 函数获取完整内容并替换. Defaults to False.
-        disable_check (bool): 禁用参数有效性检查. Defaults to False.
-
-    Returns:
-        List[Dict]: 帖子信息
-    """
-    if not disable_check:
-        AssertIslandUrl(island_url)
-        AssertIslandStatusNormal(island_url)
-    order_by = {
-        "time": "latest",
-        "hot": "hot",
-        "most_valuable": "best",
-    }[sorting_method]
-    json_obj = GetIslandPostsJsonDataApi(
-        group_slug=IslandUrlToIslandSlug(island_url),
-        max_id=start_sort_id,
-        count=count,
-        topic_id=topic_id,
-        order_by=order_by,
-    )
-
+def _ParseIslandPosts(json_obj: List[Dict]) -> List[Dict]:
     result = []
     for item in json_obj:
         item_data = {
@@ -237,30 +220,63 @@ def GetIslandPosts(
                 "topic_name": item["topic"]["name"]
                 # 有个 group_role 不知道干什么用的，没解析
             }
-        if get_full_content and "..." in item_data["content"]:  # 获取到的帖子内容不全
-            item_data["content"] = GetIslandPostFullContent(
-                IslandPostSlugToIslandPostUrl(item_data["pslug"]), disable_check=True
-            )
         result.append(item_data)
     return result
 
 
-def GetIslandAllBasicData(island_url: str, disable_check: bool = False) -> Dict:
-    """获取小岛的所有基础信息
+def GetIslandPosts(
+    island_url: str,
+    start_sort_id: Optional[int] = None,
+    count: int = 10,
+    topic_id: Optional[int] = None,
+    sorting_method: Literal["time", "comment_time", "hot"] = "time",
+    get_full_content: bool = False,
+    disable_check: bool = False,
+) -> List[Dict]:
+    """获取小岛帖子信息
 
     Args:
         island_url (str): 小岛 URL
+        start_sort_id (int, optional): 起始序号，等于上一条数据的序号. Defaults to None.
+        count (int, optional): 每次返回的数据数量. Defaults to 10.
+        topic_id (int, optional): 话题 ID. Defaults to None.
+        sorting_method (Literal["time", "comment_time", "hot"], optional): 排序方法，"time" 为按照发布时间排序，
+        "comment_time" 为按照最近评论时间排序，"hot" 为按照热度排序. Defaults to "time".
+        get_full_content (bool, optional): 为 True 时，当检测到获取的帖子内容不全时，
+        自动调用 GetIslandPostFullContent 函数获取完整内容并替换. Defaults to False.
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
 
     Returns:
-        Dict: 小岛基础信息
+        List[Dict]: 帖子信息
     """
     if not disable_check:
-        AssertIslandPostUrl(island_url)
+        AssertIslandUrl(island_url)
         AssertIslandStatusNormal(island_url)
-    result = {}
-    json_obj = GetIslandJsonDataApi(island_url)
+    order_by = {
+        "time": "latest",
+        "hot": "hot",
+        "most_valuable": "best",
+    }[sorting_method]
+    json_obj = GetIslandPostsJsonDataApi(
+        group_slug=IslandUrlToIslandSlug(island_url),
+        max_id=start_sort_id,
+        count=count,
+        topic_id=topic_id,
+        order_by=order_by,
+    )
+    result = _ParseIslandPosts(json_obj)
+    if get_full_content:
+        for item_data in result:
+            if "..." in item_data["content"]:  # 获取到的帖子内容不全
+                item_data["content"] = GetIslandPostFullContent(
+                    IslandPostSlugToIslandPostUrl(item_data["pslug"]),
+                    disable_check=True,
+                )
+    return result
 
+
+def _ParseIslandAllBasicData(json_obj: Dict) -> Dict:
+    result = {}
     result["name"] = json_obj["name"]
     result["avatar_url"] = json_obj["image"]
     result["introduction"] = json_obj["intro"]
@@ -270,6 +286,53 @@ def GetIslandAllBasicData(island_url: str, disable_check: bool = False) -> Dict:
     return result
 
 
+def GetIslandAllBasicData(island_url: str, disable_check: bool = False) -> Dict:
+    """获取小岛的所有基础信息
+
+    Args:
+        island_url (str): 小岛 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 小岛基础信息
+    """
+    if not disable_check:
+        AssertIslandUrl(island_url)
+    json_obj = GetIslandJsonDataApi(island_url)
+    if not disable_check:
+        AssertIslandJsonDataNormal(island_url, json_obj)
+    return _ParseIslandAllBasicData(json_obj)
+
+
+def GetIslandsAllBasicData(
+    island_urls: Iterable[str],
+    concurrency: int = 8,
+    ordered: bool = True,
+    disable_check: bool = False,
+) -> Generator[Tuple[str, Union[Dict, Exception]], None, None]:
+    """批量获取多个小岛的所有基础信息
+
+    各请求并发进行并共用连接池，单个小岛获取失败不会中断整个批次
+
+    Args:
+        island_urls (Iterable[str]): 小岛 URL 序列
+        concurrency (int, optional): 并发数量上限. Defaults to 8.
+        ordered (bool, optional): 为 True 时按输入顺序返回结果，为 False 时按完成顺序返回结果. Defaults to True.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Yields:
+        Iterator[Tuple[str, Union[Dict, Exception]]]: (小岛 URL, 小岛基础信息或获取失败时抛出的异常)
+    """
+    yield from BatchCall(
+        lambda island_url: GetIslandAllBasicData(
+            island_url, disable_check=disable_check
+        ),
+        island_urls,
+        concurrency,
+        ordered,
+    )
+
+
 def GetIslandAllPostsData(
     island_url: str,
     count: int = 10,
@@ -278,6 +341,9 @@ def GetIslandAllPostsData(
     get_full_content: bool = False,
     max_count: Optional[int] = None,
     disable_check: bool = False,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
 ) -> Generator[Dict, None, None]:
     """获取小岛的所有帖子信息
 
@@ -291,6 +357,10 @@ def GetIslandAllPostsData(
         自动调用 GetIslandPostFullContent 函数获取完整内容并替换. Defaults to False.
         max_count (int, optional): 获取的小岛帖子信息数量上限，Defaults to None.
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
 
     Yields:
         Iterator[Dict], None, None]: 帖子信息
@@ -298,10 +368,8 @@ def GetIslandAllPostsData(
     if not disable_check:
         AssertIslandUrl(island_url)
         AssertIslandStatusNormal(island_url)
-    start_sort_id = None
-    now_count = 0
-    while True:
-        result = GetIslandPosts(
+    yield from IterPagesById(
+        lambda start_sort_id: GetIslandPosts(
             island_url,
             start_sort_id,
             count,
@@ -309,14 +377,10 @@ def GetIslandAllPostsData(
             sorting_method,
             get_full_content,
             disable_check=True,
-        )
-        if result:
-            start_sort_id = result[-1]["sorted_id"]
-        else:
-            return
-        for item in result:
-            yield item
-            if max_count:
-                now_count += 1
-                if now_count == max_count:
-                    return
+        ),
+        lambda result: result[-1]["sorted_id"],
+        max_count,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    )
@@ -0,0 +1,113 @@
+from importlib import import_module
+from os import environ
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+__all__ = [
+    "json_loads",
+    "set_json_backend",
+    "get_json_backend",
+    "get_available_json_backends",
+]
+
+JsonLoads = Callable[[Union[bytes, str]], Any]
+
+
+def _LoadOrjson() -> JsonLoads:
+    return import_module("orjson").loads
+
+
+def _LoadMsgspec() -> JsonLoads:
+    # 复用同一个解码器，避免每次调用都重新构建
+    return import_module("msgspec.json").Decoder().decode
+
+
+def _LoadUjson() -> JsonLoads:
+    return import_module("ujson").loads
+
+
+def _LoadJson() -> JsonLoads:
+    return import_module("json").loads
+
+
+# 按自动检测时的优先级排列，以上各库均可直接解码 bytes，无需先转换为 str
+_BACKEND_LOADERS: Dict[str, Callable[[], JsonLoads]] = {
+    "orjson": _LoadOrjson,
+    "msgspec": _LoadMsgspec,
+    "ujson": _LoadUjson,
+    "json": _LoadJson,
+}
+
+_ENV_NAME = "JRT_JSON_BACKEND"
+
+
+def _DetectBackend() -> Tuple[str, JsonLoads]:
+    for name, loader in _BACKEND_LOADERS.items():
+        try:
+            return name, loader()
+        except ImportError:
+            continue
+    return "json", _LoadJson()
+
+
+def get_available_json_backends() -> Tuple[str, ...]:
+    """获取当前环境中可用的 JSON 解析库
+
+    Returns:
+        Tuple[str, ...]: 按自动检测优先级排列的可用解析库名称
+    """
+    result = []
+    for name, loader in _BACKEND_LOADERS.items():
+        try:
+            loader()
+        except ImportError:
+            continue
+        result.append(name)
+    return tuple(result)
+
+
+def set_json_backend(name: Optional[str] = None) -> None:
+    """设置用于解析接口响应的 JSON 库
+
+    Args:
+        name (Optional[str], optional): 解析库名称，可选 "orjson"、"msgspec"、"ujson"、"json"，
+        为 None 时按 orjson > msgspec > ujson > json 的顺序自动选择已安装的库. Defaults to None.
+
+    Raises:
+        ValueError: 不支持该解析库时抛出此错误
+        ImportError: 该解析库未安装时抛出此错误
+    """
+    global _backend_name, _loads
+    if name is None:
+        _backend_name, _loads = _DetectBackend()
+        return
+    if name not in _BACKEND_LOADERS:
+        raise ValueError(f"不支持的 JSON 解析库 {name}，可选值为 {'、'.join(_BACKEND_LOADERS)}")
+    _loads = _BACKEND_LOADERS[name]()
+    _backend_name = name
+
+
+def get_json_backend() -> str:
+    """获取当前使用的 JSON 解析库名称
+
+    Returns:
+        str: 解析库名称
+    """
+    return _backend_name
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """使用当前的 JSON 解析库解析数据
+
+    Args:
+        data (Union[bytes, str]): JSON 数据，响应内容可直接以 bytes 形式传入
+
+    Returns:
+        Any: 解析结果
+    """
+    return _loads(data)
+
+
+_backend_name: str
+_loads: JsonLoads
+# 可通过环境变量 JRT_JSON_BACKEND 指定解析库
+set_json_backend(environ.get(_ENV_NAME) or None)
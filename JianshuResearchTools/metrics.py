@@ -0,0 +1,470 @@
+from bisect import bisect_left
+from contextlib import suppress
+from contextvars import ContextVar
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+with suppress(ImportError):
+    from opentelemetry import metrics as otel_metrics
+
+__all__ = [
+    "Histogram",
+    "EndpointMetrics",
+    "RequestMetrics",
+    "OpenTelemetryExporter",
+    "enable_metrics",
+    "disable_metrics",
+    "get_metrics",
+]
+
+T = TypeVar("T")
+
+# 耗时直方图的桶上界（秒）
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+)
+
+
+class Histogram:
+    """固定分桶的耗时直方图，内存占用不随样本数量增长"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """构建新的直方图
+
+        Args:
+            buckets (Tuple[float, ...], optional): 递增的桶上界（秒），最后隐含一个无上界的桶. Defaults to DEFAULT_BUCKETS.
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """记录一个样本
+
+        Args:
+            value (float): 样本值（秒）
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """估算分位数，在样本所在的桶内线性插值
+
+        Args:
+            q (float): 分位，如 0.95
+
+        Returns:
+            Optional[float]: 分位数估计值（秒），没有样本时返回 None
+        """
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典
+
+        Returns:
+            Dict[str, Any]: 样本数量、总和、平均值、最大值与 p50 / p95 / p99
+        """
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else None,
+            "max": self.max if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+
+class EndpointMetrics:
+    """单个接口的请求统计"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.requests = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.bytes_received = 0
+        self.status_codes: Dict[int, int] = {}
+        self.network_time = Histogram()
+        self.parse_time = Histogram()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为字典
+
+        Returns:
+            Dict[str, Any]: 统计数据
+        """
+        return {
+            "calls": self.calls,
+            "requests": self.requests,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "bytes_received": self.bytes_received,
+            "status_codes": dict(self.status_codes),
+            "network_time": self.network_time.to_dict(),
+            "parse_time": self.parse_time.to_dict(),
+        }
+
+
+class RequestMetrics:
+    """按接口统计请求数量、传输字节数、状态码，以及网络耗时与解析耗时的分布"""
+
+    def __init__(self) -> None:
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+        # 添加导出器时整体替换，记录数据时在锁内取得引用，在锁外调用导出器
+        self._exporters: Tuple["OpenTelemetryExporter", ...] = ()
+        self._lock = Lock()
+
+    def _Get(self, endpoint: str) -> EndpointMetrics:
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoints.setdefault(endpoint, EndpointMetrics())
+        return metrics
+
+    def record_request(
+        self, endpoint: str, status_code: int, bytes_count: int, duration: float
+    ) -> None:
+        """记录一次网络请求
+
+        Args:
+            endpoint (str): 接口名称
+            status_code (int): 响应状态码
+            bytes_count (int): 响应内容字节数
+            duration (float): 网络耗时（秒）
+        """
+        with self._lock:
+            metrics = self._Get(endpoint)
+            metrics.requests += 1
+            metrics.bytes_received += bytes_count
+            metrics.status_codes[status_code] = (
+                metrics.status_codes.get(status_code, 0) + 1
+            )
+            metrics.network_time.observe(duration)
+            exporters = self._exporters
+        for exporter in exporters:
+            exporter.record_request(endpoint, status_code, bytes_count, duration)
+
+    def record_cache_hit(self, endpoint: str) -> None:
+        """记录一次响应缓存命中
+
+        Args:
+            endpoint (str): 接口名称
+        """
+        with self._lock:
+            self._Get(endpoint).cache_hits += 1
+
+    def record_coalesced(self, endpoint: str) -> None:
+        """记录一次与其它调用合并、没有单独发送的请求
+
+        Args:
+            endpoint (str): 接口名称
+        """
+        with self._lock:
+            self._Get(endpoint).coalesced += 1
+
+    def record_call(
+        self, endpoint: str, parse_duration: Optional[float], failed: bool
+    ) -> None:
+        """记录一次接口函数调用
+
+        Args:
+            endpoint (str): 接口名称
+            parse_duration (Optional[float]): 解析耗时（秒），调用失败时为 None
+            failed (bool): 调用是否抛出异常
+        """
+        with self._lock:
+            metrics = self._Get(endpoint)
+            metrics.calls += 1
+            if failed:
+                metrics.errors += 1
+            if parse_duration is not None:
+                metrics.parse_time.observe(parse_duration)
+            exporters = self._exporters
+        if parse_duration is not None:
+            for exporter in exporters:
+                exporter.record_parse(endpoint, parse_duration)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """获取当前统计数据的快照
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 以接口名称为键的统计数据
+        """
+        with self._lock:
+            return {
+                endpoint: metrics.to_dict()
+                for endpoint, metrics in sorted(self._endpoints.items())
+            }
+
+    def reset(self) -> None:
+        """清空统计数据，已添加的 OpenTelemetry 导出器仍然保留"""
+        with self._lock:
+            self._endpoints.clear()
+
+    def to_prometheus(self, prefix: str = "jrt") -> str:
+        """以 Prometheus 文本格式导出统计数据
+
+        Args:
+            prefix (str, optional): 指标名称前缀. Defaults to "jrt".
+
+        Returns:
+            str: Prometheus 文本格式的指标
+        """
+        lines: List[str] = []
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            for name, attr, help_text in (
+                ("calls_total", "calls", "接口函数调用次数"),
+                ("requests_total", "requests", "网络请求次数"),
+                ("cache_hits_total", "cache_hits", "响应缓存命中次数"),
+                ("coalesced_total", "coalesced", "与其它调用合并的请求次数"),
+                ("errors_total", "errors", "接口函数调用失败次数"),
+                ("received_bytes_total", "bytes_received", "接收的响应字节数"),
+            ):
+                lines.append(f"# HELP {prefix}_{name} {help_text}")
+                lines.append(f"# TYPE {prefix}_{name} counter")
+                lines.extend(
+                    f'{prefix}_{name}{{endpoint="{endpoint}"}} {getattr(metrics, attr)}'
+                    for endpoint, metrics in endpoints
+                )
+
+            lines.append(f"# HELP {prefix}_responses_total 按状态码统计的响应数量")
+            lines.append(f"# TYPE {prefix}_responses_total counter")
+            for endpoint, metrics in endpoints:
+                lines.extend(
+                    f'{prefix}_responses_total{{endpoint="{endpoint}",code="{code}"}} {count}'
+                    for code, count in sorted(metrics.status_codes.items())
+                )
+
+            for name, attr, help_text in (
+                ("network_seconds", "network_time", "网络耗时"),
+                ("parse_seconds", "parse_time", "解析耗时"),
+            ):
+                lines.append(f"# HELP {prefix}_{name} {help_text}")
+                lines.append(f"# TYPE {prefix}_{name} histogram")
+                for endpoint, metrics in endpoints:
+                    histogram: Histogram = getattr(metrics, attr)
+                    cumulative = 0
+                    for bucket, bucket_count in zip(
+                        (*histogram.buckets, "+Inf"), histogram.counts
+                    ):
+                        cumulative += bucket_count
+                        lines.append(
+                            f'{prefix}_{name}_bucket{{endpoint="{endpoint}",le="{bucket}"}} {cumulative}'
+                        )
+                    lines.append(
+                        f'{prefix}_{name}_sum{{endpoint="{endpoint}"}} {histogram.sum}'
+                    )
+                    lines.append(
+                        f'{prefix}_{name}_count{{endpoint="{endpoint}"}} {histogram.count}'
+                    )
+        return "\n".join(lines) + "\n"
+
+    def add_opentelemetry_exporter(
+        self, meter_provider: Any = None
+    ) -> "OpenTelemetryExporter":
+        """将此后记录的数据同时发送到 OpenTelemetry，需要安装 opentelemetry-api
+
+        Args:
+            meter_provider (Any, optional): MeterProvider 对象，为 None 时使用全局对象. Defaults to None.
+
+        Returns:
+            OpenTelemetryExporter: 导出器
+        """
+        exporter = OpenTelemetryExporter(meter_provider)
+        with self._lock:
+            self._exporters = (*self._exporters, exporter)
+        return exporter
+
+
+class OpenTelemetryExporter:
+    """将请求统计数据发送到 OpenTelemetry 的导出器"""
+
+    def __init__(self, meter_provider: Any = None) -> None:
+        """构建新的导出器
+
+        Args:
+            meter_provider (Any, optional): MeterProvider 对象，为 None 时使用全局对象. Defaults to None.
+        """
+        try:
+            otel_metrics  # noqa: B018  # type: ignore
+        except NameError:
+            raise ImportError("未安装 opentelemetry-api 模块，该功能不可用") from None
+        meter = otel_metrics.get_meter(
+            "JianshuResearchTools", meter_provider=meter_provider
+        )
+        self._requests = meter.create_counter("jrt.requests", description="网络请求次数")
+        self._bytes = meter.create_counter(
+            "jrt.received_bytes", unit="By", description="接收的响应字节数"
+        )
+        self._network_time = meter.create_histogram(
+            "jrt.network_time", unit="s", description="网络耗时"
+        )
+        self._parse_time = meter.create_histogram(
+            "jrt.parse_time", unit="s", description="解析耗时"
+        )
+
+    def record_request(
+        self, endpoint: str, status_code: int, bytes_count: int, duration: float
+    ) -> None:
+        attributes = {"endpoint": endpoint, "status_code": status_code}
+        self._requests.add(1, attributes)
+        self._bytes.add(bytes_count, {"endpoint": endpoint})
+        self._network_time.record(duration, attributes)
+
+    def record_parse(self, endpoint: str, duration: float) -> None:
+        self._parse_time.record(duration, {"endpoint": endpoint})
+
+
+_metrics: Optional[RequestMetrics] = None
+
+
+def enable_metrics() -> RequestMetrics:
+    """启用请求统计，此后所有基础接口的调用都将被记录
+
+    Returns:
+        RequestMetrics: 请求统计对象
+    """
+    global _metrics
+    if _metrics is None:
+        _metrics = RequestMetrics()
+    return _metrics
+
+
+def disable_metrics() -> None:
+    """停用请求统计"""
+    global _metrics
+    _metrics = None
+
+
+def get_metrics() -> Optional[RequestMetrics]:
+    """获取当前启用的请求统计对象
+
+    Returns:
+        Optional[RequestMetrics]: 请求统计对象，未启用时返回 None
+    """
+    return _metrics
+
+
+class _CallState:
+    __slots__ = ("endpoint", "source_time")
+
+    def __init__(self, endpoint: str) -> None:
+        self.endpoint = endpoint
+        self.source_time: Optional[float] = None  # 最后一次获取到响应内容的时间
+
+
+_call_state: ContextVar[Optional[_CallState]] = ContextVar(
+    "jrt_call_state", default=None
+)
+
+
+def _RecordCall(state: _CallState, failed: bool) -> None:
+    if _metrics is None:
+        return
+    parse_duration = (
+        perf_counter() - state.source_time
+        if state.source_time is not None and not failed
+        else None
+    )
+    _metrics.record_call(state.endpoint, parse_duration, failed)
+
+
+def _InstrumentApi(func: Callable[..., T]) -> Callable[..., T]:
+    # 解析耗时为最后一次获取到响应内容后，到函数返回前的耗时
+    endpoint = func.__name__
+
+    @wraps(func)
+    def inner(*args: Any, **kwargs: Any) -> T:
+        if _metrics is None:
+            return func(*args, **kwargs)
+        state = _CallState(endpoint)
+        token = _call_state.set(state)
+        try:
+            result = func(*args, **kwargs)
+        except Exception:
+            _RecordCall(state, failed=True)
+            raise
+        finally:
+            _call_state.reset(token)
+        _RecordCall(state, failed=False)
+        return result
+
+    return inner
+
+
+def _InstrumentAsyncApi(
+    func: Callable[..., Awaitable[T]]
+) -> Callable[..., Awaitable[T]]:
+    endpoint = func.__name__
+
+    @wraps(func)
+    async def inner(*args: Any, **kwargs: Any) -> T:
+        if _metrics is None:
+            return await func(*args, **kwargs)
+        state = _CallState(endpoint)
+        token = _call_state.set(state)
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            _RecordCall(state, failed=True)
+            raise
+        finally:
+            _call_state.reset(token)
+        _RecordCall(state, failed=False)
+        return result
+
+    return inner
+
+
+def _RecordSource(
+    status_code: Optional[int],
+    bytes_count: int,
+    start_time: float,
+    coalesced: bool = False,
+) -> None:
+    """记录一次获取响应内容的操作，status_code 为 None 时表示命中响应缓存或与其它调用合并"""
+    state = _call_state.get()
+    if _metrics is None or state is None:
+        return
+    now = perf_counter()
+    state.source_time = now
+    if coalesced:
+        _metrics.record_coalesced(state.endpoint)
+    elif status_code is None:
+        _metrics.record_cache_hit(state.endpoint)
+    else:
+        _metrics.record_request(
+            state.endpoint, status_code, bytes_count, now - start_time
+        )
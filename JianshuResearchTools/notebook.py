@@ -1,8 +1,24 @@
 from datetime import datetime
-from typing import Dict, Generator, List, Literal, Optional
-
-from .assert_funcs import AssertNotebookStatusNormal, AssertNotebookUrl
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .assert_funcs import (
+    AssertNotebookJsonDataNormal,
+    AssertNotebookStatusNormal,
+    AssertNotebookUrl,
+)
 from .basic_apis import GetNotebookArticlesJsonDataApi, GetNotebookJsonDataApi
+from .records import ArticleSummary
+from .utils import BatchCall, Cursor, IterPages
 
 __all__ = [
     "GetNotebookName",
@@ -13,6 +29,7 @@ __all__ = [
     "GetNotebookUpdateTime",
     "GetNotebookArticlesInfo",
     "GetNotebookAllBasicData",
+    "GetNotebooksAllBasicData",
     "GetNotebookAllArticlesInfo",
 ]
 
@@ -29,8 +46,9 @@ def GetNotebookName(notebook_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertNotebookUrl(notebook_url)
-        AssertNotebookStatusNormal(notebook_url)
     json_obj = GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
     return json_obj["name"]
 
 
@@ -46,11 +64,20 @@ def GetNotebookArticlesCount(notebook_url: str, disable_check: bool = False) ->
     """
     if not disable_check:
         AssertNotebookUrl(notebook_url)
-        AssertNotebookStatusNormal(notebook_url)
     json_obj = GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
     return json_obj["notes_count"]
 
 
+def _ParseNotebookAuthorInfo(json_obj: Dict) -> Dict:
+    return {
+        "name": json_obj["user"]["nickname"],
+        "uslug": json_obj["user"]["slug"],
+        "avatar_url": json_obj["user"]["avatar"],
+    }
+
+
 def GetNotebookAuthorInfo(notebook_url: str, disable_check: bool = False) -> Dict:
     """获取文集作者的信息
 
@@ -63,13 +90,10 @@ def GetNotebookAuthorInfo(notebook_url: str, disable_check: bool = False) -> Dic
     """
     if not disable_check:
         AssertNotebookUrl(notebook_url)
-        AssertNotebookStatusNormal(notebook_url)
     json_obj = GetNotebookJsonDataApi(notebook_url)
-    return {
-        "name": json_obj["user"]["nickname"],
-        "uslug": json_obj["user"]["slug"],
-        "avatar_url": json_obj["user"]["avatar"],
-    }
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
+    return _ParseNotebookAuthorInfo(json_obj)
 
 
 def GetNotebookWordage(notebook_url: str, disable_check: bool = False) -> int:
@@ -84,8 +108,9 @@ def GetNotebookWordage(notebook_url: str, disable_check: bool = False) -> int:
     """
     if not disable_check:
         AssertNotebookUrl(notebook_url)
-        AssertNotebookStatusNormal(notebook_url)
     json_obj = GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
     return json_obj["wordage"]
 
 
@@ -101,8 +126,9 @@ def GetNotebookSubscribersCount(notebook_url: str, disable_check: bool = False)
     """
     if not disable_check:
         AssertNotebookUrl(notebook_url)
-        AssertNotebookStatusNormal(notebook_url)
     json_obj = GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
     return json_obj["subscribers_count"]
 
 
@@ -118,42 +144,13 @@ def GetNotebookUpdateTime(notebook_url: str, disable_check: bool = False) -> dat
     """
     if not disable_check:
         AssertNotebookUrl(notebook_url)
-        AssertNotebookStatusNormal(notebook_url)
     json_obj = GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
     return datetime.fromtimestamp(json_obj["last_updated_at"])
 
 
-def GetNotebookArticlesInfo(
-    notebook_url: str,
-    page: int = 1,
-    count: int = 10,
-    sorting_method: Literal["time", "comment_time", "hot"] = "time",
-    disable_check: bool = False,
-) -> List[Dict]:
-    """获取文集中的文章信息
-
-    Args:
-        notebook_url (str): 文集 URL
-        page (int, optional): 页码. Defaults to 1.
-        count (int, optional): 每次返回的数据数量. Defaults to 10.
-        sorting_method (Literal["time", "comment_time", "hot"], optional): 排序方法，"time" 为按照发布时间排序，
-        "comment_time" 为按照最近评论时间排序，"hot" 为按照热度排序. Defaults to "time".
-        disable_check (bool): 禁用参数有效性检查. Defaults to False.
-
-    Returns:
-        List[Dict]: 文章信息
-    """
-    if not disable_check:
-        AssertNotebookUrl(notebook_url)
-        AssertNotebookStatusNormal(notebook_url)
-    order_by = {
-        "time": "added_at",
-        "comment_time": "commented_at",
-        "hot": "top",
-    }[sorting_method]
-    json_obj = GetNotebookArticlesJsonDataApi(
-        notebook_url=notebook_url, page=page, count=count, order_by=order_by
-    )
+def _ParseNotebookArticlesInfo(json_obj: List[Dict]) -> List[Dict]:
     result = []
     for item in json_obj:
         item_data = {
@@ -184,22 +181,46 @@ def GetNotebookArticlesInfo(
     return result
 
 
-def GetNotebookAllBasicData(notebook_url: str, disable_check: bool = False) -> Dict:
-    """获取文集的所有基础信息
+def GetNotebookArticlesInfo(
+    notebook_url: str,
+    page: int = 1,
+    count: int = 10,
+    sorting_method: Literal["time", "comment_time", "hot"] = "time",
+    disable_check: bool = False,
+    typed: bool = False,
+) -> Union[List[Dict], List[ArticleSummary]]:
+    """获取文集中的文章信息
 
     Args:
         notebook_url (str): 文集 URL
+        page (int, optional): 页码. Defaults to 1.
+        count (int, optional): 每次返回的数据数量. Defaults to 10.
+        sorting_method (Literal["time", "comment_time", "hot"], optional): 排序方法，"time" 为按照发布时间排序，
+        "comment_time" 为按照最近评论时间排序，"hot" 为按照热度排序. Defaults to "time".
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        typed (bool, optional): 为 True 时返回 ArticleSummary 对象而非字典，内存占用更小. Defaults to False.
 
     Returns:
-        Dict: 文集基础信息
+        Union[List[Dict], List[ArticleSummary]]: 文章信息
     """
     if not disable_check:
         AssertNotebookUrl(notebook_url)
         AssertNotebookStatusNormal(notebook_url)
-    result = {}
-    json_obj = GetNotebookJsonDataApi(notebook_url)
+    order_by = {
+        "time": "added_at",
+        "comment_time": "commented_at",
+        "hot": "top",
+    }[sorting_method]
+    json_obj = GetNotebookArticlesJsonDataApi(
+        notebook_url=notebook_url, page=page, count=count, order_by=order_by
+    )
+    if typed:
+        return [ArticleSummary.from_json(item) for item in json_obj]
+    return _ParseNotebookArticlesInfo(json_obj)
 
+
+def _ParseNotebookAllBasicData(json_obj: Dict) -> Dict:
+    result = {}
     result["name"] = json_obj["name"]
     result["author_info"] = {
         "name": json_obj["user"]["nickname"],
@@ -213,13 +234,65 @@ def GetNotebookAllBasicData(notebook_url: str, disable_check: bool = False) -> D
     return result
 
 
+def GetNotebookAllBasicData(notebook_url: str, disable_check: bool = False) -> Dict:
+    """获取文集的所有基础信息
+
+    Args:
+        notebook_url (str): 文集 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 文集基础信息
+    """
+    if not disable_check:
+        AssertNotebookUrl(notebook_url)
+    json_obj = GetNotebookJsonDataApi(notebook_url)
+    if not disable_check:
+        AssertNotebookJsonDataNormal(notebook_url, json_obj)
+    return _ParseNotebookAllBasicData(json_obj)
+
+
+def GetNotebooksAllBasicData(
+    notebook_urls: Iterable[str],
+    concurrency: int = 8,
+    ordered: bool = True,
+    disable_check: bool = False,
+) -> Generator[Tuple[str, Union[Dict, Exception]], None, None]:
+    """批量获取多个文集的所有基础信息
+
+    各请求并发进行并共用连接池，单个文集获取失败不会中断整个批次
+
+    Args:
+        notebook_urls (Iterable[str]): 文集 URL 序列
+        concurrency (int, optional): 并发数量上限. Defaults to 8.
+        ordered (bool, optional): 为 True 时按输入顺序返回结果，为 False 时按完成顺序返回结果. Defaults to True.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Yields:
+        Iterator[Tuple[str, Union[Dict, Exception]]]: (文集 URL, 文集基础信息或获取失败时抛出的异常)
+    """
+    yield from BatchCall(
+        lambda notebook_url: GetNotebookAllBasicData(
+            notebook_url, disable_check=disable_check
+        ),
+        notebook_urls,
+        concurrency,
+        ordered,
+    )
+
+
 def GetNotebookAllArticlesInfo(
     notebook_url: str,
     count: int = 10,
     sorting_method: Literal["time", "comment_time", "hot"] = "time",
     max_count: Optional[int] = None,
     disable_check: bool = False,
-) -> Generator[Dict, None, None]:
+    prefetch: int = 0,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+    typed: bool = False,
+) -> Generator[Union[Dict, ArticleSummary], None, None]:
     """获取文集中的全部文章信息
 
     Args:
@@ -229,6 +302,12 @@ def GetNotebookAllArticlesInfo(
         comment_time 为按照最近评论时间排序，hot 为按照热度排序. Defaults to "time".
         max_count (int, optional): 获取的文集文章信息数量上限，Defaults to None.
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        prefetch (int, optional): 预取深度，大于 0 时会并发请求后续页面. Defaults to 0.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
+        typed (bool, optional): 为 True 时返回 ArticleSummary 对象而非字典，内存占用更小. Defaults to False.
 
     Yields:
         Iterator[Dict], None, None]: 文章信息
@@ -236,19 +315,13 @@ def GetNotebookAllArticlesInfo(
     if not disable_check:
         AssertNotebookUrl(notebook_url)
         AssertNotebookStatusNormal(notebook_url)
-    page = 1
-    now_count = 0
-    while True:
-        result = GetNotebookArticlesInfo(
-            notebook_url, page, count, sorting_method, disable_check=True
-        )
-        if result:
-            page += 1
-        else:
-            return
-        for item in result:
-            yield item
-            if max_count:
-                now_count += 1
-                if max_count == now_count:
-                    return
+    yield from IterPages(
+        lambda page: GetNotebookArticlesInfo(
+            notebook_url, page, count, sorting_method, typed=typed, disable_check=True
+        ),
+        max_count,
+        prefetch,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    )
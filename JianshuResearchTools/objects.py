@@ -1,20 +1,36 @@
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from functools import wraps
+from threading import RLock
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from lxml.etree import _Element
 
 from . import article, collection, island, notebook, user
 from .assert_funcs import (
-    AssertArticleStatusNormal,
+    AssertArticleJsonDataNormal,
     AssertArticleUrl,
-    AssertCollectionStatusNormal,
+    AssertCollectionJsonDataNormal,
     AssertCollectionUrl,
-    AssertIslandStatusNormal,
+    AssertIslandJsonDataNormal,
     AssertIslandUrl,
-    AssertNotebookStatusNormal,
+    AssertNotebookJsonDataNormal,
     AssertNotebookUrl,
     AssertType,
-    AssertUserStatusNormal,
+    AssertUserJsonDataNormal,
     AssertUserUrl,
 )
+from .basic_apis import (
+    GetArticleHtmlJsonDataApi,
+    GetArticleJsonDataApi,
+    GetCollectionJsonDataApi,
+    GetIslandJsonDataApi,
+    GetNotebookJsonDataApi,
+    GetUserCollectionsAndNotebooksJsonDataApi,
+    GetUserJsonDataApi,
+    GetUserPCHtmlDataApi,
+)
 from .convert import (
     ArticleSlugToArticleUrl,
     ArticleUrlToArticleSlug,
@@ -37,54 +53,208 @@ __all__ = [
     "Notebook",
     "Collection",
     "Island",
+    "LRUCache",
     "get_cache_items_count",
+    "get_cache_stats",
+    "set_cache_backend",
     "get_cache_status",
     "set_cache_status",
+    "get_data_ttl",
+    "set_data_ttl",
     "clear_cache",
 ]
 
-_cache_dict: Dict[int, Any] = {}
 _DISABLE_CACHE = False  # 禁用缓存
+_data_ttl: Optional[float] = 300  # 用户、文章等数据的缓存有效期（秒）
+# 专题编辑、推荐作者等很少变化的数据的缓存有效期（秒）
+_STABLE_DATA_TTL = 3600
+# 每次清空缓存时加一，生成于此前的数据快照随之失效
+_snapshot_generation = 0
+
+
+class LRUCache:
+    """线程安全的 LRU 缓存，支持容量上限与过期时间
+
+    可通过 set_cache_backend 替换为其它缓存后端，
+    后端需实现与该类相同的 get、set、delete、clear、__len__ 方法与 stats 属性
+    """
 
+    def __init__(self, max_size: int = 10000) -> None:
+        """构建新的缓存对象
 
-def cache_result_wrapper(func: Callable) -> Callable:
-    """该函数是一个装饰器，用于缓存函数的返回值
+        Args:
+            max_size (int, optional): 缓存条目数量上限. Defaults to 10000.
+        """
+        if max_size <= 0:
+            raise ValueError("缓存条目数量上限必须大于 0")
+        self._max_size = max_size
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """获取缓存值
+
+        Args:
+            key (Hashable): 缓存键
+
+        Returns:
+            Tuple[bool, Any]: (是否命中, 缓存值)，未命中或已过期时缓存值为 None
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                expire_time, value = item
+                if expire_time is None or expire_time > monotonic():
+                    self._data.move_to_end(key)
+                    self._hits += 1
+                    return True, value
+                del self._data[key]  # 已过期
+            self._misses += 1
+            return False, None
+
+    def set(  # noqa: A003
+        self, key: Hashable, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        """设置缓存值，超出容量上限时淘汰最久未使用的条目
+
+        Args:
+            key (Hashable): 缓存键
+            value (Any): 缓存值
+            ttl (Optional[float], optional): 有效期（秒），为 None 时永不过期. Defaults to None.
+        """
+        expire_time = monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._data[key] = (expire_time, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """删除缓存值，键不存在时不做任何操作
+
+        Args:
+            key (Hashable): 缓存键
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """清空所有缓存值"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        """返回未过期的缓存值数量，统计前先清除已过期的条目
+
+        Returns:
+            int: 已缓存值数量
+        """
+        with self._lock:
+            now = monotonic()
+            expired_keys = [
+                key
+                for key, (expire_time, _) in self._data.items()
+                if expire_time is not None and expire_time <= now
+            ]
+            for key in expired_keys:
+                del self._data[key]
+            return len(self._data)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """获取缓存命中统计
+
+        Returns:
+            Dict[str, int]: 命中次数（hits）、未命中次数（misses）与淘汰次数（evictions）
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+
+_cache = LRUCache()
+
+
+# 未指定有效期时，使用 set_data_ttl 设置的有效期
+_USE_DATA_TTL: Any = object()
+
+
+def cache_result_wrapper(
+    func: Optional[Callable] = None, *, ttl: Optional[float] = _USE_DATA_TTL
+) -> Callable:
+    """该函数是一个装饰器，用于缓存对象方法的返回值，同一 URL 的不同对象共用缓存
+
+    可直接使用，也可通过 @cache_result_wrapper(ttl=...) 为单个方法指定缓存有效期，
+    未指定时与数据快照相同，可通过 set_data_ttl 设置
 
     Args:
-        func (Callable): 被装饰的函数
+        func (Optional[Callable], optional): 被装饰的函数. Defaults to None.
+        ttl (Optional[float], optional): 缓存有效期（秒），为 None 时永不过期. Defaults to 数据缓存有效期.
     """
+    if func is None:
+        return lambda func: cache_result_wrapper(func, ttl=ttl)
 
+    @wraps(func)
     def inner(*args: Any, **kwargs: Any) -> Any:
         if _DISABLE_CACHE:
             # 缓存已禁用，直接执行函数并返回结果
             return func(*args, **kwargs)
 
-        # 生成哈希值
-        args_hash = hash(
-            (hash(func.__qualname__),)
-            + (hash(args[0]),)
-            + tuple(args[1:])
-            + tuple(kwargs.items())
+        # 被装饰的均为对象方法，缓存键中只保存对象的 URL 而非对象本身，
+        # 避免缓存延长对象及其数据快照的生命周期；同一资源的不同对象共用缓存
+        self, *other_args = args
+        key = (
+            func.__qualname__,
+            self._url,
+            tuple(other_args),
+            tuple(sorted(kwargs.items())),
         )
 
-        cache_result = _cache_dict.get(args_hash)
-        if cache_result:  # 如果缓存中有值，则直接返回缓存值
+        hit, cache_result = _cache.get(key)
+        if hit:  # 如果缓存中有值，则直接返回缓存值
             return cache_result
 
         result = func(*args, **kwargs)  # 运行函数，获取返回值
-        _cache_dict[args_hash] = result  # 将返回值存入缓存
+        # 将返回值存入缓存
+        _cache.set(key, result, _data_ttl if ttl is _USE_DATA_TTL else ttl)
         return result
 
     return inner
 
 
 def get_cache_items_count() -> int:
-    """该函数用于获取已缓存值的数量
+    """该函数用于获取已缓存值的数量，不含已过期的值
 
     Returns:
         int: 已缓存值数量
     """
-    return len(_cache_dict)
+    return len(_cache)
+
+
+def get_cache_stats() -> Dict[str, int]:
+    """获取缓存命中统计
+
+    Returns:
+        Dict[str, int]: 命中次数（hits）、未命中次数（misses）与淘汰次数（evictions）
+    """
+    return _cache.stats
+
+
+def set_cache_backend(backend: Any) -> None:
+    """设置缓存后端，原有缓存值将被丢弃
+
+    Args:
+        backend (Any): 缓存后端，如 LRUCache(max_size=100000)
+    """
+    global _cache
+    _cache = backend
 
 
 def get_cache_status() -> bool:
@@ -108,12 +278,94 @@ def set_cache_status(status: bool) -> None:
     _DISABLE_CACHE = not status
 
 
+def get_data_ttl() -> Optional[float]:
+    """获取用户、文章等数据的缓存有效期
+
+    Returns:
+        Optional[float]: 有效期（秒），为 None 时永不过期
+    """
+    return _data_ttl
+
+
+def set_data_ttl(ttl: Optional[float]) -> None:
+    """设置用户、文章等数据的缓存有效期，同时作用于对象的数据快照与未单独指定有效期的方法返回值缓存
+
+    Args:
+        ttl (Optional[float]): 有效期（秒），为 None 时永不过期
+    """
+    if ttl is not None and ttl < 0:
+        raise ValueError("有效期不能小于 0")
+
+    global _data_ttl
+    _data_ttl = ttl
+
+
 def clear_cache():  # noqa: ANN201
-    """该函数用于清空已缓存的所有值"""
-    _cache_dict.clear()
+    """该函数用于清空已缓存的所有值，已构建对象的数据快照也将失效"""
+    global _snapshot_generation
+    _cache.clear()
+    _snapshot_generation += 1
+
+
+class _SnapshotMixin:
+    """原始数据快照，同一对象的多个属性共用一次请求获取的数据"""
+
+    # 值为 (过期时间, 生成时的缓存代数, 原始数据)
+    _snapshots: Dict[str, Tuple[Optional[float], int, Any]]
+    _snapshots_lock: RLock
+
+    def _init_snapshots(self) -> None:
+        self._snapshots = {}
+        self._snapshots_lock = RLock()
 
+    def _get_valid_snapshot(
+        self, name: str
+    ) -> Optional[Tuple[Optional[float], int, Any]]:
+        snapshot = self._snapshots.get(name)
+        if snapshot is None:
+            return None
+        expire_time, generation, _ = snapshot
+        if generation != _snapshot_generation:  # 缓存已被清空
+            return None
+        if expire_time is not None and expire_time <= monotonic():
+            return None
+        return snapshot
 
-class User:
+    def _get_snapshot(self, name: str, fetch_func: Callable[[], Any]) -> Any:
+        """获取原始数据快照，首次访问、快照过期或缓存被清空时请求数据
+
+        多个线程同时访问时只会请求一次。缓存被禁用时，每次访问都会重新请求数据
+
+        Args:
+            name (str): 快照名称
+            fetch_func (Callable[[], Any]): 获取原始数据的函数
+
+        Returns:
+            Any: 原始数据
+        """
+        if _DISABLE_CACHE:
+            return fetch_func()
+        snapshot = self._get_valid_snapshot(name)
+        if snapshot is None:
+            with self._snapshots_lock:
+                snapshot = self._get_valid_snapshot(name)  # 其它线程可能已完成请求
+                if snapshot is None:
+                    generation = _snapshot_generation
+                    value = fetch_func()
+                    expire_time = (
+                        monotonic() + _data_ttl if _data_ttl is not None else None
+                    )
+                    snapshot = (expire_time, generation, value)
+                    self._snapshots[name] = snapshot
+        return snapshot[2]
+
+    def refresh(self) -> None:
+        """清空原始数据快照，下次访问属性时重新获取数据"""
+        with self._snapshots_lock:
+            self._snapshots.clear()
+
+
+class User(_SnapshotMixin):
     """用户类"""
 
     def __init__(
@@ -136,8 +388,10 @@ class User:
         else:
             raise ValueError("user_url 和 user_slug 至少需要传入一个")
 
-        AssertUserStatusNormal(user_url)
         self._url = user_url
+        self._init_snapshots()
+        # 状态检查所用的数据同时作为快照，避免重复请求
+        AssertUserJsonDataNormal(user_url, self._json_obj)
 
     @classmethod
     def from_url(cls, user_url: str) -> "User":
@@ -173,7 +427,26 @@ class User:
         return self._url
 
     @property
-    @cache_result_wrapper
+    def _json_obj(self) -> Dict:
+        """用户 JSON 数据快照"""
+        return self._get_snapshot("json", lambda: GetUserJsonDataApi(self._url))
+
+    @property
+    def _html_obj(self) -> _Element:
+        """用户个人主页 HTML 数据快照"""
+        return self._get_snapshot("pc_html", lambda: GetUserPCHtmlDataApi(self._url))
+
+    @property
+    def _collections_and_notebooks_json_obj(self) -> Dict:
+        """用户专题与文集 JSON 数据快照"""
+        return self._get_snapshot(
+            "collections_and_notebooks",
+            lambda: GetUserCollectionsAndNotebooksJsonDataApi(
+                self._url, UserUrlToUserSlug(self._url)
+            ),
+        )
+
+    @property
     def slug(self) -> str:
         """获取用户 Slug
 
@@ -183,184 +456,170 @@ class User:
         return UserUrlToUserSlug(self._url)
 
     @property
-    @cache_result_wrapper
     def name(self) -> str:
         """获取用户昵称
 
         Returns:
             str: 用户昵称
         """
-        return CallWithoutCheck(user.GetUserName, self._url)
+        return self._json_obj["nickname"]
 
     @property
-    @cache_result_wrapper
     def gender(self) -> int:
         """获取用户性别
 
         Returns:
             int: 用户性别，0 为未知，1 为男，2 为女
         """
-        return CallWithoutCheck(user.GetUserGender, self._url)
+        return user._ParseUserGender(self._json_obj)
 
     @property
-    @cache_result_wrapper
     def followers_count(self) -> int:
         """获取用户关注数
 
         Returns:
             int: 关注数
         """
-        return CallWithoutCheck(user.GetUserFollowersCount, self._url)
+        return self._json_obj["following_users_count"]
 
     @property
-    @cache_result_wrapper
     def fans_count(self) -> int:
         """获取用户粉丝数
 
         Returns:
             int: 粉丝数
         """
-        return CallWithoutCheck(user.GetUserFansCount, self._url)
+        return self._json_obj["followers_count"]
 
     @property
-    @cache_result_wrapper
     def articles_count(self) -> int:
         """获取用户文章数
 
         Returns:
             int: 文章数
         """
-        return CallWithoutCheck(user.GetUserArticlesCount, self._url)
+        return user._ParseUserArticlesCount(self._html_obj)
 
     @property
-    @cache_result_wrapper
     def wordage(self) -> int:
         """获取用户总字数
 
         Returns:
             int: 总字数
         """
-        return CallWithoutCheck(user.GetUserWordage, self._url)
+        return self._json_obj["total_wordage"]
 
     @property
-    @cache_result_wrapper
     def likes_count(self) -> int:
         """获取用户被点赞数
 
         Returns:
             int: 被点赞数
         """
-        return CallWithoutCheck(user.GetUserLikesCount, self._url)
+        return self._json_obj["total_likes_count"]
 
     @property
-    @cache_result_wrapper
     def assets_count(self) -> float:
         """获取用户资产量
 
         Returns:
             int: 资产量
         """
-        return CallWithoutCheck(user.GetUserAssetsCount, self._url)
+        return user._ParseUserAssetsCount(self._html_obj)
 
     @property
-    @cache_result_wrapper
     def FP_count(self) -> float:
         """获取用户简书钻数量
 
         Returns:
             int: 简书钻数量
         """
-        return CallWithoutCheck(user.GetUserFPCount, self._url)
+        return user._ParseUserFPCount(self._json_obj)
 
     @property
-    @cache_result_wrapper
     def FTN_count(self) -> float:
         """获取用户简书贝数量
 
         Returns:
             int: 简书贝数量
         """
-        return CallWithoutCheck(user.GetUserFTNCount, self._url)
+        return user._ParseUserFTNCount(self._json_obj, self._html_obj)
 
     @property
-    @cache_result_wrapper
     def badges(self) -> List:
         """获取徽章列表
 
         Returns:
             List: 徽章列表
         """
-        return CallWithoutCheck(user.GetUserBadgesList, self._url)
+        return user._ParseUserBadgesList(self._html_obj)
 
     @property
-    @cache_result_wrapper
     def last_update_time(self) -> datetime:
         """获取最近更新时间
 
         Returns:
             datetime: 最近更新时间
         """
-        return CallWithoutCheck(user.GetUserLastUpdateTime, self._url)
+        return datetime.fromtimestamp(self._json_obj["last_updated_at"])
 
     @property
-    @cache_result_wrapper
     def VIP_info(self) -> Dict:
         """获取用户会员信息
 
         Returns:
             Dict: 会员信息
         """
-        return CallWithoutCheck(user.GetUserVIPInfo, self._url)
+        return user._ParseUserVIPInfo(self._json_obj)
 
     @property
-    @cache_result_wrapper
     def introduction_text(self) -> str:
         """获取纯文本格式的用户简介
 
         Returns:
             str: 纯文本格式的用户简介
         """
-        return CallWithoutCheck(user.GetUserIntroductionText, self._url)
+        return user._ParseUserIntroductionText(self._json_obj)
 
     @property
-    @cache_result_wrapper
     def introduction_html(self) -> str:
         """获取 Html 格式的用户简介
 
         Returns:
             str: Html 格式的用户简介
         """
-        return CallWithoutCheck(user.GetUserIntroductionHtml, self._url)
+        return self._json_obj["intro"]
 
     @property
-    @cache_result_wrapper
     def notebooks(self) -> List:
         """获取用户文集信息
 
         Returns:
             List: 文集信息
         """
-        return CallWithoutCheck(user.GetUserNotebooksInfo, self._url)
+        return user._ParseUserNotebooksInfo(self._collections_and_notebooks_json_obj)
 
     @property
-    @cache_result_wrapper
     def own_collections(self) -> List:
         """获取自己创建的专题信息
 
         Returns:
             List: 自己创建的专题信息
         """
-        return CallWithoutCheck(user.GetUserOwnCollectionsInfo, self._url)
+        return user._ParseUserCollectionsInfo(
+            self._collections_and_notebooks_json_obj["own_collections"]
+        )
 
     @property
-    @cache_result_wrapper
     def manageable_collections(self) -> List:
         """获取用户有管理权的专题信息
 
         Returns:
             List: 有管理权的专题信息
         """
-        return CallWithoutCheck(user.GetUserManageableCollectionsInfo, self._url)
+        return user._ParseUserCollectionsInfo(
+            self._collections_and_notebooks_json_obj["manageable_collections"]
+        )
 
     @cache_result_wrapper
     def articles_info(self, page: int = 1, count: int = 10) -> List[Dict]:
@@ -448,7 +707,7 @@ class User:
         )
 
 
-class Article:
+class Article(_SnapshotMixin):
     """文章类"""
 
     def __init__(
@@ -471,8 +730,10 @@ class Article:
         else:
             raise ValueError("article_url 和 article_slug 至少需要传入一个")
 
-        AssertArticleStatusNormal(article_url)
         self._url = article_url
+        self._init_snapshots()
+        # 状态检查所用的数据同时作为快照，避免重复请求
+        AssertArticleJsonDataNormal(article_url, self._json_obj)
 
     @classmethod
     def from_url(cls, article_url: str) -> "Article":
@@ -508,7 +769,18 @@ class Article:
         return self._url
 
     @property
-    @cache_result_wrapper
+    def _json_obj(self) -> Dict:
+        """文章 JSON 数据快照"""
+        return self._get_snapshot("json", lambda: GetArticleJsonDataApi(self._url))
+
+    @property
+    def _html_json_obj(self) -> Dict:
+        """文章页面中的 JSON 数据快照"""
+        return self._get_snapshot(
+            "html_json", lambda: GetArticleHtmlJsonDataApi(self._url)
+        )
+
+    @property
     def slug(self) -> str:
         """获取文章 Slug
 
@@ -518,147 +790,138 @@ class Article:
         return ArticleUrlToArticleSlug(self._url)
 
     @property
-    @cache_result_wrapper
     def title(self) -> str:
         """获取文章标题
 
         Returns:
             str: 标题
         """
-        return CallWithoutCheck(article.GetArticleTitle, self._url)
+        return self._json_obj["public_title"]
 
     @property
-    @cache_result_wrapper
     def author_name(self) -> str:
         """获取文章作者名
 
         Returns:
             str: 作者名
         """
-        return CallWithoutCheck(article.GetArticleAuthorName, self._url)
+        return self._html_json_obj["props"]["initialState"]["note"]["data"]["user"][
+            "nickname"
+        ]
 
     @property
-    @cache_result_wrapper
     def wordage(self) -> int:
         """获取文章总字数
 
         Returns:
             int: 总字数
         """
-        return CallWithoutCheck(article.GetArticleWordage, self._url)
+        return self._html_json_obj["props"]["initialState"]["note"]["data"]["wordage"]
 
     @property
-    @cache_result_wrapper
     def reads_count(self) -> int:
         """获取文章阅读量
 
         Returns:
             int: 阅读量
         """
-        return CallWithoutCheck(article.GetArticleReadsCount, self._url)
+        return self._html_json_obj["props"]["initialState"]["note"]["data"][
+            "views_count"
+        ]
 
     @property
-    @cache_result_wrapper
     def likes_count(self) -> int:
         """获取文章点赞量
 
         Returns:
             int: 文章点赞量
         """
-        return CallWithoutCheck(article.GetArticleLikesCount, self._url)
+        return self._json_obj["likes_count"]
 
     @property
-    @cache_result_wrapper
     def comments_count(self) -> int:
         """获取文章评论量
 
         Returns:
             int: 文章评论量
         """
-        return CallWithoutCheck(article.GetArticleCommentsCount, self._url)
+        return self._json_obj["public_comment_count"]
 
     @property
-    @cache_result_wrapper
     def most_valuable_comments_count(self) -> int:
         """获取文章精选评论量
 
         Returns:
             int: 文章精选评论量
         """
-        return CallWithoutCheck(article.GetArticleMostValuableCommentsCount, self._url)
+        return self._json_obj["featured_comments_count"]
 
     @property
-    @cache_result_wrapper
     def total_FP_count(self) -> float:
         """获取文章总获钻量
 
         Returns:
             int: 文章总获钻量
         """
-        return CallWithoutCheck(article.GetArticleTotalFPCount, self._url)
+        return self._json_obj["total_fp_amount"] / 1000
 
     @property
-    @cache_result_wrapper
     def description(self) -> str:
         """获取文章摘要
 
         Returns:
             str: 文章摘要
         """
-        return CallWithoutCheck(article.GetArticleDescription, self._url)
+        return self._json_obj["description"]
 
     @property
-    @cache_result_wrapper
     def publish_time(self) -> datetime:
         """获取文章发布时间
 
         Returns:
             datetime: 文章发布时间
         """
-        return CallWithoutCheck(article.GetArticlePublishTime, self._url)
+        return datetime.fromisoformat(self._json_obj["first_shared_at"]).replace(
+            tzinfo=None
+        )
 
     @property
-    @cache_result_wrapper
     def update_time(self) -> datetime:
         """获取文章更新时间
 
         Returns:
             datetime: 文章更新时间
         """
-        return CallWithoutCheck(article.GetArticleUpdateTime, self._url)
+        return datetime.fromtimestamp(self._json_obj["last_updated_at"])
 
     @property
-    @cache_result_wrapper
     def paid_status(self) -> bool:
         """获取文章付费状态
 
         Returns:
             bool: 文章付费状态
         """
-        return CallWithoutCheck(article.GetArticlePaidStatus, self._url)
+        return article._ParseArticlePaidStatus(self._json_obj)
 
     @property
-    @cache_result_wrapper
     def reprint_status(self) -> bool:
         """获取文章转载状态
 
         Returns:
             bool: 文章转载状态
         """
-        return CallWithoutCheck(article.GetArticleReprintStatus, self._url)
+        return self._json_obj["reprintable"]
 
     @property
-    @cache_result_wrapper
     def comment_status(self) -> bool:
         """获取文章评论状态
 
         Returns:
             bool: 文章评论状态
         """
-        return CallWithoutCheck(article.GetArticleCommentStatus, self._url)
+        return self._json_obj["commentable"]
 
     @property
-    @cache_result_wrapper
     def html(self) -> str:
         """获取 Html 格式的文章内容
 
@@ -668,10 +931,9 @@ class Article:
         Returns:
             str: Html 格式的文章内容
         """
-        return CallWithoutCheck(article.GetArticleHtml, self._url)
+        return article._ParseArticleHtml(self._json_obj)
 
     @property
-    @cache_result_wrapper
     def text(self) -> str:
         """获取纯文本格式的文章内容
 
@@ -681,10 +943,9 @@ class Article:
         Returns:
             str: 纯文本格式的文章内容
         """
-        return CallWithoutCheck(article.GetArticleText, self._url)
+        return article._ParseArticleText(self._json_obj)
 
     @property
-    @cache_result_wrapper
     def markdown(self) -> str:
         """获取 Markdown 格式的文章内容
 
@@ -694,7 +955,7 @@ class Article:
         Returns:
             str: Markdown 格式的文章内容
         """
-        return CallWithoutCheck(article.GetArticleMarkdown, self._url)
+        return article._ConvertArticleHtmlToMarkdown(self.html)
 
     def __eq__(self, other: object) -> bool:
         """判断是否是同一篇文章
@@ -745,7 +1006,7 @@ class Article:
         )
 
 
-class Notebook:
+class Notebook(_SnapshotMixin):
     """文集类"""
 
     def __init__(
@@ -768,8 +1029,10 @@ class Notebook:
         else:
             raise ValueError("notebook_url 和 notebook_slug 至少需要传入一个")
 
-        AssertNotebookStatusNormal(notebook_url)
         self._url = notebook_url
+        self._init_snapshots()
+        # 状态检查所用的数据同时作为快照，避免重复请求
+        AssertNotebookJsonDataNormal(notebook_url, self._json_obj)
 
     @classmethod
     def from_url(cls, notebook_url: str) -> "Notebook":
@@ -805,7 +1068,11 @@ class Notebook:
         return self._url
 
     @property
-    @cache_result_wrapper
+    def _json_obj(self) -> Dict:
+        """文集 JSON 数据快照"""
+        return self._get_snapshot("json", lambda: GetNotebookJsonDataApi(self._url))
+
+    @property
     def id(self) -> int:  # noqa: A003
         """获取文集 ID
 
@@ -815,7 +1082,6 @@ class Notebook:
         return NotebookUrlToNotebookId(self._url)
 
     @property
-    @cache_result_wrapper
     def slug(self) -> str:
         """获取文集 Slug
 
@@ -825,74 +1091,67 @@ class Notebook:
         return NotebookUrlToNotebookSlug(self._url)
 
     @property
-    @cache_result_wrapper
     def name(self) -> str:
         """获取文集名称
 
         Returns:
             str: 文集名称
         """
-        return CallWithoutCheck(notebook.GetNotebookName, self._url)
+        return self._json_obj["name"]
 
     @property
-    @cache_result_wrapper
     def articles_count(self) -> int:
         """获取文集中的文章总数
 
         Returns:
             int: 文章总数
         """
-        return CallWithoutCheck(notebook.GetNotebookArticlesCount, self._url)
+        return self._json_obj["notes_count"]
 
     @property
-    @cache_result_wrapper
     def author_name(self) -> str:
         """获取文集的作者名
 
         Returns:
             str: 作者名
         """
-        return CallWithoutCheck(notebook.GetNotebookAuthorInfo, self._url)["name"]
+        return self._json_obj["user"]["nickname"]
 
     @property
-    @cache_result_wrapper
     def author_info(self) -> Dict:
         """获取文集的作者信息
 
         Returns:
             Dict: 作者信息
         """
-        return CallWithoutCheck(notebook.GetNotebookAuthorInfo, self._url)
+        return notebook._ParseNotebookAuthorInfo(self._json_obj)
 
     @property
-    @cache_result_wrapper
     def wordage(self) -> int:
         """获取文集中所有文章的总字数
 
         Returns:
             int: 文集总字数
         """
-        return CallWithoutCheck(notebook.GetNotebookWordage, self._url)
+        return self._json_obj["wordage"]
 
     @property
-    @cache_result_wrapper
     def subscribers_count(self) -> int:
         """获取文集的关注者数量
 
         Returns:
             int: 关注者数量
         """
-        return CallWithoutCheck(notebook.GetNotebookSubscribersCount, self._url)
+        return self._json_obj["subscribers_count"]
 
     @property
-    @cache_result_wrapper
     def update_time(self) -> datetime:
         """获取文集的更新时间
 
         Returns:
             datetime: 更新时间
         """
-        return CallWithoutCheck(notebook.GetNotebookUpdateTime, self._url)
+        return datetime.fromtimestamp(self._json_obj["last_updated_at"])
 
     @cache_result_wrapper
     def articles_info(
@@ -954,7 +1213,7 @@ class Notebook:
         )
 
 
-class Collection:
+class Collection(_SnapshotMixin):
     """专题类"""
 
     def __init__(
@@ -981,8 +1240,10 @@ class Collection:
         else:
             raise ValueError("collection_url 和 collection_slug 至少需要传入一个")
 
-        AssertCollectionStatusNormal(collection_url)
         self._url = collection_url
+        self._init_snapshots()
+        # 状态检查所用的数据同时作为快照，避免重复请求
+        AssertCollectionJsonDataNormal(collection_url, self._json_obj)
 
         self._id = collection_id if collection_id else None
 
@@ -1026,7 +1287,11 @@ class Collection:
         return self._url
 
     @property
-    @cache_result_wrapper
+    def _json_obj(self) -> Dict:
+        """专题 JSON 数据快照"""
+        return self._get_snapshot("json", lambda: GetCollectionJsonDataApi(self._url))
+
+    @property
     def slug(self) -> str:
         """获取专题 Slug
 
@@ -1036,98 +1301,87 @@ class Collection:
         return CollectionUrlToCollectionSlug(self._url)
 
     @property
-    @cache_result_wrapper
     def name(self) -> str:
         """获取专题名称
 
         Returns:
             str: 专题名称
         """
-        return CallWithoutCheck(collection.GetCollectionName, self._url)
+        return self._json_obj["title"]
 
     @property
-    @cache_result_wrapper
     def avatar_url(self) -> str:
         """获取专题头像链接
 
         Returns:
             str: 专题头像链接
         """
-        return CallWithoutCheck(collection.GetCollectionAvatarUrl, self._url)
+        return self._json_obj["image"]
 
     @property
-    @cache_result_wrapper
     def introduction_text(self) -> str:
         """获取纯文本格式的专题简介
 
         Returns:
             str: 纯文本格式的专题简介
         """
-        return CallWithoutCheck(collection.GetCollectionIntroductionText, self._url)
+        return self._json_obj["content_without_html"]
 
     @property
-    @cache_result_wrapper
     def introduction_html(self) -> str:
         """获取 Html 格式的专题简介
 
         Returns:
             str:  Html 格式的专题简介
         """
-        return CallWithoutCheck(collection.GetCollectionIntroductionHtml, self._url)
+        return self._json_obj["content_in_full"]
 
     @property
-    @cache_result_wrapper
     def articles_update_time(self) -> datetime:
         """获取专题文章更新时间
 
         Returns:
             datetime: 专题文章更新时间
         """
-        return CallWithoutCheck(collection.GetCollectionArticlesUpdateTime, self._url)
+        return datetime.fromtimestamp(self._json_obj["newly_added_at"])
 
     @property
-    @cache_result_wrapper
     def info_update_time(self) -> datetime:
         """获取专题信息更新时间
 
         Returns:
             datetime: 专题信息更新时间
         """
-        return CallWithoutCheck(
-            collection.GetCollectionInformationUpdateTime, self._url
-        )
+        return datetime.fromtimestamp(self._json_obj["last_updated_at"])
 
     @property
-    @cache_result_wrapper
     def owner_info(self) -> Dict:
         """获取专题的所有者信息
 
         Returns:
             Dict: 用户信息
         """
-        return CallWithoutCheck(collection.GetCollectionOwnerInfo, self._url)
+        return collection._ParseCollectionOwnerInfo(self._json_obj)
 
     @property
-    @cache_result_wrapper
     def articles_count(self) -> int:
         """获取专题文章数
 
         Returns:
             int: 专题文章数
         """
-        return CallWithoutCheck(collection.GetCollectionArticlesCount, self._url)
+        return self._json_obj["notes_count"]
 
     @property
-    @cache_result_wrapper
     def subscribers_count(self) -> int:
         """获取专题关注者数
 
         Returns:
             int: 专题关注者数
         """
-        return CallWithoutCheck(collection.GetCollectionSubscribersCount, self._url)
+        return self._json_obj["subscribers_count"]
 
-    @cache_result_wrapper
+    @cache_result_wrapper(ttl=_STABLE_DATA_TTL)
     def editors_info(self, page: int = 1) -> List[Dict]:
         """获取专题编辑信息
 
@@ -1144,7 +1398,7 @@ class Collection:
             raise InputError("实例化该专题对象时未传入 ID 参数，无法获取编辑信息")
         return collection.GetCollectionEditorsInfo(self._id, page)
 
-    @cache_result_wrapper
+    @cache_result_wrapper(ttl=_STABLE_DATA_TTL)
     def recommended_writers_info(self, page: int = False) -> List[Dict]:
         """获取专题推荐作者信息
 
@@ -1240,7 +1494,7 @@ class Collection:
         )
 
 
-class Island:
+class Island(_SnapshotMixin):
     """小岛类"""
 
     def __init__(
@@ -1262,8 +1516,10 @@ class Island:
         else:
             raise ValueError("island_url 和 island_slug 至少需要传入一个")
 
-        AssertIslandStatusNormal(island_url)
         self._url = island_url
+        self._init_snapshots()
+        # 状态检查所用的数据同时作为快照，避免重复请求
+        AssertIslandJsonDataNormal(island_url, self._json_obj)
 
     @classmethod
     def from_url(cls, island_url: str) -> "Island":
@@ -1299,7 +1555,11 @@ class Island:
         return self._url
 
     @property
-    @cache_result_wrapper
+    def _json_obj(self) -> Dict:
+        """小岛 JSON 数据快照"""
+        return self._get_snapshot("json", lambda: GetIslandJsonDataApi(self._url))
+
+    @property
     def slug(self) -> str:
         """获取小岛 Slug
 
@@ -1309,64 +1569,58 @@ class Island:
         return IslandUrlToIslandSlug(self._url)
 
     @property
-    @cache_result_wrapper
     def name(self) -> str:
         """获取小岛名称
 
         Returns:
             str: 小岛名称
         """
-        return CallWithoutCheck(island.GetIslandName, self._url)
+        return self._json_obj["name"]
 
     @property
-    @cache_result_wrapper
     def avatar_url(self) -> str:
         """获取小岛头像链接
 
         Returns:
             str: 小岛头像链接
         """
-        return CallWithoutCheck(island.GetIslandAvatarUrl, self._url)
+        return self._json_obj["image"]
 
     @property
-    @cache_result_wrapper
     def introduction(self) -> str:
         """获取小岛简介
 
         Returns:
             str: 小岛简介
         """
-        return CallWithoutCheck(island.GetIslandIntroduction, self._url)
+        return self._json_obj["intro"]
 
     @property
-    @cache_result_wrapper
     def members_count(self) -> int:
         """获取小岛成员数量
 
         Returns:
             int: 成员数量
         """
-        return CallWithoutCheck(island.GetIslandMembersCount, self._url)
+        return self._json_obj["members_count"]
 
     @property
-    @cache_result_wrapper
     def posts_count(self) -> int:
         """获取小岛帖子数量
 
         Returns:
             int: 帖子数量
         """
-        return CallWithoutCheck(island.GetIslandPostsCount, self._url)
+        return self._json_obj["posts_count"]
 
     @property
-    @cache_result_wrapper
     def category(self) -> str:
         """获取小岛分类
 
         Returns:
             str: 分类
         """
-        return CallWithoutCheck(island.GetIslandCategory, self._url)
+        return self._json_obj["category"]["name"]
 
     @cache_result_wrapper
     def posts(
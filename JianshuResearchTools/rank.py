@@ -1,5 +1,7 @@
 from datetime import date, datetime, timedelta
-from typing import Dict, List
+from itertools import chain
+from json import dumps as json_dumps
+from typing import Callable, Dict, Generator, List, Optional, Set, TypeVar
 
 from .basic_apis import (
     GetArticlesFPRankListJsonDataApi,
@@ -8,33 +10,32 @@ from .basic_apis import (
 )
 from .convert import UserSlugToUserUrl
 from .exceptions import APIError, ResourceError
+from .json_backend import json_loads
+from .response_cache import ResponseCache, _IsSettledFPRankDate
 from .user import GetUserFPCount
+from .utils import BatchCall
 
 __all__ = [
     "GetAssetsRankData",
+    "GetAllAssetsRankData",
+    "GetAssetsRankSnapshot",
+    "DiffAssetsRankSnapshots",
     "GetDailyArticleRankData",
     "GetUserFPRankData",
     "GetArticleFPRankBasicInfo",
     "GetUserFPRankData",
+    "GetArticleFPRankDataRange",
+    "GetArticleFPRankBasicInfoRange",
+    "GetUserFPRankDataRange",
+    "enable_fp_rank_cache",
+    "disable_fp_rank_cache",
+    "get_fp_rank_cache",
 ]
 
+T = TypeVar("T")
 
-def GetAssetsRankData(start_id: int = 1, get_full: bool = False) -> List[Dict]:
-    """获取资产排行榜信息
 
-    ! 2.10 之前的版本中存在数据错误，总资产（assets）以简书钻（FP）字段返回，
-    ! 为保证向后兼容，FP 字段在 v3 中暂不移除，其值与 assets 字段相同。
-    ! 若 get_full = True，将获取真实的简书钻数据，并替换兼容用途的 FP 字段，简书贝（FTN）字段也将正确计算。
-
-    Args:
-        start_id (int, optional): 起始位置. Defaults to 1.
-        get_full (bool, optional): 为 True 时获取简书贝和总资产数据. Defaults to False.
-
-    Returns:
-        List[Dict]: 资产排行榜信息
-    """
-    since_id = start_id - 1  # 索引下标为 0
-    json_obj = GetAssetsRankJsonDataApi(max_id=1000000000, since_id=since_id)
+def _ParseAssetsRankData(json_obj: Dict) -> List[Dict]:
     result = []
     for item in json_obj["rankings"]:
         item_data = {
@@ -46,26 +47,191 @@ def GetAssetsRankData(start_id: int = 1, get_full: bool = False) -> List[Dict]:
             "FP": item["amount"] / 1000,
             "assets": item["amount"] / 1000,
         }
-        if get_full:
-            user_url = UserSlugToUserUrl(item_data["uslug"])
-            try:
-                item_data["FP"] = GetUserFPCount(user_url, disable_check=True)
-                item_data["FTN"] = round(
-                    item_data["assets"] - item_data["FP"], 3
-                )  # 处理浮点数精度问题
-            except APIError:
-                pass
         result.append(item_data)
     return result
 
 
-def GetDailyArticleRankData() -> List[Dict]:
-    """获取日更排行榜信息
+def _FillAssetsRankItemFP(item_data: Dict, fp_count: float) -> None:
+    item_data["FP"] = fp_count
+    item_data["FTN"] = round(item_data["assets"] - fp_count, 3)  # 处理浮点数精度问题
+
+
+def GetAssetsRankData(
+    start_id: int = 1, get_full: bool = False, concurrency: int = 8
+) -> List[Dict]:
+    """获取资产排行榜信息
+
+    ! 2.10 之前的版本中存在数据错误，总资产（assets）以简书钻（FP）字段返回，
+    ! 为保证向后兼容，FP 字段在 v3 中暂不移除，其值与 assets 字段相同。
+    ! 若 get_full = True，将获取真实的简书钻数据，并替换兼容用途的 FP 字段，简书贝（FTN）字段也将正确计算。
+
+    Args:
+        start_id (int, optional): 起始位置. Defaults to 1.
+        get_full (bool, optional): 为 True 时获取简书贝和总资产数据. Defaults to False.
+        concurrency (int, optional): get_full 为 True 时同时获取简书钻数据的用户数量上限. Defaults to 8.
 
     Returns:
-        List[Dict]: 日更排行榜信息
+        List[Dict]: 资产排行榜信息
     """
-    json_obj = GetDailyArticleRankListJsonDataApi()
+    result = _FetchAssetsRankPage(start_id - 1)  # 索引下标为 0
+    if get_full:
+        for item_data, fp_count in BatchCall(
+            lambda item_data: GetUserFPCount(
+                UserSlugToUserUrl(item_data["uslug"]), disable_check=True
+            ),
+            result,
+            concurrency,
+        ):
+            if isinstance(fp_count, APIError):
+                continue
+            if isinstance(fp_count, Exception):
+                raise fp_count
+            _FillAssetsRankItemFP(item_data, fp_count)
+    return result
+
+
+def _FetchAssetsRankPage(since_id: int) -> List[Dict]:
+    json_obj = GetAssetsRankJsonDataApi(max_id=1000000000, since_id=since_id)
+    return _ParseAssetsRankData(json_obj)
+
+
+def _GetAssetsRankSinceIds(since_id: int, max_count: int, page_size: int) -> range:
+    # 第一页已单独获取，用于确定接口每页返回的数据条数
+    return range(since_id + page_size, since_id + max_count, page_size)
+
+
+def _CheckAssetsRankPage(
+    since_id: int, page: List[Dict], page_size: int, short_page_since_id: Optional[int]
+) -> Optional[int]:
+    # 不足一页的分段之后仍有数据时，两个分段之间的数据会被遗漏
+    if short_page_since_id is not None:
+        raise ResourceError(
+            f"资产排行榜位置 {short_page_since_id + 1} 开始的分段不足 {page_size} 条数据，" "获取结果可能不完整"
+        )
+    return since_id if len(page) < page_size else None
+
+
+def _DeduplicateAssetsRankItems(
+    page: List[Dict], seen_uids: Set[int]
+) -> Generator[Dict, None, None]:
+    for item_data in page:
+        if item_data["uid"] in seen_uids:
+            continue
+        seen_uids.add(item_data["uid"])
+        yield item_data
+
+
+def GetAllAssetsRankData(
+    start_id: int = 1, max_count: int = 1000, concurrency: int = 8
+) -> Generator[Dict, None, None]:
+    """将资产排行榜按位置分段并发获取，依次返回全部数据
+
+    排行榜在获取过程中可能发生变动，同一用户出现在多个分段中时只返回排名最靠前的一条数据；
+    分段大小以第一页返回的数据条数为准
+
+    Args:
+        start_id (int, optional): 起始位置. Defaults to 1.
+        max_count (int, optional): 获取的数据数量上限. Defaults to 1000.
+        concurrency (int, optional): 同时获取的分段数量上限. Defaults to 8.
+
+    Raises:
+        ResourceError: 排行榜中间的分段返回的数据不足一页，可能遗漏数据时抛出此异常
+
+    Yields:
+        Iterator[Dict, None, None]: 资产排行榜信息，FP 字段含义同 GetAssetsRankData
+    """
+    since_id = start_id - 1  # 索引下标为 0
+    first_page = _FetchAssetsRankPage(since_id)
+    # 分段大小以接口实际返回的数据条数为准
+    page_size = len(first_page)
+    if not page_size:
+        return
+    pages = chain(
+        [(since_id, first_page)],
+        BatchCall(
+            _FetchAssetsRankPage,
+            _GetAssetsRankSinceIds(since_id, max_count, page_size),
+            concurrency,
+        ),
+    )
+    seen_uids: Set[int] = set()
+    short_page_since_id = None
+    count = 0
+    for page_since_id, page in pages:
+        if isinstance(page, Exception):
+            raise page
+        if not page:  # 已到达排行榜末尾
+            return
+        short_page_since_id = _CheckAssetsRankPage(
+            page_since_id, page, page_size, short_page_since_id
+        )
+        for item_data in _DeduplicateAssetsRankItems(page, seen_uids):
+            yield item_data
+            count += 1
+            if count == max_count:
+                return
+
+
+def GetAssetsRankSnapshot(max_count: int = 1000, concurrency: int = 8) -> Dict:
+    """获取带有时间戳的资产排行榜快照，可使用 DiffAssetsRankSnapshots 与之前的快照对比
+
+    Args:
+        max_count (int, optional): 获取的数据数量上限. Defaults to 1000.
+        concurrency (int, optional): 同时获取的分段数量上限. Defaults to 8.
+
+    Returns:
+        Dict: 资产排行榜快照
+    """
+    fetch_time = datetime.now()
+    return {
+        "fetch_time": fetch_time,
+        "data": list(GetAllAssetsRankData(1, max_count, concurrency)),
+    }
+
+
+def DiffAssetsRankSnapshots(old_snapshot: Dict, new_snapshot: Dict) -> Dict:
+    """对比两个资产排行榜快照
+
+    Args:
+        old_snapshot (Dict): 较早的快照
+        new_snapshot (Dict): 较晚的快照
+
+    Returns:
+        Dict: 对比结果，ranking_change 为正数时表示排名上升
+    """
+    old_items = {item["uid"]: item for item in old_snapshot["data"]}
+    new_items = {item["uid"]: item for item in new_snapshot["data"]}
+    changed = []
+    for uid, new_item in new_items.items():
+        old_item = old_items.get(uid)
+        if old_item is None:
+            continue
+        if (
+            old_item["ranking"] == new_item["ranking"]
+            and old_item["assets"] == new_item["assets"]
+        ):
+            continue
+        changed.append(
+            {
+                "uid": uid,
+                "uslug": new_item["uslug"],
+                "name": new_item["name"],
+                "old_ranking": old_item["ranking"],
+                "new_ranking": new_item["ranking"],
+                "ranking_change": old_item["ranking"] - new_item["ranking"],
+                "assets_change": round(new_item["assets"] - old_item["assets"], 3),
+            }
+        )
+    return {
+        "old_fetch_time": old_snapshot["fetch_time"],
+        "new_fetch_time": new_snapshot["fetch_time"],
+        "entered": [item for uid, item in new_items.items() if uid not in old_items],
+        "left": [item for uid, item in old_items.items() if uid not in new_items],
+        "changed": changed,
+    }
+
+
+def _ParseDailyArticleRankData(json_obj: Dict) -> List[Dict]:
     result = []
     for item in json_obj["daps"]:
         item_data = {
@@ -79,25 +245,17 @@ def GetDailyArticleRankData() -> List[Dict]:
     return result
 
 
-def GetArticleFPRankData(target_date: str = "latest") -> List[Dict]:
-    """获取文章收益排行榜信息
-
-    目前只能获取 2020 年 6 月 20 日之后的数据。
-
-    Args:
-        target_date (str, optional): 日期，格式“YYYYMMDD”. Defaults to "latest".
-
-    Raises:
-        ResourceError: 对应日期的排行榜数据为空时抛出此异常
+def GetDailyArticleRankData() -> List[Dict]:
+    """获取日更排行榜信息
 
     Returns:
-        List[Dict]: 文章收益排行榜信息
+        List[Dict]: 日更排行榜信息
     """
-    if target_date == "latest":
-        target_date = (datetime.today() + timedelta(days=-1)).strftime(r"%Y%m%d")
-    json_obj = GetArticlesFPRankListJsonDataApi(date=target_date, type_=None)
-    if json_obj["notes"] == []:
-        raise ResourceError(f"对应日期 {date} 的排行榜数据为空")
+    json_obj = GetDailyArticleRankListJsonDataApi()
+    return _ParseDailyArticleRankData(json_obj)
+
+
+def _ParseArticleFPRankData(json_obj: Dict) -> List[Dict]:
     result = []
     for ranking, item in enumerate(json_obj["notes"]):
         item_data = {
@@ -114,7 +272,7 @@ def GetArticleFPRankData(target_date: str = "latest") -> List[Dict]:
     return result
 
 
-def GetArticleFPRankBasicInfo(target_date: str = "latest") -> Dict:
+def GetArticleFPRankData(target_date: str = "latest") -> List[Dict]:
     """获取文章收益排行榜信息
 
     目前只能获取 2020 年 6 月 20 日之后的数据。
@@ -126,13 +284,17 @@ def GetArticleFPRankBasicInfo(target_date: str = "latest") -> Dict:
         ResourceError: 对应日期的排行榜数据为空时抛出此异常
 
     Returns:
-        Dict: 文章收益排行榜基础信息
+        List[Dict]: 文章收益排行榜信息
     """
     if target_date == "latest":
-        target_date = (date.today() + timedelta(days=-1)).strftime("%Y%m%d")
+        target_date = (datetime.today() + timedelta(days=-1)).strftime(r"%Y%m%d")
     json_obj = GetArticlesFPRankListJsonDataApi(date=target_date, type_=None)
     if json_obj["notes"] == []:
         raise ResourceError(f"对应日期 {target_date} 的排行榜数据为空")
+    return _ParseArticleFPRankData(json_obj)
+
+
+def _ParseArticleFPRankBasicInfo(json_obj: Dict) -> Dict:
     return {
         "total_fp": json_obj["fp"],
         "fp_to_author": json_obj["author_fp"],
@@ -140,27 +302,29 @@ def GetArticleFPRankBasicInfo(target_date: str = "latest") -> Dict:
     }
 
 
-def GetUserFPRankData(
-    target_date: str = "latest", rank_type: str = "all"
-) -> List[Dict]:
-    """获取用户收益排行榜信息
+def GetArticleFPRankBasicInfo(target_date: str = "latest") -> Dict:
+    """获取文章收益排行榜信息
 
     目前只能获取 2020 年 6 月 20 日之后的数据。
 
     Args:
         target_date (str, optional): 日期，格式“YYYYMMDD”. Defaults to "latest".
-        rank_type (str, optional): 排行榜分类，"all" 为总收益榜，"write" 为内容收益榜，"vote" 为投票收益榜
 
     Raises:
         ResourceError: 对应日期的排行榜数据为空时抛出此异常
 
     Returns:
-        List[Dict]: 用户收益排行榜信息
+        Dict: 文章收益排行榜基础信息
     """
-    type_ = {"all": None, "write": "note", "vote": "like"}[rank_type]
-    json_obj = GetArticlesFPRankListJsonDataApi(date=target_date, type_=type_)
-    if json_obj["users"] == []:
+    if target_date == "latest":
+        target_date = (date.today() + timedelta(days=-1)).strftime("%Y%m%d")
+    json_obj = GetArticlesFPRankListJsonDataApi(date=target_date, type_=None)
+    if json_obj["notes"] == []:
         raise ResourceError(f"对应日期 {target_date} 的排行榜数据为空")
+    return _ParseArticleFPRankBasicInfo(json_obj)
+
+
+def _ParseUserFPRankData(json_obj: Dict) -> List[Dict]:
     result = []
     for ranking, item in enumerate(json_obj["users"]):
         item_data = {
@@ -173,3 +337,191 @@ def GetUserFPRankData(
         }
         result.append(item_data)
     return result
+
+
+def GetUserFPRankData(
+    target_date: str = "latest", rank_type: str = "all"
+) -> List[Dict]:
+    """获取用户收益排行榜信息
+
+    目前只能获取 2020 年 6 月 20 日之后的数据。
+
+    Args:
+        target_date (str, optional): 日期，格式“YYYYMMDD”. Defaults to "latest".
+        rank_type (str, optional): 排行榜分类，"all" 为总收益榜，"write" 为内容收益榜，"vote" 为投票收益榜
+
+    Raises:
+        ResourceError: 对应日期的排行榜数据为空时抛出此异常
+
+    Returns:
+        List[Dict]: 用户收益排行榜信息
+    """
+    type_ = {"all": None, "write": "note", "vote": "like"}[rank_type]
+    json_obj = GetArticlesFPRankListJsonDataApi(date=target_date, type_=type_)
+    if json_obj["users"] == []:
+        raise ResourceError(f"对应日期 {target_date} 的排行榜数据为空")
+    return _ParseUserFPRankData(json_obj)
+
+
+def _GetDatesInRange(start_date: str, end_date: str) -> List[str]:
+    start = datetime.strptime(start_date, "%Y%m%d").date()
+    end = datetime.strptime(end_date, "%Y%m%d").date()
+    if start > end:
+        raise ValueError("起始日期不能晚于结束日期")
+    return [
+        (start + timedelta(days=i)).strftime("%Y%m%d")
+        for i in range((end - start).days + 1)
+    ]
+
+
+_fp_rank_cache: Optional[ResponseCache] = None
+
+
+def enable_fp_rank_cache(path: str = "jrt_fp_rank_cache.sqlite3") -> ResponseCache:
+    """启用收益排行榜日期范围查询的缓存
+
+    只作用于 GetArticleFPRankDataRange 等日期范围查询函数，以日期为键永久缓存两天前及更早日期的解析结果，
+    不影响其它接口，也不依赖 enable_response_cache 启用的响应缓存
+
+    Args:
+        path (str, optional): SQLite 数据库文件路径. Defaults to "jrt_fp_rank_cache.sqlite3".
+
+    Returns:
+        ResponseCache: 缓存对象
+    """
+    global _fp_rank_cache
+    disable_fp_rank_cache()
+    _fp_rank_cache = ResponseCache(path, default_ttl=None)
+    return _fp_rank_cache
+
+
+def disable_fp_rank_cache() -> None:
+    """停用收益排行榜日期范围查询的缓存，已缓存的内容仍保留在磁盘上"""
+    global _fp_rank_cache
+    if _fp_rank_cache is not None:
+        _fp_rank_cache.close()
+    _fp_rank_cache = None
+
+
+def get_fp_rank_cache() -> Optional[ResponseCache]:
+    """获取当前启用的收益排行榜日期范围查询缓存对象
+
+    Returns:
+        Optional[ResponseCache]: 缓存对象，未启用时返回 None
+    """
+    return _fp_rank_cache
+
+
+def _CachedFPRankFetcher(
+    func: Callable[[str], T], kind: str
+) -> Callable[[str], Optional[T]]:
+    cache = _fp_rank_cache
+    if cache is None:
+        return func
+
+    def inner(target_date: str) -> Optional[T]:
+        if not _IsSettledFPRankDate(target_date):
+            return func(target_date)
+        key = f"{kind} {target_date}"
+        content = cache.get(key)
+        if content is not None:
+            return json_loads(content)
+        try:
+            data = func(target_date)
+        except ResourceError:
+            data = None  # 排行榜数据为空的日期同样不会再变化
+        cache.set(key, json_dumps(data, ensure_ascii=False).encode(), None)
+        return data
+
+    return inner
+
+
+def _GetFPRankRange(
+    func: Callable[[str], T],
+    kind: str,
+    start_date: str,
+    end_date: str,
+    concurrency: int,
+) -> Dict[str, T]:
+    result = {}
+    for target_date, data in BatchCall(
+        _CachedFPRankFetcher(func, kind),
+        _GetDatesInRange(start_date, end_date),
+        concurrency,
+    ):
+        if data is None or isinstance(data, ResourceError):  # 该日期没有排行榜数据
+            continue
+        if isinstance(data, Exception):
+            raise data
+        result[target_date] = data
+    return result
+
+
+def GetArticleFPRankDataRange(
+    start_date: str, end_date: str, concurrency: int = 8
+) -> Dict[str, List[Dict]]:
+    """并发获取日期范围内每一天的文章收益排行榜信息
+
+    启用 enable_fp_rank_cache 后，两天前及更早日期的数据将被永久缓存，
+    再次获取时只会对缓存中不存在的日期与最近的日期发送请求
+
+    Args:
+        start_date (str): 起始日期，格式“YYYYMMDD”
+        end_date (str): 结束日期（包含），格式“YYYYMMDD”
+        concurrency (int, optional): 同时获取的日期数量上限. Defaults to 8.
+
+    Returns:
+        Dict[str, List[Dict]]: 以日期为键的文章收益排行榜信息，排行榜数据为空的日期不包含在内
+    """
+    return _GetFPRankRange(
+        GetArticleFPRankData, "article", start_date, end_date, concurrency
+    )
+
+
+def GetArticleFPRankBasicInfoRange(
+    start_date: str, end_date: str, concurrency: int = 8
+) -> Dict[str, Dict]:
+    """并发获取日期范围内每一天的文章收益排行榜基础信息
+
+    缓存行为同 GetArticleFPRankDataRange
+
+    Args:
+        start_date (str): 起始日期，格式“YYYYMMDD”
+        end_date (str): 结束日期（包含），格式“YYYYMMDD”
+        concurrency (int, optional): 同时获取的日期数量上限. Defaults to 8.
+
+    Returns:
+        Dict[str, Dict]: 以日期为键的文章收益排行榜基础信息，排行榜数据为空的日期不包含在内
+    """
+    return _GetFPRankRange(
+        GetArticleFPRankBasicInfo,
+        "article_basic_info",
+        start_date,
+        end_date,
+        concurrency,
+    )
+
+
+def GetUserFPRankDataRange(
+    start_date: str, end_date: str, rank_type: str = "all", concurrency: int = 8
+) -> Dict[str, List[Dict]]:
+    """并发获取日期范围内每一天的用户收益排行榜信息
+
+    缓存行为同 GetArticleFPRankDataRange
+
+    Args:
+        start_date (str): 起始日期，格式“YYYYMMDD”
+        end_date (str): 结束日期（包含），格式“YYYYMMDD”
+        rank_type (str, optional): 排行榜分类，"all" 为总收益榜，"write" 为内容收益榜，"vote" 为投票收益榜
+        concurrency (int, optional): 同时获取的日期数量上限. Defaults to 8.
+
+    Returns:
+        Dict[str, List[Dict]]: 以日期为键的用户收益排行榜信息，排行榜数据为空的日期不包含在内
+    """
+    return _GetFPRankRange(
+        lambda target_date: GetUserFPRankData(target_date, rank_type),
+        f"user_{rank_type}",
+        start_date,
+        end_date,
+        concurrency,
+    )
@@ -0,0 +1,278 @@
+from asyncio import sleep as async_sleep
+from threading import Lock
+from time import monotonic, sleep
+from typing import Dict, Literal, Optional, Tuple
+
+from httpx import (
+    AsyncBaseTransport,
+    BaseTransport,
+    Request,
+    Response,
+    TransportError,
+)
+
+__all__ = [
+    "TokenBucket",
+    "AIMDGovernor",
+    "RateLimitedTransport",
+    "AsyncRateLimitedTransport",
+    "set_rate_limit",
+    "clear_rate_limit",
+    "get_current_rate",
+]
+
+EndpointFamily = Literal["api", "pc", "mobile"]
+
+
+class TokenBucket:
+    """线程安全的令牌桶，用于限制请求速率"""
+
+    def __init__(self, rate: float, burst: Optional[int] = None) -> None:
+        """构建新的令牌桶
+
+        Args:
+            rate (float): 每秒补充的令牌数量，即稳定状态下的请求速率
+            burst (Optional[int], optional): 令牌桶容量，即允许的突发请求数量，为 None 时与速率相同. Defaults to None.
+        """
+        if rate <= 0:
+            raise ValueError("请求速率必须大于 0")
+        self._rate = rate
+        self._burst = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self._burst)
+        self._last_time = monotonic()
+        self._lock = Lock()
+
+    @property
+    def rate(self) -> float:
+        """每秒补充的令牌数量"""
+        return self._rate
+
+    @rate.setter
+    def rate(self, value: float) -> None:
+        with self._lock:
+            self._refill()
+            self._rate = value
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._last_time) * self._rate
+        )
+        self._last_time = now
+
+    def reserve(self) -> float:
+        """预订一个令牌
+
+        令牌不足时仍会预订成功，调用方需等待返回的时长后再发送请求
+
+        Returns:
+            float: 需要等待的时长（秒）
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0
+            return -self._tokens / self._rate
+
+    def acquire(self) -> None:
+        """获取一个令牌，令牌不足时阻塞等待"""
+        wait_time = self.reserve()
+        if wait_time > 0:
+            sleep(wait_time)
+
+    async def async_acquire(self) -> None:
+        """获取一个令牌，令牌不足时异步等待"""
+        wait_time = self.reserve()
+        if wait_time > 0:
+            await async_sleep(wait_time)
+
+
+class AIMDGovernor:
+    """加性增、乘性减（AIMD）的速率调节器
+
+    请求成功时小幅提高令牌桶速率，遇到 429、5xx 或网络错误时成倍降低速率
+    """
+
+    def __init__(
+        self,
+        bucket: TokenBucket,
+        min_rate: float = 1,
+        max_rate: Optional[float] = None,
+        increase: float = 0.1,
+        decrease_factor: float = 0.5,
+        cooldown: float = 1,
+    ) -> None:
+        """构建新的速率调节器
+
+        Args:
+            bucket (TokenBucket): 被调节的令牌桶
+            min_rate (float, optional): 速率下限. Defaults to 1.
+            max_rate (Optional[float], optional): 速率上限，为 None 时使用令牌桶的初始速率. Defaults to None.
+            increase (float, optional): 每次请求成功时增加的速率. Defaults to 0.1.
+            decrease_factor (float, optional): 请求失败时速率的缩放倍数. Defaults to 0.5.
+            cooldown (float, optional): 两次降速之间的最短间隔（秒），避免并发的失败请求使速率骤降. Defaults to 1.
+        """
+        self._bucket = bucket
+        self._min_rate = min_rate
+        self._max_rate = max_rate if max_rate is not None else bucket.rate
+        self._increase = increase
+        self._decrease_factor = decrease_factor
+        self._cooldown = cooldown
+        self._last_decrease_time = 0.0
+        self._lock = Lock()
+
+    @staticmethod
+    def is_overloaded(status_code: int) -> bool:
+        """判断响应状态码是否表明服务端过载
+
+        Args:
+            status_code (int): 响应状态码
+
+        Returns:
+            bool: 判断结果
+        """
+        return status_code == 429 or status_code >= 500
+
+    def on_success(self) -> None:
+        """记录一次成功的请求"""
+        with self._lock:
+            self._bucket.rate = min(self._max_rate, self._bucket.rate + self._increase)
+
+    def on_failure(self) -> None:
+        """记录一次失败的请求"""
+        with self._lock:
+            now = monotonic()
+            if now - self._last_decrease_time < self._cooldown:
+                return
+            self._last_decrease_time = now
+            self._bucket.rate = max(
+                self._min_rate, self._bucket.rate * self._decrease_factor
+            )
+
+
+_limiters: Dict[str, Tuple[TokenBucket, Optional[AIMDGovernor]]] = {}
+
+
+def set_rate_limit(
+    family: EndpointFamily,
+    rate: float,
+    burst: Optional[int] = None,
+    adaptive: bool = False,
+    min_rate: float = 1,
+    max_rate: Optional[float] = None,
+) -> None:
+    """为一类接口设置请求速率限制，同步与异步客户端共用同一个令牌桶
+
+    Args:
+        family (Literal["api", "pc", "mobile"]): 接口类型，"api" 为 JSON 接口，
+        "pc" 为 PC 端页面，"mobile" 为移动端页面
+        rate (float): 每秒请求数量上限
+        burst (Optional[int], optional): 允许的突发请求数量. Defaults to None.
+        adaptive (bool, optional): 为 True 时根据响应状态自动调节速率. Defaults to False.
+        min_rate (float, optional): 自动调节时的速率下限. Defaults to 1.
+        max_rate (Optional[float], optional): 自动调节时的速率上限，为 None 时与 rate 相同. Defaults to None.
+    """
+    bucket = TokenBucket(rate, burst)
+    governor = AIMDGovernor(bucket, min_rate, max_rate) if adaptive else None
+    _limiters[family] = (bucket, governor)
+
+
+def clear_rate_limit(family: Optional[EndpointFamily] = None) -> None:
+    """取消请求速率限制
+
+    Args:
+        family (Optional[Literal["api", "pc", "mobile"]], optional): 接口类型，为 None 时取消所有限制. Defaults to None.
+    """
+    if family is None:
+        _limiters.clear()
+    else:
+        _limiters.pop(family, None)
+
+
+def get_current_rate(family: EndpointFamily) -> Optional[float]:
+    """获取一类接口当前的请求速率上限
+
+    Args:
+        family (Literal["api", "pc", "mobile"]): 接口类型
+
+    Returns:
+        Optional[float]: 每秒请求数量上限，未设置限制时返回 None
+    """
+    limiter = _limiters.get(family)
+    return limiter[0].rate if limiter else None
+
+
+def _OnResponse(governor: Optional[AIMDGovernor], response: Response) -> None:
+    if governor is None:
+        return
+    if AIMDGovernor.is_overloaded(response.status_code):
+        governor.on_failure()
+    else:
+        governor.on_success()
+
+
+class RateLimitedTransport(BaseTransport):
+    """在发送请求前获取令牌的传输层"""
+
+    def __init__(self, transport: BaseTransport, family: EndpointFamily) -> None:
+        """构建新的限速传输层
+
+        Args:
+            transport (BaseTransport): 实际发送请求的传输层
+            family (Literal["api", "pc", "mobile"]): 接口类型
+        """
+        self.transport = transport
+        self.family = family
+
+    def handle_request(self, request: Request) -> Response:
+        limiter = _limiters.get(self.family)
+        if limiter is None:
+            return self.transport.handle_request(request)
+
+        bucket, governor = limiter
+        bucket.acquire()
+        try:
+            response = self.transport.handle_request(request)
+        except TransportError:
+            if governor:
+                governor.on_failure()
+            raise
+        _OnResponse(governor, response)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRateLimitedTransport(AsyncBaseTransport):
+    """在发送请求前获取令牌的异步传输层"""
+
+    def __init__(self, transport: AsyncBaseTransport, family: EndpointFamily) -> None:
+        """构建新的异步限速传输层
+
+        Args:
+            transport (AsyncBaseTransport): 实际发送请求的异步传输层
+            family (Literal["api", "pc", "mobile"]): 接口类型
+        """
+        self.transport = transport
+        self.family = family
+
+    async def handle_async_request(self, request: Request) -> Response:
+        limiter = _limiters.get(self.family)
+        if limiter is None:
+            return await self.transport.handle_async_request(request)
+
+        bucket, governor = limiter
+        await bucket.async_acquire()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except TransportError:
+            if governor:
+                governor.on_failure()
+            raise
+        _OnResponse(governor, response)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
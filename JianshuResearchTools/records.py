@@ -0,0 +1,307 @@
+from datetime import datetime
+from typing import Any, Dict, FrozenSet, List, Optional
+
+__all__ = ["UserRef", "ArticleSummary", "CommentRecord"]
+
+_VIP_TYPES = {
+    "bronze": "铜牌",
+    "silver": "银牌",
+    "gold": "黄金",
+    "platina": "白金",
+    "ordinary": "普通（旧会员）",
+    "distinguished": "至尊（旧会员）",
+}
+
+
+class _Record:
+    """使用 __slots__ 存储字段的轻量数据记录，内存占用远小于等价的字典"""
+
+    __slots__ = ()
+    # 值为 None 时不出现在 to_dict 结果中的字段，与字典形式返回值的键保持一致
+    _OPTIONAL_FIELDS: FrozenSet[str] = frozenset()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return False
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为与字典形式返回值结构相同的字典
+
+        Returns:
+            Dict[str, Any]: 记录内容
+        """
+        result = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if value is None and name in self._OPTIONAL_FIELDS:
+                continue
+            if isinstance(value, _Record):
+                value = value.to_dict()
+            elif isinstance(value, list) and value and isinstance(value[0], _Record):
+                value = [x.to_dict() for x in value]
+            result[name] = value
+        return result
+
+
+class UserRef(_Record):
+    """用户引用信息"""
+
+    __slots__ = ("uid", "name", "uslug", "avatar_url", "vip_type", "vip_expire_date")
+    _OPTIONAL_FIELDS = frozenset(("vip_type", "vip_expire_date"))
+
+    uid: int
+    name: str
+    uslug: str
+    avatar_url: str
+    vip_type: Optional[str]
+    vip_expire_date: Optional[datetime]
+
+    def __init__(
+        self,
+        uid: int,
+        name: str,
+        uslug: str,
+        avatar_url: str,
+        vip_type: Optional[str] = None,
+        vip_expire_date: Optional[datetime] = None,
+    ) -> None:
+        self.uid = uid
+        self.name = name
+        self.uslug = uslug
+        self.avatar_url = avatar_url
+        self.vip_type = vip_type
+        self.vip_expire_date = vip_expire_date
+
+    @classmethod
+    def from_json(cls, json_obj: Dict, with_vip_info: bool = True) -> "UserRef":
+        """从接口返回的用户数据构建记录
+
+        Args:
+            json_obj (Dict): 用户数据
+            with_vip_info (bool, optional): 是否解析会员信息，字典形式的文章列表中没有会员信息. Defaults to True.
+
+        Returns:
+            UserRef: 用户引用信息
+
+        Raises:
+            KeyError: 会员类型未知时抛出此错误，与字典形式的解析函数相同
+        """
+        user = cls(
+            json_obj["id"], json_obj["nickname"], json_obj["slug"], json_obj["avatar"]
+        )
+        # 与字典形式的解析函数相同，按是否存在 member 字段判断是否开通会员
+        if with_vip_info and "member" in json_obj:
+            user.vip_type = _VIP_TYPES[json_obj["member"]["type"]]
+            user.vip_expire_date = datetime.fromtimestamp(
+                json_obj["member"]["expires_at"]
+            )
+        return user
+
+
+class ArticleSummary(_Record):
+    """文章列表中的文章摘要信息"""
+
+    __slots__ = (
+        "aid",
+        "title",
+        "aslug",
+        "release_time",
+        "first_image_url",
+        "summary",
+        "views_count",
+        "likes_count",
+        "is_top",
+        "paid",
+        "commentable",
+        "user",
+        "total_fp_amount",
+        "comments_count",
+        "rewards_count",
+    )
+    _OPTIONAL_FIELDS = frozenset(("is_top",))
+
+    aid: int
+    title: str
+    aslug: str
+    release_time: datetime
+    first_image_url: str
+    summary: str
+    views_count: int
+    likes_count: int
+    is_top: Optional[bool]
+    paid: bool
+    commentable: bool
+    user: UserRef
+    total_fp_amount: float
+    comments_count: int
+    rewards_count: int
+
+    def __init__(
+        self,
+        aid: int,
+        title: str,
+        aslug: str,
+        release_time: datetime,
+        first_image_url: str,
+        summary: str,
+        views_count: int,
+        likes_count: int,
+        is_top: Optional[bool],
+        paid: bool,
+        commentable: bool,
+        user: UserRef,
+        total_fp_amount: float,
+        comments_count: int,
+        rewards_count: int,
+    ) -> None:
+        self.aid = aid
+        self.title = title
+        self.aslug = aslug
+        self.release_time = release_time
+        self.first_image_url = first_image_url
+        self.summary = summary
+        self.views_count = views_count
+        self.likes_count = likes_count
+        self.is_top = is_top
+        self.paid = paid
+        self.commentable = commentable
+        self.user = user
+        self.total_fp_amount = total_fp_amount
+        self.comments_count = comments_count
+        self.rewards_count = rewards_count
+
+    @classmethod
+    def from_json(cls, json_obj: Dict) -> "ArticleSummary":
+        """从文章列表接口返回的单项数据构建记录
+
+        Args:
+            json_obj (Dict): 文章列表中的单项数据
+
+        Returns:
+            ArticleSummary: 文章摘要信息，发布时间不含时区信息
+        """
+        data = json_obj["object"]["data"]
+        return cls(
+            aid=data["id"],
+            title=data["title"],
+            aslug=data["slug"],
+            release_time=datetime.fromisoformat(data["first_shared_at"]).replace(
+                tzinfo=None
+            ),
+            first_image_url=data["list_image_url"],
+            summary=data["public_abbr"],
+            views_count=data["views_count"],
+            likes_count=data["likes_count"],
+            is_top=data.get("is_top"),  # 专题文章列表中没有此字段
+            paid=data["paid"],
+            commentable=data["commentable"],
+            user=UserRef.from_json(data["user"], with_vip_info=False),
+            total_fp_amount=data["total_fp_amount"] / 1000,
+            comments_count=data["public_comments_count"],
+            rewards_count=data["total_rewards_count"],
+        )
+
+
+class CommentRecord(_Record):
+    """文章评论信息，子评论同样以此类型表示"""
+
+    __slots__ = (
+        "cmid",
+        "publish_time",
+        "content",
+        "floor",
+        "images",
+        "likes_count",
+        "sub_comments_count",
+        "parent_comment_id",
+        "user",
+        "sub_comments",
+    )
+    # 子评论没有楼层、点赞数与子评论，评论没有父评论 ID
+    _OPTIONAL_FIELDS = frozenset(
+        (
+            "floor",
+            "likes_count",
+            "sub_comments_count",
+            "parent_comment_id",
+            "sub_comments",
+        )
+    )
+
+    cmid: int
+    publish_time: datetime
+    content: str
+    floor: Optional[int]
+    images: List[str]
+    likes_count: Optional[int]
+    sub_comments_count: Optional[int]
+    parent_comment_id: Optional[int]
+    user: UserRef
+    sub_comments: Optional[List["CommentRecord"]]
+
+    def __init__(
+        self,
+        cmid: int,
+        publish_time: datetime,
+        content: str,
+        images: List[str],
+        user: UserRef,
+        floor: Optional[int] = None,
+        likes_count: Optional[int] = None,
+        sub_comments_count: Optional[int] = None,
+        parent_comment_id: Optional[int] = None,
+        sub_comments: Optional[List["CommentRecord"]] = None,
+    ) -> None:
+        self.cmid = cmid
+        self.publish_time = publish_time
+        self.content = content
+        self.images = images
+        self.user = user
+        self.floor = floor
+        self.likes_count = likes_count
+        self.sub_comments_count = sub_comments_count
+        self.parent_comment_id = parent_comment_id
+        self.sub_comments = sub_comments
+
+    @classmethod
+    def from_json(cls, json_obj: Dict) -> "CommentRecord":
+        """从评论接口返回的单条评论数据构建记录
+
+        Args:
+            json_obj (Dict): 单条评论数据
+
+        Returns:
+            CommentRecord: 评论信息
+        """
+        children = json_obj.get("children")
+        return cls(
+            cmid=json_obj["id"],
+            publish_time=datetime.fromisoformat(json_obj["created_at"]),
+            content=json_obj["compiled_content"],
+            floor=json_obj["floor"],
+            images=[image["url"] for image in json_obj["images"]],
+            likes_count=json_obj["likes_count"],
+            sub_comments_count=json_obj["children_count"],
+            user=UserRef.from_json(json_obj["user"]),
+            sub_comments=[cls._FromSubCommentJson(x) for x in children]
+            if children is not None
+            else None,
+        )
+
+    @classmethod
+    def _FromSubCommentJson(cls, json_obj: Dict) -> "CommentRecord":
+        return cls(
+            cmid=json_obj["id"],
+            publish_time=datetime.fromisoformat(json_obj["created_at"]),
+            content=json_obj["compiled_content"],
+            images=[image["url"] for image in json_obj["images"]],
+            parent_comment_id=json_obj["parent_id"],
+            user=UserRef.from_json(json_obj["user"]),
+        )
@@ -0,0 +1,259 @@
+import gzip
+import json
+from asyncio import sleep as async_sleep
+from base64 import b64decode, b64encode
+from contextlib import contextmanager
+from os.path import exists
+from threading import Lock
+from time import sleep
+from typing import Dict, Generator, Optional, Tuple
+
+from httpx import AsyncBaseTransport, BaseTransport, Request, Response
+
+from .exceptions import ResourceError
+from .httpx_client import HttpConfig, get_http_config, set_http_config
+from .response_cache import ResponseCache
+
+__all__ = [
+    "FixtureArchive",
+    "RecordingTransport",
+    "AsyncRecordingTransport",
+    "ReplayTransport",
+    "AsyncReplayTransport",
+    "record_fixtures",
+    "replay_fixtures",
+]
+
+_ARCHIVE_VERSION = 1
+
+
+class FixtureArchive:
+    """以请求方法与完整 URL 为键保存响应的存档，以 gzip 压缩的 JSON 格式存储在单个文件中"""
+
+    def __init__(self) -> None:
+        """构建新的空存档"""
+        # 键为 "方法 URL"，值为 (状态码, Content-Type, 响应内容)
+        self.responses: Dict[str, Tuple[int, str, bytes]] = {}
+        self._lock = Lock()
+
+    @classmethod
+    def load(cls, path: str) -> "FixtureArchive":
+        """从文件中读取存档
+
+        Args:
+            path (str): 存档文件路径
+
+        Returns:
+            FixtureArchive: 存档
+        """
+        archive = cls()
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data["version"] != _ARCHIVE_VERSION:
+            raise ValueError(f"不支持的存档版本 {data['version']}")
+        for key, (status_code, content_type, content) in data["responses"].items():
+            archive.responses[key] = (status_code, content_type, b64decode(content))
+        return archive
+
+    def save(self, path: str) -> None:
+        """将存档写入文件
+
+        Args:
+            path (str): 存档文件路径
+        """
+        with self._lock:
+            responses = {
+                key: [status_code, content_type, b64encode(content).decode()]
+                for key, (status_code, content_type, content) in self.responses.items()
+            }
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(
+                {"version": _ARCHIVE_VERSION, "responses": responses},
+                f,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+
+    def add(self, request: Request, response: Response) -> None:
+        """记录响应，响应内容需已读取
+
+        Args:
+            request (Request): 请求
+            response (Response): 响应
+        """
+        key = ResponseCache.make_key(request.method, request.url)
+        with self._lock:
+            self.responses[key] = (
+                response.status_code,
+                response.headers.get("Content-Type", ""),
+                response.content,
+            )
+
+    def make_response(self, request: Request) -> Response:
+        """根据存档构建请求对应的响应
+
+        Args:
+            request (Request): 请求
+
+        Raises:
+            ResourceError: 存档中没有该请求的响应时抛出此异常
+
+        Returns:
+            Response: 响应
+        """
+        key = ResponseCache.make_key(request.method, request.url)
+        try:
+            status_code, content_type, content = self.responses[key]
+        except KeyError:
+            raise ResourceError(f"存档中没有 {request.url} 的数据") from None
+        headers = {"Content-Type": content_type} if content_type else {}
+        return Response(status_code, headers=headers, content=content, request=request)
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+
+class RecordingTransport(BaseTransport):
+    """将实际网络请求的响应记录到存档中的传输层"""
+
+    def __init__(self, archive: FixtureArchive, transport: BaseTransport) -> None:
+        """构建新的记录传输层
+
+        Args:
+            archive (FixtureArchive): 记录响应的存档
+            transport (BaseTransport): 实际发送请求的传输层
+        """
+        self.archive = archive
+        self.transport = transport
+
+    def handle_request(self, request: Request) -> Response:
+        response = self.transport.handle_request(request)
+        response.read()
+        self.archive.add(request, response)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRecordingTransport(AsyncBaseTransport):
+    """将实际网络请求的响应记录到存档中的异步传输层"""
+
+    def __init__(self, archive: FixtureArchive, transport: AsyncBaseTransport) -> None:
+        """构建新的异步记录传输层
+
+        Args:
+            archive (FixtureArchive): 记录响应的存档
+            transport (AsyncBaseTransport): 实际发送请求的异步传输层
+        """
+        self.archive = archive
+        self.transport = transport
+
+    async def handle_async_request(self, request: Request) -> Response:
+        response = await self.transport.handle_async_request(request)
+        await response.aread()
+        self.archive.add(request, response)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class ReplayTransport(BaseTransport):
+    """从存档中返回响应，不发送网络请求的传输层"""
+
+    def __init__(self, archive: FixtureArchive, latency: float = 0) -> None:
+        """构建新的回放传输层
+
+        Args:
+            archive (FixtureArchive): 存档
+            latency (float, optional): 每次请求的模拟延迟（秒）. Defaults to 0.
+        """
+        self.archive = archive
+        self.latency = latency
+
+    def handle_request(self, request: Request) -> Response:
+        if self.latency:
+            sleep(self.latency)
+        return self.archive.make_response(request)
+
+
+class AsyncReplayTransport(AsyncBaseTransport):
+    """从存档中返回响应，不发送网络请求的异步传输层"""
+
+    def __init__(self, archive: FixtureArchive, latency: float = 0) -> None:
+        """构建新的异步回放传输层
+
+        Args:
+            archive (FixtureArchive): 存档
+            latency (float, optional): 每次请求的模拟延迟（秒）. Defaults to 0.
+        """
+        self.archive = archive
+        self.latency = latency
+
+    async def handle_async_request(self, request: Request) -> Response:
+        if self.latency:
+            await async_sleep(self.latency)
+        return self.archive.make_response(request)
+
+
+@contextmanager
+def record_fixtures(
+    path: str, archive: Optional[FixtureArchive] = None
+) -> Generator[FixtureArchive, None, None]:
+    """在上下文中将所有客户端的响应记录到存档文件，退出时写入文件
+
+    文件已存在时，新记录的响应将与其合并
+
+    Args:
+        path (str): 存档文件路径
+        archive (Optional[FixtureArchive], optional): 记录响应的存档，为 None 时读取已有文件或新建. Defaults to None.
+
+    Yields:
+        Iterator[FixtureArchive]: 存档
+    """
+    if archive is None:
+        archive = FixtureArchive.load(path) if exists(path) else FixtureArchive()
+    old_config = get_http_config()
+    set_http_config(
+        HttpConfig(
+            timeout=old_config.timeout,
+            transport=RecordingTransport(archive, old_config.make_transport()),
+            async_transport=AsyncRecordingTransport(
+                archive, old_config.make_async_transport()
+            ),
+        )
+    )
+    try:
+        yield archive
+    finally:
+        set_http_config(old_config)
+        archive.save(path)
+
+
+@contextmanager
+def replay_fixtures(
+    path: str, latency: float = 0
+) -> Generator[FixtureArchive, None, None]:
+    """在上下文中让所有客户端从存档文件中读取响应，不发送网络请求
+
+    Args:
+        path (str): 存档文件路径
+        latency (float, optional): 每次请求的模拟延迟（秒）. Defaults to 0.
+
+    Yields:
+        Iterator[FixtureArchive]: 存档
+    """
+    archive = FixtureArchive.load(path)
+    old_config = get_http_config()
+    set_http_config(
+        HttpConfig(
+            timeout=old_config.timeout,
+            transport=ReplayTransport(archive, latency),
+            async_transport=AsyncReplayTransport(archive, latency),
+        )
+    )
+    try:
+        yield archive
+    finally:
+        set_http_config(old_config)
@@ -0,0 +1,239 @@
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from re import Pattern
+from re import compile as re_compile
+from threading import Lock
+from time import time
+from typing import Dict, List, Optional, Tuple
+
+from httpx import URL
+
+__all__ = [
+    "ResponseCache",
+    "enable_response_cache",
+    "disable_response_cache",
+    "get_response_cache",
+]
+
+_BEIJING_TIMEZONE = timezone(timedelta(hours=8))
+_FP_RANK_LIST_PATH = "/asimov/fp_rankings/voter_notes"
+# 每写入该数量的条目后重新统计一次缓存内容总大小
+_SIZE_SYNC_INTERVAL = 1000
+
+
+def _IsSettledFPRankDate(date: str) -> bool:
+    """判断对应日期的收益排行榜数据是否已不会再变化"""
+    # 留出一天供排行榜数据生成
+    two_days_ago = datetime.now(_BEIJING_TIMEZONE) - timedelta(days=2)
+    return date != "latest" and date <= two_days_ago.strftime("%Y%m%d")
+
+
+class ResponseCache:
+    """基于 SQLite 的持久化响应缓存
+
+    以请求方法与完整 URL（包含查询参数）为键，保存原始响应内容，可跨进程、跨重启复用
+    """
+
+    def __init__(
+        self,
+        path: str,
+        default_ttl: Optional[float] = 3600,
+        ttls: Optional[Dict[str, Optional[float]]] = None,
+        max_size: int = 256 * 1024 * 1024,
+        offline: bool = False,
+    ) -> None:
+        """构建新的响应缓存对象
+
+        Args:
+            path (str): SQLite 数据库文件路径
+            default_ttl (Optional[float], optional): 默认有效期（秒），为 None 时永不过期. Defaults to 3600.
+            ttls (Optional[Dict[str, Optional[float]]], optional): 按接口设置的有效期，
+            键为匹配 URL 路径的正则表达式，值为有效期（秒），为 0 时不缓存，为 None 时永不过期. Defaults to None.
+            max_size (int, optional): 缓存内容总大小上限（字节），超出时淘汰最久未访问的条目. Defaults to 256 MiB.
+            offline (bool, optional): 离线模式，只读取缓存（包括已过期的条目），不发送请求也不写入缓存. Defaults to False.
+        """
+        self.offline = offline
+        self._default_ttl = default_ttl
+        self._ttls: List[Tuple[Pattern, Optional[float]]] = [
+            (re_compile(pattern), ttl) for pattern, ttl in (ttls or {}).items()
+        ]
+        self._max_size = max_size
+        self._lock = Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, content BLOB NOT NULL, size INTEGER NOT NULL, "
+                "expire_time REAL, access_time REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_access_time "
+                "ON responses (access_time)"
+            )
+        # 缓存内容总大小，避免每次写入都扫描全表；其它进程也可能写入，因此定期重新统计
+        self._total_size = self._QueryTotalSize()
+        self._writes_since_sync = 0
+
+    @staticmethod
+    def make_key(method: str, url: URL, family: Optional[str] = None) -> str:
+        """生成缓存键
+
+        Args:
+            method (str): 请求方法
+            url (URL): 完整请求 URL
+            family (Optional[str], optional): 接口类型，不同类型接口的请求头不同，即使 URL 相同响应也可能不同. Defaults to None.
+
+        Returns:
+            str: 缓存键
+        """
+        if family is None:
+            return f"{method} {url}"
+        return f"{family} {method} {url}"
+
+    def get_ttl(self, url: URL) -> Optional[float]:
+        """获取对应请求的缓存有效期
+
+        历史日期的文章收益排行榜数据不会再变化，将被永久缓存
+
+        Args:
+            url (URL): 完整请求 URL
+
+        Returns:
+            Optional[float]: 有效期（秒），为 None 时永不过期
+        """
+        if url.path == _FP_RANK_LIST_PATH and _IsSettledFPRankDate(
+            url.params.get("date", "latest")
+        ):
+            return None
+        for pattern, ttl in self._ttls:
+            if pattern.search(url.path):
+                return ttl
+        return self._default_ttl
+
+    def get(self, key: str) -> Optional[bytes]:  # noqa: A003
+        """获取缓存的响应内容
+
+        Args:
+            key (str): 缓存键
+
+        Returns:
+            Optional[bytes]: 响应内容，不存在或已过期时返回 None（离线模式下不检查是否过期）
+        """
+        now = time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content, expire_time FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            content, expire_time = row
+            if not self.offline and expire_time is not None and expire_time <= now:
+                return None
+            if not self.offline:
+                with self._conn:
+                    self._conn.execute(
+                        "UPDATE responses SET access_time = ? WHERE key = ?",
+                        (now, key),
+                    )
+        return content
+
+    def set(self, key: str, content: bytes, ttl: Optional[float]) -> None:  # noqa: A003
+        """写入响应内容，超出大小上限时淘汰最久未访问的条目
+
+        Args:
+            key (str): 缓存键
+            content (bytes): 响应内容
+            ttl (Optional[float]): 有效期（秒），为 0 时不写入，为 None 时永不过期
+        """
+        if self.offline or ttl == 0 or len(content) > self._max_size:
+            return
+        now = time()
+        expire_time = now + ttl if ttl is not None else None
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, content, len(content), expire_time, now),
+            )
+            self._total_size += len(content) - (row[0] if row is not None else 0)
+            self._writes_since_sync += 1
+            if self._writes_since_sync >= _SIZE_SYNC_INTERVAL:
+                self._total_size = self._QueryTotalSize()
+            if self._total_size <= self._max_size:
+                return
+            # 淘汰前重新统计，以计入其它进程写入的内容
+            self._total_size = self._QueryTotalSize()
+            # 从最久未访问的条目开始淘汰，直到总大小不超过上限
+            for old_key, size in self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY access_time"
+            ).fetchall():
+                if self._total_size <= self._max_size:
+                    break
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (old_key,))
+                self._total_size -= size
+
+    def _QueryTotalSize(self) -> int:
+        self._writes_since_sync = 0
+        return self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+
+    def clear(self) -> None:
+        """清空所有缓存的响应内容"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+            self._total_size = 0
+
+    def close(self) -> None:
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def enable_response_cache(
+    path: str = "jrt_response_cache.sqlite3",
+    default_ttl: Optional[float] = 3600,
+    ttls: Optional[Dict[str, Optional[float]]] = None,
+    max_size: int = 256 * 1024 * 1024,
+    offline: bool = False,
+) -> ResponseCache:
+    """启用持久化响应缓存，此后所有网络请求将优先从缓存中读取
+
+    Args:
+        path (str, optional): SQLite 数据库文件路径. Defaults to "jrt_response_cache.sqlite3".
+        default_ttl (Optional[float], optional): 默认有效期（秒），为 None 时永不过期. Defaults to 3600.
+        ttls (Optional[Dict[str, Optional[float]]], optional): 按接口设置的有效期，
+        键为匹配 URL 路径的正则表达式，如 {r"^/asimov/users/": 300}. Defaults to None.
+        max_size (int, optional): 缓存内容总大小上限（字节）. Defaults to 256 MiB.
+        offline (bool, optional): 离线模式，只读取缓存，缓存中不存在时抛出 ResourceError. Defaults to False.
+
+    Returns:
+        ResponseCache: 响应缓存对象
+    """
+    global _response_cache
+    disable_response_cache()
+    _response_cache = ResponseCache(path, default_ttl, ttls, max_size, offline)
+    return _response_cache
+
+
+def disable_response_cache() -> None:
+    """停用持久化响应缓存，已缓存的内容仍保留在磁盘上"""
+    global _response_cache
+    if _response_cache is not None:
+        _response_cache.close()
+    _response_cache = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """获取当前启用的响应缓存对象
+
+    Returns:
+        Optional[ResponseCache]: 响应缓存对象，未启用时返回 None
+    """
+    return _response_cache
@@ -0,0 +1,230 @@
+from asyncio import sleep as async_sleep
+from random import uniform
+from time import monotonic, sleep
+from typing import Collection, Dict, Optional, Tuple, Type
+
+from httpx import (
+    AsyncBaseTransport,
+    BaseTransport,
+    NetworkError,
+    RemoteProtocolError,
+    Request,
+    Response,
+    TimeoutException,
+)
+
+__all__ = [
+    "RetryPolicy",
+    "RetryTransport",
+    "AsyncRetryTransport",
+    "set_retry_policy",
+    "get_retry_policy",
+]
+
+
+class RetryPolicy:
+    """请求重试策略，使用带随机抖动的指数退避"""
+
+    # 可以安全重试的网络错误
+    retry_exceptions: Tuple[Type[Exception], ...] = (
+        TimeoutException,
+        NetworkError,
+        RemoteProtocolError,
+    )
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10,
+        retry_status_codes: Collection[int] = (429, 500, 502, 503, 504),
+        retry_methods: Collection[str] = ("GET", "HEAD", "OPTIONS"),
+        deadline: Optional[float] = 30,
+    ) -> None:
+        """构建新的重试策略
+
+        Args:
+            attempts (int, optional): 最大尝试次数，包括首次请求. Defaults to 3.
+            backoff_base (float, optional): 首次重试前等待时长的上限（秒），此后每次翻倍. Defaults to 0.5.
+            backoff_max (float, optional): 单次等待时长的上限（秒）. Defaults to 10.
+            retry_status_codes (Collection[int], optional): 需要重试的响应状态码. Defaults to (429, 500, 502, 503, 504).
+            retry_methods (Collection[str], optional): 允许重试的请求方法，默认只重试幂等请求. Defaults to ("GET", "HEAD", "OPTIONS").
+            deadline (Optional[float], optional): 单次调用（包括所有重试）的总时长上限（秒），每次尝试的超时时间
+            都会缩短到距截止时间的剩余时长，为 None 时不限制. Defaults to 30.
+        """
+        if attempts <= 0:
+            raise ValueError("最大尝试次数必须大于 0")
+        self.attempts = attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.deadline = deadline
+
+    def get_backoff(self, attempt: int, response: Optional[Response] = None) -> float:
+        """计算第 attempt 次尝试失败后的等待时长
+
+        采用 Full Jitter 策略，在 [0, min(backoff_max, backoff_base * 2 ^ (attempt - 1))] 中随机取值，
+        如果响应中包含 Retry-After 头，则至少等待其指定的时长
+
+        Args:
+            attempt (int): 已进行的尝试次数
+            response (Optional[Response], optional): 失败的响应，网络错误时为 None. Defaults to None.
+
+        Returns:
+            float: 等待时长（秒）
+        """
+        backoff = uniform(  # noqa: S311
+            0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        )
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                backoff = max(backoff, float(retry_after))
+        return backoff
+
+    def can_retry(
+        self, attempt: int, wait_time: float, deadline: Optional[float]
+    ) -> bool:
+        """判断是否可以进行下一次尝试
+
+        Args:
+            attempt (int): 已进行的尝试次数
+            wait_time (float): 下一次尝试前的等待时长（秒）
+            deadline (Optional[float]): 调用的截止时间（monotonic 时间）
+
+        Returns:
+            bool: 判断结果
+        """
+        if attempt >= self.attempts:
+            return False
+        return deadline is None or monotonic() + wait_time < deadline
+
+    def get_deadline(self) -> Optional[float]:
+        """根据当前时间计算调用的截止时间
+
+        Returns:
+            Optional[float]: 截止时间（monotonic 时间），不限制时为 None
+        """
+        return monotonic() + self.deadline if self.deadline is not None else None
+
+
+_retry_policy: Optional[RetryPolicy] = RetryPolicy()
+_TIMEOUT_KEYS = ("connect", "read", "write", "pool")
+
+
+def set_retry_policy(policy: Optional[RetryPolicy]) -> None:
+    """设置全局重试策略
+
+    Args:
+        policy (Optional[RetryPolicy]): 重试策略，为 None 时禁用重试
+    """
+    global _retry_policy
+    _retry_policy = policy
+
+
+def get_retry_policy() -> Optional[RetryPolicy]:
+    """获取全局重试策略
+
+    Returns:
+        Optional[RetryPolicy]: 重试策略，禁用重试时为 None
+    """
+    return _retry_policy
+
+
+def _LimitTimeout(
+    request: Request,
+    timeout: Dict[str, Optional[float]],
+    deadline: Optional[float],
+) -> None:
+    # 将本次尝试的各项超时时间缩短到距截止时间的剩余时长，使最后一次尝试也不会超出截止时间
+    if deadline is None:
+        return
+    remaining = max(deadline - monotonic(), 0)
+    limited_timeout = {}
+    for key in _TIMEOUT_KEYS:
+        value = timeout.get(key)
+        limited_timeout[key] = remaining if value is None else min(value, remaining)
+    request.extensions["timeout"] = limited_timeout
+
+
+class RetryTransport(BaseTransport):
+    """按照全局重试策略重试失败请求的传输层"""
+
+    def __init__(self, transport: BaseTransport) -> None:
+        """构建新的重试传输层
+
+        Args:
+            transport (BaseTransport): 实际发送请求的传输层
+        """
+        self.transport = transport
+
+    def handle_request(self, request: Request) -> Response:
+        policy = _retry_policy
+        if policy is None or request.method not in policy.retry_methods:
+            return self.transport.handle_request(request)
+
+        deadline = policy.get_deadline()
+        timeout = request.extensions.get("timeout", {})
+        attempt = 0
+        while True:
+            attempt += 1
+            _LimitTimeout(request, timeout, deadline)
+            try:
+                response = self.transport.handle_request(request)
+            except policy.retry_exceptions:
+                wait_time = policy.get_backoff(attempt)
+                if not policy.can_retry(attempt, wait_time, deadline):
+                    raise
+            else:
+                if response.status_code not in policy.retry_status_codes:
+                    return response
+                wait_time = policy.get_backoff(attempt, response)
+                if not policy.can_retry(attempt, wait_time, deadline):
+                    return response
+                response.close()
+            sleep(wait_time)
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncRetryTransport(AsyncBaseTransport):
+    """按照全局重试策略重试失败请求的异步传输层"""
+
+    def __init__(self, transport: AsyncBaseTransport) -> None:
+        """构建新的异步重试传输层
+
+        Args:
+            transport (AsyncBaseTransport): 实际发送请求的异步传输层
+        """
+        self.transport = transport
+
+    async def handle_async_request(self, request: Request) -> Response:
+        policy = _retry_policy
+        if policy is None or request.method not in policy.retry_methods:
+            return await self.transport.handle_async_request(request)
+
+        deadline = policy.get_deadline()
+        timeout = request.extensions.get("timeout", {})
+        attempt = 0
+        while True:
+            attempt += 1
+            _LimitTimeout(request, timeout, deadline)
+            try:
+                response = await self.transport.handle_async_request(request)
+            except policy.retry_exceptions:
+                wait_time = policy.get_backoff(attempt)
+                if not policy.can_retry(attempt, wait_time, deadline):
+                    raise
+            else:
+                if response.status_code not in policy.retry_status_codes:
+                    return response
+                wait_time = policy.get_backoff(attempt, response)
+                if not policy.can_retry(attempt, wait_time, deadline):
+                    return response
+                await response.aclose()
+            await async_sleep(wait_time)
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,140 @@
+from asyncio import AbstractEventLoop, Task, get_running_loop, shield
+from functools import partial
+from threading import Event, Lock
+from typing import Any, Callable, Coroutine, Dict, Hashable, Optional, Tuple, TypeVar
+
+__all__ = [
+    "SingleFlight",
+    "AsyncSingleFlight",
+    "enable_request_coalescing",
+    "disable_request_coalescing",
+    "get_single_flight",
+    "get_async_single_flight",
+]
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """合并并发的相同调用，同一时间每个键只有一个调用在进行，其余调用等待并共享其结果"""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = Lock()
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> Tuple[T, bool]:
+        """执行调用，已有相同键的调用在进行时等待其完成
+
+        Args:
+            key (Hashable): 调用的键
+            func (Callable[[], T]): 要执行的函数
+
+        Returns:
+            Tuple[T, bool]: (函数返回值, 是否共享了其它线程的调用结果)，
+            共享的调用抛出异常时同样抛出该异常
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            shared = call is not None
+            if call is None:
+                call = self._calls[key] = _Call()
+
+        if shared:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+
+class AsyncSingleFlight:
+    """SingleFlight 的异步版本，调用在独立的任务中执行，等待方被取消时不会影响其它等待方"""
+
+    def __init__(self) -> None:
+        # 不同线程中的事件循环互不共享调用
+        self._calls: Dict[Tuple[AbstractEventLoop, Hashable], Task] = {}
+
+    async def do(
+        self, key: Hashable, func: Callable[[], Coroutine[Any, Any, T]]
+    ) -> Tuple[T, bool]:
+        """执行调用，已有相同键的调用在进行时等待其完成
+
+        Args:
+            key (Hashable): 调用的键
+            func (Callable[[], Coroutine[Any, Any, T]]): 要执行的异步函数
+
+        Returns:
+            Tuple[T, bool]: (函数返回值, 是否共享了其它任务的调用结果)，
+            共享的调用抛出异常时同样抛出该异常
+        """
+        loop = get_running_loop()
+        call_key = (loop, key)
+        task = self._calls.get(call_key)
+        shared = task is not None
+        if task is None:
+            task = loop.create_task(func())
+            self._calls[call_key] = task
+            task.add_done_callback(partial(self._Finish, call_key))
+        return await shield(task), shared
+
+    def _Finish(self, call_key: Tuple[AbstractEventLoop, Hashable], task: Task) -> None:
+        del self._calls[call_key]
+        if not task.cancelled():
+            task.exception()  # 所有等待方都被取消时，避免出现异常未被获取的警告
+
+
+_single_flight: Optional[SingleFlight] = SingleFlight()
+_async_single_flight: Optional[AsyncSingleFlight] = AsyncSingleFlight()
+
+
+def enable_request_coalescing() -> None:
+    """启用请求合并，并发的相同请求（URL 与参数均相同）只发送一次，默认启用"""
+    global _single_flight, _async_single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    if _async_single_flight is None:
+        _async_single_flight = AsyncSingleFlight()
+
+
+def disable_request_coalescing() -> None:
+    """停用请求合并，每次调用都发送独立的请求"""
+    global _single_flight, _async_single_flight
+    _single_flight = None
+    _async_single_flight = None
+
+
+def get_single_flight() -> Optional[SingleFlight]:
+    """获取用于合并请求的 SingleFlight 对象
+
+    Returns:
+        Optional[SingleFlight]: SingleFlight 对象，未启用请求合并时返回 None
+    """
+    return _single_flight
+
+
+def get_async_single_flight() -> Optional[AsyncSingleFlight]:
+    """获取用于合并异步请求的 AsyncSingleFlight 对象
+
+    Returns:
+        Optional[AsyncSingleFlight]: AsyncSingleFlight 对象，未启用请求合并时返回 None
+    """
+    return _async_single_flight
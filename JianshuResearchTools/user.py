@@ -1,10 +1,25 @@
 from datetime import datetime
 from re import findall
-from typing import Dict, Generator, List, Literal, Optional
+from typing import (
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from lxml import etree
+from lxml.etree import _Element
 
-from .assert_funcs import AssertUserStatusNormal, AssertUserUrl
+from .assert_funcs import (
+    AssertUserJsonDataNormal,
+    AssertUserStatusNormal,
+    AssertUserUrl,
+)
 from .basic_apis import (
     GetUserArticlesListJsonDataApi,
     GetUserCollectionsAndNotebooksJsonDataApi,
@@ -23,6 +38,8 @@ from .convert import (
     UserUrlToUserSlug,
 )
 from .exceptions import APIError
+from .records import ArticleSummary
+from .utils import BatchCall, Cursor, IterPages, IterPagesById
 
 __all__ = [
     "GetUserName",
@@ -48,6 +65,7 @@ __all__ = [
     "GetUserFollowingInfo",
     "GetUserFansInfo",
     "GetUserAllBasicData",
+    "GetUsersAllBasicData",
     "GetUserTimelineInfo",
     "GetUserAllArticlesInfo",
     "GetUserAllFollowingInfo",
@@ -68,11 +86,19 @@ def GetUserName(user_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
     return json_obj["nickname"]
 
 
+def _ParseUserGender(json_obj: Dict) -> int:
+    result = json_obj["gender"]
+    if result == 3:  # 某些未设置性别的账号性别值为 3，怀疑为简书系统遗留问题
+        result = 0  # 3 也代表性别未知
+    return result
+
+
 def GetUserGender(user_url: str, disable_check: bool = False) -> int:
     """获取用户性别
 
@@ -85,12 +111,10 @@ def GetUserGender(user_url: str, disable_check: bool = False) -> int:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
-    result = json_obj["gender"]
-    if result == 3:  # 某些未设置性别的账号性别值为 3，怀疑为简书系统遗留问题
-        result = 0  # 3 也代表性别未知
-    return result
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    return _ParseUserGender(json_obj)
 
 
 def GetUserFollowersCount(user_url: str, disable_check: bool = False) -> int:
@@ -105,8 +129,9 @@ def GetUserFollowersCount(user_url: str, disable_check: bool = False) -> int:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
     return json_obj["following_users_count"]
 
 
@@ -122,11 +147,19 @@ def GetUserFansCount(user_url: str, disable_check: bool = False) -> int:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
     return json_obj["followers_count"]
 
 
+def _ParseUserArticlesCount(html_obj: _Element) -> int:
+    result = html_obj.xpath(
+        "//div[@class='info']/ul/li[3]/div[@class='meta-block']/a/p"
+    )[0].text
+    return int(result)
+
+
 def GetUserArticlesCount(user_url: str, disable_check: bool = False) -> int:
     """获取用户文章数
 
@@ -141,11 +174,7 @@ def GetUserArticlesCount(user_url: str, disable_check: bool = False) -> int:
         AssertUserUrl(user_url)
         AssertUserStatusNormal(user_url)
     html_obj = GetUserPCHtmlDataApi(user_url)
-    result = html_obj.xpath(
-        "//div[@class='info']/ul/li[3]/div[@class='meta-block']/a/p"
-    )[0].text
-    result = int(result)
-    return result
+    return _ParseUserArticlesCount(html_obj)
 
 
 def GetUserWordage(user_url: str, disable_check: bool = False) -> int:
@@ -160,8 +189,9 @@ def GetUserWordage(user_url: str, disable_check: bool = False) -> int:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
     return json_obj["total_wordage"]
 
 
@@ -177,11 +207,22 @@ def GetUserLikesCount(user_url: str, disable_check: bool = False) -> int:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
     return json_obj["total_likes_count"]
 
 
+def _ParseUserAssetsCount(html_obj: _Element) -> float:
+    try:
+        result = html_obj.xpath(
+            "//div[@class='info']/ul/li[6]/div[@class='meta-block']/p"
+        )[0].text
+    except IndexError:
+        raise APIError("受简书 API 限制，用户无文章时无法获取其总资产数据") from None
+    return float(result.replace(".", "").replace("w", "000"))
+
+
 def GetUserAssetsCount(user_url: str, disable_check: bool = False) -> float:
     """获取用户总资产
 
@@ -202,13 +243,13 @@ def GetUserAssetsCount(user_url: str, disable_check: bool = False) -> float:
         AssertUserUrl(user_url)
         AssertUserStatusNormal(user_url)
     html_obj = GetUserPCHtmlDataApi(user_url)
-    try:
-        result = html_obj.xpath(
-            "//div[@class='info']/ul/li[6]/div[@class='meta-block']/p"
-        )[0].text
-    except IndexError:
-        raise APIError("受简书 API 限制，用户无文章时无法获取其总资产数据") from None
-    result = float(result.replace(".", "").replace("w", "000"))
+    return _ParseUserAssetsCount(html_obj)
+
+
+def _ParseUserFPCount(json_obj: Dict) -> float:
+    result = json_obj["jsd_balance"] / 1000
+    if json_obj["total_wordage"] == 0 and result == 0:
+        raise APIError("受简书 API 限制，用户无文章时无法获取其简书钻数据")
     return result
 
 
@@ -229,11 +270,18 @@ def GetUserFPCount(user_url: str, disable_check: bool = False) -> float:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
-    result = json_obj["jsd_balance"] / 1000
-    if json_obj["total_wordage"] == 0 and result == 0:
-        raise APIError("受简书 API 限制，用户无文章时无法获取其简书钻数据")
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    return _ParseUserFPCount(json_obj)
+
+
+def _ParseUserFTNCount(json_obj: Dict, html_obj: _Element) -> float:
+    assets = _ParseUserAssetsCount(html_obj)
+    FTN = _ParseUserFPCount(json_obj)
+    result = assets - FTN
+    result = abs(result)  # 处理用户简书贝数量较少导致结果为负的情况
+    result = round(result, 3)  # 处理浮点数精度问题
     return result
 
 
@@ -251,13 +299,17 @@ def GetUserFTNCount(user_url: str, disable_check: bool = False) -> float:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
-    assets = GetUserAssetsCount(user_url)
-    FTN = GetUserFPCount(user_url)
-    result = assets - FTN
-    result = abs(result)  # 处理用户简书贝数量较少导致结果为负的情况
-    result = round(result, 3)  # 处理浮点数精度问题
-    return result
+    json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    html_obj = GetUserPCHtmlDataApi(user_url)
+    return _ParseUserFTNCount(json_obj, html_obj)
+
+
+def _ParseUserBadgesList(html_obj: _Element) -> List[str]:
+    result = html_obj.xpath("//li[@class='badge-icon']/a/text()")
+    result = [item.replace(" ", "").replace("\n", "") for item in result]  # 移除空格和换行符
+    return [item for item in result if item != ""]  # 去除空值
 
 
 def GetUserBadgesList(user_url: str, disable_check: bool = False) -> List[str]:
@@ -274,10 +326,7 @@ def GetUserBadgesList(user_url: str, disable_check: bool = False) -> List[str]:
         AssertUserUrl(user_url)
         AssertUserStatusNormal(user_url)
     html_obj = GetUserPCHtmlDataApi(user_url)
-    result = html_obj.xpath("//li[@class='badge-icon']/a/text()")
-    result = [item.replace(" ", "").replace("\n", "") for item in result]  # 移除空格和换行符
-    result = [item for item in result if item != ""]  # 去除空值
-    return result
+    return _ParseUserBadgesList(html_obj)
 
 
 def GetUserLastUpdateTime(user_url: str, disable_check: bool = False) -> datetime:
@@ -292,11 +341,24 @@ def GetUserLastUpdateTime(user_url: str, disable_check: bool = False) -> datetim
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
     return datetime.fromtimestamp(json_obj["last_updated_at"])
 
 
+def _ParseUserVIPInfo(json_obj: Dict) -> Dict:
+    try:
+        return {
+            "vip_type": {"bronze": "铜牌", "silver": "银牌", "gold": "黄金", "platina": "白金"}[
+                json_obj["member"]["type"]
+            ],
+            "expire_date": datetime.fromtimestamp(json_obj["member"]["expires_at"]),
+        }
+    except KeyError:
+        return {"vip_type": None, "expire_date": None}
+
+
 def GetUserVIPInfo(user_url: str, disable_check: bool = False) -> Dict:
     """获取用户会员信息
 
@@ -309,18 +371,10 @@ def GetUserVIPInfo(user_url: str, disable_check: bool = False) -> Dict:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
-    try:
-        result = {
-            "vip_type": {"bronze": "铜牌", "silver": "银牌", "gold": "黄金", "platina": "白金"}[
-                json_obj["member"]["type"]
-            ],
-            "expire_date": datetime.fromtimestamp(json_obj["member"]["expires_at"]),
-        }
-    except KeyError:
-        result = {"vip_type": None, "expire_date": None}
-    return result
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    return _ParseUserVIPInfo(json_obj)
 
 
 def GetUserIntroductionHtml(user_url: str, disable_check: bool = False) -> str:
@@ -335,11 +389,19 @@ def GetUserIntroductionHtml(user_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
     return json_obj["intro"]
 
 
+def _ParseUserIntroductionText(json_obj: Dict) -> str:
+    if json_obj["intro"] == "":  # 简介为空
+        return ""
+    html_obj = etree.HTML(json_obj["intro"])  # type: ignore
+    return "\n".join(html_obj.xpath("//*/text()"))
+
+
 def GetUserIntroductionText(user_url: str, disable_check: bool = False) -> str:
     """获取纯文本格式的用户简介
 
@@ -352,14 +414,15 @@ def GetUserIntroductionText(user_url: str, disable_check: bool = False) -> str:
     """
     if not disable_check:
         AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
     json_obj = GetUserJsonDataApi(user_url)
-    if json_obj["intro"] == "":  # 简介为空
-        return ""
-    html_obj = etree.HTML(json_obj["intro"])  # type: ignore
-    result = html_obj.xpath("//*/text()")
-    result = "\n".join(result)
-    return result
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    return _ParseUserIntroductionText(json_obj)
+
+
+def _ParseUserNextAnniversaryDay(html_obj: _Element) -> datetime:
+    result = html_obj.xpath('//*[@id="app"]/div[1]/div/text()')[0]
+    return datetime.fromisoformat("-".join(findall(r"\d+", result)))
 
 
 def GetUserNextAnniversaryDay(user_url: str, disable_check: bool = False) -> datetime:
@@ -377,28 +440,10 @@ def GetUserNextAnniversaryDay(user_url: str, disable_check: bool = False) -> dat
         AssertUserStatusNormal(user_url)
     user_slug = UserUrlToUserSlug(user_url)
     html_obj = GetUserNextAnniversaryDayHtmlDataApi(user_slug)
-    result = html_obj.xpath('//*[@id="app"]/div[1]/div/text()')[0]
-    result = findall(r"\d+", result)
-    result = datetime.fromisoformat("-".join(result))
-    return result
+    return _ParseUserNextAnniversaryDay(html_obj)
 
 
-def GetUserNotebooksInfo(user_url: str, disable_check: bool = False) -> List[Dict]:
-    """获取用户文集与连载信息
-
-    Args:
-        user_url (str): 用户个人主页 URL
-        disable_check (bool): 禁用参数有效性检查. Defaults to False.
-
-    Returns:
-        List[Dict]: 用户文集与连载信息
-    """
-    if not disable_check:
-        AssertUserUrl(user_url)
-        AssertUserStatusNormal(user_url)
-    json_obj = GetUserCollectionsAndNotebooksJsonDataApi(
-        user_url=user_url, user_slug=UserUrlToUserSlug(user_url)
-    )
+def _ParseUserNotebooksInfo(json_obj: Dict) -> List[Dict]:
     result = []
     for item in json_obj["notebooks"]:
         item_data = {"nid": item["id"], "name": item["name"], "is_book": item["book"]}
@@ -408,15 +453,15 @@ def GetUserNotebooksInfo(user_url: str, disable_check: bool = False) -> List[Dic
     return result
 
 
-def GetUserOwnCollectionsInfo(user_url: str, disable_check: bool = False) -> List[Dict]:
-    """获取用户自己创建的专题信息
+def GetUserNotebooksInfo(user_url: str, disable_check: bool = False) -> List[Dict]:
+    """获取用户文集与连载信息
 
     Args:
         user_url (str): 用户个人主页 URL
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
 
     Returns:
-        List[Dict]: 用户自己创建的专题信息
+        List[Dict]: 用户文集与连载信息
     """
     if not disable_check:
         AssertUserUrl(user_url)
@@ -424,8 +469,12 @@ def GetUserOwnCollectionsInfo(user_url: str, disable_check: bool = False) -> Lis
     json_obj = GetUserCollectionsAndNotebooksJsonDataApi(
         user_url=user_url, user_slug=UserUrlToUserSlug(user_url)
     )
+    return _ParseUserNotebooksInfo(json_obj)
+
+
+def _ParseUserCollectionsInfo(items: List[Dict]) -> List[Dict]:
     result = []
-    for item in json_obj["own_collections"]:
+    for item in items:
         item_data = {
             "cid": item["id"],
             "cslug": item["slug"],
@@ -436,17 +485,15 @@ def GetUserOwnCollectionsInfo(user_url: str, disable_check: bool = False) -> Lis
     return result
 
 
-def GetUserManageableCollectionsInfo(
-    user_url: str, disable_check: bool = False
-) -> List[Dict]:
-    """获取用户管理的专题信息
+def GetUserOwnCollectionsInfo(user_url: str, disable_check: bool = False) -> List[Dict]:
+    """获取用户自己创建的专题信息
 
     Args:
         user_url (str): 用户个人主页 URL
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
 
     Returns:
-        List[Dict]: 用户管理的专题信息
+        List[Dict]: 用户自己创建的专题信息
     """
     if not disable_check:
         AssertUserUrl(user_url)
@@ -454,49 +501,31 @@ def GetUserManageableCollectionsInfo(
     json_obj = GetUserCollectionsAndNotebooksJsonDataApi(
         user_url=user_url, user_slug=UserUrlToUserSlug(user_url)
     )
-    result = []
-    for item in json_obj["manageable_collections"]:
-        item_data = {
-            "cid": item["id"],
-            "cslug": item["slug"],
-            "name": item["title"],
-            "avatar_url": item["avatar"],
-        }
-        result.append(item_data)
-    return result
+    return _ParseUserCollectionsInfo(json_obj["own_collections"])
 
 
-def GetUserArticlesInfo(
-    user_url: str,
-    page: int = 1,
-    count: int = 10,
-    sorting_method: Literal["time", "comment_time", "hot"] = "time",
-    disable_check: bool = False,
+def GetUserManageableCollectionsInfo(
+    user_url: str, disable_check: bool = False
 ) -> List[Dict]:
-    """获取用户文章信息
+    """获取用户管理的专题信息
 
     Args:
         user_url (str): 用户个人主页 URL
-        page (int, optional): 页码，与网页端文章顺序相同. Defaults to 1.
-        count (int, optional): 获取的文章数量. Defaults to 10.
-        sorting_method (Literal["time", "comment_time", "hot"], optional): 排序方法，time 为按照发布时间排序，
-        comment_time 为按照最近评论时间排序，hot 为按照热度排序. Defaults to "time".
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
 
     Returns:
-        List[Dict]: 用户文章信息
+        List[Dict]: 用户管理的专题信息
     """
     if not disable_check:
         AssertUserUrl(user_url)
         AssertUserStatusNormal(user_url)
-    order_by = {
-        "time": "added_at",
-        "comment_time": "commented_at",
-        "hot": "top",
-    }[sorting_method]
-    json_obj = GetUserArticlesListJsonDataApi(
-        user_url=user_url, page=page, count=count, order_by=order_by
+    json_obj = GetUserCollectionsAndNotebooksJsonDataApi(
+        user_url=user_url, user_slug=UserUrlToUserSlug(user_url)
     )
+    return _ParseUserCollectionsInfo(json_obj["manageable_collections"])
+
+
+def _ParseUserArticlesInfo(json_obj: Dict) -> List[Dict]:
     result = []
     for item in json_obj:
         item_data = {
@@ -527,23 +556,45 @@ def GetUserArticlesInfo(
     return result
 
 
-def GetUserFollowingInfo(
-    user_url: str, page: int = 1, disable_check: bool = False
-) -> List[Dict]:
-    """获取用户关注者信息
+def GetUserArticlesInfo(
+    user_url: str,
+    page: int = 1,
+    count: int = 10,
+    sorting_method: Literal["time", "comment_time", "hot"] = "time",
+    disable_check: bool = False,
+    typed: bool = False,
+) -> Union[List[Dict], List[ArticleSummary]]:
+    """获取用户文章信息
 
     Args:
         user_url (str): 用户个人主页 URL
-        page (int, optional): 关注列表页码. Defaults to 1.
+        page (int, optional): 页码，与网页端文章顺序相同. Defaults to 1.
+        count (int, optional): 获取的文章数量. Defaults to 10.
+        sorting_method (Literal["time", "comment_time", "hot"], optional): 排序方法，time 为按照发布时间排序，
+        comment_time 为按照最近评论时间排序，hot 为按照热度排序. Defaults to "time".
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        typed (bool, optional): 为 True 时返回 ArticleSummary 对象而非字典，内存占用更小. Defaults to False.
 
     Returns:
-        List[Dict]: 用户关注者信息
+        Union[List[Dict], List[ArticleSummary]]: 用户文章信息
     """
     if not disable_check:
         AssertUserUrl(user_url)
         AssertUserStatusNormal(user_url)
-    html_obj = GetUserFollowingListHtmlDataApi(user_url=user_url, page=page)
+    order_by = {
+        "time": "added_at",
+        "comment_time": "commented_at",
+        "hot": "top",
+    }[sorting_method]
+    json_obj = GetUserArticlesListJsonDataApi(
+        user_url=user_url, page=page, count=count, order_by=order_by
+    )
+    if typed:
+        return [ArticleSummary.from_json(item) for item in json_obj]
+    return _ParseUserArticlesInfo(json_obj)
+
+
+def _ParseUserFollowListInfo(html_obj: _Element) -> List[Dict]:
     name_raw_data = html_obj.xpath("//a[@class='name']")[1:]
     if not name_raw_data:  # 判断该页数据是否为空
         return []
@@ -569,68 +620,53 @@ def GetUserFollowingInfo(
     return result
 
 
-def GetUserFansInfo(
+def GetUserFollowingInfo(
     user_url: str, page: int = 1, disable_check: bool = False
 ) -> List[Dict]:
-    """获取用户粉丝信息
+    """获取用户关注者信息
 
     Args:
         user_url (str): 用户个人主页 URL
-        page (int, optional): 粉丝列表页码. Defaults to 1.
+        page (int, optional): 关注列表页码. Defaults to 1.
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
 
     Returns:
-        List[Dict]: 用户粉丝信息
+        List[Dict]: 用户关注者信息
     """
     if not disable_check:
         AssertUserUrl(user_url)
         AssertUserStatusNormal(user_url)
-    html_obj = GetUserFollowersListHtmlDataApi(user_url=user_url, page=page)
-    name_raw_data = html_obj.xpath("//a[@class='name']")[1:]
-    if not name_raw_data:  # 判断该页数据是否为空
-        return []
-    followers_raw_data = html_obj.xpath("//div[@class='meta'][1]/span[1]")
-    fans_raw_data = html_obj.xpath("//div[@class='meta'][1]/span[2]")
-    articles_raw_data = html_obj.xpath("//div[@class='meta'][1]/span[3]")
-    words_and_likes_raw_data = html_obj.xpath("//div[@class='meta'][2]")
-    result = []
-    for index in range(8):
-        item_data = {
-            "name": name_raw_data[index].text,
-            "followers_count": int(followers_raw_data[index].text.replace("关注 ", "")),
-            "fans_count": int(fans_raw_data[index].text.replace("粉丝", "")),
-            "articles_count": int(articles_raw_data[index].text.replace("文章 ", "")),
-            "words_count": int(
-                findall(r"\d+", words_and_likes_raw_data[index].text)[0]
-            ),
-            "likes_count": int(
-                findall(r"\d+", words_and_likes_raw_data[index].text)[1]
-            ),
-        }
-        result.append(item_data)
-    return result
+    html_obj = GetUserFollowingListHtmlDataApi(user_url=user_url, page=page)
+    return _ParseUserFollowListInfo(html_obj)
 
 
-def GetUserAllBasicData(user_url: str, disable_check: bool = False) -> Dict:
-    """获取用户的所有基础信息
+def GetUserFansInfo(
+    user_url: str, page: int = 1, disable_check: bool = False
+) -> List[Dict]:
+    """获取用户粉丝信息
 
     Args:
         user_url (str): 用户个人主页 URL
+        page (int, optional): 粉丝列表页码. Defaults to 1.
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
 
     Returns:
-        Dict: 用户基础信息
+        List[Dict]: 用户粉丝信息
     """
     if not disable_check:
         AssertUserUrl(user_url)
         AssertUserStatusNormal(user_url)
-    result = {}
-    json_obj = GetUserJsonDataApi(user_url)
-    html_obj = GetUserPCHtmlDataApi(user_url)
-    anniversary_day_html_obj = GetUserNextAnniversaryDayHtmlDataApi(
-        UserUrlToUserSlug(user_url)
-    )
+    html_obj = GetUserFollowersListHtmlDataApi(user_url=user_url, page=page)
+    return _ParseUserFollowListInfo(html_obj)
 
+
+def _ParseUserAllBasicData(
+    user_url: str,
+    json_obj: Dict,
+    html_obj: _Element,
+    anniversary_day_html_obj: _Element,
+) -> Dict:
+    result = {}
     result["name"] = json_obj["nickname"]
     result["url"] = user_url
     result["uslug"] = UserUrlToUserSlug(user_url)
@@ -691,6 +727,258 @@ def GetUserAllBasicData(user_url: str, disable_check: bool = False) -> Dict:
     return result
 
 
+def GetUserAllBasicData(user_url: str, disable_check: bool = False) -> Dict:
+    """获取用户的所有基础信息
+
+    Args:
+        user_url (str): 用户个人主页 URL
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Returns:
+        Dict: 用户基础信息
+    """
+    if not disable_check:
+        AssertUserUrl(user_url)
+    json_obj = GetUserJsonDataApi(user_url)
+    if not disable_check:
+        AssertUserJsonDataNormal(user_url, json_obj)
+    html_obj = GetUserPCHtmlDataApi(user_url)
+    anniversary_day_html_obj = GetUserNextAnniversaryDayHtmlDataApi(
+        UserUrlToUserSlug(user_url)
+    )
+    return _ParseUserAllBasicData(
+        user_url, json_obj, html_obj, anniversary_day_html_obj
+    )
+
+
+def GetUsersAllBasicData(
+    user_urls: Iterable[str],
+    concurrency: int = 8,
+    ordered: bool = True,
+    disable_check: bool = False,
+) -> Generator[Tuple[str, Union[Dict, Exception]], None, None]:
+    """批量获取多个用户的所有基础信息
+
+    各请求并发进行并共用连接池，单个用户获取失败不会中断整个批次
+
+    Args:
+        user_urls (Iterable[str]): 用户个人主页 URL 序列
+        concurrency (int, optional): 并发数量上限. Defaults to 8.
+        ordered (bool, optional): 为 True 时按输入顺序返回结果，为 False 时按完成顺序返回结果. Defaults to True.
+        disable_check (bool): 禁用参数有效性检查. Defaults to False.
+
+    Yields:
+        Iterator[Tuple[str, Union[Dict, Exception]]]: (用户个人主页 URL, 用户基础信息或获取失败时抛出的异常)
+    """
+    yield from BatchCall(
+        lambda user_url: GetUserAllBasicData(user_url, disable_check=disable_check),
+        user_urls,
+        concurrency,
+        ordered,
+    )
+
+
+_TIMELINE_BLOCKS = etree.XPath("//li[starts-with(@id, 'feed-')]")
+# 以下 XPath 均相对于单条动态所在的 li 元素求值
+_TIMELINE_TIME_SPAN = etree.XPath(".//span[starts-with(@data-datetime, '20')]")
+_TIMELINE_OPERATOR_NAME = etree.XPath(".//a[@class='nickname']/text()")
+_TIMELINE_OPERATOR_HREF = etree.XPath(".//a[@class='nickname']/@href")
+_TIMELINE_OPERATOR_AVATAR = etree.XPath(".//a[@class='avatar']/img/@src")
+_TIMELINE_TITLE = etree.XPath(".//a[@class='title']/text()")
+_TIMELINE_TITLE_HREF = etree.XPath(".//a[@class='title']/@href")
+_TIMELINE_ORIGIN_AUTHOR_NAME = etree.XPath(".//div[@class='origin-author']/a/text()")
+_TIMELINE_ORIGIN_AUTHOR_HREF = etree.XPath(".//div[@class='origin-author']/a/@href")
+_TIMELINE_META_LINK_TEXTS = etree.XPath(".//div[@class='meta']/a/text()")
+_TIMELINE_META_LINK_HREFS = etree.XPath(".//div[@class='meta']/a/@href")
+_TIMELINE_META_SPAN_TEXTS = etree.XPath(".//div[@class='meta']/span/text()")
+_TIMELINE_ABSTRACT_TEXTS = etree.XPath(".//p[@class='abstract']/text()")
+_TIMELINE_COMMENT_TEXTS = etree.XPath(".//p[@class='comment']/text()")
+_TIMELINE_QUOTE_ARTICLE_TITLE = etree.XPath(".//blockquote/div/span/a/text()")
+_TIMELINE_QUOTE_ARTICLE_HREF = etree.XPath(".//blockquote/div/span/a/@href")
+_TIMELINE_QUOTE_USER_NAME = etree.XPath(".//blockquote/div/a/text()")
+_TIMELINE_QUOTE_USER_HREF = etree.XPath(".//blockquote/div/a/@href")
+_TIMELINE_FOLLOW_AVATAR = etree.XPath(".//div[@class='follow-detail']/div/a/img/@src")
+_TIMELINE_CREATER_NAME = etree.XPath(".//a[@class='creater']/text()")
+_TIMELINE_CREATER_HREF = etree.XPath(".//a[@class='creater']/@href")
+_TIMELINE_FOLLOW_INFO_TEXTS = etree.XPath(".//div[@class='info'][1]/p/text()")
+_TIMELINE_USER_TITLE = etree.XPath(".//div[@class='info']/a[@class='title']/text()")
+_TIMELINE_USER_TITLE_HREF = etree.XPath(".//div[@class='info']/a[@class='title']/@href")
+_TIMELINE_USER_INFO_TEXTS = etree.XPath(
+    ".//div[@class='follow-detail']/div[@class='info']/p/text()"
+)
+_TIMELINE_SIGNATURE_TEXTS = etree.XPath(".//div[@class='signature']/text()")
+
+
+def _ParseTimelineOperator(block: _Element, item_data: Dict, slug_start: int) -> None:
+    item_data["operator_name"] = _TIMELINE_OPERATOR_NAME(block)[0]
+    item_data["operator_url"] = UserSlugToUserUrl(
+        _TIMELINE_OPERATOR_HREF(block)[0][slug_start:]
+    )
+    item_data["operator_avatar_url"] = _TIMELINE_OPERATOR_AVATAR(block)[0]
+
+
+def _ParseTimelineArticle(block: _Element, item_data: Dict) -> None:
+    item_data["target_article_title"] = _TIMELINE_TITLE(block)[0]
+    item_data["target_article_url"] = ArticleSlugToArticleUrl(
+        _TIMELINE_TITLE_HREF(block)[0][3:]
+    )
+    meta_link_texts = _TIMELINE_META_LINK_TEXTS(block)
+    item_data["target_article_reads_count"] = int(meta_link_texts[1])
+    item_data["target_article_likes_count"] = int(_TIMELINE_META_SPAN_TEXTS(block)[0])
+    # 文章没有评论或评论区关闭时为 0
+    item_data["target_article_comments_count"] = (
+        int(meta_link_texts[3]) if len(meta_link_texts) > 3 else 0
+    )
+
+
+def _ParseTimelineArticleExtra(block: _Element, item_data: Dict) -> None:
+    abstract_texts = _TIMELINE_ABSTRACT_TEXTS(block)  # 文章没有摘要时为空
+    item_data["target_article_description"] = (
+        abstract_texts[0] if abstract_texts else ""
+    )
+    meta_span_texts = _TIMELINE_META_SPAN_TEXTS(block)  # 没有赞赏数据时为 0
+    item_data["target_article_rewards_count"] = (
+        int(meta_span_texts[1]) if len(meta_span_texts) > 1 else 0
+    )
+
+
+def _ParseTimelineOriginAuthor(block: _Element, item_data: Dict) -> None:
+    item_data["target_user_name"] = _TIMELINE_ORIGIN_AUTHOR_NAME(block)[0]
+    item_data["target_user_url"] = UserSlugToUserUrl(
+        _TIMELINE_ORIGIN_AUTHOR_HREF(block)[0].split("/")[-1]
+    )
+
+
+def _ParseTimelineLikeArticle(block: _Element, item_data: Dict) -> None:
+    _ParseTimelineOperator(block, item_data, 3)
+    _ParseTimelineArticle(block, item_data)
+    _ParseTimelineOriginAuthor(block, item_data)
+    abstract_texts = _TIMELINE_ABSTRACT_TEXTS(block)
+    item_data["target_article_description"] = (
+        abstract_texts[0] if abstract_texts else ""
+    )
+
+
+def _ParseTimelineLikeComment(block: _Element, item_data: Dict) -> None:
+    _ParseTimelineOperator(block, item_data, 3)
+    item_data["comment_content"] = "\n".join(_TIMELINE_COMMENT_TEXTS(block))
+    item_data["target_article_title"] = _TIMELINE_QUOTE_ARTICLE_TITLE(block)[0]
+    item_data["target_article_url"] = ArticleSlugToArticleUrl(
+        _TIMELINE_QUOTE_ARTICLE_HREF(block)[0][3:]
+    )
+    item_data["target_user_name"] = _TIMELINE_QUOTE_USER_NAME(block)[0]
+    item_data["target_user_url"] = UserSlugToUserUrl(
+        _TIMELINE_QUOTE_USER_HREF(block)[0][3:]
+    )
+
+
+def _ParseTimelinePublishArticle(block: _Element, item_data: Dict) -> None:
+    _ParseTimelineOperator(block, item_data, 3)
+    _ParseTimelineArticle(block, item_data)
+    item_data["target_article_description"] = "\n".join(_TIMELINE_ABSTRACT_TEXTS(block))
+
+
+def _ParseTimelineCommentArticle(block: _Element, item_data: Dict) -> None:
+    _ParseTimelineOperator(block, item_data, 3)
+    item_data["comment_content"] = "\n".join(_TIMELINE_COMMENT_TEXTS(block))
+    _ParseTimelineArticle(block, item_data)
+    _ParseTimelineOriginAuthor(block, item_data)
+    _ParseTimelineArticleExtra(block, item_data)
+
+
+def _ParseTimelineRewardArticle(block: _Element, item_data: Dict) -> None:
+    _ParseTimelineOperator(block, item_data, 4)
+    _ParseTimelineArticle(block, item_data)
+    item_data["target_user_name"] = _TIMELINE_ORIGIN_AUTHOR_NAME(block)[0]
+    item_data["target_user_url"] = UserSlugToUserUrl(
+        _TIMELINE_META_LINK_HREFS(block)[0][3:]
+    )
+    _ParseTimelineArticleExtra(block, item_data)
+
+
+def _ParseTimelineFollowDetail(
+    block: _Element, item_data: Dict, target: Literal["notebook", "collection"]
+) -> None:
+    _ParseTimelineOperator(block, item_data, 4)
+    item_data[f"target_{target}_title"] = _TIMELINE_TITLE(block)[0]
+    if target == "notebook":
+        item_data["target_notebook_url"] = NotebookSlugToNotebookUrl(
+            _TIMELINE_TITLE_HREF(block)[0][4:]
+        )
+    else:
+        item_data["target_collection_url"] = CollectionSlugToCollectionUrl(
+            _TIMELINE_TITLE_HREF(block)[0][3:]
+        )
+    item_data[f"target_{target}_avatar_url"] = _TIMELINE_FOLLOW_AVATAR(block)[0]
+    item_data["target_user_name"] = _TIMELINE_CREATER_NAME(block)[0]
+    item_data["target_user_url"] = UserSlugToUserUrl(
+        _TIMELINE_CREATER_HREF(block)[0][3:]
+    )
+    numbers = findall(r"\d+", _TIMELINE_FOLLOW_INFO_TEXTS(block)[1])
+    item_data[f"target_{target}_articles_count"] = int(numbers[0])
+    item_data[f"target_{target}_subscribers_count"] = int(numbers[1])
+
+
+def _ParseTimelineFollowNotebook(block: _Element, item_data: Dict) -> None:
+    _ParseTimelineFollowDetail(block, item_data, "notebook")
+
+
+def _ParseTimelineFollowCollection(block: _Element, item_data: Dict) -> None:
+    _ParseTimelineFollowDetail(block, item_data, "collection")
+
+
+def _ParseTimelineFollowUser(block: _Element, item_data: Dict) -> None:
+    _ParseTimelineOperator(block, item_data, 4)
+    item_data["target_user_name"] = _TIMELINE_USER_TITLE(block)[0]
+    item_data["target_user_url"] = UserSlugToUserUrl(
+        _TIMELINE_USER_TITLE_HREF(block)[0][3:]
+    )
+    numbers = findall(r"\d+", _TIMELINE_USER_INFO_TEXTS(block)[0])
+    item_data["target_user_wordage"] = int(numbers[0])
+    item_data["target_user_fans_count"] = int(numbers[1])
+    item_data["target_user_likes_count"] = int(numbers[2])
+    item_data["target_user_description"] = "\n".join(_TIMELINE_SIGNATURE_TEXTS(block))
+
+
+def _ParseTimelineJoinJianshu(block: _Element, item_data: Dict) -> None:
+    _ParseTimelineOperator(block, item_data, 4)
+
+
+# 页面中的动态类型: (返回的动态类型, 解析函数)
+# 简书页面中的部分动态类型名称与含义不符，如对文章点赞被写成了 like_note，返回时统一修正
+_TIMELINE_PARSERS: Dict[str, Tuple[str, Callable[[_Element, Dict], None]]] = {
+    "like_note": ("like_article", _ParseTimelineLikeArticle),
+    "like_comment": ("like_comment", _ParseTimelineLikeComment),
+    "share_note": ("publish_article", _ParseTimelinePublishArticle),
+    "comment_note": ("comment_article", _ParseTimelineCommentArticle),
+    "like_notebook": ("follow_notebook", _ParseTimelineFollowNotebook),
+    "like_collection": ("follow_collection", _ParseTimelineFollowCollection),
+    "like_user": ("follow_user", _ParseTimelineFollowUser),
+    "reward_note": ("reward_article", _ParseTimelineRewardArticle),
+    "join_jianshu": ("join_jianshu", _ParseTimelineJoinJianshu),
+}
+
+
+def _ParseUserTimelineInfo(html_obj: _Element) -> List[Dict]:
+    result = []
+    for block in _TIMELINE_BLOCKS(html_obj):
+        time_span = _TIMELINE_TIME_SPAN(block)[0]
+        operation_type = time_span.get("data-type")
+        item_data = {
+            "operation_id": int(block.get("id")[5:]),
+            "operation_type": operation_type,
+            "operation_time": datetime.fromisoformat(
+                time_span.get("data-datetime")
+            ).replace(tzinfo=None),
+        }
+        parser = _TIMELINE_PARSERS.get(operation_type)
+        if parser:  # 无法解析的动态类型只返回基础信息
+            item_data["operation_type"], parse_func = parser
+            parse_func(block, item_data)
+        result.append(item_data)
+    return result
+
+
 def GetUserTimelineInfo(
     user_url: str, max_id: Optional[int] = 1000000000, disable_check: bool = False
 ) -> List[Dict]:
@@ -711,332 +999,7 @@ def GetUserTimelineInfo(
         AssertUserStatusNormal(user_url)
     user_slug = UserUrlToUserSlug(user_url)
     html_obj = GetUserTimelineHtmlDataApi(user_slug, max_id)
-    blocks = [x.__copy__() for x in html_obj.xpath("//li[starts-with(@id, 'feed-')]")]
-    result = []
-
-    for block in blocks:
-        item_data = {
-            "operation_id": int(block.xpath("//li/@id")[0][5:]),
-            "operation_type": block.xpath(
-                "//span[starts-with(@data-datetime, '20')]/@data-type"
-            )[0],
-            "operation_time": datetime.fromisoformat(
-                block.xpath("//span[starts-with(@data-datetime, '20')]/@data-datetime")[
-                    0
-                ]
-            ).replace(tzinfo=None),
-        }
-
-        if item_data["operation_type"] == "like_note":  # 对文章点赞
-            item_data["operation_type"] = "like_article"  # 鬼知道谁把对文章点赞写成 like_note 的
-            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
-            item_data["operator_url"] = UserSlugToUserUrl(
-                block.xpath("//a[@class='nickname']/@href")[0][3:]
-            )
-            item_data["operator_avatar_url"] = block.xpath(
-                "//a[@class='avatar']/img/@src"
-            )[0]
-            item_data["target_article_title"] = block.xpath(
-                "//a[@class='title']/text()"
-            )[0]
-            item_data["target_article_url"] = ArticleSlugToArticleUrl(
-                block.xpath("//a[@class='title']/@href")[0][3:]
-            )
-            item_data["target_user_name"] = block.xpath(
-                "//div[@class='origin-author']/a/text()"
-            )[0]
-            item_data["target_user_url"] = UserSlugToUserUrl(
-                block.xpath("//div[@class='origin-author']/a/@href")[0].split("/")[-1]
-            )
-            item_data["target_article_reads_count"] = int(
-                block.xpath("//div[@class='meta']/a/text()")[1]
-            )
-            item_data["target_article_likes_count"] = int(
-                block.xpath("//div[@class='meta']/span/text()")[0]
-            )
-            try:
-                item_data["target_article_comments_count"] = int(
-                    block.xpath("//div[@class='meta']/a/text()")[3]
-                )
-            except IndexError:  # 文章没有评论或评论区关闭
-                item_data["target_article_comments_count"] = 0
-            try:
-                item_data["target_article_description"] = block.xpath(
-                    "//p[@class='abstract']/text()"
-                )[0]
-            except IndexError:  # 文章没有摘要
-                item_data["target_article_description"] = ""
-
-        elif item_data["operation_type"] == "like_comment":  # 对评论点赞
-            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
-            item_data["operator_url"] = UserSlugToUserUrl(
-                block.xpath("//a[@class='nickname']/@href")[0][3:]
-            )
-            item_data["operator_avatar_url"] = block.xpath(
-                "//a[@class='avatar']/img/@src"
-            )[0]
-            item_data["comment_content"] = "\n".join(
-                block.xpath("//p[@class='comment']/text()")
-            )
-            item_data["target_article_title"] = block.xpath(
-                "//blockquote/div/span/a/text()"
-            )[0]
-            item_data["target_article_url"] = ArticleSlugToArticleUrl(
-                block.xpath("//blockquote/div/span/a/@href")[0][3:]
-            )
-            item_data["target_user_name"] = block.xpath("//blockquote/div/a/text()")[0]
-            item_data["target_user_url"] = UserSlugToUserUrl(
-                block.xpath("//blockquote/div/a/@href")[0][3:]
-            )
-
-        elif item_data["operation_type"] == "share_note":  # 发表文章
-            item_data["operation_type"] = "publish_article"  # 鬼知道谁把发表文章写成 share_note 的
-            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
-            item_data["operator_url"] = UserSlugToUserUrl(
-                block.xpath("//a[@class='nickname']/@href")[0][3:]
-            )
-            item_data["operator_avatar_url"] = block.xpath(
-                "//a[@class='avatar']/img/@src"
-            )[0]
-            item_data["target_article_title"] = block.xpath(
-                "//a[@class='title']/text()"
-            )[0]
-            item_data["target_article_url"] = ArticleSlugToArticleUrl(
-                block.xpath("//a[@class='title']/@href")[0][3:]
-            )
-            item_data["target_article_reads_count"] = int(
-                block.xpath("//div[@class='meta']/a/text()")[1]
-            )
-            item_data["target_article_likes_count"] = int(
-                block.xpath("//div[@class='meta']/span/text()")[0]
-            )
-            item_data["target_article_description"] = "\n".join(
-                block.xpath("//p[@class='abstract']/text()")
-            )
-            try:
-                item_data["target_article_comments_count"] = int(
-                    block.xpath("//div[@class='meta']/a/text()")[3]
-                )
-            except IndexError:
-                item_data["target_article_comments_count"] = 0
-
-        elif item_data["operation_type"] == "comment_note":  # 发表评论
-            item_data[
-                "operation_type"
-            ] = "comment_article"  # 鬼知道谁把评论文章写成 comment_note 的
-            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
-            item_data["operator_url"] = UserSlugToUserUrl(
-                block.xpath("//a[@class='nickname']/@href")[0][3:]
-            )
-            item_data["operator_avatar_url"] = block.xpath(
-                "//a[@class='avatar']/img/@src"
-            )[0]
-            item_data["comment_content"] = "\n".join(
-                block.xpath("//p[@class='comment']/text()")
-            )
-            item_data["target_article_title"] = block.xpath(
-                "//a[@class='title']/text()"
-            )[0]
-            item_data["target_article_url"] = ArticleSlugToArticleUrl(
-                block.xpath("//a[@class='title']/@href")[0][3:]
-            )
-            item_data["target_user_name"] = block.xpath(
-                "//div[@class='origin-author']/a/text()"
-            )[0]
-            item_data["target_user_url"] = UserSlugToUserUrl(
-                block.xpath("//div[@class='origin-author']/a/@href")[0].split("/")[-1]
-            )
-            item_data["target_article_reads_count"] = int(
-                block.xpath("//div[@class='meta']/a/text()")[1]
-            )
-            item_data["target_article_likes_count"] = int(
-                block.xpath("//div[@class='meta']/span/text()")[0]
-            )
-            try:
-                item_data["target_article_comments_count"] = int(
-                    block.xpath("//div[@class='meta']/a/text()")[3]
-                )
-            except IndexError:  # 文章没有评论或评论区关闭
-                item_data["target_article_comments_count"] = 0
-            try:
-                item_data["target_article_description"] = block.xpath(
-                    "//p[@class='abstract']/text()"
-                )[0]
-            except IndexError:  # 文章没有描述
-                item_data["target_article_description"] = ""
-            try:
-                item_data["target_article_rewards_count"] = int(
-                    block.xpath("//div[@class='meta']/span/text()")[1]
-                )
-            except IndexError:  # 没有赞赏数据
-                item_data["target_article_rewards_count"] = 0
-
-        elif item_data["operation_type"] == "like_notebook":  # 关注文集
-            item_data[
-                "operation_type"
-            ] = "follow_notebook"  # 鬼知道谁把关注文集写成 like_notebook 的
-            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
-            item_data["operator_url"] = UserSlugToUserUrl(
-                block.xpath("//a[@class='nickname']/@href")[0][4:]
-            )
-            item_data["operator_avatar_url"] = block.xpath(
-                "//a[@class='avatar']/img/@src"
-            )[0]
-            item_data["target_notebook_title"] = block.xpath(
-                "//a[@class='title']/text()"
-            )[0]
-            item_data["target_notebook_url"] = NotebookSlugToNotebookUrl(
-                block.xpath("//a[@class='title']/@href")[0][4:]
-            )
-            item_data["target_notebook_avatar_url"] = block.xpath(
-                "//div[@class='follow-detail']/div/a/img/@src"
-            )[0]
-            item_data["target_user_name"] = block.xpath("//a[@class='creater']/text()")[
-                0
-            ]
-            item_data["target_user_url"] = UserSlugToUserUrl(
-                block.xpath("//a[@class='creater']/@href")[0][3:]
-            )
-            item_data["target_notebook_articles_count"] = int(
-                findall(r"\d+", block.xpath("//div[@class='info'][1]/p/text()")[1])[0]
-            )
-            item_data["target_notebook_subscribers_count"] = int(
-                findall(r"\d+", block.xpath("//div[@class='info'][1]/p/text()")[1])[1]
-            )
-
-        elif item_data["operation_type"] == "like_collection":  # 关注专题
-            item_data[
-                "operation_type"
-            ] = "follow_collection"  # 鬼知道谁把关注专题写成 like_collection 的
-            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
-            item_data["operator_url"] = UserSlugToUserUrl(
-                block.xpath("//a[@class='nickname']/@href")[0][4:]
-            )
-            item_data["operator_avatar_url"] = block.xpath(
-                "//a[@class='avatar']/img/@src"
-            )[0]
-            item_data["target_collection_title"] = block.xpath(
-                "//a[@class='title']/text()"
-            )[0]
-            item_data["target_collection_url"] = CollectionSlugToCollectionUrl(
-                block.xpath("//a[@class='title']/@href")[0][3:]
-            )
-            item_data["target_collection_avatar_url"] = block.xpath(
-                "//div[@class='follow-detail']/div/a/img/@src"
-            )[0]
-            item_data["target_user_name"] = block.xpath("//a[@class='creater']/text()")[
-                0
-            ]
-            item_data["target_user_url"] = UserSlugToUserUrl(
-                block.xpath("//a[@class='creater']/@href")[0][3:]
-            )
-            item_data["target_collection_articles_count"] = int(
-                findall(r"\d+", block.xpath("//div[@class='info'][1]/p/text()")[1])[0]
-            )
-            item_data["target_collection_subscribers_count"] = int(
-                findall(r"\d+", block.xpath("//div[@class='info'][1]/p/text()")[1])[1]
-            )
-
-        elif item_data["operation_type"] == "like_user":  # 关注用户
-            item_data["operation_type"] = "follow_user"  # 鬼知道谁把关注用户写成 like_user 的
-            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
-            item_data["operator_url"] = UserSlugToUserUrl(
-                block.xpath("//a[@class='nickname']/@href")[0][4:]
-            )
-            item_data["operator_avatar_url"] = block.xpath(
-                "//a[@class='avatar']/img/@src"
-            )[0]
-            item_data["target_user_name"] = block.xpath(
-                "//div[@class='info']/a[@class='title']/text()"
-            )[0]
-            item_data["target_user_url"] = UserSlugToUserUrl(
-                block.xpath("//div[@class='info']/a[@class='title']/@href")[0][3:]
-            )
-            item_data["target_user_wordage"] = int(
-                findall(
-                    r"\d+",
-                    block.xpath(
-                        "//div[@class='follow-detail']/div[@class='info']/p/text()"
-                    )[0],
-                )[0]
-            )
-            item_data["target_user_fans_count"] = int(
-                findall(
-                    r"\d+",
-                    block.xpath(
-                        "//div[@class='follow-detail']/div[@class='info']/p/text()"
-                    )[0],
-                )[1]
-            )
-            item_data["target_user_likes_count"] = int(
-                findall(
-                    r"\d+",
-                    block.xpath(
-                        "//div[@class='follow-detail']/div[@class='info']/p/text()"
-                    )[0],
-                )[2]
-            )
-            item_data["target_user_description"] = "\n".join(
-                block.xpath("//div[@class='signature']/text()")
-            )
-
-        elif item_data["operation_type"] == "reward_note":  # 赞赏文章
-            item_data["operation_type"] = "reward_article"  # 鬼知道谁把赞赏文章写成 reward_note 的
-            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
-            item_data["operator_url"] = UserSlugToUserUrl(
-                block.xpath("//a[@class='nickname']/@href")[0][4:]
-            )
-            item_data["operator_avatar_url"] = block.xpath(
-                "//a[@class='avatar']/img/@src"
-            )[0]
-            item_data["target_article_title"] = block.xpath(
-                "//a[@class='title']/text()"
-            )[0]
-            item_data["target_article_url"] = ArticleSlugToArticleUrl(
-                block.xpath("//a[@class='title']/@href")[0][3:]
-            )
-            item_data["target_user_name"] = block.xpath(
-                "//div[@class='origin-author']/a/text()"
-            )[0]
-            item_data["target_user_url"] = UserSlugToUserUrl(
-                block.xpath("//div[@class='meta']/a/@href")[0][3:]
-            )
-            item_data["target_article_reads_count"] = int(
-                block.xpath("//div[@class='meta']/a/text()")[1]
-            )
-            item_data["target_article_likes_count"] = int(
-                block.xpath("//div[@class='meta']/span/text()")[0]
-            )
-            try:
-                item_data["target_article_comments_count"] = int(
-                    block.xpath("//div[@class='meta']/a/text()")[3]
-                )
-            except IndexError:  # 文章没有评论或评论区关闭
-                item_data["target_article_comments_count"] = 0
-            try:
-                item_data["target_article_description"] = block.xpath(
-                    "//p[@class='abstract']/text()"
-                )[0]
-            except IndexError:  # 文章没有描述
-                item_data["target_article_description"] = ""
-            try:
-                item_data["target_article_rewards_count"] = int(
-                    block.xpath("//div[@class='meta']/span/text()")[1]
-                )
-            except IndexError:  # 没有赞赏数据
-                item_data["target_article_rewards_count"] = 0
-
-        elif item_data["operation_type"] == "join_jianshu":  # 加入简书
-            item_data["operator_name"] = block.xpath("//a[@class='nickname']/text()")[0]
-            item_data["operator_url"] = UserSlugToUserUrl(
-                block.xpath("//a[@class='nickname']/@href")[0][4:]
-            )
-            item_data["operator_avatar_url"] = block.xpath(
-                "//a[@class='avatar']/img/@src"
-            )[0]
-
-        result.append(item_data)
-    return result
+    return _ParseUserTimelineInfo(html_obj)
 
 
 def GetUserAllArticlesInfo(
@@ -1045,7 +1008,12 @@ def GetUserAllArticlesInfo(
     sorting_method: Literal["time", "comment_time", "hot"] = "time",
     max_count: Optional[int] = None,
     disable_check: bool = False,
-) -> Generator[Dict, None, None]:
+    prefetch: int = 0,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+    typed: bool = False,
+) -> Generator[Union[Dict, ArticleSummary], None, None]:
     """获取用户的所有文章信息
 
     Args:
@@ -1055,6 +1023,12 @@ def GetUserAllArticlesInfo(
         comment_time 为按照最近评论时间排序，hot 为按照热度排序. Defaults to "time".
         max_count (int, optional): 获取的文章信息数量上限，Defaults to None.
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        prefetch (int, optional): 预取深度，大于 0 时会并发请求后续页面. Defaults to 0.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
+        typed (bool, optional): 为 True 时返回 ArticleSummary 对象而非字典，内存占用更小. Defaults to False.
 
     Yields:
         Iterator[Dict], None, None]: 文章信息
@@ -1062,26 +1036,26 @@ def GetUserAllArticlesInfo(
     if not disable_check:
         AssertUserUrl(user_url)
         AssertUserStatusNormal(user_url)
-    page = 1
-    now_count = 0
-    while True:
-        result = GetUserArticlesInfo(
-            user_url, page, count, sorting_method, disable_check=True
-        )
-        if result:
-            page += 1
-        else:  # 没有新的数据
-            return
-        for item in result:
-            yield item
-            if max_count:  # 如果有上限
-                now_count += 1
-                if now_count == max_count:  # 达到上限
-                    return
+    yield from IterPages(
+        lambda page: GetUserArticlesInfo(
+            user_url, page, count, sorting_method, typed=typed, disable_check=True
+        ),
+        max_count,
+        prefetch,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    )
 
 
 def GetUserAllFollowingInfo(
-    user_url: str, max_count: Optional[int] = None, disable_check: bool = False
+    user_url: str,
+    max_count: Optional[int] = None,
+    disable_check: bool = False,
+    prefetch: int = 0,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
 ) -> Generator[Dict, None, None]:
     """获取用户的所有关注者信息
 
@@ -1089,6 +1063,11 @@ def GetUserAllFollowingInfo(
         user_url (str): 用户个人主页 URL
         max_count (int, optional): 获取的关注者信息数量上限，Defaults to None.
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        prefetch (int, optional): 预取深度，大于 0 时会并发请求后续页面. Defaults to 0.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
 
     Yields:
         Iterator[Dict], None, None]: 关注者信息
@@ -1096,24 +1075,24 @@ def GetUserAllFollowingInfo(
     if not disable_check:
         AssertUserUrl(user_url)
         AssertUserStatusNormal(user_url)
-    page = 1
-    now_count = 0
-    while True:
-        result = GetUserFollowingInfo(user_url, page, disable_check=True)
-        if result:
-            page += 1
-        else:
-            return
-        for item in result:
-            yield item
-            if max_count:
-                now_count += 1
-                if now_count == max_count:
-                    return
+    yield from IterPages(
+        lambda page: GetUserFollowingInfo(user_url, page, disable_check=True),
+        max_count,
+        prefetch,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    )
 
 
 def GetUserAllFansInfo(
-    user_url: str, max_count: Optional[int] = None, disable_check: bool = False
+    user_url: str,
+    max_count: Optional[int] = None,
+    disable_check: bool = False,
+    prefetch: int = 0,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
 ) -> Generator[Dict, None, None]:
     """获取用户的所有粉丝信息
 
@@ -1121,6 +1100,11 @@ def GetUserAllFansInfo(
         user_url (str): 用户个人主页 URL
         max_count (int, optional): 获取的粉丝信息数量上限，Defaults to None.
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        prefetch (int, optional): 预取深度，大于 0 时会并发请求后续页面. Defaults to 0.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
 
     Yields:
         Iterator[Dict], None, None]: 粉丝信息
@@ -1128,24 +1112,23 @@ def GetUserAllFansInfo(
     if not disable_check:
         AssertUserUrl(user_url)
         AssertUserStatusNormal(user_url)
-    page = 1
-    now_count = 0
-    while True:
-        result = GetUserFansInfo(user_url, page, disable_check=True)
-        if result:
-            page += 1
-        else:
-            return
-        for item in result:
-            yield item
-            if max_count:
-                now_count += 1
-                if now_count == max_count:
-                    return
+    yield from IterPages(
+        lambda page: GetUserFansInfo(user_url, page, disable_check=True),
+        max_count,
+        prefetch,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    )
 
 
 def GetUserAllTimelineInfo(
-    user_url: str, max_count: Optional[int] = None, disable_check: bool = False
+    user_url: str,
+    max_count: Optional[int] = None,
+    disable_check: bool = False,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
 ) -> Generator[Dict, None, None]:
     """获取用户的所有动态信息
 
@@ -1153,6 +1136,10 @@ def GetUserAllTimelineInfo(
         user_url (str): 用户个人主页 URL
         max_count (int, optional): 获取的动态信息数量上限，Defaults to None.
         disable_check (bool): 禁用参数有效性检查. Defaults to False.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新，可用于断点续传. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
 
     Yields:
         Iterator[Dict], None, None]: 动态信息
@@ -1160,17 +1147,11 @@ def GetUserAllTimelineInfo(
     if not disable_check:
         AssertUserUrl(user_url)
         AssertUserStatusNormal(user_url)
-    max_id = None
-    now_count = 0
-    while True:
-        result = GetUserTimelineInfo(user_url, max_id, disable_check=True)
-        if result:
-            max_id = result[-1]["operation_id"]
-        else:
-            return
-        for item in result:
-            yield item
-            if max_count:
-                now_count += 1
-                if now_count == max_count:
-                    return
+    yield from IterPagesById(
+        lambda max_id: GetUserTimelineInfo(user_url, max_id, disable_check=True),
+        lambda result: result[-1]["operation_id"],
+        max_count,
+        cursor=cursor,
+        checkpoint=checkpoint,
+        checkpoint_interval=checkpoint_interval,
+    )
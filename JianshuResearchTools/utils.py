@@ -1,6 +1,22 @@
-from typing import Any, Callable, Dict, Tuple
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
-__all__ = ["NameValueMappingToString", "CallWithoutCheck"]
+__all__ = ["NameValueMappingToString", "CallWithoutCheck", "Cursor"]
 
 
 def NameValueMappingToString(
@@ -47,3 +63,443 @@ def OnlyOne(*args: Any) -> bool:
         bool: 判断结果
     """
     return len([arg for arg in args if arg]) == 1
+
+
+class Cursor:
+    """可序列化的分页位置，用于在中断后从原位置继续获取数据
+
+    传入 "All" 系列生成器后，其内容会随数据的返回而更新，
+    将 to_dict 的结果持久化，下次通过 from_dict 还原后传入，即可从中断处继续获取
+
+    分页位置在调用方取下一条数据时才越过上一条数据，因此在循环体中保存的位置仍包含当前条目，
+    恢复后当前条目会被再次返回（至少一次），避免处理到一半的数据在中断后丢失；
+    不能重复处理数据时，请按 ID 等字段去重
+    """
+
+    def __init__(
+        self,
+        position: Optional[int] = None,
+        offset: int = 0,
+        count: int = 0,
+        finished: bool = False,
+    ) -> None:
+        """构建新的分页位置对象
+
+        Args:
+            position (Optional[int], optional): 当前页的位置，为页码或上一页最后一条数据的 ID，为 None 时从头开始. Defaults to None.
+            offset (int, optional): 当前页中已返回的数据数量. Defaults to 0.
+            count (int, optional): 已返回的数据总数. Defaults to 0.
+            finished (bool, optional): 是否已获取全部数据. Defaults to False.
+        """
+        self.position = position
+        self.offset = offset
+        self.count = count
+        self.finished = finished
+
+    def __repr__(self) -> str:
+        return (
+            f"Cursor(position={self.position!r}, offset={self.offset}, "
+            f"count={self.count}, finished={self.finished})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Cursor):
+            return False
+        return self.to_dict() == other.to_dict()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """转换为可 JSON 序列化的字典
+
+        Returns:
+            Dict[str, Any]: 分页位置信息
+        """
+        return {
+            "position": self.position,
+            "offset": self.offset,
+            "count": self.count,
+            "finished": self.finished,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Cursor":
+        """从 to_dict 返回的字典还原分页位置对象
+
+        Args:
+            data (Dict[str, Any]): 分页位置信息
+
+        Returns:
+            Cursor: 分页位置对象
+        """
+        return cls(**data)
+
+
+def _YieldPageItems(
+    result: List[Dict], cursor: Cursor, max_count: Optional[int]
+) -> Generator[Dict, None, bool]:
+    # 跳过中断前已返回的数据，返回值表示是否达到数量上限
+    for item in result[cursor.offset :]:
+        yield item
+        # 调用方取下一条数据时才计入本条，中断后恢复时本条会被再次返回
+        cursor.offset += 1
+        cursor.count += 1
+        if max_count and cursor.count >= max_count:  # 达到上限
+            return True
+    return False
+
+
+def _FinishPage(
+    cursor: Cursor,
+    next_position: Optional[int],
+    pages_count: int,
+    checkpoint: Optional[Callable[[Cursor], None]],
+    checkpoint_interval: int,
+) -> None:
+    cursor.position = next_position
+    cursor.offset = 0
+    if checkpoint and pages_count % checkpoint_interval == 0:
+        checkpoint(cursor)
+
+
+def _FinishAll(cursor: Cursor, checkpoint: Optional[Callable[[Cursor], None]]) -> None:
+    cursor.offset = 0
+    cursor.finished = True
+    if checkpoint:
+        checkpoint(cursor)
+
+
+def _IterPagesSerial(
+    fetch_func: Callable[[Any], List[Dict]],
+    get_next_position: Callable[[Optional[int], List[Dict]], Optional[int]],
+    max_count: Optional[int],
+    cursor: Cursor,
+    checkpoint: Optional[Callable[[Cursor], None]],
+    checkpoint_interval: int,
+) -> Generator[Dict, None, None]:
+    pages_count = 0
+    while True:
+        result = fetch_func(cursor.position)
+        if not result:  # 没有新的数据
+            _FinishAll(cursor, checkpoint)
+            return
+        if (yield from _YieldPageItems(result, cursor, max_count)):
+            return
+        pages_count += 1
+        _FinishPage(
+            cursor,
+            get_next_position(cursor.position, result),
+            pages_count,
+            checkpoint,
+            checkpoint_interval,
+        )
+
+
+def _PrepareCursor(
+    cursor: Optional[Cursor],
+    start_position: Optional[int],
+    max_count: Optional[int],
+    checkpoint_interval: int,
+) -> Optional[Cursor]:
+    # 返回 None 表示无需继续获取
+    if checkpoint_interval <= 0:
+        raise ValueError("检查点页数间隔必须大于 0")
+    if cursor is None:
+        cursor = Cursor(start_position)
+    elif cursor.position is None:
+        cursor.position = start_position
+    if cursor.finished or (max_count and cursor.count >= max_count):
+        return None
+    return cursor
+
+
+def IterPages(
+    fetch_func: Callable[[int], List[Dict]],
+    max_count: Optional[int] = None,
+    prefetch: int = 0,
+    start_page: int = 1,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+) -> Generator[Dict, None, None]:
+    """逐页获取数据并依次返回其中的条目，遇到空页或达到数量上限时停止
+
+    prefetch 大于 0 时，会在线程池中提前请求后续页面，同时保持最多 prefetch 个请求在途，
+    使每页的网络延迟相互重叠；设置了 max_count 时，只预取达到数量上限还需要的页面，
+    停止迭代时取消尚未开始的请求；为 0 时与逐页串行请求行为一致。
+
+    Args:
+        fetch_func (Callable[[int], List[Dict]]): 接收页码，返回该页数据的函数
+        max_count (int, optional): 获取的数据数量上限. Defaults to None.
+        prefetch (int, optional): 预取深度，即同时在途的请求数量上限. Defaults to 0.
+        start_page (int, optional): 起始页码. Defaults to 1.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
+
+    Yields:
+        Iterator[Dict], None, None]: 数据条目
+    """
+    cursor = _PrepareCursor(cursor, start_page, max_count, checkpoint_interval)
+    if cursor is None:
+        return
+    if prefetch <= 0:
+        yield from _IterPagesSerial(
+            fetch_func,
+            lambda page, _: page + 1,
+            max_count,
+            cursor,
+            checkpoint,
+            checkpoint_interval,
+        )
+        return
+
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+    pending: Deque[Tuple[int, Future]] = deque()
+    try:
+        # 设置了数量上限时，得知每页数据条数前只请求一页
+        next_page = _ResizePrefetchWindow(
+            executor,
+            fetch_func,
+            pending,
+            cursor.position,
+            1 if max_count else prefetch,
+        )
+        pages_count = 0
+        while pending:
+            page, future = pending.popleft()
+            result = future.result()
+            if not result:  # 没有新的数据，后续页面同样为空
+                _FinishAll(cursor, checkpoint)
+                return
+            # 先调整窗口，再返回本页数据，使网络请求与调用方的处理并行
+            next_page = _ResizePrefetchWindow(
+                executor,
+                fetch_func,
+                pending,
+                next_page,
+                _GetPrefetchWindow(
+                    prefetch,
+                    max_count,
+                    cursor.count + len(result) - cursor.offset,
+                    len(result),
+                ),
+            )
+            if (yield from _YieldPageItems(result, cursor, max_count)):
+                return
+            pages_count += 1
+            _FinishPage(cursor, page + 1, pages_count, checkpoint, checkpoint_interval)
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def _GetPrefetchWindow(
+    prefetch: int, max_count: Optional[int], fetched_count: int, page_size: int
+) -> int:
+    # 只预取达到数量上限还需要的页数，避免请求最终会被丢弃的页面
+    if not max_count:
+        return prefetch
+    remaining = max_count - fetched_count
+    return min(prefetch, max(-(-remaining // page_size), 0))
+
+
+def _ResizePrefetchWindow(
+    executor: ThreadPoolExecutor,
+    fetch_func: Callable[[int], List[Dict]],
+    pending: Deque[Tuple[int, Future]],
+    next_page: int,
+    window: int,
+) -> int:
+    # 返回下一个待请求的页码
+    while len(pending) > window:
+        _, future = pending.pop()
+        future.cancel()
+        next_page -= 1
+    while len(pending) < window:
+        pending.append((next_page, _Submit(executor, fetch_func, next_page)))
+        next_page += 1
+    return next_page
+
+
+def IterPagesById(
+    fetch_func: Callable[[Optional[int]], List[Dict]],
+    get_next_id: Callable[[List[Dict]], int],
+    max_count: Optional[int] = None,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+) -> Generator[Dict, None, None]:
+    """以上一页最后一条数据的 ID 作为分页参数，逐页获取数据并依次返回其中的条目
+
+    Args:
+        fetch_func (Callable[[Optional[int]], List[Dict]]): 接收上一页最后一条数据的 ID（首页为 None），返回该页数据的函数
+        get_next_id (Callable[[List[Dict]], int]): 接收一页数据，返回获取下一页所需 ID 的函数
+        max_count (int, optional): 获取的数据数量上限. Defaults to None.
+        cursor (Optional[Cursor], optional): 分页位置，传入时从该位置继续获取并随之更新. Defaults to None.
+        checkpoint (Optional[Callable[[Cursor], None]], optional): 每获取完 checkpoint_interval 页
+        及全部数据获取完毕时调用，参数为当前分页位置. Defaults to None.
+        checkpoint_interval (int, optional): 调用 checkpoint 的页数间隔. Defaults to 1.
+
+    Yields:
+        Iterator[Dict], None, None]: 数据条目
+    """
+    cursor = _PrepareCursor(cursor, None, max_count, checkpoint_interval)
+    if cursor is None:
+        return
+    yield from _IterPagesSerial(
+        fetch_func,
+        lambda _, result: get_next_id(result),
+        max_count,
+        cursor,
+        checkpoint,
+        checkpoint_interval,
+    )
+
+
+async def _AsyncIterPagesSerial(
+    fetch_func: Callable[[Any], Awaitable[List[Dict]]],
+    get_next_position: Callable[[Optional[int], List[Dict]], Optional[int]],
+    max_count: Optional[int],
+    cursor: Cursor,
+    checkpoint: Optional[Callable[[Cursor], None]],
+    checkpoint_interval: int,
+) -> AsyncGenerator[Dict, None]:
+    pages_count = 0
+    while True:
+        result = await fetch_func(cursor.position)
+        if not result:
+            _FinishAll(cursor, checkpoint)
+            return
+        for item in _YieldPageItems(result, cursor, max_count):
+            yield item
+        if max_count and cursor.count >= max_count:
+            return
+        pages_count += 1
+        _FinishPage(
+            cursor,
+            get_next_position(cursor.position, result),
+            pages_count,
+            checkpoint,
+            checkpoint_interval,
+        )
+
+
+async def AsyncIterPages(
+    fetch_func: Callable[[int], Awaitable[List[Dict]]],
+    max_count: Optional[int] = None,
+    start_page: int = 1,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+) -> AsyncGenerator[Dict, None]:
+    """IterPages 的异步版本，不支持预取"""
+    cursor = _PrepareCursor(cursor, start_page, max_count, checkpoint_interval)
+    if cursor is None:
+        return
+    async for item in _AsyncIterPagesSerial(
+        fetch_func,
+        lambda page, _: page + 1,
+        max_count,
+        cursor,
+        checkpoint,
+        checkpoint_interval,
+    ):
+        yield item
+
+
+async def AsyncIterPagesById(
+    fetch_func: Callable[[Optional[int]], Awaitable[List[Dict]]],
+    get_next_id: Callable[[List[Dict]], int],
+    max_count: Optional[int] = None,
+    cursor: Optional[Cursor] = None,
+    checkpoint: Optional[Callable[[Cursor], None]] = None,
+    checkpoint_interval: int = 1,
+) -> AsyncGenerator[Dict, None]:
+    """IterPagesById 的异步版本"""
+    cursor = _PrepareCursor(cursor, None, max_count, checkpoint_interval)
+    if cursor is None:
+        return
+    async for item in _AsyncIterPagesSerial(
+        fetch_func,
+        lambda _, result: get_next_id(result),
+        max_count,
+        cursor,
+        checkpoint,
+        checkpoint_interval,
+    ):
+        yield item
+
+
+def _Submit(executor: ThreadPoolExecutor, func: Callable, *args: Any) -> Future:
+    # 在工作线程中沿用提交时的上下文变量，使请求统计与请求预算能够覆盖并发发出的请求
+    return executor.submit(copy_context().run, func, *args)
+
+
+def _CallAndCatch(func: Callable[[Any], Any], arg: Any) -> Any:
+    try:
+        return func(arg)
+    except Exception as e:
+        return e
+
+
+def BatchCall(
+    func: Callable[[Any], Any],
+    args: Iterable[Any],
+    concurrency: int = 8,
+    ordered: bool = True,
+) -> Generator[Tuple[Any, Any], None, None]:
+    """在线程池中并发调用函数，同时最多有 concurrency 个调用在进行
+
+    单次调用抛出的异常不会中断整个批次，而是作为该项的结果返回
+
+    Args:
+        func (Callable[[Any], Any]): 接收单个参数的函数
+        args (Iterable[Any]): 参数序列
+        concurrency (int, optional): 并发数量上限. Defaults to 8.
+        ordered (bool, optional): 为 True 时按参数顺序返回结果，为 False 时按完成顺序返回结果. Defaults to True.
+
+    Yields:
+        Iterator[Tuple[Any, Any]]: (参数, 函数返回值或抛出的异常)
+    """
+    if concurrency <= 0:
+        raise ValueError("并发数量上限必须大于 0")
+    args_iter = iter(args)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    submitted: Deque[Tuple[Any, Future]] = deque()
+    futures: Set[Future] = set()
+    try:
+        for arg in args_iter:
+            submitted.append((arg, _Submit(executor, _CallAndCatch, func, arg)))
+            if len(submitted) == concurrency:
+                break
+
+        if ordered:
+            while submitted:
+                arg, future = submitted.popleft()
+                result = future.result()
+                for next_arg in args_iter:  # 补充一个新的调用
+                    submitted.append(
+                        (next_arg, _Submit(executor, _CallAndCatch, func, next_arg))
+                    )
+                    break
+                yield arg, result
+            return
+
+        future_to_arg = {future: arg for arg, future in submitted}
+        futures = set(future_to_arg)
+        while futures:
+            done, futures = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                for next_arg in args_iter:
+                    next_future = _Submit(executor, _CallAndCatch, func, next_arg)
+                    future_to_arg[next_future] = next_arg
+                    futures.add(next_future)
+                    break
+                yield future_to_arg.pop(future), future.result()
+    finally:
+        for _, future in submitted:
+            future.cancel()
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -0,0 +1,75 @@
+"""基准测试用例
+
+每个用例是一个无参数函数，返回本次调用得到的数据条目数，用于计算吞吐量
+"""
+from typing import Callable, Dict, Iterable
+
+import JianshuResearchTools as jrt
+from JianshuResearchTools.objects import Article, Island, User, clear_cache
+
+USER_URL = "https://www.jianshu.com/u/ea36c8d8aa30"
+ARTICLE_URL = "https://www.jianshu.com/p/52698676395f"
+ARTICLE_ID = 87256893
+ISLAND_URL = "https://www.jianshu.com/g/6187f99def472f5e"
+
+# 分页生成器获取的数据条数上限
+ALL_MAX_COUNT = 100
+
+
+def Count(result: Iterable) -> int:
+    return sum(1 for _ in result)
+
+
+def ObjectStr(obj_class: Callable, url: str) -> int:
+    clear_cache()  # 避免命中上一轮的缓存结果
+    str(obj_class(url))
+    return 1
+
+
+# 参数有效性检查会发送额外的请求，不属于解析开销，因此统一禁用
+CASES: Dict[str, Callable[[], int]] = {
+    "user.GetUserTimelineInfo": lambda: len(
+        jrt.user.GetUserTimelineInfo(USER_URL, disable_check=True)
+    ),
+    "user.GetUserFollowingInfo": lambda: len(
+        jrt.user.GetUserFollowingInfo(USER_URL, disable_check=True)
+    ),
+    "article.GetArticleCommentsData": lambda: len(
+        jrt.article.GetArticleCommentsData(ARTICLE_ID)
+    ),
+    "article.GetArticleCommentsData(typed)": lambda: len(
+        jrt.article.GetArticleCommentsData(ARTICLE_ID, typed=True)
+    ),
+    "article.GetArticleMarkdown": lambda: len(
+        jrt.article.GetArticleMarkdown(ARTICLE_URL, disable_check=True).splitlines()
+    ),
+    "island.GetIslandPosts": lambda: len(
+        jrt.island.GetIslandPosts(ISLAND_URL, disable_check=True)
+    ),
+    "objects.User.__str__": lambda: ObjectStr(User, USER_URL),
+    "objects.Article.__str__": lambda: ObjectStr(Article, ARTICLE_URL),
+    "objects.Island.__str__": lambda: ObjectStr(Island, ISLAND_URL),
+    "user.GetUserAllTimelineInfo": lambda: Count(
+        jrt.user.GetUserAllTimelineInfo(
+            USER_URL, max_count=ALL_MAX_COUNT, disable_check=True
+        )
+    ),
+    "user.GetUserAllArticlesInfo": lambda: Count(
+        jrt.user.GetUserAllArticlesInfo(
+            USER_URL, max_count=ALL_MAX_COUNT, disable_check=True
+        )
+    ),
+    "user.GetUserAllFollowingInfo": lambda: Count(
+        jrt.user.GetUserAllFollowingInfo(
+            USER_URL, max_count=ALL_MAX_COUNT, disable_check=True
+        )
+    ),
+    "article.GetArticleAllCommentsData": lambda: Count(
+        jrt.article.GetArticleAllCommentsData(ARTICLE_ID, max_count=ALL_MAX_COUNT)
+    ),
+    "island.GetIslandAllPostsData": lambda: Count(
+        jrt.island.GetIslandAllPostsData(
+            ISLAND_URL, max_count=ALL_MAX_COUNT, disable_check=True
+        )
+    ),
+}
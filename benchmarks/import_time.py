@@ -0,0 +1,75 @@
+"""导入耗时基准测试
+
+在独立的子进程中多次导入，取中位数，避免模块缓存影响结果：
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --max-ms 50  # 超出阈值时以非零状态码退出，可用于 CI
+"""
+import subprocess
+import sys
+from argparse import ArgumentParser
+from statistics import median
+from typing import List
+
+TARGETS = {
+    "import JianshuResearchTools": "import JianshuResearchTools",
+    "首次访问 jrt.user": "import JianshuResearchTools as jrt; jrt.user",
+    "首次创建客户端": (
+        "import JianshuResearchTools as jrt; jrt.user; "
+        "from JianshuResearchTools.httpx_client import get_client; get_client('api')"
+    ),
+}
+
+
+def MeasureImportTime(code: str, rounds: int) -> float:
+    """在子进程中执行代码并测量耗时
+
+    Args:
+        code (str): 要执行的代码
+        rounds (int): 测量次数
+
+    Returns:
+        float: 耗时中位数（毫秒）
+    """
+    timer_code = (
+        "from time import perf_counter as _t; _s = _t()\n"
+        f"{code}\n"
+        "print((_t() - _s) * 1000)"
+    )
+    results: List[float] = []
+    for _ in range(rounds):
+        output = subprocess.run(
+            [sys.executable, "-c", timer_code],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results.append(float(output))
+    return median(results)
+
+
+def main() -> None:
+    parser = ArgumentParser(description="测量 JianshuResearchTools 的导入耗时")
+    parser.add_argument("--rounds", type=int, default=10, help="每项的测量次数")
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=None,
+        help="import JianshuResearchTools 的耗时上限（毫秒）",
+    )
+    args = parser.parse_args()
+
+    results: List[float] = []
+    for name, code in TARGETS.items():
+        result = MeasureImportTime(code, args.rounds)
+        results.append(result)
+        print(f"{name}: {result:.2f} ms")
+
+    # 第一项为 import JianshuResearchTools 的耗时
+    if args.max_ms is not None and results and results[0] > args.max_ms:
+        print(f"导入耗时超出上限 {args.max_ms} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
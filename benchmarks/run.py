@@ -0,0 +1,156 @@
+"""解析与分页性能基准测试
+
+响应存档不随仓库分发，首次使用时需要联网录制，之后在回放模式下离线运行，结果只反映本地解析与调度的开销：
+
+    python benchmarks/run.py --record  # 录制 benchmarks/fixtures.json.gz
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --baseline results.json --threshold 0.2  # 比基准慢 20% 以上时以非零状态码退出
+"""
+import json
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from os.path import dirname, exists, join
+from platform import python_version
+from statistics import median
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, dirname(dirname(__file__)))  # 使用仓库中的代码，而非已安装的版本
+
+from cases import CASES  # noqa: E402
+
+from JianshuResearchTools import __version__  # noqa: E402
+from JianshuResearchTools.exceptions import ResourceError  # noqa: E402
+from JianshuResearchTools.replay import record_fixtures, replay_fixtures  # noqa: E402
+
+DEFAULT_FIXTURES_PATH = join(dirname(__file__), "fixtures.json.gz")
+
+
+def RunCase(func: Callable[[], int], rounds: int) -> Dict:
+    """运行单个用例
+
+    Args:
+        func (Callable[[], int]): 用例函数
+        rounds (int): 计时的运行次数
+
+    Returns:
+        Dict: 耗时中位数（毫秒）、吞吐量（条 / 秒）与内存峰值（KiB）
+    """
+    tracemalloc.start()  # 内存统计会拖慢运行速度，与计时分开进行
+    items_count = func()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    durations: List[float] = []
+    for _ in range(rounds):
+        start_time = perf_counter()
+        func()
+        durations.append(perf_counter() - start_time)
+    median_duration = median(durations)
+    return {
+        "latency_ms": round(median_duration * 1000, 3),
+        "items": items_count,
+        "items_per_second": round(items_count / median_duration, 1)
+        if median_duration
+        else None,
+        "peak_memory_kib": round(peak_memory / 1024, 1),
+    }
+
+
+def FindRegressions(
+    results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float
+) -> List[str]:
+    """找出耗时比基准增加超过阈值的用例
+
+    Args:
+        results (Dict[str, Dict]): 本次结果
+        baseline (Dict[str, Dict]): 基准结果
+        threshold (float): 允许的耗时增加比例
+
+    Returns:
+        List[str]: 性能退化说明
+    """
+    regressions = []
+    for name, result in results.items():
+        base_result = baseline.get(name)
+        if base_result is None or result.get("skipped") or base_result.get("skipped"):
+            continue
+        limit = base_result["latency_ms"] * (1 + threshold)
+        if result["latency_ms"] > limit:
+            regressions.append(
+                f"{name}: {result['latency_ms']} ms > {base_result['latency_ms']} ms × {1 + threshold:.2f}"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = ArgumentParser(description="JianshuResearchTools 性能基准测试")
+    parser.add_argument("--fixtures", default=DEFAULT_FIXTURES_PATH, help="响应存档路径")
+    parser.add_argument("--record", action="store_true", help="联网运行并录制响应存档")
+    parser.add_argument("--rounds", type=int, default=20, help="每个用例的计时次数")
+    parser.add_argument("--latency", type=float, default=0, help="回放时的模拟网络延迟（秒）")
+    parser.add_argument("-k", dest="keyword", default="", help="只运行名称中包含该字符串的用例")
+    parser.add_argument("--output", help="以 JSON 格式写入结果的文件路径")
+    parser.add_argument("--baseline", help="用于对比的基准结果文件路径")
+    parser.add_argument("--threshold", type=float, default=0.2, help="允许的耗时增加比例")
+    args = parser.parse_args()
+    if not args.record and not exists(args.fixtures):
+        parser.error(
+            f"响应存档 {args.fixtures} 不存在。存档不随仓库分发，"
+            "请先在可以访问简书的环境中运行 python benchmarks/run.py --record 录制"
+        )
+
+    cases = {name: func for name, func in CASES.items() if args.keyword in name}
+
+    if args.record:
+        with record_fixtures(args.fixtures) as archive:
+            for func in cases.values():
+                func()
+        print(f"已录制 {len(archive)} 个响应到 {args.fixtures}")
+        return
+
+    results: Dict[str, Dict] = {}
+    with replay_fixtures(args.fixtures, args.latency):
+        for name, func in cases.items():
+            try:
+                results[name] = RunCase(func, args.rounds)
+            except ResourceError:  # 存档中缺少该用例需要的响应
+                results[name] = {"skipped": True}
+                print(f"{name:<40} 跳过（存档中缺少数据，请重新录制）")
+                continue
+            result = results[name]
+            print(
+                f"{name:<40} {result['latency_ms']:>10.3f} ms "
+                f"{result['items_per_second'] or 0:>12.1f} 条/秒 "
+                f"{result['peak_memory_kib']:>10.1f} KiB"
+            )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": __version__,
+                    "python": python_version(),
+                    "rounds": args.rounds,
+                    "latency": args.latency,
+                    "results": results,
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+    baseline: Optional[Dict] = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = FindRegressions(results, baseline, args.threshold)
+        if regressions:
+            print("性能退化：")
+            print("\n".join(regressions))
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
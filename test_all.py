@@ -1,10 +1,43 @@
+import asyncio
+import gc
+import gzip
+import inspect
+import json
+import os
+import pickle
+import subprocess
+import sys
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from datetime import datetime
-from typing import Any, List, Union
+from io import BytesIO
+from pathlib import Path
+from threading import Event, Lock
+from time import monotonic, sleep
+from typing import Any, Callable, Dict, Generator, List, Optional, Union
 
 import pytest
+from httpx import (
+    URL,
+    Client,
+    ConnectTimeout,
+    Limits,
+    MockTransport,
+    ReadTimeout,
+    Request,
+    Response,
+    Timeout,
+)
+from lxml import etree
 from yaml import full_load as yaml_load
 
 import JianshuResearchTools as jrt
+from JianshuResearchTools import aio as jrt_aio
+from JianshuResearchTools import basic_apis
+from JianshuResearchTools import metrics as metrics_module
+from JianshuResearchTools.aio import basic_apis as aio_basic_apis
+from JianshuResearchTools.article import _ParseArticleCommentsData
 from JianshuResearchTools.convert import (
     ArticleSlugToArticleId,
     ArticleSlugToArticleUrl,
@@ -22,7 +55,84 @@ from JianshuResearchTools.convert import (
     UserUrlToUserId,
     UserUrlToUserSlug,
 )
-from JianshuResearchTools.exceptions import APIError, InputError, ResourceError
+from JianshuResearchTools.exceptions import (
+    APIError,
+    BudgetExceededError,
+    InputError,
+    ResourceError,
+)
+from JianshuResearchTools.export import (
+    IterArrowBatches,
+    WriteFeather,
+    WriteNDJSON,
+    WriteParquet,
+)
+from JianshuResearchTools.headers import API_HEADER, MOBILE_HEADER, PC_HEADER
+from JianshuResearchTools.httpx_client import (
+    JIANSHU_API_ASYNC_CLIENT,
+    JIANSHU_API_CLIENT,
+    HttpConfig,
+    get_async_client,
+    set_http_config,
+)
+from JianshuResearchTools.json_backend import (
+    get_available_json_backends,
+    get_json_backend,
+    json_loads,
+    set_json_backend,
+)
+from JianshuResearchTools.metrics import (
+    Histogram,
+    RequestMetrics,
+    disable_metrics,
+    enable_metrics,
+)
+from JianshuResearchTools.objects import (
+    LRUCache,
+    cache_result_wrapper,
+    clear_cache,
+    get_cache_items_count,
+    get_data_ttl,
+    set_data_ttl,
+)
+from JianshuResearchTools.rate_limit import (
+    AIMDGovernor,
+    RateLimitedTransport,
+    TokenBucket,
+    clear_rate_limit,
+    get_current_rate,
+    set_rate_limit,
+)
+from JianshuResearchTools.records import ArticleSummary, CommentRecord
+from JianshuResearchTools.replay import (
+    FixtureArchive,
+    RecordingTransport,
+    record_fixtures,
+    replay_fixtures,
+)
+from JianshuResearchTools.response_cache import (
+    ResponseCache,
+    disable_response_cache,
+    enable_response_cache,
+)
+from JianshuResearchTools.retry import (
+    RetryPolicy,
+    RetryTransport,
+    get_retry_policy,
+    set_retry_policy,
+)
+from JianshuResearchTools.single_flight import (
+    disable_request_coalescing,
+    enable_request_coalescing,
+)
+from JianshuResearchTools.user import _ParseUserArticlesInfo, _ParseUserTimelineInfo
+from JianshuResearchTools.utils import (
+    AsyncIterPagesById,
+    BatchCall,
+    Cursor,
+    IterPages,
+    IterPagesById,
+)
 
 error_text_to_obj = {
     "InputError": InputError,
@@ -566,5 +676,1321 @@ class TestNotebookModule:
                 jrt.notebook.GetNotebookUpdateTime(case["url"])
 
 
+class TestUtilsModule:
+    def test_NewParametersAfterDisableCheck(self) -> None:
+        # 新增的参数位于 disable_check 之后，不影响原有的按位置传参
+        new_params = {
+            "prefetch",
+            "cursor",
+            "checkpoint",
+            "checkpoint_interval",
+            "typed",
+        }
+        for package in (jrt, jrt_aio):
+            for module_name in ("article", "collection", "island", "notebook", "user"):
+                module = getattr(package, module_name)
+                for name in module.__all__:
+                    params = list(inspect.signature(getattr(module, name)).parameters)
+                    if "disable_check" not in params:
+                        continue
+                    index = params.index("disable_check")
+                    assert not new_params & set(params[:index]), name
+                    assert set(params[index + 1 :]) <= new_params, name
+
+    @staticmethod
+    def FakePages(pages_count: int) -> Callable[[int], List[int]]:
+        return (
+            lambda page: list(range(page * 10, page * 10 + 3))
+            if page <= pages_count
+            else []
+        )
+
+    def test_IterPages(self) -> None:
+        expected = list(IterPages(self.FakePages(5)))
+        assert len(expected) == 15
+        for prefetch in (1, 3, 8):
+            assert list(IterPages(self.FakePages(5), prefetch=prefetch)) == expected
+            assert (
+                list(IterPages(self.FakePages(5), max_count=7, prefetch=prefetch))
+                == expected[:7]
+            )
+
+    def test_IterPagesWindow(self) -> None:
+        lock = Lock()
+        in_flight = [0, 0]  # 当前在途数量，历史最大值
+
+        def fetch_func(page: int) -> List[int]:
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight)
+            sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return [page] if page <= 20 else []
+
+        assert list(IterPages(fetch_func, prefetch=4)) == list(range(1, 21))
+        assert 1 < in_flight[1] <= 4
+
+    def test_IterPagesPrefetchMaxCount(self) -> None:
+        fetched_pages: List[int] = []
+        fake_pages = self.FakePages(10)
+
+        def fetch_func(page: int) -> List[int]:
+            fetched_pages.append(page)
+            return fake_pages(page)
+
+        expected = list(IterPages(self.FakePages(10)))
+        # 每页 3 条数据，获取 7 条只需要 3 页
+        assert list(IterPages(fetch_func, max_count=7, prefetch=8)) == expected[:7]
+        assert sorted(fetched_pages) == [1, 2, 3]
+
+    def test_IterPagesCursor(self) -> None:
+        expected = list(IterPages(self.FakePages(5)))
+        checkpoints: List[dict] = []
+        for prefetch in (0, 3):
+            checkpoints.clear()
+            cursor = Cursor()
+            first_part = []
+            for item in IterPages(
+                self.FakePages(5),
+                prefetch=prefetch,
+                cursor=cursor,
+                checkpoint=lambda cursor: checkpoints.append(cursor.to_dict()),
+                checkpoint_interval=2,
+            ):
+                first_part.append(item)
+                if len(first_part) == 8:  # 在第三页中途中断
+                    break
+            assert checkpoints == [
+                {"position": 3, "offset": 0, "count": 6, "finished": False}
+            ]
+            assert cursor == Cursor(position=3, offset=1, count=7)  # 第 8 条尚未处理完
+
+            resumed = Cursor.from_dict(cursor.to_dict())
+            rest = list(IterPages(self.FakePages(5), prefetch=prefetch, cursor=resumed))
+            assert first_part[:7] + rest == expected
+            assert resumed.finished
+            assert list(IterPages(self.FakePages(5), cursor=resumed)) == []
+
+    def test_CursorSavedInLoopBody(self) -> None:
+        expected = list(IterPages(self.FakePages(5)))
+        cursor = Cursor()
+        saved: Dict[str, Any] = {}
+        for item in IterPages(self.FakePages(5), cursor=cursor):
+            saved = cursor.to_dict()  # 在循环体中保存分页位置
+            if item == expected[4]:
+                break  # 处理第 5 条时中断
+
+        # 至少一次：恢复后中断时正在处理的条目会被再次返回
+        rest = list(IterPages(self.FakePages(5), cursor=Cursor.from_dict(saved)))
+        assert rest == expected[4:]
+
+    def test_IterPagesById(self) -> None:
+        data = list(range(100, 0, -1))
+
+        def fetch_func(max_id: Optional[int]) -> List[int]:
+            start = 0 if max_id is None else data.index(max_id) + 1
+            return data[start : start + 7]
+
+        cursor = Cursor()
+        result = list(IterPagesById(fetch_func, lambda page: page[-1], 30, cursor))
+        assert result == data[:30]
+        assert cursor.count == 30
+        result += list(IterPagesById(fetch_func, lambda page: page[-1], cursor=cursor))
+        assert result == data
+
+        async def async_fetch_func(max_id: Optional[int]) -> List[int]:
+            return fetch_func(max_id)
+
+        async def collect() -> List[int]:
+            return [
+                item
+                async for item in AsyncIterPagesById(
+                    async_fetch_func, lambda page: page[-1], 10
+                )
+            ]
+
+        assert asyncio.run(collect()) == data[:10]
+
+    def test_BatchCall(self) -> None:
+        def func(x: int) -> int:
+            sleep(0.01 * (x % 3))
+            if x == 5:
+                raise ValueError(x)
+            return x * 2
+
+        result = list(BatchCall(func, range(10), concurrency=4))
+        assert [arg for arg, _ in result] == list(range(10))
+        assert isinstance(result[5][1], ValueError)
+        assert [value for arg, value in result if arg != 5] == [
+            x * 2 for x in range(10) if x != 5
+        ]
+
+        unordered = dict(BatchCall(func, range(10), concurrency=4, ordered=False))
+        assert unordered.keys() == set(range(10))
+        assert unordered[9] == 18
+
+
+class TestRankModule:
+    def test_GetAssetsRankDataFull(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        json_obj = {
+            "rankings": [
+                {
+                    "ranking": i + 1,
+                    "amount": (100 - i) * 1000,
+                    "user": {
+                        "id": i,
+                        "slug": f"{i:012x}",
+                        "nickname": f"用户 {i}",
+                        "avatar": "avatar.jpg",
+                    },
+                }
+                for i in range(20)
+            ]
+        }
+        active = []
+        max_active = []
+        lock = Lock()
+
+        def FakeGetUserFPCount(user_url: str, disable_check: bool) -> float:
+            with lock:
+                active.append(user_url)
+                max_active.append(len(active))
+            sleep(0.01)
+            with lock:
+                active.remove(user_url)
+            if user_url.endswith("000000000003"):
+                raise APIError("用户已注销")
+            return 10.5
+
+        monkeypatch.setattr(jrt.rank, "GetAssetsRankJsonDataApi", lambda **_: json_obj)
+        monkeypatch.setattr(jrt.rank, "GetUserFPCount", FakeGetUserFPCount)
+        result = jrt.rank.GetAssetsRankData(get_full=True, concurrency=4)
+        assert [item["ranking"] for item in result] == list(range(1, 21))
+        assert 1 < max(max_active) <= 4
+        assert result[0]["FP"] == 10.5
+        assert result[0]["FTN"] == 89.5
+        assert result[3]["FP"] == result[3]["assets"]  # 获取失败时保留原数据
+        assert "FTN" not in result[3]
+
+    def test_GetAllAssetsRankData(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def FakeApi(max_id: int, since_id: int) -> Dict:
+            # 第二页获取时排行榜发生变动，上一页的最后一名下降到该页
+            start = since_id - 1 if since_id == 20 else since_id
+            return {
+                "rankings": [
+                    {
+                        "ranking": i + 1,
+                        "amount": (100 - i) * 1000,
+                        "user": {
+                            "id": i,
+                            "slug": f"{i:012x}",
+                            "nickname": f"用户 {i}",
+                            "avatar": "avatar.jpg",
+                        },
+                    }
+                    for i in range(start, min(start + 20, 50))
+                ]
+            }
+
+        monkeypatch.setattr(jrt.rank, "GetAssetsRankJsonDataApi", FakeApi)
+        result = list(jrt.rank.GetAllAssetsRankData(max_count=100, concurrency=2))
+        uids = [item["uid"] for item in result]
+        assert uids == sorted(set(uids))  # 重复出现的用户只保留一次
+        assert uids[:20] == list(range(20))
+        assert len(list(jrt.rank.GetAllAssetsRankData(max_count=30))) == 30
+
+        old_snapshot = jrt.rank.GetAssetsRankSnapshot(max_count=3)
+        new_snapshot = {
+            "fetch_time": old_snapshot["fetch_time"],
+            "data": [
+                dict(old_snapshot["data"][1], ranking=1, assets=101.5),
+                dict(old_snapshot["data"][0], ranking=2),
+                {"uid": 99, "ranking": 3, "assets": 90.0},
+            ],
+        }
+        diff = jrt.rank.DiffAssetsRankSnapshots(old_snapshot, new_snapshot)
+        assert [item["uid"] for item in diff["entered"]] == [99]
+        assert [item["uid"] for item in diff["left"]] == [2]
+        assert [
+            (item["uid"], item["ranking_change"], item["assets_change"])
+            for item in diff["changed"]
+        ] == [(1, 1, 2.5), (0, -1, 0)]
+
+    def test_GetAllAssetsRankDataPageSize(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        short_since_id = None
+
+        def FakeApi(max_id: int, since_id: int) -> Dict:
+            # 接口每页返回 10 条数据，short_since_id 对应的分段只返回 5 条
+            end = since_id + (5 if since_id == short_since_id else 10)
+            return {
+                "rankings": [
+                    {
+                        "ranking": i + 1,
+                        "amount": (100 - i) * 1000,
+                        "user": {
+                            "id": i,
+                            "slug": f"{i:012x}",
+                            "nickname": f"用户 {i}",
+                            "avatar": "avatar.jpg",
+                        },
+                    }
+                    for i in range(since_id, min(end, 45))
+                ]
+            }
+
+        async def FakeAsyncApi(max_id: int, since_id: int) -> Dict:
+            return FakeApi(max_id, since_id)
+
+        monkeypatch.setattr(jrt.rank, "GetAssetsRankJsonDataApi", FakeApi)
+        monkeypatch.setattr(jrt_aio.rank, "GetAssetsRankJsonDataApi", FakeAsyncApi)
+
+        async def CollectAsync() -> List[Dict]:
+            return [
+                item
+                async for item in jrt_aio.rank.GetAllAssetsRankData(
+                    max_count=100, concurrency=2
+                )
+            ]
+
+        result = list(jrt.rank.GetAllAssetsRankData(max_count=100, concurrency=2))
+        assert [item["uid"] for item in result] == list(range(45))
+        assert asyncio.run(CollectAsync()) == result
+
+        short_since_id = 10  # 中间的分段返回的数据不足一页
+        with pytest.raises(ResourceError):
+            list(jrt.rank.GetAllAssetsRankData(max_count=100, concurrency=2))
+        with pytest.raises(ResourceError):
+            asyncio.run(CollectAsync())
+
+    def test_GetFPRankDataRange(self, tmp_path: Path) -> None:
+        requested_dates = []
+
+        def handler(request: Request) -> Response:
+            target_date = request.url.params["date"]
+            requested_dates.append(target_date)
+            notes = [] if target_date == "20220102" else [{"slug": "a"}]
+            return Response(
+                200,
+                json={"notes": notes, "fp": 1, "author_fp": 2, "voter_fp": 3},
+            )
+
+        set_http_config(HttpConfig(transport=MockTransport(handler)))
+        enable_response_cache(str(tmp_path / "cache.sqlite3"))
+        try:
+            result = jrt.rank.GetArticleFPRankBasicInfoRange("20211230", "20220103")
+            assert list(result) == ["20211230", "20211231", "20220101", "20220103"]
+            assert result["20220103"] == {
+                "total_fp": 1,
+                "fp_to_author": 2,
+                "fp_to_voter": 3,
+            }
+            assert len(requested_dates) == 5
+
+            jrt.rank.GetArticleFPRankBasicInfoRange("20211230", "20220104")
+            assert requested_dates[5:] == ["20220104"]  # 历史日期从缓存中读取
+        finally:
+            disable_response_cache()
+            set_http_config()
+
+        with pytest.raises(ValueError):
+            jrt.rank.GetArticleFPRankBasicInfoRange("20220103", "20220101")
+
+    def test_FPRankRangeCache(self, tmp_path: Path) -> None:
+        requested_paths = []
+
+        def handler(request: Request) -> Response:
+            requested_paths.append(
+                (request.url.path, request.url.params.get("date", ""))
+            )
+            if request.url.path.endswith("/rank"):
+                return Response(200, json={"daps": []})
+            notes = [] if request.url.params["date"] == "20220102" else [{"slug": "a"}]
+            return Response(
+                200,
+                json={"notes": notes, "fp": 1, "author_fp": 2, "voter_fp": 3},
+            )
+
+        set_http_config(HttpConfig(transport=MockTransport(handler)))
+        jrt.rank.enable_fp_rank_cache(str(tmp_path / "fp_rank.sqlite3"))
+        try:
+            result = jrt.rank.GetArticleFPRankBasicInfoRange("20211230", "20220103")
+            assert list(result) == ["20211230", "20211231", "20220101", "20220103"]
+            assert len(requested_paths) == 5
+
+            requested_paths.clear()
+            assert (
+                jrt.rank.GetArticleFPRankBasicInfoRange("20211230", "20220103")
+                == result
+            )
+            assert requested_paths == []  # 包括数据为空的日期在内都从缓存中读取
+
+            # 其它接口与单日期查询不受影响
+            jrt.rank.GetDailyArticleRankData()
+            jrt.rank.GetDailyArticleRankData()
+            jrt.rank.GetArticleFPRankBasicInfo("20211230")
+            assert len(requested_paths) == 3
+        finally:
+            jrt.rank.disable_fp_rank_cache()
+            set_http_config()
+
+
+class TestUserTimelineParser:
+    def test_ParseUserTimelineInfo(self) -> None:
+        html_obj = etree.HTML(
+            "<ul>"
+            "<li id='feed-1002'><a class='avatar'><img src='avatar.jpg'></a>"
+            "<a class='nickname' href='/u//ea36c8d8aa30'>Op</a>"
+            "<span data-datetime='2022-05-01T10:00:00+08:00' data-type='like_user'>"
+            "</span><div class='follow-detail'><div class='info'>"
+            "<a class='title' href='/u/b6b2bf1e6c8f'>Target</a>"
+            "<p>写了 100 字，被 20 人关注，获得了 30 个喜欢</p></div>"
+            "<div class='signature'>a<br>b</div></div></li>"
+            "<li id='feed-1001'>"
+            "<span data-datetime='2022-04-30T10:00:00+08:00' data-type='unknown'>"
+            "</span></li>"
+            "</ul>"
+        )
+        result = _ParseUserTimelineInfo(html_obj)
+        assert result[0]["operation_id"] == 1002
+        assert result[0]["operation_type"] == "follow_user"
+        assert result[0]["operation_time"] == datetime(2022, 5, 1, 10)
+        assert result[0]["operator_url"] == "https://www.jianshu.com/u/ea36c8d8aa30"
+        assert result[0]["target_user_name"] == "Target"
+        assert result[0]["target_user_likes_count"] == 30
+        assert result[0]["target_user_description"] == "a\nb"
+        # 无法解析的动态类型只返回基础信息
+        assert result[1] == {
+            "operation_id": 1001,
+            "operation_type": "unknown",
+            "operation_time": datetime(2022, 4, 30, 10),
+        }
+
+
+class TestRecords:
+    article_item = {
+        "object": {
+            "data": {
+                "id": 1,
+                "title": "标题",
+                "slug": "a1b2c3d4e5f6",
+                "first_shared_at": "2022-05-01T10:00:00.000+08:00",
+                "list_image_url": "https://example.com/1.jpg",
+                "public_abbr": "摘要",
+                "views_count": 10,
+                "likes_count": 2,
+                "is_top": False,
+                "paid": False,
+                "commentable": True,
+                "user": {
+                    "id": 2,
+                    "nickname": "作者",
+                    "slug": "ea36c8d8aa30",
+                    "avatar": "https://example.com/2.jpg",
+                },
+                "total_fp_amount": 1234,
+                "public_comments_count": 3,
+                "total_rewards_count": 0,
+            }
+        }
+    }
+    user = {"id": 3, "nickname": "评论者", "slug": "b6b2bf1e6c8f", "avatar": "a.jpg"}
+    comments = {
+        "comments": [
+            {
+                "id": 10,
+                "created_at": "2022-05-01T10:00:00.000+08:00",
+                "compiled_content": "评论",
+                "floor": 1,
+                "images": [{"url": "https://example.com/3.jpg"}],
+                "likes_count": 5,
+                "children_count": 1,
+                "user": {**user, "member": {"type": "gold", "expires_at": 1700000000}},
+                "children": [
+                    {
+                        "id": 11,
+                        "created_at": "2022-05-02T10:00:00.000+08:00",
+                        "compiled_content": "回复",
+                        "images": [],
+                        "parent_id": 10,
+                        "user": user,
+                    }
+                ],
+            },
+            {
+                "id": 12,
+                "created_at": "2022-05-03T10:00:00.000+08:00",
+                "compiled_content": "没有子评论",
+                "floor": 2,
+                "images": [],
+                "likes_count": 0,
+                "children_count": 0,
+                "user": user,
+            },
+        ]
+    }
+
+    def test_ArticleSummary(self) -> None:
+        record = ArticleSummary.from_json(self.article_item)
+        assert record.user.uslug == "ea36c8d8aa30"
+        assert record.total_fp_amount == 1.234
+        assert not hasattr(record, "__dict__")
+        # 与字典形式的返回值保持一致
+        assert record.to_dict() == _ParseUserArticlesInfo([self.article_item])[0]
+        assert pickle.loads(pickle.dumps(record)) == record  # noqa: S301
+
+    def test_ArticleSummaryWithVipAuthor(self) -> None:
+        item = deepcopy(self.article_item)
+        item["object"]["data"]["user"]["member"] = {
+            "type": "gold",
+            "expires_at": 1700000000,
+        }
+        record = ArticleSummary.from_json(item)
+        assert record.user.vip_type is None
+        assert record.to_dict() == _ParseUserArticlesInfo([item])[0]
+
+    def test_UnknownVipType(self) -> None:
+        comments = deepcopy(self.comments)
+        comments["comments"][0]["user"]["member"]["type"] = "unknown"
+        with pytest.raises(KeyError):
+            _ParseArticleCommentsData(comments)
+        with pytest.raises(KeyError):
+            CommentRecord.from_json(comments["comments"][0])
+
+    def test_CommentRecord(self) -> None:
+        records = [CommentRecord.from_json(x) for x in self.comments["comments"]]
+        assert records[0].user.vip_type == "黄金"
+        assert records[0].sub_comments[0].parent_comment_id == 10
+        assert records[1].sub_comments is None
+        assert [x.to_dict() for x in records] == _ParseArticleCommentsData(
+            self.comments
+        )
+
+
+class TestExport:
+    @staticmethod
+    def FakeItems(count: int) -> Generator[Dict, None, None]:
+        for i in range(count):
+            yield {
+                "aid": i,
+                "title": f"文章 {i}",
+                "release_time": datetime(2022, 5, 1, 10),
+                "user": {"uid": i % 7, "name": "作者"},
+            }
+
+    def test_IterArrowBatches(self) -> None:
+        pytest.importorskip("pyarrow")
+        batches = list(IterArrowBatches(self.FakeItems(25), batch_size=10))
+        assert [batch.num_rows for batch in batches] == [10, 10, 5]
+        assert batches[0].schema == batches[2].schema
+        assert batches[2].column("aid").to_pylist() == list(range(20, 25))
+
+        record = ArticleSummary.from_json(TestRecords.article_item)
+        batch = next(IterArrowBatches([record]))
+        assert batch.column("user").to_pylist()[0]["uslug"] == "ea36c8d8aa30"
+
+    def test_WriteParquetAndFeather(self, tmp_path: Path) -> None:
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        parquet_path = str(tmp_path / "data.parquet")
+        assert WriteParquet(self.FakeItems(25), parquet_path, batch_size=10) == 25
+        table = pq.read_table(parquet_path)
+        assert table.num_rows == 25
+        assert pq.ParquetFile(parquet_path).num_row_groups == 3
+
+        feather_path = str(tmp_path / "data.feather")
+        assert WriteFeather(self.FakeItems(25), feather_path, batch_size=10) == 25
+        assert pa.ipc.open_file(feather_path).read_all().equals(table)
+
+        assert WriteParquet([], str(tmp_path / "empty.parquet")) == 0
+        assert not (tmp_path / "empty.parquet").exists()
+
+    def test_WriteNDJSON(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "data-{index}.ndjson.gz")
+        assert (
+            WriteNDJSON(
+                self.FakeItems(25),
+                path,
+                compression="gzip",
+                max_file_size=1000,
+                buffer_size=300,
+            )
+            == 25
+        )
+        rows = []
+        index = 0
+        while (tmp_path / f"data-{index}.ndjson.gz").exists():
+            with gzip.open(tmp_path / f"data-{index}.ndjson.gz") as f:
+                rows.extend(json.loads(line) for line in f)
+            index += 1
+        assert index > 1
+        assert [row["aid"] for row in rows] == list(range(25))
+        assert rows[0]["release_time"] == "2022-05-01T10:00:00"
+
+        buffer = BytesIO()
+        record = ArticleSummary.from_json(TestRecords.article_item)
+        assert WriteNDJSON([record], buffer) == 1
+        assert json.loads(buffer.getvalue())["user"]["uslug"] == "ea36c8d8aa30"
+
+        with pytest.raises(ValueError):
+            WriteNDJSON([], str(tmp_path / "data.ndjson"), max_file_size=1000)
+
+    def test_WriteNDJSONPartialFailure(self, tmp_path: Path) -> None:
+        def FailingItems() -> Generator[Dict, None, None]:
+            yield from self.FakeItems(5)
+            raise ResourceError("获取数据失败")
+
+        path = tmp_path / "data.ndjson.gz"
+        with pytest.raises(ResourceError):
+            WriteNDJSON(FailingItems(), str(path), compression="gzip")
+        with gzip.open(path) as f:  # 已获取的数据不会丢失，且压缩数据完整
+            rows = [json.loads(line) for line in f]
+        assert [row["aid"] for row in rows] == list(range(5))
+
+    def test_WriteNDJSONZstd(self, tmp_path: Path) -> None:
+        zstandard = pytest.importorskip("zstandard")
+        path = tmp_path / "data.ndjson.zst"
+        assert WriteNDJSON(self.FakeItems(25), str(path), compression="zstd") == 25
+        with zstandard.ZstdDecompressor().stream_reader(path.open("rb")) as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 25
+
+
+class TestObjectsCache:
+    def test_LRUCacheEviction(self) -> None:
+        cache = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 0)
+        assert cache.get("a") == (True, 1)  # a 成为最近使用的条目
+        cache.set("c", 3)
+        assert cache.get("b") == (False, None)
+        assert cache.get("c") == (True, 3)
+        assert len(cache) == 2
+        assert cache.stats == {"hits": 2, "misses": 1, "evictions": 1}
+
+    def test_LRUCacheTTL(self) -> None:
+        cache = LRUCache()
+        cache.set("a", 1, ttl=0.01)
+        cache.set("b", 2)
+        sleep(0.02)
+        assert len(cache) == 1  # 已过期的条目不计入
+        assert cache.get("a") == (False, None)
+        assert cache.get("b") == (True, 2)
+        assert len(cache) == 1
+
+    def test_PerMethodTTL(self) -> None:
+        calls: List[str] = []
+
+        class Resource:
+            _url = "https://www.jianshu.com/u/ea36c8d8aa30"
+
+            @cache_result_wrapper
+            def default_ttl(self) -> int:
+                calls.append("default")
+                return len(calls)
+
+            @cache_result_wrapper(ttl=0)
+            def no_cache(self) -> int:
+                calls.append("no_cache")
+                return len(calls)
+
+        clear_cache()
+        try:
+            resource = Resource()
+            assert resource.default_ttl() == resource.default_ttl()
+            assert resource.no_cache() != resource.no_cache()
+            assert calls == ["default", "no_cache", "no_cache"]
+            assert get_cache_items_count() == 1
+        finally:
+            clear_cache()
+
+    def test_CacheDoesNotKeepObjectsAlive(self) -> None:
+        requests_count = 0
+
+        def handler(request: Request) -> Response:
+            nonlocal requests_count
+            requests_count += 1
+            if request.url.path.endswith("/public_notes"):
+                return Response(200, json=[])
+            return Response(200, json={"nickname": "name"})
+
+        set_http_config(HttpConfig(transport=MockTransport(handler)))
+        clear_cache()
+        user_url = "https://www.jianshu.com/u/ea36c8d8aa30"
+        try:
+            user_obj = jrt.objects.User(user_url)
+            assert user_obj.name == "name"
+            assert user_obj.slug == "ea36c8d8aa30"
+            assert user_obj.articles_info() == []
+            assert get_cache_items_count() == 1  # Slug 等直接计算的值不进入缓存
+            user_ref = weakref.ref(user_obj)
+            del user_obj
+            gc.collect()
+            assert user_ref() is None
+
+            # 同一用户的其它对象仍可命中缓存
+            requests_count = 0
+            assert jrt.objects.User(user_url).articles_info() == []
+            assert requests_count == 1  # 只有构建对象时的状态检查请求
+        finally:
+            clear_cache()
+            set_http_config()
+
+    def test_ObjectSnapshot(self) -> None:
+        requests_count = 0
+        requests_count_lock = Lock()
+
+        def handler(request: Request) -> Response:
+            nonlocal requests_count
+            with requests_count_lock:
+                requests_count += 1
+            sleep(0.05)
+            return Response(
+                200, json={"nickname": "name", "gender": 1, "total_wordage": 100}
+            )
+
+        set_http_config(HttpConfig(transport=MockTransport(handler)))
+        disable_request_coalescing()  # 只测试对象自身的并发控制
+        old_ttl = get_data_ttl()
+        try:
+            user_obj = jrt.objects.User("https://www.jianshu.com/u/ea36c8d8aa30")
+            assert (user_obj.name, user_obj.gender, user_obj.wordage) == (
+                "name",
+                1,
+                100,
+            )
+            assert requests_count == 1  # 状态检查与各属性共用同一份数据
+
+            clear_cache()  # 清空缓存后数据快照同样失效
+            requests_count = 0
+            results = list(BatchCall(lambda _: user_obj.name, range(5), concurrency=5))
+            assert [x for _, x in results] == ["name"] * 5
+            assert requests_count == 1  # 并发访问时只请求一次
+
+            set_data_ttl(0)  # 对此后获取的数据生效
+            user_obj.refresh()
+            requests_count = 0
+            assert user_obj.name == "name"
+            assert user_obj.name == "name"
+            assert requests_count == 2
+        finally:
+            set_data_ttl(old_ttl)
+            enable_request_coalescing()
+            clear_cache()
+            set_http_config()
+
+
+class TestResponseCache:
+    def test_ResponseCacheTTL(self, tmp_path: Path) -> None:
+        cache = ResponseCache(
+            str(tmp_path / "cache.sqlite3"), ttls={r"^/asimov/users/": 0.01}
+        )
+        user_url = URL("https://www.jianshu.com/asimov/users/slug/ea36c8d8aa30")
+        user_key = cache.make_key("GET", user_url)
+        cache.set(user_key, b"{}", cache.get_ttl(user_url))
+        assert cache.get(user_key) == b"{}"
+        sleep(0.02)
+        assert cache.get(user_key) is None
+
+        rank_url = URL(
+            "https://www.jianshu.com/asimov/fp_rankings/voter_notes?date=20220101"
+        )
+        assert cache.get_ttl(rank_url) is None  # 历史数据永久缓存
+        assert cache.get_ttl(URL("https://www.jianshu.com/asimov/posts")) == 3600
+
+        cache.offline = True
+        assert cache.get(user_key) == b"{}"  # 离线模式下可读取已过期的数据
+
+    def test_ResponseCacheMaxSize(self, tmp_path: Path) -> None:
+        cache = ResponseCache(str(tmp_path / "cache.sqlite3"), max_size=10)
+        cache.set("a", b"12345", None)
+        sleep(0.01)
+        cache.set("b", b"12345", None)
+        sleep(0.01)
+        assert cache.get("a") == b"12345"  # a 成为最近访问的条目
+        cache.set("c", b"12345", None)
+        assert cache.get("b") is None
+        assert cache.get("a") == b"12345"
+        assert cache.get("c") == b"12345"
+
+    def test_ResponseCacheRunningSize(self, tmp_path: Path) -> None:
+        cache = ResponseCache(str(tmp_path / "cache.sqlite3"), max_size=10)
+        statements: List[str] = []
+        cache._conn.set_trace_callback(statements.append)
+        cache.set("a", b"12345", None)
+        cache.set("a", b"1234", None)  # 覆盖已有条目时扣除原有大小
+        cache.set("b", b"12345", None)
+        assert not any("SUM(size)" in x for x in statements)  # 不再每次写入都扫描全表
+        assert cache.get("a") == b"1234"
+        assert cache.get("b") == b"12345"
+        cache._conn.set_trace_callback(None)
+
+    def test_ResponseCacheKeyIncludesFamily(self, tmp_path: Path) -> None:
+        def handler(request: Request) -> Response:
+            return Response(200, text=request.headers["User-Agent"])
+
+        set_http_config(HttpConfig(transport=MockTransport(handler)))
+        enable_response_cache(str(tmp_path / "cache.sqlite3"))
+        try:
+            assert (
+                basic_apis._GetSource("api", "/same")
+                == API_HEADER["User-Agent"].encode()
+            )
+            assert (
+                basic_apis._GetSource("pc", "/same") == PC_HEADER["User-Agent"].encode()
+            )
+        finally:
+            disable_response_cache()
+            set_http_config()
+
+
+class TestStatusCheck:
+    def test_GetterValidatesFetchedPayload(self) -> None:
+        requests_count = 0
+
+        def handler(request: Request) -> Response:
+            nonlocal requests_count
+            requests_count += 1
+            if request.url.path.endswith("b6b2bf1e6c8f"):
+                return Response(200, json={"error": ["用户不存在"]})
+            if "/nb/" in request.url.path:
+                return Response(200, json={"name": "文集"})
+            return Response(200, json={"nickname": "name"})
+
+        set_http_config(
+            HttpConfig(
+                transport=MockTransport(handler), async_transport=MockTransport(handler)
+            )
+        )
+        try:
+            assert (
+                jrt.user.GetUserName("https://www.jianshu.com/u/ea36c8d8aa30") == "name"
+            )
+            assert requests_count == 1  # 状态检查使用获取到的数据，不再单独请求
+
+            requests_count = 0
+            assert (
+                asyncio.run(
+                    jrt_aio.user.GetUserName("https://www.jianshu.com/u/ea36c8d8aa30")
+                )
+                == "name"
+            )
+            assert requests_count == 1
+
+            requests_count = 0
+            assert (
+                jrt.notebook.GetNotebookName("https://www.jianshu.com/nb/43709189")
+                == "文集"
+            )
+            assert requests_count == 1
+
+            with pytest.raises(ResourceError):
+                jrt.user.GetUserName("https://www.jianshu.com/u/b6b2bf1e6c8f")
+            with pytest.raises(ResourceError):
+                asyncio.run(
+                    jrt_aio.user.GetUserName("https://www.jianshu.com/u/b6b2bf1e6c8f")
+                )
+        finally:
+            set_http_config()
+
+
+class TestRateLimit:
+    def test_TokenBucket(self) -> None:
+        bucket = TokenBucket(rate=100, burst=1)
+        start_time = monotonic()
+        for _ in range(11):
+            bucket.acquire()
+        assert monotonic() - start_time >= 0.09
+
+    def test_AIMDGovernor(self) -> None:
+        bucket = TokenBucket(rate=10)
+        governor = AIMDGovernor(bucket, min_rate=2, max_rate=10, increase=1)
+        governor.on_failure()
+        assert bucket.rate == 5
+        governor.on_failure()  # 冷却时间内不再降速
+        assert bucket.rate == 5
+        for _ in range(10):
+            governor.on_success()
+        assert bucket.rate == 10
+
+    def test_RateLimitedTransport(self) -> None:
+        def handler(request: Request) -> Response:
+            return Response(503 if request.url.path == "/busy" else 200)
+
+        client = Client(
+            base_url="https://www.jianshu.com",
+            transport=RateLimitedTransport(MockTransport(handler), "api"),
+        )
+        set_rate_limit("api", rate=100, adaptive=True)
+        try:
+            client.get("/ok")
+            assert get_current_rate("api") == 100
+            client.get("/busy")
+            assert get_current_rate("api") == 50
+        finally:
+            clear_rate_limit()
+        assert get_current_rate("api") is None
+
+
+class TestJsonBackend:
+    def test_SetJsonBackend(self) -> None:
+        available = get_available_json_backends()
+        assert available[-1] == "json"
+        assert get_json_backend() == available[0]
+        try:
+            for name in available:
+                set_json_backend(name)
+                assert get_json_backend() == name
+                assert json_loads(b'{"a": [1, 2.5, "\xe7\xae\x80"]}') == {
+                    "a": [1, 2.5, "简"]
+                }
+            with pytest.raises(ValueError):
+                set_json_backend("simplejson")
+        finally:
+            set_json_backend(None)
+
+    def test_ArticleHtmlJsonWithOrjson(self) -> None:
+        pytest.importorskip("orjson")
+        code = (
+            "from httpx import MockTransport, Response\n"
+            "from JianshuResearchTools.basic_apis import GetArticleHtmlJsonDataApi\n"
+            "from JianshuResearchTools.httpx_client import HttpConfig, set_http_config\n"
+            "from JianshuResearchTools.json_backend import get_json_backend\n"
+            "assert get_json_backend() == 'orjson'\n"
+            'html = \'<script id="__NEXT_DATA__">{"a": 1}</script>\'\n'
+            "set_http_config(HttpConfig(transport=MockTransport("
+            "lambda request: Response(200, text=html))))\n"
+            "assert GetArticleHtmlJsonDataApi("
+            "'https://www.jianshu.com/p/06d33efd4ed2') == {'a': 1}\n"
+        )
+        subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            env={**os.environ, "JRT_JSON_BACKEND": "orjson"},
+        )
+
+
+class TestRetry:
+    def test_RetryTransport(self) -> None:
+        calls: List[str] = []
+
+        def handler(request: Request) -> Response:
+            calls.append(request.method)
+            if len(calls) == 1:
+                raise ConnectTimeout("timeout", request=request)
+            if len(calls) == 2:
+                return Response(503)
+            return Response(200)
+
+        client = Client(
+            base_url="https://www.jianshu.com",
+            transport=RetryTransport(MockTransport(handler)),
+        )
+        old_policy = get_retry_policy()
+        set_retry_policy(RetryPolicy(attempts=3, backoff_base=0.001))
+        try:
+            assert client.get("/").status_code == 200
+            assert len(calls) == 3
+
+            calls.clear()
+            with pytest.raises(ConnectTimeout):
+                client.post("/")  # 非幂等请求不重试
+            assert calls == ["POST"]
+
+            calls.clear()
+            set_retry_policy(RetryPolicy(attempts=3, deadline=0))
+            with pytest.raises(ConnectTimeout):
+                client.get("/")  # 等待时长超过截止时间时不重试
+            assert len(calls) == 1
+        finally:
+            set_retry_policy(old_policy)
+
+    def test_RetryDeadlineLimitsTimeout(self) -> None:
+        timeouts: List[Dict[str, float]] = []
+
+        def handler(request: Request) -> Response:
+            timeouts.append(request.extensions["timeout"])
+            sleep(0.05)
+            raise ReadTimeout("timeout", request=request)
+
+        client = Client(
+            base_url="https://www.jianshu.com",
+            timeout=Timeout(5, connect=1),
+            transport=RetryTransport(MockTransport(handler)),
+        )
+        old_policy = get_retry_policy()
+        set_retry_policy(RetryPolicy(attempts=2, backoff_base=0, deadline=0.2))
+        try:
+            with pytest.raises(ReadTimeout):
+                client.get("/")
+            assert len(timeouts) == 2
+            # 每次尝试的超时时间不超过距截止时间的剩余时长
+            assert all(0 < value <= 0.2 for value in timeouts[0].values())
+            assert all(value <= 0.2 - 0.05 for value in timeouts[1].values())
+        finally:
+            set_retry_policy(old_policy)
+
+
+class TestHttpConfig:
+    def test_HttpConfigFromEnv(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("JRT_MAX_CONNECTIONS", "200")
+        monkeypatch.setenv("JRT_TIMEOUT", "10")
+        monkeypatch.setenv("JRT_HTTP2", "0")
+        config = HttpConfig.from_env()
+        assert config.limits.max_connections == 200
+        assert (
+            config.limits.max_keepalive_connections
+            == Limits().max_keepalive_connections
+        )
+        assert config.timeout == Timeout(10)
+        assert not config.http2
+        assert config.proxy is None
+
+    def test_SetHttpConfig(self) -> None:
+        async def async_handler(request: Request) -> Response:
+            return Response(200, text="async")
+
+        config = HttpConfig(
+            timeout=Timeout(5, connect=2),
+            transport=MockTransport(lambda request: Response(200, text="sync")),
+            async_transport=MockTransport(async_handler),
+        )
+        set_http_config(config)
+        try:
+            assert JIANSHU_API_CLIENT.timeout.connect == 2
+            assert JIANSHU_API_CLIENT.get("/").text == "sync"
+            assert asyncio.run(JIANSHU_API_ASYNC_CLIENT.get("/")).text == "async"
+        finally:
+            set_http_config()
+        assert JIANSHU_API_CLIENT.timeout == Timeout(5)
+
+    def test_AsyncClientsPerEventLoop(self) -> None:
+        user_agents: List[str] = []
+
+        def handler(request: Request) -> Response:
+            user_agents.append(request.headers["User-Agent"])
+            if request.url.path.startswith("/asimov/"):
+                return Response(200, json={"nickname": "name"})
+            return Response(200, text="<html><body><p>ok</p></body></html>")
+
+        api_calls: Dict[str, Callable] = {
+            "api": lambda: aio_basic_apis.GetUserJsonDataApi(
+                "https://www.jianshu.com/u/ea36c8d8aa30"
+            ),
+            "pc": lambda: aio_basic_apis.GetUserPCHtmlDataApi(
+                "https://www.jianshu.com/u/ea36c8d8aa30"
+            ),
+            "mobile": lambda: aio_basic_apis.GetUserNextAnniversaryDayHtmlDataApi(
+                "ea36c8d8aa30"
+            ),
+        }
+        headers = {"api": API_HEADER, "pc": PC_HEADER, "mobile": MOBILE_HEADER}
+        set_http_config(HttpConfig(async_transport=MockTransport(handler)))
+        try:
+            for family, api_call in api_calls.items():
+                clients = []
+
+                async def main() -> Any:
+                    clients.append(get_async_client(family))  # noqa: B023
+                    return await api_call()  # noqa: B023
+
+                # 每次 asyncio.run 都会创建新的事件循环，客户端不能跨事件循环复用
+                for _ in range(2):
+                    user_agents.clear()
+                    assert asyncio.run(main()) is not None
+                    assert user_agents == [headers[family]["User-Agent"]]
+                assert clients[0] is not clients[1]
+                assert all(client.is_closed for client in clients)
+        finally:
+            set_http_config()
+
+    def test_LazyImport(self) -> None:
+        code = (
+            "import sys\n"
+            "import JianshuResearchTools as jrt\n"
+            "assert 'httpx' not in sys.modules\n"
+            "jrt.user\n"
+            "from JianshuResearchTools import httpx_client\n"
+            "assert not httpx_client._clients\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestReplay:
+    def test_RecordAndReplay(self, tmp_path: Path) -> None:
+        def handler(request: Request) -> Response:
+            return Response(200, json={"nickname": request.url.path.split("/")[-1]})
+
+        archive = FixtureArchive()
+        client = Client(
+            base_url="https://www.jianshu.com",
+            transport=RecordingTransport(archive, MockTransport(handler)),
+        )
+        assert client.get("/asimov/users/slug/ea36c8d8aa30").status_code == 200
+        path = str(tmp_path / "fixtures.json.gz")
+        archive.save(path)
+
+        set_http_config(HttpConfig(transport=MockTransport(handler)))
+        try:
+            with record_fixtures(path) as merged_archive:
+                jrt.basic_apis.GetUserJsonDataApi(
+                    "https://www.jianshu.com/u/b6b2bf1e6c8f"
+                )
+            assert len(merged_archive) == 2
+        finally:
+            set_http_config()
+
+        with replay_fixtures(path, latency=0.01) as loaded_archive:
+            assert len(loaded_archive) == 2
+            start_time = monotonic()
+            assert (
+                jrt.basic_apis.GetUserJsonDataApi(
+                    "https://www.jianshu.com/u/ea36c8d8aa30"
+                )["nickname"]
+                == "ea36c8d8aa30"
+            )
+            assert monotonic() - start_time >= 0.01
+            with pytest.raises(ResourceError):
+                jrt.basic_apis.GetUserJsonDataApi(
+                    "https://www.jianshu.com/u/7b6a51bc0d23"
+                )
+
+
+class TestMetrics:
+    def test_Histogram(self) -> None:
+        histogram = Histogram(buckets=(0.01, 0.1, 1))
+        assert histogram.quantile(0.5) is None
+        for value in [0.005] * 50 + [0.05] * 45 + [0.5] * 5:
+            histogram.observe(value)
+        assert histogram.quantile(0.5) == 0.01
+        assert 0.01 < histogram.quantile(0.95) <= 0.1
+        assert 0.1 < histogram.quantile(0.99) <= 1
+        assert histogram.to_dict()["max"] == 0.5
+
+    def test_RequestMetrics(self) -> None:
+        def handler(request: Request) -> Response:
+            if request.url.path.endswith("b6b2bf1e6c8f"):
+                return Response(404, content=b"not json")
+            return Response(200, content=b'{"nickname": "name"}')
+
+        set_http_config(HttpConfig(transport=MockTransport(handler)))
+        metrics = enable_metrics()
+        try:
+            for _ in range(2):
+                jrt.basic_apis.GetUserJsonDataApi(
+                    "https://www.jianshu.com/u/ea36c8d8aa30"
+                )
+            with pytest.raises(ValueError):
+                jrt.basic_apis.GetUserJsonDataApi(
+                    "https://www.jianshu.com/u/b6b2bf1e6c8f"
+                )
+            snapshot = metrics.snapshot()["GetUserJsonDataApi"]
+            assert snapshot["calls"] == 3
+            assert snapshot["requests"] == 3
+            assert snapshot["errors"] == 1
+            assert snapshot["bytes_received"] == 20 * 2 + 8
+            assert snapshot["status_codes"] == {200: 2, 404: 1}
+            assert snapshot["network_time"]["count"] == 3
+            assert snapshot["parse_time"]["count"] == 2
+            assert snapshot["network_time"]["p99"] is not None
+
+            text = metrics.to_prometheus()
+            assert 'jrt_requests_total{endpoint="GetUserJsonDataApi"} 3' in text
+            assert (
+                'jrt_responses_total{endpoint="GetUserJsonDataApi",code="404"} 1'
+                in text
+            )
+            assert 'jrt_network_seconds_count{endpoint="GetUserJsonDataApi"} 3' in text
+        finally:
+            disable_metrics()
+            set_http_config()
+
+    def test_OpenTelemetryExporters(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        records: List[str] = []
+
+        class FakeExporter:
+            def __init__(self, meter_provider: Any) -> None:
+                pass
+
+            def record_request(self, endpoint: str, *_: Any) -> None:
+                records.append(endpoint)
+
+            def record_parse(self, endpoint: str, _: float) -> None:
+                records.append(endpoint)
+
+        monkeypatch.setattr(metrics_module, "OpenTelemetryExporter", FakeExporter)
+        metrics = RequestMetrics()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(lambda _: metrics.add_opentelemetry_exporter(), range(32))
+            )
+        metrics.reset()  # 导出器不随统计数据清空
+        metrics.record_request("GetUserJsonDataApi", 200, 10, 0.1)
+        metrics.record_call("GetUserJsonDataApi", 0.01, False)
+        assert len(records) == 64
+
+
+class TestRequestBudget:
+    def test_RequestBudget(self) -> None:
+        requests_count = 0
+        requests_count_lock = Lock()
+
+        def handler(request: Request) -> Response:
+            nonlocal requests_count
+            with requests_count_lock:
+                requests_count += 1
+            return Response(200, json={"nickname": "name"})
+
+        set_http_config(
+            HttpConfig(
+                transport=MockTransport(handler), async_transport=MockTransport(handler)
+            )
+        )
+        user_url = "https://www.jianshu.com/u/ea36c8d8aa30"
+        try:
+            with jrt.request_budget(max_requests=2) as budget:
+                jrt.basic_apis.GetUserJsonDataApi(user_url)
+                jrt.basic_apis.GetUserJsonDataApi(user_url)
+                with pytest.raises(BudgetExceededError):
+                    jrt.basic_apis.GetUserJsonDataApi(user_url)
+            assert requests_count == 2
+            assert budget.requests == 2
+            assert budget.remaining == 0
+            assert budget.families == {"api": 2}
+            assert len(budget.call_sites) == 2  # 两次调用位于不同的行
+            for call_site in budget.call_sites:
+                assert "test_all.py" in call_site
+                assert "test_RequestBudget" in call_site
+
+            # 并发发出的请求与异步请求同样计入，嵌套时计入外层预算
+            with jrt.request_budget(raise_on_exceed=False) as outer:
+                with jrt.request_budget(max_requests=1, raise_on_exceed=False) as inner:
+                    results = list(
+                        BatchCall(jrt.basic_apis.GetUserJsonDataApi, [user_url] * 3)
+                    )
+                    assert all(isinstance(x, dict) for _, x in results)
+                asyncio.run(aio_basic_apis.GetUserJsonDataApi(user_url))
+            assert inner.requests == 3
+            assert inner.exceeded
+            assert outer.requests == 4
+            assert "请求次数：4 / 不限" in outer.report()
+        finally:
+            set_http_config()
+
+
+class TestSingleFlight:
+    def test_RequestCoalescing(self) -> None:
+        requests_count = 0
+        requests_count_lock = Lock()
+
+        def handler(request: Request) -> Response:
+            nonlocal requests_count
+            with requests_count_lock:
+                requests_count += 1
+            sleep(0.2)  # 保证其它调用在请求完成前发出
+            return Response(200, json={"nickname": "name"})
+
+        async def async_handler(request: Request) -> Response:
+            nonlocal requests_count
+            requests_count += 1
+            await asyncio.sleep(0.2)
+            return Response(200, json={"nickname": "name"})
+
+        async def gather(user_url: str) -> List[Dict]:
+            return await asyncio.gather(
+                *(aio_basic_apis.GetUserJsonDataApi(user_url) for _ in range(5))
+            )
+
+        set_http_config(
+            HttpConfig(
+                transport=MockTransport(handler),
+                async_transport=MockTransport(async_handler),
+            )
+        )
+        user_url = "https://www.jianshu.com/u/ea36c8d8aa30"
+        metrics = enable_metrics()
+        try:
+            results = [
+                x
+                for _, x in BatchCall(
+                    jrt.basic_apis.GetUserJsonDataApi, [user_url] * 5, concurrency=5
+                )
+            ]
+            assert requests_count == 1
+            assert results == [{"nickname": "name"}] * 5
+            assert results[0] is not results[1]  # 每个调用方得到独立解码的结果
+            snapshot = metrics.snapshot()["GetUserJsonDataApi"]
+            assert snapshot["requests"] == 1
+            assert snapshot["coalesced"] == 4
+
+            requests_count = 0
+            assert asyncio.run(gather(user_url)) == [{"nickname": "name"}] * 5
+            assert requests_count == 1
+
+            disable_request_coalescing()
+            requests_count = 0
+            list(
+                BatchCall(
+                    jrt.basic_apis.GetUserJsonDataApi, [user_url] * 5, concurrency=5
+                )
+            )
+            assert requests_count == 5
+        finally:
+            enable_request_coalescing()
+            disable_metrics()
+            set_http_config()
+
+    def test_CoalescingWithBudget(self) -> None:
+        started = Event()
+        release = Event()
+        requests_count = 0
+
+        def handler(request: Request) -> Response:
+            nonlocal requests_count
+            requests_count += 1
+            started.set()
+            release.wait(5)
+            return Response(200, json={"nickname": "name"})
+
+        user_url = "https://www.jianshu.com/u/ea36c8d8aa30"
+
+        def CallWithBudget(max_requests: int) -> Any:
+            with jrt.request_budget(max_requests=max_requests) as budget:
+                try:
+                    result = jrt.basic_apis.GetUserJsonDataApi(user_url)
+                except BudgetExceededError:
+                    result = None
+            return result, budget.requests
+
+        set_http_config(HttpConfig(transport=MockTransport(handler)))
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            leader = executor.submit(jrt.basic_apis.GetUserJsonDataApi, user_url)
+            assert started.wait(5)
+            # 预算已用尽的调用不能共享进行中的请求
+            assert CallWithBudget(0) == (None, 0)
+            follower = executor.submit(CallWithBudget, 1)
+            sleep(0.1)
+            release.set()
+            assert leader.result() == {"nickname": "name"}
+            # 共享请求的调用同样计入自己的预算
+            assert follower.result() == ({"nickname": "name"}, 1)
+            assert requests_count == 1
+
+            # 超出预算的调用不会发起请求，没有预算的调用不受影响
+            requests_count = 0
+            assert CallWithBudget(0) == (None, 0)
+            assert requests_count == 0
+            assert jrt.basic_apis.GetUserJsonDataApi(user_url) == {"nickname": "name"}
+            assert requests_count == 1
+        finally:
+            release.set()
+            executor.shutdown()
+            set_http_config()
+
+
 if __name__ == "__main__":
     pytest.main(args=["-n 4"])  # 运行测试